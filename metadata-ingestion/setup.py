@@ -57,7 +57,8 @@ framework_common = {
     "packaging",
     "aiohttp<4",
     "cached_property",
-    "ijson",
+    # use_float was added in 3.1
+    "ijson>=3.1",
     "click-spinner",
 }
 
@@ -233,6 +234,8 @@ plugins: Dict[str, Set[str]] = {
         "clickhouse-sqlalchemy==0.1.8",
     },
     "datahub-lineage-file": set(),
+    # Reading and writing zstd compressed files.
+    "file": {"zstandard"},
     "datahub-business-glossary": set(),
     "delta-lake": {*data_lake_profiling, *delta_lake},
     "dbt": {"requests"} | aws_common,
@@ -374,6 +377,7 @@ base_dev_requirements = {
             "delta-lake",
             "druid",
             "elasticsearch",
+            "file",
             "iceberg",
             "ldap",
             "looker",
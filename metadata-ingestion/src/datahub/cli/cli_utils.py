@@ -326,17 +326,13 @@ def post_delete_endpoint_with_session_and_url(
     return urn, rows_affected
 
 
-def get_urns_by_filter(
+def _get_urn_filter_criteria(
     platform: Optional[str],
-    env: Optional[str] = None,
-    entity_type: str = "dataset",
-    search_query: str = "*",
-    include_removed: bool = False,
-    only_soft_deleted: Optional[bool] = None,
-) -> Iterable[str]:
-    session, gms_host = get_session_and_host()
-    endpoint: str = "/entities?action=search"
-    url = gms_host + endpoint
+    env: Optional[str],
+    entity_type: str,
+    include_removed: bool,
+    only_soft_deleted: Optional[bool],
+) -> List[Dict[str, str]]:
     filter_criteria = []
     entity_type_lower = entity_type.lower()
     if env and entity_type_lower != "container":
@@ -380,32 +376,100 @@ def get_urns_by_filter(
                 "condition": "EQUAL",
             }
         )
+    return filter_criteria
+
+
+def _search_urns(
+    session: Session,
+    gms_host: str,
+    search_body: Dict[str, Any],
+) -> Dict[str, Any]:
+    url = gms_host + "/entities?action=search"
+    payload = json.dumps(search_body)
+    log.debug(payload)
+    response: Response = session.post(url, payload)
+    if response.status_code != 200:
+        log.error(f"Failed to execute search query with {str(response.content)}")
+        response.raise_for_status()
+    assert response._content
+    return json.loads(response._content)["value"]
+
 
+def get_num_urns_by_filter(
+    platform: Optional[str],
+    env: Optional[str] = None,
+    entity_type: str = "dataset",
+    search_query: str = "*",
+    include_removed: bool = False,
+    only_soft_deleted: Optional[bool] = None,
+    start_after_urn: Optional[str] = None,
+) -> int:
+    """Returns the number of entities that get_urns_by_filter would yield for the same arguments."""
+    session, gms_host = get_session_and_host()
+    filter_criteria = _get_urn_filter_criteria(
+        platform, env, entity_type, include_removed, only_soft_deleted
+    )
+    if start_after_urn is not None:
+        filter_criteria.append(
+            {"field": "urn", "value": start_after_urn, "condition": "GREATER_THAN"}
+        )
     search_body = {
         "input": search_query,
         "entity": entity_type,
         "start": 0,
-        "count": 10000,
+        "count": 0,
         "filter": {"or": [{"and": filter_criteria}]},
     }
-    payload = json.dumps(search_body)
-    log.debug(payload)
-    response: Response = session.post(url, payload)
-    if response.status_code == 200:
-        assert response._content
-        results = json.loads(response._content)
-        num_entities = results["value"]["numEntities"]
-        entities_yielded: int = 0
-        for x in results["value"]["entities"]:
-            entities_yielded += 1
+    return _search_urns(session, gms_host, search_body)["numEntities"]
+
+
+def get_urns_by_filter(
+    platform: Optional[str],
+    env: Optional[str] = None,
+    entity_type: str = "dataset",
+    search_query: str = "*",
+    include_removed: bool = False,
+    only_soft_deleted: Optional[bool] = None,
+    start_after_urn: Optional[str] = None,
+    batch_size: int = 1000,
+) -> Iterable[str]:
+    """
+    Yields the urns of the entities matching the filters, in ascending order.
+
+    Rather than paging with offsets, which the search index caps at 10000 results and
+    which shift when entities are deleted along the way, every page asks for the urns
+    after the last one seen. Passing start_after_urn resumes a previous listing after
+    that urn.
+    """
+    session, gms_host = get_session_and_host()
+    filter_criteria = _get_urn_filter_criteria(
+        platform, env, entity_type, include_removed, only_soft_deleted
+    )
+    cursor = start_after_urn
+    while True:
+        page_criteria = list(filter_criteria)
+        if cursor is not None:
+            page_criteria.append(
+                {"field": "urn", "value": cursor, "condition": "GREATER_THAN"}
+            )
+        search_body = {
+            "input": search_query,
+            "entity": entity_type,
+            "start": 0,
+            "count": batch_size,
+            "filter": {"or": [{"and": page_criteria}]},
+            "sort": {"field": "urn", "order": "ASCENDING"},
+        }
+        results = _search_urns(session, gms_host, search_body)
+        entities = results["entities"]
+        for x in entities:
             log.debug(f"yielding {x['entity']}")
             yield x["entity"]
-        assert (
-            entities_yielded == num_entities
-        ), "Did not delete all entities, try running this command again!"
-    else:
-        log.error(f"Failed to execute search query with {str(response.content)}")
-        response.raise_for_status()
+        # The server drops hits for entities that no longer exist from a page, but not
+        # from numEntities, so a short page doesn't mean that this was the last one.
+        if not entities or results["numEntities"] <= len(entities):
+            break
+        cursor = entities[-1]["entity"]
 
 
 def get_container_ids_by_filter(
@@ -1,8 +1,10 @@
+import collections
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from random import choices
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 import click
 import progressbar
@@ -27,6 +29,11 @@ RUN_TABLE_COLUMNS = ["urn", "aspect name", "created at"]
 
 UNKNOWN_NUM_RECORDS = -1
 
+# A delete by filter first deletes the entities that aren't soft-deleted and then,
+# when asked to, the soft-deleted ones. Resume points name the pass they belong to.
+ACTIVE_PASS = "active"
+SOFT_DELETED_PASS = "soft-deleted"
+
 
 @dataclass
 class DeletionResult:
@@ -92,6 +99,19 @@ def delete_for_registry(
 @click.option("--registry-id", required=False, type=str)
 @click.option("-n", "--dry-run", required=False, is_flag=True)
 @click.option("--only-soft-deleted", required=False, is_flag=True, default=False)
+@click.option(
+    "--workers",
+    required=False,
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of entities to delete concurrently when deleting by filter.",
+)
+@click.option(
+    "--resume-from",
+    required=False,
+    type=str,
+    help="Resume point printed by an interrupted delete by filter. Only entities after it are deleted.",
+)
 @upgrade.check_upgrade
 @telemetry.with_telemetry
 def delete(
@@ -105,6 +125,8 @@ def delete(
     registry_id: str,
     dry_run: bool,
     only_soft_deleted: bool,
+    workers: int,
+    resume_from: Optional[str],
 ) -> None:
     """Delete metadata from datahub using a single urn or a combination of filters"""
 
@@ -196,6 +218,8 @@ def delete(
             force=force,
             include_removed=include_removed,
             only_soft_deleted=only_soft_deleted,
+            workers=workers,
+            resume_from=resume_from,
         )
 
     if not dry_run:
@@ -217,6 +241,17 @@ def _get_current_time() -> int:
     return int(time.time() * 1000.0)
 
 
+def _parse_resume_point(resume_from: str) -> Tuple[str, str]:
+    """Splits a resume point printed by _delete_urns_concurrently into its pass and urn."""
+    deletion_pass, _, urn = resume_from.partition(":")
+    if deletion_pass not in (ACTIVE_PASS, SOFT_DELETED_PASS) or not urn:
+        raise click.BadParameter(
+            f"expected '{ACTIVE_PASS}:<urn>' or '{SOFT_DELETED_PASS}:<urn>', got '{resume_from}'",
+            param_hint="--resume-from",
+        )
+    return deletion_pass, urn
+
+
 @telemetry.with_telemetry
 def delete_with_filters(
     dry_run: bool,
@@ -228,51 +263,58 @@ def delete_with_filters(
     env: Optional[str] = None,
     platform: Optional[str] = None,
     only_soft_deleted: Optional[bool] = False,
+    workers: int = 1,
+    resume_from: Optional[str] = None,
 ) -> DeletionResult:
 
-    session, gms_host = cli_utils.get_session_and_host()
-    token = cli_utils.get_token()
+    # the pass being resumed starts after the resume point, the passes before it are
+    # already done and the ones after it start from the beginning
+    resume_pass: Optional[str] = None
+    resume_after: Dict[str, str] = {}
+    if resume_from:
+        resume_pass, resume_urn = _parse_resume_point(resume_from)
+        resume_after[resume_pass] = resume_urn
 
+    _, gms_host = cli_utils.get_session_and_host()
     logger.info(f"datahub configured with {gms_host}")
-    emitter = rest_emitter.DatahubRestEmitter(gms_server=gms_host, token=token)
     batch_deletion_result = DeletionResult()
 
-    urns: List[str] = []
-    if not only_soft_deleted:
-        urns = list(
-            cli_utils.get_urns_by_filter(
-                env=env,
-                platform=platform,
-                search_query=search_query,
-                entity_type=entity_type,
-                include_removed=False,
-            )
+    num_urns = 0
+    if not only_soft_deleted and resume_pass != SOFT_DELETED_PASS:
+        num_urns = cli_utils.get_num_urns_by_filter(
+            env=env,
+            platform=platform,
+            search_query=search_query,
+            entity_type=entity_type,
+            include_removed=False,
+            start_after_urn=resume_after.get(ACTIVE_PASS),
         )
 
-    soft_deleted_urns: List[str] = []
+    num_soft_deleted_urns = 0
     if include_removed or only_soft_deleted:
-        soft_deleted_urns = list(
-            cli_utils.get_urns_by_filter(
-                env=env,
-                platform=platform,
-                search_query=search_query,
-                entity_type=entity_type,
-                only_soft_deleted=True,
-            )
+        num_soft_deleted_urns = cli_utils.get_num_urns_by_filter(
+            env=env,
+            platform=platform,
+            search_query=search_query,
+            entity_type=entity_type,
+            only_soft_deleted=True,
+            start_after_urn=resume_after.get(SOFT_DELETED_PASS),
         )
 
     final_message = ""
-    if len(urns) > 0:
-        final_message = f"{len(urns)} "
-    if len(urns) > 0 and len(soft_deleted_urns) > 0:
+    if num_urns > 0:
+        final_message = f"{num_urns} "
+    if num_urns > 0 and num_soft_deleted_urns > 0:
         final_message += "and "
-    if len(soft_deleted_urns) > 0:
-        final_message = f"{len(soft_deleted_urns)} (soft-deleted) "
+    if num_soft_deleted_urns > 0:
+        final_message = f"{num_soft_deleted_urns} (soft-deleted) "
 
-    logger.info(
-        f"Filter matched {final_message} {entity_type} entities of {platform}. Sample: {choices(urns, k=min(5, len(urns)))}"
-    )
-    if len(urns) == 0 and len(soft_deleted_urns) == 0:
+    logger.info(f"Filter matched {final_message} {entity_type} entities of {platform}.")
+    if resume_pass:
+        logger.info(
+            f"Resuming the {resume_pass} pass after {resume_after[resume_pass]}, earlier urns are skipped."
+        )
+    if num_urns == 0 and num_soft_deleted_urns == 0:
         click.echo(
             f"No urns to delete. Maybe you want to change entity_type={entity_type} or platform={platform} to be something different?"
         )
@@ -281,40 +323,143 @@ def delete_with_filters(
     if not force and not dry_run:
         type_delete = "soft" if soft else "permanently"
         click.confirm(
-            f"This will {type_delete} delete {len(urns)} entities. Are you sure?",
+            f"This will {type_delete} delete {num_urns} entities. Are you sure?",
             abort=True,
         )
 
-    if len(urns) > 0:
-        for urn in progressbar.progressbar(urns, redirect_stdout=True):
-            one_result = _delete_one_urn(
-                urn,
-                soft=soft,
+    if num_urns > 0:
+        _delete_urns_concurrently(
+            cli_utils.get_urns_by_filter(
+                env=env,
+                platform=platform,
+                search_query=search_query,
                 entity_type=entity_type,
-                dry_run=dry_run,
-                cached_session_host=(session, gms_host),
-                cached_emitter=emitter,
-            )
-            batch_deletion_result.merge(one_result)
+                include_removed=False,
+                start_after_urn=resume_after.get(ACTIVE_PASS),
+            ),
+            num_urns,
+            batch_deletion_result,
+            workers,
+            ACTIVE_PASS,
+            soft=soft,
+            entity_type=entity_type,
+            dry_run=dry_run,
+        )
 
-    if len(soft_deleted_urns) > 0 and not soft:
+    if num_soft_deleted_urns > 0 and not soft:
         click.echo("Starting to delete soft-deleted URNs")
-        for urn in progressbar.progressbar(soft_deleted_urns, redirect_stdout=True):
-            one_result = _delete_one_urn(
-                urn,
-                soft=soft,
+        _delete_urns_concurrently(
+            cli_utils.get_urns_by_filter(
+                env=env,
+                platform=platform,
+                search_query=search_query,
                 entity_type=entity_type,
-                dry_run=dry_run,
-                cached_session_host=(session, gms_host),
-                cached_emitter=emitter,
-                is_soft_deleted=True,
-            )
-            batch_deletion_result.merge(one_result)
+                only_soft_deleted=True,
+                start_after_urn=resume_after.get(SOFT_DELETED_PASS),
+            ),
+            num_soft_deleted_urns,
+            batch_deletion_result,
+            workers,
+            SOFT_DELETED_PASS,
+            soft=soft,
+            entity_type=entity_type,
+            dry_run=dry_run,
+            is_soft_deleted=True,
+        )
     batch_deletion_result.end()
 
     return batch_deletion_result
 
 
+def _delete_urns_concurrently(
+    urns: Iterable[str],
+    num_urns: int,
+    batch_deletion_result: DeletionResult,
+    workers: int,
+    deletion_pass: str,
+    **delete_args: Any,
+) -> None:
+    """
+    Deletes the urns, which must come in ascending order, with up to `workers` deletes in
+    flight at a time, and reports progress, throughput and ETA as it goes.
+
+    Results are collected in the order the urns were submitted, so the last collected urn
+    is a point that every earlier urn has been deleted by. If anything interrupts the
+    deletion, that urn is printed together with the deletion pass, so that it can be
+    passed to --resume-from.
+    """
+    start_time = time.time()
+    num_deleted = 0
+    last_deleted_urn: Optional[str] = None
+    in_flight: Deque[Tuple[str, Future]] = collections.deque()
+    progress = progressbar.ProgressBar(
+        max_value=num_urns,
+        widgets=[
+            progressbar.Percentage(),
+            " ",
+            progressbar.SimpleProgress(),
+            " ",
+            progressbar.Bar(),
+            " ",
+            progressbar.AdaptiveETA(),
+        ],
+        redirect_stdout=True,
+    )
+
+    # requests sessions aren't thread-safe, so every worker uses its own session and emitter
+    thread_local = threading.local()
+
+    def delete_one_urn(urn: str) -> DeletionResult:
+        if not hasattr(thread_local, "session_host"):
+            thread_local.session_host = cli_utils.get_session_and_host()
+            thread_local.emitter = rest_emitter.DatahubRestEmitter(
+                gms_server=thread_local.session_host[1], token=cli_utils.get_token()
+            )
+        return _delete_one_urn(
+            urn,
+            cached_session_host=thread_local.session_host,
+            cached_emitter=thread_local.emitter,
+            **delete_args,
+        )
+
+    def collect_oldest() -> None:
+        nonlocal num_deleted, last_deleted_urn
+        urn, future = in_flight.popleft()
+        batch_deletion_result.merge(future.result())
+        num_deleted += 1
+        last_deleted_urn = urn
+        # the filter may match more entities by now than it did when they were counted
+        progress.update(min(num_deleted, num_urns))
+
+    completed = False
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for urn in urns:
+                    if len(in_flight) >= 2 * workers:
+                        collect_oldest()
+                    in_flight.append((urn, executor.submit(delete_one_urn, urn)))
+                while in_flight:
+                    collect_oldest()
+            except BaseException:
+                for _, future in in_flight:
+                    future.cancel()
+                raise
+        completed = True
+    finally:
+        # finish first, so that the progress bar stops capturing stdout
+        progress.finish(dirty=True)
+        if not completed and last_deleted_urn is not None:
+            click.echo(
+                f"Deletion was interrupted. To continue where it left off, rerun with --resume-from '{deletion_pass}:{last_deleted_urn}'"
+            )
+
+    elapsed = max(time.time() - start_time, 1e-6)
+    click.echo(
+        f"Processed {num_deleted} entities in {elapsed:.1f} seconds ({num_deleted / elapsed:.1f} entities/sec)"
+    )
+
+
 def _delete_one_urn(
     urn: str,
     soft: bool = False,
@@ -1,12 +1,19 @@
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import IO, Any, ClassVar, Dict, List, Optional, Pattern, cast
+from typing import IO, Any, ClassVar, Dict, List, Optional, Pattern, Tuple, cast
 
 from cached_property import cached_property
-from pydantic import BaseModel, Extra, validator
+from pydantic import BaseModel, Extra, PrivateAttr, validator
 from pydantic.fields import Field
 
+from datahub.configuration.pattern_matcher import (
+    AllowDenySets,
+    CachedMatcher,
+    OrderedPatternList,
+    PatternMatchStats,
+)
+
 
 class ConfigModel(BaseModel):
     class Config:
@@ -153,15 +160,35 @@ class AllowDenyPattern(ConfigModel):
     def allow_all(cls) -> "AllowDenyPattern":
         return AllowDenyPattern()
 
-    def allowed(self, string: str) -> bool:
-        for deny_pattern in self.deny:
-            if re.match(deny_pattern, string, self.regex_flags):
-                return False
+    # Compiled from the patterns on first use, and again if they are changed later.
+    _matcher: Optional[CachedMatcher] = None
+    _matcher_source: Optional[Tuple[List[str], List[str], int]] = None
+    _stats: PatternMatchStats = PrivateAttr(default_factory=PatternMatchStats)
 
-        return any(
-            re.match(allow_pattern, string, self.regex_flags)
-            for allow_pattern in self.allow
-        )
+    @property
+    def stats(self) -> PatternMatchStats:
+        """How often this pattern was evaluated, and how long that took, for reports."""
+        return self._stats
+
+    def allowed(self, string: str) -> bool:
+        source = self._matcher_source
+        if (
+            self._matcher is None
+            or source is None
+            or source[0] != self.allow
+            or source[1] != self.deny
+            or source[2] != self.regex_flags
+        ):
+            self._matcher = CachedMatcher(
+                AllowDenySets(self.allow, self.deny, self.regex_flags).allowed,
+                self._stats,
+            )
+            self._matcher_source = (
+                list(self.allow),
+                list(self.deny),
+                self.regex_flags,
+            )
+        return self._matcher(string)
 
     def is_fully_specified_allow_list(self) -> bool:
         """
@@ -197,13 +224,30 @@ class KeyValuePattern(ConfigModel):
     def all(cls) -> "KeyValuePattern":
         return KeyValuePattern()
 
+    _matcher: Optional[CachedMatcher] = None
+    _matcher_source: Optional[List[str]] = None
+    _stats: PatternMatchStats = PrivateAttr(default_factory=PatternMatchStats)
+
+    @property
+    def stats(self) -> PatternMatchStats:
+        """How often this pattern was evaluated, and how long that took, for reports."""
+        return self._stats
+
+    def _first_matching_key(self, string: str) -> Optional[str]:
+        keys = list(self.rules.keys())
+        if self._matcher is None or self._matcher_source != keys:
+            self._matcher = CachedMatcher(
+                OrderedPatternList(keys).first_match, self._stats
+            )
+            self._matcher_source = keys
+        return self._matcher(string)
+
     def value(self, string: str) -> List[str]:
-        return next(
-            (self.rules[key] for key in self.rules.keys() if re.match(key, string)), []
-        )
+        key = self._first_matching_key(string)
+        return self.rules[key] if key is not None else []
 
     def matched(self, string: str) -> bool:
-        return any(re.match(key, string) for key in self.rules.keys())
+        return self._first_matching_key(string) is not None
 
     def is_fully_specified_key(self) -> bool:
         """
@@ -0,0 +1,195 @@
+import functools
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Pattern, Sequence
+
+# Patterns made of these characters, optionally anchored with ^ and $, can be checked
+# with plain string operations. Escaped dots are allowed too, unescaped ones are not
+# since they match any character.
+_LITERAL_PATTERN = re.compile(r"^\^?((?:[A-Za-z0-9 _-]|\\\.)+)(\$?)$")
+
+# Patterns that can't be safely joined into a single alternation: backreferences would
+# refer to the wrong groups and inline global flags would apply to every alternative.
+_UNCOMBINABLE_PATTERN = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+
+_MATCH_ALL_PATTERNS = {".*", "^.*"}
+
+DEFAULT_MATCH_CACHE_SIZE = 10_000
+
+
+@dataclass
+class PatternMatchStats:
+    calls: int = 0
+    cache_misses: int = 0
+    matched: int = 0
+    evaluation_time_sec: float = 0.0
+
+    def as_obj(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _Alternation:
+    """Finds the first of several regexes that matches a string with re.match."""
+
+    def __init__(self, patterns: Sequence[str], flags: int) -> None:
+        self.regexes: List[Pattern] = [
+            re.compile(pattern, flags) for pattern in patterns
+        ]
+        # Join the regexes into one, with an empty group after each alternative to tell
+        # which one matched.
+        self.combined: Optional[Pattern] = None
+        self.group_to_index: Dict[int, int] = {}
+        if len(self.regexes) > 1 and not any(
+            _UNCOMBINABLE_PATTERN.search(pattern) for pattern in patterns
+        ):
+            alternatives = []
+            group = 0
+            for i, regex in enumerate(self.regexes):
+                group += regex.groups + 1
+                self.group_to_index[group] = i
+                alternatives.append(f"(?:{regex.pattern})()")
+            try:
+                self.combined = re.compile("|".join(alternatives), flags)
+            except re.error:
+                self.combined = None
+
+    def first_match(self, string: str) -> Optional[int]:
+        if self.combined is not None:
+            match = self.combined.match(string)
+            if match is None:
+                return None
+            assert match.lastindex is not None
+            return self.group_to_index[match.lastindex]
+        for i, regex in enumerate(self.regexes):
+            if regex.match(string):
+                return i
+        return None
+
+
+class PatternSet:
+    """
+    A set of regexes, checked against strings with re.match, that matches a string if
+    any of them do.
+
+    Literal regexes are checked with a set lookup (when anchored with $) or a single
+    str.startswith, and the rest are joined into one alternation when that is safe.
+    """
+
+    def __init__(self, patterns: Sequence[str], flags: int) -> None:
+        self.ignore_case = bool(flags & re.IGNORECASE)
+        self.match_all = any(pattern in _MATCH_ALL_PATTERNS for pattern in patterns)
+
+        exact_literals = set()
+        prefix_literals = []
+        literal_patterns = []
+        regex_patterns = []
+        for pattern in patterns:
+            literal = _LITERAL_PATTERN.match(pattern)
+            if literal is None:
+                regex_patterns.append(pattern)
+                continue
+            literal_patterns.append(pattern)
+            text = literal.group(1).replace("\\.", ".")
+            if self.ignore_case:
+                text = text.lower()
+            if literal.group(2):
+                exact_literals.add(text)
+            else:
+                prefix_literals.append(text)
+        self.exact_literals: FrozenSet[str] = frozenset(exact_literals)
+        self.prefix_literals = tuple(prefix_literals)
+        self.regexes = _Alternation(regex_patterns, flags)
+        # IGNORECASE folds some non-ascii characters onto ascii ones, which lower() does
+        # not, so for those strings the literals are checked as regexes.
+        self.literal_regexes = (
+            _Alternation(literal_patterns, flags) if self.ignore_case else None
+        )
+
+    def _literal_match(self, string: str) -> bool:
+        if self.ignore_case:
+            if not string.isascii():
+                assert self.literal_regexes is not None
+                return self.literal_regexes.first_match(string) is not None
+            string = string.lower()
+        if string in self.exact_literals or (
+            # $ also matches right before a trailing newline
+            string.endswith("\n")
+            and string[:-1] in self.exact_literals
+        ):
+            return True
+        return string.startswith(self.prefix_literals)
+
+    def matches(self, string: str) -> bool:
+        return (
+            self.match_all
+            or self._literal_match(string)
+            or self.regexes.first_match(string) is not None
+        )
+
+
+class OrderedPatternList:
+    """A list of regexes, checked against strings with re.match, that finds the first one that matches."""
+
+    def __init__(self, patterns: Sequence[str], flags: int = 0) -> None:
+        self.patterns = list(patterns)
+        self.regexes = _Alternation(self.patterns, flags)
+
+    def first_match(self, string: str) -> Optional[str]:
+        index = self.regexes.first_match(string)
+        return self.patterns[index] if index is not None else None
+
+
+class CachedMatcher:
+    """
+    Memoizes a matching function in a bounded LRU and keeps PatternMatchStats for it.
+
+    The function must be picklable (e.g. a method of a PatternSet). The LRU is not, so it
+    is dropped when pickling and starts out empty again after unpickling.
+    """
+
+    def __init__(
+        self,
+        evaluate: Callable[[str], Any],
+        stats: PatternMatchStats,
+        cache_size: int = DEFAULT_MATCH_CACHE_SIZE,
+    ) -> None:
+        self.evaluate = evaluate
+        self.stats = stats
+        self.cache_size = cache_size
+        self._cached = functools.lru_cache(maxsize=cache_size)(self._timed_evaluate)
+
+    def _timed_evaluate(self, string: str) -> Any:
+        start = time.perf_counter()
+        result = self.evaluate(string)
+        self.stats.cache_misses += 1
+        self.stats.evaluation_time_sec += time.perf_counter() - start
+        return result
+
+    def __call__(self, string: str) -> Any:
+        result = self._cached(string)
+        self.stats.calls += 1
+        if result is not None and result is not False:
+            self.stats.matched += 1
+        return result
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "evaluate": self.evaluate,
+            "stats": self.stats,
+            "cache_size": self.cache_size,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore
+
+
+class AllowDenySets:
+    """The compiled form of an allow/deny pattern pair."""
+
+    def __init__(self, allow: Sequence[str], deny: Sequence[str], flags: int) -> None:
+        self.allow = PatternSet(allow, flags)
+        self.deny = PatternSet(deny, flags)
+
+    def allowed(self, string: str) -> bool:
+        return not self.deny.matches(string) and self.allow.matches(string)
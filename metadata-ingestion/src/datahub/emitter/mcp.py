@@ -1,6 +1,6 @@
 import dataclasses
 import json
-from typing import Union
+from typing import Any, Optional, Tuple, Union
 
 from datahub.emitter.serialization_helper import pre_json_transform
 from datahub.metadata.schema_classes import (
@@ -38,6 +38,19 @@ class MetadataChangeProposalWrapper:
     aspect: Union[None, _Aspect] = None
     systemMetadata: Union[None, SystemMetadataClass] = None
 
+    # Serialized (entityKeyAspect, aspect), memoized so that validating and then
+    # emitting a record only serializes its aspects once. Assigning either aspect
+    # invalidates it, so code that mutates an aspect in place after validation
+    # must reassign it (as transformers do) for the change to be picked up.
+    _serialized_aspects: Optional[
+        Tuple[Optional[GenericAspectClass], Optional[GenericAspectClass]]
+    ] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in {"entityKeyAspect", "aspect"}:
+            object.__setattr__(self, "_serialized_aspects", None)
+        object.__setattr__(self, name, value)
+
     def __post_init__(self) -> None:
         if not self.aspectName and self.aspect:
             self.aspectName = self.aspect.get_aspect_name()
@@ -50,14 +63,28 @@ class MetadataChangeProposalWrapper:
                 f"aspectName {self.aspectName} does not match aspect type {type(self.aspect)} with name {self.aspect.get_aspect_name()}"
             )
 
-    def make_mcp(self) -> MetadataChangeProposalClass:
-        serializedEntityKeyAspect: Union[None, GenericAspectClass] = None
-        if isinstance(self.entityKeyAspect, DictWrapper):
-            serializedEntityKeyAspect = _make_generic_aspect(self.entityKeyAspect)
+    def _serialize_aspects(
+        self,
+    ) -> Tuple[Optional[GenericAspectClass], Optional[GenericAspectClass]]:
+        if self._serialized_aspects is None:
+            serializedEntityKeyAspect: Union[None, GenericAspectClass] = None
+            if isinstance(self.entityKeyAspect, DictWrapper):
+                serializedEntityKeyAspect = _make_generic_aspect(self.entityKeyAspect)
+
+            serializedAspect = None
+            if self.aspect is not None:
+                serializedAspect = _make_generic_aspect(self.aspect)
 
-        serializedAspect = None
-        if self.aspect is not None:
-            serializedAspect = _make_generic_aspect(self.aspect)
+            object.__setattr__(
+                self,
+                "_serialized_aspects",
+                (serializedEntityKeyAspect, serializedAspect),
+            )
+        assert self._serialized_aspects is not None
+        return self._serialized_aspects
+
+    def make_mcp(self) -> MetadataChangeProposalClass:
+        serializedEntityKeyAspect, serializedAspect = self._serialize_aspects()
 
         return MetadataChangeProposalClass(
             entityType=self.entityType,
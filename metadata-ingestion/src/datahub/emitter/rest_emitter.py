@@ -4,7 +4,7 @@ import json
 import logging
 import os
 from json.decoder import JSONDecodeError
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
@@ -23,6 +23,28 @@ from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
 
 logger = logging.getLogger(__name__)
 
+_EmittableRecord = Union[
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+    MetadataChangeProposalWrapper,
+    UsageAggregation,
+]
+
+
+class BatchEntry(NamedTuple):
+    """A single record, serialized once, ready to be packed into a batch request.
+
+    `endpoint` identifies the batch endpoint the record must be sent to, and
+    `params` maps each array parameter of that endpoint to the record's JSON.
+    """
+
+    endpoint: str
+    params: Dict[str, str]
+
+    @property
+    def size(self) -> int:
+        return sum(len(value) for value in self.params.values())
+
 
 class DataHubRestEmitter:
     DEFAULT_CONNECT_TIMEOUT_SEC = 30  # 30 seconds should be plenty to connect
@@ -167,13 +189,7 @@ class DataHubRestEmitter:
             raise ConfigurationError(message)
 
     def emit(
-        self,
-        item: Union[
-            MetadataChangeEvent,
-            MetadataChangeProposal,
-            MetadataChangeProposalWrapper,
-            UsageAggregation,
-        ],
+        self, item: _EmittableRecord
     ) -> Tuple[datetime.datetime, datetime.datetime]:
         start_time = datetime.datetime.now()
         if isinstance(item, UsageAggregation):
@@ -187,6 +203,17 @@ class DataHubRestEmitter:
     def emit_mce(self, mce: MetadataChangeEvent) -> None:
         url = f"{self._gms_server}/entities?action=ingest"
 
+        mce_obj, system_metadata_obj = self._make_mce_objs(mce)
+        snapshot = {
+            "entity": mce_obj,
+            "systemMetadata": system_metadata_obj,
+        }
+        payload = json.dumps(snapshot)
+
+        self._emit_generic(url, payload)
+
+    @staticmethod
+    def _make_mce_objs(mce: MetadataChangeEvent) -> Tuple[dict, dict]:
         raw_mce_obj = mce.proposedSnapshot.to_obj()
         mce_obj = pre_json_transform(raw_mce_obj)
         snapshot_fqn = (
@@ -198,13 +225,7 @@ class DataHubRestEmitter:
                 "lastObserved": mce.systemMetadata.lastObserved,
                 "runId": mce.systemMetadata.runId,
             }
-        snapshot = {
-            "entity": {"value": {snapshot_fqn: mce_obj}},
-            "systemMetadata": system_metadata_obj,
-        }
-        payload = json.dumps(snapshot)
-
-        self._emit_generic(url, payload)
+        return {"value": {snapshot_fqn: mce_obj}}, system_metadata_obj
 
     def emit_mcp(
         self, mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
@@ -230,6 +251,70 @@ class DataHubRestEmitter:
         payload = json.dumps(snapshot)
         self._emit_generic(url, payload)
 
+    def make_batch_entry(self, item: _EmittableRecord) -> BatchEntry:
+        """Serializes a record for use with emit_batch_entries().
+
+        Records are serialized exactly once, so that callers can bound batches by
+        payload size without paying for a second serialization pass.
+        """
+        if isinstance(item, UsageAggregation):
+            return BatchEntry(
+                endpoint="/usageStats?action=batchIngest",
+                params={"buckets": json.dumps(pre_json_transform(item.to_obj()))},
+            )
+        elif isinstance(item, (MetadataChangeProposal, MetadataChangeProposalWrapper)):
+            return BatchEntry(
+                endpoint="/aspects?action=ingestProposalBatch",
+                params={"proposals": json.dumps(pre_json_transform(item.to_obj()))},
+            )
+        else:
+            mce_obj, system_metadata_obj = self._make_mce_objs(item)
+            return BatchEntry(
+                endpoint="/entities?action=batchIngest",
+                params={
+                    "entities": json.dumps(mce_obj),
+                    "systemMetadata": json.dumps(system_metadata_obj),
+                },
+            )
+
+    def emit_batch_entries(
+        self, entries: Sequence[BatchEntry]
+    ) -> Tuple[datetime.datetime, datetime.datetime]:
+        """Emits pre-serialized records that share an endpoint in a single request."""
+        start_time = datetime.datetime.now()
+        if entries:
+            endpoints = {entry.endpoint for entry in entries}
+            if len(endpoints) != 1:
+                raise ValueError(
+                    f"All entries in a batch must target the same endpoint, got {endpoints}"
+                )
+            url = f"{self._gms_server}{entries[0].endpoint}"
+            # The entries are already valid JSON, so the envelope is assembled by
+            # hand rather than decoding and re-encoding every record.
+            payload = (
+                "{"
+                + ", ".join(
+                    f'"{param}": [{", ".join(entry.params[param] for entry in entries)}]'
+                    for param in entries[0].params
+                )
+                + "}"
+            )
+            self._emit_generic(url, payload)
+        return start_time, datetime.datetime.now()
+
+    def emit_batch(
+        self, items: Sequence[_EmittableRecord]
+    ) -> Tuple[datetime.datetime, datetime.datetime]:
+        """Emits records using one batch request per record type."""
+        start_time = datetime.datetime.now()
+        entries_by_endpoint: Dict[str, List[BatchEntry]] = {}
+        for item in items:
+            entry = self.make_batch_entry(item)
+            entries_by_endpoint.setdefault(entry.endpoint, []).append(entry)
+        for entries in entries_by_endpoint.values():
+            self.emit_batch_entries(entries)
+        return start_time, datetime.datetime.now()
+
     def _emit_generic(self, url: str, payload: str) -> None:
         curl_command = _make_curl_command(self._session, "POST", url, payload)
         logger.debug(
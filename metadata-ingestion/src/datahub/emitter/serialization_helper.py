@@ -1,34 +1,75 @@
-from collections import OrderedDict
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
+
+# Keys seen by a transformer are almost always schema names (record fields and
+# union member types), so the set of distinct keys is bounded by the schema. Map
+# fields can contain arbitrary user keys, so we still cap the mapping size.
+_MAX_CACHED_KEYS = 100_000
+
+
+class _JsonTransformer:
+    """Rewrites the namespace of union member keys in avro-serialized json.
+
+    Whether a key needs rewriting, and what it is rewritten to, is computed once per
+    distinct key and then looked up from a precomputed mapping, which avoids
+    re-running string prefix checks and replacements for every object in the tree.
+    """
+
+    _instances: Dict[Tuple[str, str], "_JsonTransformer"] = {}
+
+    def __init__(self, from_pattern: str, to_pattern: str) -> None:
+        self.from_pattern = from_pattern
+        self.to_pattern = to_pattern
+        self._key_mapping: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def get(cls, from_pattern: str, to_pattern: str) -> "_JsonTransformer":
+        key = (from_pattern, to_pattern)
+        transformer = cls._instances.get(key)
+        if transformer is None:
+            transformer = cls(from_pattern, to_pattern)
+            cls._instances[key] = transformer
+        return transformer
+
+    def _rewrite_key(self, key: str) -> Optional[str]:
+        try:
+            return self._key_mapping[key]
+        except KeyError:
+            new_key: Optional[str] = None
+            if key.startswith(self.from_pattern):
+                new_key = key.replace(self.from_pattern, self.to_pattern, 1)
+            if len(self._key_mapping) < _MAX_CACHED_KEYS:
+                self._key_mapping[key] = new_key
+            return new_key
+
+    def transform(self, obj: Any) -> Any:
+        if obj is None or isinstance(obj, (str, int, float)):
+            return obj
+        elif isinstance(obj, dict):
+            if len(obj) == 1:
+                ((key, value),) = obj.items()
+                new_key = self._rewrite_key(key)
+                if new_key is not None:
+                    return {new_key: self.transform(value)}
+
+            if "fieldDiscriminator" in obj:
+                # Field discriminators are used for unions between primitive types.
+                field = obj["fieldDiscriminator"]
+                return {field: self.transform(obj[field])}
+
+            return {
+                key: self.transform(value)
+                for key, value in obj.items()
+                if value is not None
+            }
+        elif isinstance(obj, list):
+            return [self.transform(item) for item in obj]
+        elif isinstance(obj, bytes):
+            return obj.decode()
+        return obj
 
 
 def _json_transform(obj: Any, from_pattern: str, to_pattern: str) -> Any:
-    if isinstance(obj, (dict, OrderedDict)):
-        if len(obj.keys()) == 1:
-            key: str = list(obj.keys())[0]
-            value = obj[key]
-            if key.startswith(from_pattern):
-                new_key = key.replace(from_pattern, to_pattern, 1)
-                return {new_key: _json_transform(value, from_pattern, to_pattern)}
-
-        if "fieldDiscriminator" in obj:
-            # Field discriminators are used for unions between primitive types.
-            field = obj["fieldDiscriminator"]
-            return {field: _json_transform(obj[field], from_pattern, to_pattern)}
-
-        new_obj: Any = {
-            key: _json_transform(value, from_pattern, to_pattern)
-            for key, value in obj.items()
-            if value is not None
-        }
-
-        return new_obj
-    elif isinstance(obj, list):
-        new_obj = [_json_transform(item, from_pattern, to_pattern) for item in obj]
-        return new_obj
-    elif isinstance(obj, bytes):
-        return obj.decode()
-    return obj
+    return _JsonTransformer.get(from_pattern, to_pattern).transform(obj)
 
 
 def pre_json_transform(obj: Any) -> Any:
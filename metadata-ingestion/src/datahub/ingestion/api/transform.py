@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Iterable
+from typing import Iterable, List, Optional
 
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.report import Report
 
 
 class Transformer:
@@ -19,3 +20,11 @@ class Transformer:
     @abstractmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
         pass
+
+    def get_report(self) -> Optional[Report]:
+        """Transformers that keep track of stats can return them here to have them included in the pipeline summary."""
+        return None
+
+    def prefetch(self, entity_urns: List[str]) -> None:
+        """Called with the urns of upcoming records before they are transformed. Transformers that look up server state can fetch it for all of them at once here."""
+        pass
@@ -0,0 +1,77 @@
+import collections
+import threading
+import time
+from typing import Optional, Tuple
+
+from datahub.metadata.schema_classes import _Aspect
+
+# (entity urn, aspect name)
+_CacheKey = Tuple[str, str]
+
+
+class AspectCache:
+    """
+    A bounded, expiring cache of aspects fetched from DataHub.
+
+    Entries are keyed by entity urn and aspect name and hold the aspect, or None when the
+    server has no such aspect for the entity. The least recently used entries are evicted
+    once there are more than max_entries of them, and entries older than ttl_sec are
+    treated as missing.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10_000
+    DEFAULT_TTL_SEC = 300
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "collections.OrderedDict[_CacheKey, Tuple[float, Optional[_Aspect]]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, entity_urn: str, aspect_name: str) -> Tuple[bool, Optional[_Aspect]]:
+        """Returns whether the aspect is cached, and the cached aspect if it is."""
+        key = (entity_urn, aspect_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, aspect = entry
+                if time.monotonic() - stored_at <= self.ttl_sec:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, aspect
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, entity_urn: str, aspect_name: str, aspect: Optional[_Aspect]) -> None:
+        key = (entity_urn, aspect_name)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), aspect)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, entity_urn: str, aspect_name: str) -> None:
+        with self._lock:
+            self._entries.pop((entity_urn, aspect_name), None)
+
+    def contains(self, entity_urn: str, aspect_name: str) -> bool:
+        """Like get, but without touching the statistics or the recency of the entry."""
+        with self._lock:
+            entry = self._entries.get((entity_urn, aspect_name))
+            return entry is not None and time.monotonic() - entry[0] <= self.ttl_sec
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,8 +1,20 @@
+import datetime
 import json
 import logging
 import os
 from json.decoder import JSONDecodeError
-from typing import Any, Dict, Iterable, List, Optional, Type
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from avro.schema import RecordSchema
 from deprecated import deprecated
@@ -11,8 +23,14 @@ from requests.models import HTTPError
 
 from datahub.configuration.common import ConfigModel, OperationalError
 from datahub.emitter.mce_builder import Aspect
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.rest_emitter import DatahubRestEmitter, _EmittableRecord
 from datahub.emitter.serialization_helper import post_json_transform
+from datahub.ingestion.graph.aspect_cache import AspectCache
+from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+)
 from datahub.metadata.schema_classes import (
     DatasetUsageStatisticsClass,
     DomainPropertiesClass,
@@ -44,6 +62,9 @@ class DatahubClientConfig(ConfigModel):
     ca_certificate_path: Optional[str]
     max_threads: int = 1
     disable_ssl_verification: bool = False
+    prefetch_batch_size: int = 50
+    aspect_cache_max_entries: int = AspectCache.DEFAULT_MAX_ENTRIES
+    aspect_cache_ttl_sec: int = AspectCache.DEFAULT_TTL_SEC
 
 
 class DataHubGraph(DatahubRestEmitter):
@@ -59,6 +80,12 @@ class DataHubGraph(DatahubRestEmitter):
             extra_headers=self.config.extra_headers,
             ca_certificate_path=self.config.ca_certificate_path,
         )
+        # Only populated by prefetch_aspects and only read with use_prefetched, so other
+        # callers always see the server's current state.
+        self.aspect_cache = AspectCache(
+            max_entries=self.config.aspect_cache_max_entries,
+            ttl_sec=self.config.aspect_cache_ttl_sec,
+        )
         self.test_connection()
         if not telemetry_enabled:
             self.server_id = "missing"
@@ -136,6 +163,7 @@ class DataHubGraph(DatahubRestEmitter):
         aspect_type: Type[Aspect],
         aspect: str,
         aspect_type_name: Optional[str] = None,
+        use_prefetched: bool = False,
     ) -> Optional[Aspect]:
         """
         Get an aspect for an entity.
@@ -144,10 +172,15 @@ class DataHubGraph(DatahubRestEmitter):
         :param Type[Aspect] aspect_type: The type class of the aspect being requested (e.g. datahub.metadata.schema_classes.DatasetProperties)
         :param str aspect: The name of the aspect being requested (e.g. schemaMetadata, datasetProperties, etc.)
         :param Optional[str] aspect_type_name: The fully qualified classname of the aspect being requested. Typically not needed and extracted automatically from the class directly. (e.g. com.linkedin.common.DatasetProperties)
+        :param bool use_prefetched: Whether to return the aspect fetched by prefetch_aspects, if any. Such an aspect can be up to aspect_cache_ttl_sec old, unless this graph emitted a change to it since.
         :return: the Aspect as a dictionary if present, None if no aspect was found (HTTP status 404)
         :rtype: Optional[Aspect]
         :raises HttpError: if the HTTP response is not a 200 or a 404
         """
+        if use_prefetched:
+            is_cached, cached_aspect = self.aspect_cache.get(entity_urn, aspect)
+            if is_cached:
+                return cast(Optional[Aspect], cached_aspect)
         url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version=0"
         response = self._session.get(url)
         if response.status_code == 404:
@@ -175,14 +208,104 @@ class DataHubGraph(DatahubRestEmitter):
                 f"Failed to find {aspect_type_name} in response {response_json}"
             )
 
+    def prefetch_aspects(
+        self, entity_urns: Iterable[str], aspect_types: List[Type[Aspect]]
+    ) -> None:
+        """
+        Fetch the given aspects for many entities at once and keep them in the aspect cache,
+        so that subsequent get_aspect_v2 calls for them with use_prefetched don't need a
+        request each.
+
+        Urns whose aspects are already cached are skipped, and the rest are requested in
+        batches of prefetch_batch_size. Failures are logged and otherwise ignored, since
+        get_aspect_v2 falls back to fetching uncached aspects one at a time.
+
+        :param Iterable[str] entity_urns: The urns of the entities
+        :param List[Type[Aspect]] aspect_types: The type classes of the aspects to fetch (e.g. [datahub.metadata.schema_classes.OwnershipClass])
+        """
+        aspect_names = [aspect_type.get_aspect_name() for aspect_type in aspect_types]
+        urns_to_fetch = list(
+            dict.fromkeys(
+                urn
+                for urn in entity_urns
+                if not all(
+                    self.aspect_cache.contains(urn, aspect_name)
+                    for aspect_name in aspect_names
+                )
+            )
+        )
+        batch_size = self.config.prefetch_batch_size
+        for i in range(0, len(urns_to_fetch), batch_size):
+            batch = urns_to_fetch[i : i + batch_size]
+            try:
+                self._prefetch_batch(batch, aspect_types)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch aspects {aspect_names}: {e}")
+
+    def _prefetch_batch(
+        self, entity_urns: List[str], aspect_types: List[Type[Aspect]]
+    ) -> None:
+        aspect_names = [aspect_type.get_aspect_name() for aspect_type in aspect_types]
+        ids_list = ",".join(Urn.url_encode(urn) for urn in entity_urns)
+        aspects_list = ",".join(aspect_names)
+        url: str = f"{self._gms_server}/entitiesV2?ids=List({ids_list})&aspects=List({aspects_list})"
+        response_json = self._get_generic(url)
+
+        results = response_json.get("results", {})
+        errors = response_json.get("errors", {})
+        for urn in entity_urns:
+            if urn in errors:
+                # leave it to be fetched on its own
+                continue
+            entity_aspects = results.get(urn, {}).get("aspects", {})
+            for aspect_name, aspect_type in zip(aspect_names, aspect_types):
+                aspect_json = entity_aspects.get(aspect_name)
+                aspect_value: Optional[Aspect] = None
+                if aspect_json:
+                    # need to apply a transform to the response to match rest.li and avro serialization
+                    post_json_obj = post_json_transform(aspect_json)
+                    aspect_value = aspect_type.from_obj(post_json_obj["value"])
+                self.aspect_cache.put(urn, aspect_name, aspect_value)
+
+    def emit_mce(self, mce: MetadataChangeEvent) -> None:
+        super().emit_mce(mce)
+        self._invalidate_cached_aspects(mce)
+
+    def emit_mcp(
+        self, mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+    ) -> None:
+        super().emit_mcp(mcp)
+        self._invalidate_cached_aspects(mcp)
+
+    def emit_batch(
+        self, items: Sequence[_EmittableRecord]
+    ) -> Tuple[datetime.datetime, datetime.datetime]:
+        times = super().emit_batch(items)
+        for item in items:
+            self._invalidate_cached_aspects(item)
+        return times
+
+    def _invalidate_cached_aspects(self, item: _EmittableRecord) -> None:
+        if isinstance(item, MetadataChangeEvent):
+            for aspect in item.proposedSnapshot.aspects:
+                self.aspect_cache.invalidate(
+                    item.proposedSnapshot.urn, aspect.get_aspect_name()
+                )
+        elif isinstance(item, (MetadataChangeProposal, MetadataChangeProposalWrapper)):
+            if item.entityUrn and item.aspectName:
+                self.aspect_cache.invalidate(item.entityUrn, item.aspectName)
+
     def get_config(self) -> Dict[str, Any]:
         return self._get_generic(f"{self.config.server}/config")
 
-    def get_ownership(self, entity_urn: str) -> Optional[OwnershipClass]:
+    def get_ownership(
+        self, entity_urn: str, use_prefetched: bool = False
+    ) -> Optional[OwnershipClass]:
         return self.get_aspect_v2(
             entity_urn=entity_urn,
             aspect="ownership",
             aspect_type=OwnershipClass,
+            use_prefetched=use_prefetched,
         )
 
     def get_domain_properties(self, entity_urn: str) -> Optional[DomainPropertiesClass]:
@@ -206,11 +329,14 @@ class DataHubGraph(DatahubRestEmitter):
             aspect_type=GlossaryTermsClass,
         )
 
-    def get_domain(self, entity_urn: str) -> Optional[DomainsClass]:
+    def get_domain(
+        self, entity_urn: str, use_prefetched: bool = False
+    ) -> Optional[DomainsClass]:
         return self.get_aspect_v2(
             entity_urn=entity_urn,
             aspect="domains",
             aspect_type=DomainsClass,
+            use_prefetched=use_prefetched,
         )
 
     def get_usage_aspects_from_urn(
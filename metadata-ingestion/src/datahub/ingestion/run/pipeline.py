@@ -4,7 +4,7 @@ import platform
 import sys
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import click
 
@@ -15,8 +15,9 @@ from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnv
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, WriteCallback
-from datahub.ingestion.api.source import Extractor, Source
+from datahub.ingestion.api.source import Extractor, Source, WorkUnit
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
 from datahub.ingestion.reporting.reporting_provider_registry import (
     reporting_provider_registry,
@@ -25,8 +26,12 @@ from datahub.ingestion.run.pipeline_config import PipelineConfig, ReporterConfig
 from datahub.ingestion.sink.file import FileSink, FileSinkConfig
 from datahub.ingestion.sink.sink_registry import sink_registry
 from datahub.ingestion.source.source_registry import source_registry
+from datahub.ingestion.transformer.base_transformer import BaseTransformer
 from datahub.ingestion.transformer.transform_registry import transform_registry
-from datahub.metadata.schema_classes import MetadataChangeProposalClass
+from datahub.metadata.schema_classes import (
+    MetadataChangeEventClass,
+    MetadataChangeProposalClass,
+)
 from datahub.telemetry import stats, telemetry
 
 logger = logging.getLogger(__name__)
@@ -217,9 +222,18 @@ class Pipeline:
                 transformer_type = transformer.type
                 transformer_class = transform_registry.get(transformer_type)
                 transformer_config = transformer.dict().get("config", {})
-                self.transformers.append(
-                    transformer_class.create(transformer_config, self.ctx)
+                transformer_instance = transformer_class.create(
+                    transformer_config, self.ctx
                 )
+                if transformer.spill_threshold is not None:
+                    if not isinstance(transformer_instance, BaseTransformer):
+                        raise ValueError(
+                            f"Transformer type:{transformer_type} does not support spill_threshold"
+                        )
+                    transformer_instance.entity_tracker.spill_threshold = (
+                        transformer.spill_threshold
+                    )
+                self.transformers.append(transformer_instance)
                 logger.debug(
                     f"Transformer type:{transformer_type},{transformer_class} configured"
                 )
@@ -335,9 +349,11 @@ class Pipeline:
                     self.ctx, self.config.failure_log.log_config
                 )
             )
-            for wu in itertools.islice(
-                self.source.get_workunits(),
-                self.preview_workunits if self.preview_mode else None,
+            for wu in self._prefetch_ahead(
+                itertools.islice(
+                    self.source.get_workunits(),
+                    self.preview_workunits if self.preview_mode else None,
+                )
             ):
                 if self._time_to_print():
                     self.pretty_print_summary(currently_running=True)
@@ -388,6 +404,41 @@ class Pipeline:
 
             self._notify_reporters_on_ingestion_completion()
 
+    def _prefetch_ahead(self, workunits: Iterable[WorkUnit]) -> Iterable[WorkUnit]:
+        """
+        Reads workunits a window at a time and lets the transformers prefetch the server
+        state they need for the whole window, before passing the workunits on.
+        """
+        if self.ctx.graph is None or not self.transformers:
+            yield from workunits
+            return
+
+        window_size = self.ctx.graph.config.prefetch_batch_size
+        window: List[WorkUnit] = []
+        for wu in workunits:
+            window.append(wu)
+            if len(window) >= window_size:
+                self._prefetch_for_transformers(window)
+                yield from window
+                window = []
+        if window:
+            self._prefetch_for_transformers(window)
+            yield from window
+
+    def _prefetch_for_transformers(self, workunits: List[WorkUnit]) -> None:
+        entity_urns: List[str] = []
+        for wu in workunits:
+            if not isinstance(wu, MetadataWorkUnit):
+                continue
+            if isinstance(wu.metadata, MetadataChangeEventClass):
+                entity_urns.append(wu.metadata.proposedSnapshot.urn)
+            elif wu.metadata.entityUrn:
+                entity_urns.append(wu.metadata.entityUrn)
+        if not entity_urns:
+            return
+        for transformer in self.transformers:
+            transformer.prefetch(entity_urns)
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
@@ -492,6 +543,9 @@ class Pipeline:
         click.echo(self.source.get_report().as_string())
         click.secho(f"Sink ({self.config.sink.type}) report:", bold=True)
         click.echo(self.sink.get_report().as_string())
+        for transformer_type, report in self._get_transformer_reports():
+            click.secho(f"Transformer ({transformer_type}) report:", bold=True)
+            click.echo(report.as_string())
         click.echo()
         workunits_produced = self.source.get_report().events_produced
         duration_message = (
@@ -534,8 +588,18 @@ class Pipeline:
             )
             return 0
 
+    def _get_transformer_reports(self) -> List[Tuple[str, Report]]:
+        reports = []
+        for transformer_config, transformer in zip(
+            self.config.transformers or [], self.transformers
+        ):
+            report = transformer.get_report()
+            if report is not None:
+                reports.append((transformer_config.type, report))
+        return reports
+
     def _get_structured_report(self) -> Dict[str, Any]:
-        return {
+        structured_report: Dict[str, Any] = {
             "source": {
                 "type": self.config.source.type,
                 "report": self.source.get_report().as_obj(),
@@ -545,3 +609,10 @@ class Pipeline:
                 "report": self.sink.get_report().as_obj(),
             },
         }
+        transformer_reports = self._get_transformer_reports()
+        if transformer_reports:
+            structured_report["transformers"] = [
+                {"type": transformer_type, "report": report.as_obj()}
+                for transformer_type, report in transformer_reports
+            ]
+        return structured_report
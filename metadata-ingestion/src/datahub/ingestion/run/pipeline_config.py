@@ -29,6 +29,19 @@ class ReporterConfig(DynamicTypedConfig):
     )
 
 
+class TransformerConfig(DynamicTypedConfig):
+    spill_threshold: Optional[int] = Field(
+        None,
+        description="Only applies to transformers that emit aspects for unseen entities at the end of the stream. Once more than this many entities are pending, they are moved to a temporary on-disk database. Defaults to the DATAHUB_TRANSFORMER_SPILL_THRESHOLD environment variable, or to keeping them all in memory.",
+    )
+
+    @validator("spill_threshold")
+    def spill_threshold_positive(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and v < 1:
+            raise ValueError("spill_threshold must be at least 1")
+        return v
+
+
 class FailureLoggingConfig(ConfigModel):
     enabled: bool = Field(
         False,
@@ -44,7 +57,7 @@ class PipelineConfig(ConfigModel):
 
     source: SourceConfig
     sink: DynamicTypedConfig
-    transformers: Optional[List[DynamicTypedConfig]]
+    transformers: Optional[List[TransformerConfig]]
     reporting: List[ReporterConfig] = []
     run_id: str = DEFAULT_RUN_ID
     datahub_api: Optional[DatahubClientConfig] = None
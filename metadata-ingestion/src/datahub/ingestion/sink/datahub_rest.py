@@ -2,19 +2,20 @@ import concurrent.futures
 import contextlib
 import functools
 import logging
+import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import Enum
-from threading import BoundedSemaphore
-from typing import Union, cast
+from threading import BoundedSemaphore, Event, Lock, Thread
+from typing import Dict, List, Optional, Sequence, Union, cast
 
 from pydantic import validator
 
 from datahub.cli.cli_utils import set_env_variables_override_config
 from datahub.configuration.common import ConfigurationError, OperationalError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.rest_emitter import BatchEntry, DatahubRestEmitter
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope, WorkUnit
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -32,12 +33,18 @@ logger = logging.getLogger(__name__)
 class SyncOrAsync(Enum):
     SYNC = "SYNC"
     ASYNC = "ASYNC"
+    ASYNC_BATCH = "ASYNC_BATCH"
 
 
 class DatahubRestSinkConfig(DatahubClientConfig):
     max_pending_requests: int = 1000
     mode: SyncOrAsync = SyncOrAsync.ASYNC
 
+    # Only used in ASYNC_BATCH mode. A batch is sent as soon as any of these is hit.
+    max_batch_records: int = 100
+    max_batch_bytes: int = 1024 * 1024
+    max_batch_linger_sec: float = 1.0
+
     @validator("mode", pre=True)
     def str_to_enum_value(cls, v):
         if v and isinstance(v, str):
@@ -48,6 +55,8 @@ class DatahubRestSinkConfig(DatahubClientConfig):
 class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
     pending_requests: int = 0
+    batches_written: int = 0
+    batch_fallbacks: int = 0
 
     def compute_stats(self) -> None:
         super().compute_stats()
@@ -87,6 +96,28 @@ class BoundedExecutor:
         self.executor.shutdown(wait)
 
 
+@dataclass
+class _RecordBatch:
+    """Records waiting to be sent together to a single batch endpoint."""
+
+    created_at: float = field(default_factory=time.monotonic)
+    record_envelopes: List[RecordEnvelope] = field(default_factory=list)
+    write_callbacks: List[WriteCallback] = field(default_factory=list)
+    entries: List[BatchEntry] = field(default_factory=list)
+    size: int = 0
+
+    def add(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        entry: BatchEntry,
+    ) -> None:
+        self.record_envelopes.append(record_envelope)
+        self.write_callbacks.append(write_callback)
+        self.entries.append(entry)
+        self.size += entry.size
+
+
 @dataclass
 class DatahubRestSink(Sink):
     config: DatahubRestSinkConfig
@@ -131,6 +162,16 @@ class DatahubRestSink(Sink):
             bound=self.config.max_pending_requests,
         )
 
+        self._batches: Dict[str, _RecordBatch] = {}
+        self._batches_lock = Lock()
+        self._linger_stop = Event()
+        self._linger_thread: Optional[Thread] = None
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self._linger_thread = Thread(
+                target=self._flush_lingering_batches, daemon=True
+            )
+            self._linger_thread.start()
+
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "DatahubRestSink":
         config = DatahubRestSinkConfig.parse_obj(config_dict)
@@ -163,32 +204,131 @@ class DatahubRestSink(Sink):
                 self.report.report_record_written(record_envelope)
                 self.report.report_write_latency(end_time - start_time)
                 write_callback.on_success(record_envelope, {})
-            elif isinstance(e, OperationalError):
-                # only OperationalErrors should be ignored
-                # trim exception stacktraces in all cases when reporting
-                if "stackTrace" in e.info:
-                    with contextlib.suppress(Exception):
-                        e.info["stackTrace"] = "\n".join(
-                            e.info["stackTrace"].split("\n")[:3]
-                        )
-
-                if not self.treat_errors_as_warnings:
-                    self.report.report_failure({"error": e.message, "info": e.info})
+            else:
+                self._handle_write_failure(record_envelope, write_callback, e)
+
+    def _handle_write_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        e: BaseException,
+    ) -> None:
+        if isinstance(e, OperationalError):
+            # only OperationalErrors should be ignored
+            # trim exception stacktraces in all cases when reporting
+            if "stackTrace" in e.info:
+                with contextlib.suppress(Exception):
+                    e.info["stackTrace"] = "\n".join(
+                        e.info["stackTrace"].split("\n")[:3]
+                    )
+
+            if not self.treat_errors_as_warnings:
+                self.report.report_failure({"error": e.message, "info": e.info})
+            else:
+                record = record_envelope.record
+                if isinstance(record, MetadataChangeProposalWrapper):
+                    # include information about the entity that failed
+                    entity_id = cast(MetadataChangeProposalWrapper, record).entityUrn
+                    e.info["id"] = entity_id
                 else:
-                    record = record_envelope.record
-                    if isinstance(record, MetadataChangeProposalWrapper):
-                        # include information about the entity that failed
-                        entity_id = cast(
-                            MetadataChangeProposalWrapper, record
-                        ).entityUrn
-                        e.info["id"] = entity_id
-                    else:
-                        entity_id = None
-                    self.report.report_warning({"warning": e.message, "info": e.info})
-                write_callback.on_failure(record_envelope, e, e.info)
+                    entity_id = None
+                self.report.report_warning({"warning": e.message, "info": e.info})
+            write_callback.on_failure(record_envelope, e, e.info)
+        else:
+            self.report.report_failure({"e": e})
+            write_callback.on_failure(record_envelope, Exception(e), {})
+
+    def _emit_batch(self, batch: _RecordBatch) -> List[Optional[Exception]]:
+        """Sends a batch, returning the error (if any) for each of its records."""
+        try:
+            start_time, end_time = self.emitter.emit_batch_entries(batch.entries)
+            self.report.report_write_latency(end_time - start_time)
+            return [None] * len(batch.entries)
+        except OperationalError as e:
+            # A single bad record fails the whole batch, and older GMS versions
+            # may not support the batch endpoint at all. Fall back to one request
+            # per record so that failures are attributed to the right records.
+            # Batches are not atomic, so records before the failing one may have
+            # been applied already. Sending them again is harmless for upserts.
+            logger.debug(f"Batch write failed, retrying records individually: {e}")
+            self.report.batch_fallbacks += 1
+            errors: List[Optional[Exception]] = []
+            for record_envelope in batch.record_envelopes:
+                try:
+                    self.emitter.emit(record_envelope.record)
+                    errors.append(None)
+                except Exception as record_error:
+                    errors.append(record_error)
+            return errors
+
+    def _write_batch_done_callback(
+        self,
+        batch: _RecordBatch,
+        future: concurrent.futures.Future,
+    ) -> None:
+        self.report.pending_requests -= 1
+        if future.cancelled():
+            errors: Sequence[Optional[BaseException]] = [
+                OperationalError("future was cancelled")
+            ] * len(batch.entries)
+        elif future.exception():
+            errors = [future.exception()] * len(batch.entries)
+        else:
+            errors = future.result()
+            self.report.batches_written += 1
+
+        for record_envelope, write_callback, error in zip(
+            batch.record_envelopes, batch.write_callbacks, errors
+        ):
+            if error is None:
+                self.report.report_record_written(record_envelope)
+                write_callback.on_success(record_envelope, {})
             else:
-                self.report.report_failure({"e": e})
-                write_callback.on_failure(record_envelope, Exception(e), {})
+                self._handle_write_failure(record_envelope, write_callback, error)
+
+    def _submit_batch(self, batch: _RecordBatch) -> None:
+        write_future = self.executor.submit(self._emit_batch, batch)
+        write_future.add_done_callback(
+            functools.partial(self._write_batch_done_callback, batch)
+        )
+        self.report.pending_requests += 1
+
+    def _add_to_batch(
+        self, record_envelope: RecordEnvelope, write_callback: WriteCallback
+    ) -> None:
+        entry = self.emitter.make_batch_entry(record_envelope.record)
+        full_batches = []
+        with self._batches_lock:
+            batch = self._batches.get(entry.endpoint)
+            if (
+                batch is not None
+                and batch.size + entry.size > self.config.max_batch_bytes
+            ):
+                full_batches.append(self._batches.pop(entry.endpoint))
+                batch = None
+            if batch is None:
+                batch = self._batches.setdefault(entry.endpoint, _RecordBatch())
+            batch.add(record_envelope, write_callback, entry)
+            if len(batch.entries) >= self.config.max_batch_records:
+                full_batches.append(self._batches.pop(entry.endpoint))
+        for full_batch in full_batches:
+            self._submit_batch(full_batch)
+
+    def _flush_batches(self, max_created_at: Optional[float] = None) -> None:
+        with self._batches_lock:
+            ready = [
+                endpoint
+                for endpoint, batch in self._batches.items()
+                if max_created_at is None or batch.created_at <= max_created_at
+            ]
+            batches = [self._batches.pop(endpoint) for endpoint in ready]
+        for batch in batches:
+            self._submit_batch(batch)
+
+    def _flush_lingering_batches(self) -> None:
+        linger_sec = self.config.max_batch_linger_sec
+        while not self._linger_stop.wait(timeout=linger_sec / 2):
+            self._flush_batches(max_created_at=time.monotonic() - linger_sec)
 
     def write_record_async(
         self,
@@ -203,7 +343,9 @@ class DatahubRestSink(Sink):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        if self.config.mode == SyncOrAsync.ASYNC:
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self._add_to_batch(record_envelope, write_callback)
+        elif self.config.mode == SyncOrAsync.ASYNC:
             write_future = self.executor.submit(self.emitter.emit, record)
             write_future.add_done_callback(
                 functools.partial(
@@ -223,6 +365,10 @@ class DatahubRestSink(Sink):
         return self.report
 
     def close(self):
+        if self._linger_thread is not None:
+            self._linger_stop.set()
+            self._linger_thread.join()
+        self._flush_batches()
         self.executor.shutdown(wait=True)
 
     def __repr__(self) -> str:
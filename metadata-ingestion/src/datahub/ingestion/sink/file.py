@@ -1,6 +1,6 @@
+import io
 import json
 import logging
-import pathlib
 from typing import Union
 
 from datahub.configuration.common import ConfigModel
@@ -12,6 +12,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.utilities.json_files import CompressedFile, is_json_lines_file
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +30,14 @@ class FileSink(Sink):
         self.config = config
         self.report = SinkReport()
 
-        fpath = pathlib.Path(self.config.filename)
-        self.file = fpath.open("w")
-        self.file.write("[\n")
+        # Files named *.jsonl get one compact record per line, so that the file is
+        # valid after every record and can be read back line by line. A .gz or .zst
+        # extension compresses the output.
+        self.json_lines = is_json_lines_file(self.config.filename)
+        self.compressed_file = CompressedFile(self.config.filename, "wb")
+        self.file = io.TextIOWrapper(self.compressed_file.stream, encoding="utf-8")
+        if not self.json_lines:
+            self.file.write("[\n")
         self.wrote_something = False
 
     @classmethod
@@ -60,10 +66,14 @@ class FileSink(Sink):
         record = record_envelope.record
         obj = record.to_obj()
 
-        if self.wrote_something:
-            self.file.write(",\n")
+        if self.json_lines:
+            self.file.write(json.dumps(obj, separators=(",", ":")))
+            self.file.write("\n")
+        else:
+            if self.wrote_something:
+                self.file.write(",\n")
 
-        json.dump(obj, self.file, indent=4)
+            json.dump(obj, self.file, indent=4)
         self.wrote_something = True
 
         self.report.report_record_written(record_envelope)
@@ -73,5 +83,7 @@ class FileSink(Sink):
         return self.report
 
     def close(self):
-        self.file.write("\n]")
+        if not self.json_lines:
+            self.file.write("\n]")
         self.file.close()
+        self.compressed_file.close()
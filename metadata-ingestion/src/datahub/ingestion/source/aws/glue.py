@@ -204,7 +204,6 @@ class GlueSourceConfig(
 class GlueSourceReport(StatefulIngestionReport):
     tables_scanned = 0
     filtered: List[str] = dataclass_field(default_factory=list)
-    soft_deleted_stale_entities: List[str] = dataclass_field(default_factory=list)
 
     def report_table_scanned(self) -> None:
         self.tables_scanned += 1
@@ -212,9 +211,6 @@ class GlueSourceReport(StatefulIngestionReport):
     def report_table_dropped(self, table: str) -> None:
         self.filtered.append(table)
 
-    def report_stale_entity_soft_deleted(self, urn: str) -> None:
-        self.soft_deleted_stale_entities.append(urn)
-
 
 @platform_name("Glue")
 @config_class(GlueSourceConfig)
@@ -944,8 +940,6 @@ class GlueSource(StatefulIngestionSourceBase):
                 self.report.report_workunit(wu)
                 yield wu
 
-    # TODO: Consider refactoring this logic out for use across sources as it is leading to a significant amount of
-    #  code duplication.
     def gen_removed_entity_workunits(self) -> Iterable[MetadataWorkUnit]:
         last_checkpoint = self.get_last_checkpoint(
             self.get_default_ingestion_job_id(), BaseSQLAlchemyCheckpointState
@@ -963,21 +957,6 @@ class GlueSource(StatefulIngestionSourceBase):
         ):
             logger.debug("Checking for stale entity removal.")
 
-            def soft_delete_item(urn: str, type: str) -> Iterable[MetadataWorkUnit]:
-
-                logger.info(f"Soft-deleting stale entity of type {type} - {urn}.")
-                mcp = MetadataChangeProposalWrapper(
-                    entityType=type,
-                    entityUrn=urn,
-                    changeType=ChangeTypeClass.UPSERT,
-                    aspectName="status",
-                    aspect=StatusClass(removed=True),
-                )
-                wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
-                self.report.report_workunit(wu)
-                self.report.report_stale_entity_soft_deleted(urn)
-                yield wu
-
             last_checkpoint_state = cast(
                 BaseSQLAlchemyCheckpointState, last_checkpoint.state
             )
@@ -985,10 +964,10 @@ class GlueSource(StatefulIngestionSourceBase):
                 BaseSQLAlchemyCheckpointState, cur_checkpoint.state
             )
 
-            for table_urn in last_checkpoint_state.get_table_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(table_urn, "dataset")
+            yield from self.gen_stale_entity_workunits(
+                "dataset",
+                last_checkpoint_state.get_table_urns_not_in(cur_checkpoint_state),
+            )
 
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
         database_seen = set()
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import re
@@ -5,7 +6,6 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 import parse
 import pydantic
-from cached_property import cached_property
 from pydantic.fields import Field
 from wcmatch import pathlib
 
@@ -110,7 +110,7 @@ class PathSpec(ConfigModel):
 
     @pydantic.validator("default_extension")
     def validate_default_extension(cls, v):
-        if v not in SUPPORTED_FILE_TYPES:
+        if v is not None and v not in SUPPORTED_FILE_TYPES:
             raise ValueError(
                 f"default extension {v} not in supported default file extension. Please specify one from {SUPPORTED_FILE_TYPES}"
             )
@@ -155,23 +155,19 @@ class PathSpec(ConfigModel):
                 )
         return v
 
-    @cached_property
+    # These aren't cached on the instance, where they would end up in the serialized
+    # config, e.g. the one stored with stateful ingestion checkpoints.
+    @property
     def is_s3(self):
         return is_s3_uri(self.include)
 
-    @cached_property
+    @property
     def compiled_include(self):
-        parsable_include = PathSpec.get_parsable_include(self.include)
-        logger.debug(f"parsable_include: {parsable_include}")
-        compiled_include = parse.compile(parsable_include)
-        logger.debug(f"Setting compiled_include: {compiled_include}")
-        return compiled_include
+        return _compile_include(self.include)
 
-    @cached_property
+    @property
     def glob_include(self):
-        glob_include = re.sub(r"\{[^}]+\}", "*", self.include)
-        logger.debug(f"Setting _glob_include: {glob_include}")
-        return glob_include
+        return re.sub(r"\{[^}]+\}", "*", self.include)
 
     @pydantic.root_validator()
     def validate_path_spec(cls, values: Dict) -> Dict[str, Any]:
@@ -215,3 +211,12 @@ class PathSpec(ConfigModel):
                 "/".join(path.split("/")[:depth]) + "/" + parsed_vars.named["table"]
             )
             return self._extract_table_name(parsed_vars.named), table_path
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_include(include: str) -> parse.Parser:
+    parsable_include = PathSpec.get_parsable_include(include)
+    logger.debug(f"parsable_include: {parsable_include}")
+    compiled_include = parse.compile(parsable_include)
+    logger.debug(f"Setting compiled_include: {compiled_include}")
+    return compiled_include
@@ -16,7 +16,6 @@ from datahub.emitter.mce_builder import (
     make_domain_urn,
     make_tag_urn,
 )
-from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import (
     BigQueryDatasetKey,
     PlatformKey,
@@ -82,10 +81,8 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     TimeType,
 )
 from datahub.metadata.schema_classes import (
-    ChangeTypeClass,
     DataPlatformInstanceClass,
     GlobalTagsClass,
-    StatusClass,
     TagAssociationClass,
 )
 from datahub.utilities.mapping import Constants
@@ -358,22 +355,6 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         ):
             logger.debug("Checking for stale entity removal.")
 
-            def soft_delete_item(urn: str, type: str) -> Iterable[MetadataWorkUnit]:
-                entity_type: str = type if type == "container" else "dataset"
-
-                logger.info(f"Soft-deleting stale entity of type {type} - {urn}.")
-                mcp = MetadataChangeProposalWrapper(
-                    entityType=entity_type,
-                    entityUrn=urn,
-                    changeType=ChangeTypeClass.UPSERT,
-                    aspectName="status",
-                    aspect=StatusClass(removed=True),
-                )
-                wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
-                self.report.report_workunit(wu)
-                self.report.report_stale_entity_soft_deleted(urn)
-                yield wu
-
             last_checkpoint_state = cast(
                 BaseSQLAlchemyCheckpointState, last_checkpoint.state
             )
@@ -381,20 +362,18 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 BaseSQLAlchemyCheckpointState, cur_checkpoint.state
             )
 
-            for table_urn in last_checkpoint_state.get_table_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(table_urn, "table")
-
-            for view_urn in last_checkpoint_state.get_view_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(view_urn, "view")
-
-            for container_urn in last_checkpoint_state.get_container_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(container_urn, "container")
+            yield from self.gen_stale_entity_workunits(
+                "table",
+                last_checkpoint_state.get_table_urns_not_in(cur_checkpoint_state),
+            )
+            yield from self.gen_stale_entity_workunits(
+                "view", last_checkpoint_state.get_view_urns_not_in(cur_checkpoint_state)
+            )
+            yield from self.gen_stale_entity_workunits(
+                "container",
+                last_checkpoint_state.get_container_urns_not_in(cur_checkpoint_state),
+                entity_type="container",
+            )
 
     def gen_dataset_key(self, db_name: str, schema: str) -> PlatformKey:
         return BigQueryDatasetKey(
@@ -7,6 +7,7 @@ from typing import Counter, Dict, List, Optional
 import pydantic
 
 from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+from datahub.utilities.sql_parser_cache import SQLParseCacheReport
 
 
 @dataclass
@@ -15,6 +16,7 @@ class BigQueryV2Report(SQLSourceReport):
     num_skipped_lineage_entries_missing_data: Optional[int] = None
     num_skipped_lineage_entries_not_allowed: Optional[int] = None
     num_skipped_lineage_entries_sql_parser_failure: Optional[int] = None
+    sql_parse_cache: Optional[SQLParseCacheReport] = None
     num_skipped_lineage_entries_other: Optional[int] = None
     num_total_log_entries: Optional[int] = None
     num_parsed_log_entires: Optional[int] = None
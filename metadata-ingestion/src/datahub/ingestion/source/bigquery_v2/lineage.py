@@ -28,6 +28,7 @@ from datahub.metadata.schema_classes import (
     UpstreamLineageClass,
 )
 from datahub.utilities.bigquery_sql_parser import BigQuerySQLParser
+from datahub.utilities.sql_parser_cache import get_sql_parse_cache
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -357,6 +358,7 @@ timestamp < "{end_time}"
         self.report.num_skipped_lineage_entries_not_allowed = 0
         self.report.num_skipped_lineage_entries_other = 0
         self.report.num_skipped_lineage_entries_sql_parser_failure = 0
+        self.report.sql_parse_cache = get_sql_parse_cache().report
         for e in entries:
             self.report.num_total_lineage_entries += 1
             if e.destinationTable is None or not (
@@ -389,9 +391,13 @@ timestamp < "{end_time}"
                 # in the references. There is no distinction between direct/base objects accessed. So doing sql parsing
                 # to ensure we only use direct objects accessed for lineage
                 try:
-                    parser = BigQuerySQLParser(e.query)
                     referenced_objs = set(
-                        map(lambda x: x.split(".")[-1], parser.get_tables())
+                        map(
+                            lambda x: x.split(".")[-1],
+                            get_sql_parse_cache().get_tables(
+                                BigQuerySQLParser, e.query
+                            ),
+                        )
                     )
                 except Exception as ex:
                     logger.warning(
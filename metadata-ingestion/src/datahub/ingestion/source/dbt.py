@@ -131,10 +131,7 @@ class DBTStatefulIngestionConfig(StatefulIngestionConfig):
 
 @dataclass
 class DBTSourceReport(StatefulIngestionReport):
-    soft_deleted_stale_entities: List[str] = field(default_factory=list)
-
-    def report_stale_entity_soft_deleted(self, urn: str) -> None:
-        self.soft_deleted_stale_entities.append(urn)
+    pass
 
 
 class EmitDirective(Enum):
@@ -1144,8 +1141,6 @@ class DBTSource(StatefulIngestionSourceBase):
 
         return last_checkpoint
 
-    # TODO: Consider refactoring this logic out for use across sources as it is leading to a significant amount of
-    #  code duplication.
     def gen_removed_entity_workunits(self) -> Iterable[MetadataWorkUnit]:
         last_checkpoint: Optional[Checkpoint] = self.get_last_dbt_checkpoint(
             self.get_default_ingestion_job_id(), DbtCheckpointState
@@ -1164,41 +1159,18 @@ class DBTSource(StatefulIngestionSourceBase):
         ):
             logger.debug("Checking for stale entity removal.")
 
-            def get_soft_delete_item_workunit(urn: str, type: str) -> MetadataWorkUnit:
-
-                logger.info(f"Soft-deleting stale entity of type {type} - {urn}.")
-                mcp = MetadataChangeProposalWrapper(
-                    entityType=type,
-                    entityUrn=urn,
-                    changeType=ChangeTypeClass.UPSERT,
-                    aspectName="status",
-                    aspect=StatusClass(removed=True),
-                )
-                wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
-                self.report.report_workunit(wu)
-                self.report.report_stale_entity_soft_deleted(urn)
-                return wu
-
             last_checkpoint_state = cast(DbtCheckpointState, last_checkpoint.state)
             cur_checkpoint_state = cast(DbtCheckpointState, cur_checkpoint.state)
 
-            urns_to_soft_delete_by_type: Dict = {
-                "dataset": [
-                    node_urn
-                    for node_urn in last_checkpoint_state.get_node_urns_not_in(
-                        cur_checkpoint_state
-                    )
-                ],
-                "assertion": [
-                    assertion_urn
-                    for assertion_urn in last_checkpoint_state.get_assertion_urns_not_in(
-                        cur_checkpoint_state
-                    )
-                ],
-            }
-            for entity_type in urns_to_soft_delete_by_type:
-                for urn in urns_to_soft_delete_by_type[entity_type]:
-                    yield get_soft_delete_item_workunit(urn, entity_type)
+            yield from self.gen_stale_entity_workunits(
+                "dataset",
+                last_checkpoint_state.get_node_urns_not_in(cur_checkpoint_state),
+            )
+            yield from self.gen_stale_entity_workunits(
+                "assertion",
+                last_checkpoint_state.get_assertion_urns_not_in(cur_checkpoint_state),
+                entity_type="assertion",
+            )
 
     def load_file_as_json(self, uri: str) -> Any:
         if re.match("^https?://", uri):
@@ -1551,28 +1523,6 @@ class DBTSource(StatefulIngestionSourceBase):
             # Clean up stale entities.
             yield from self.gen_removed_entity_workunits()
 
-    def remove_duplicate_urns_from_checkpoint_state(self) -> None:
-        """
-        During MCEs creation process some nodes getting processed more than once and hence
-        duplicates URN are getting added in checkpoint_state.
-        This function will remove duplicates
-        """
-        if not self.is_stateful_ingestion_configured():
-            return
-
-        cur_checkpoint = self.get_current_checkpoint(
-            self.get_default_ingestion_job_id()
-        )
-
-        if cur_checkpoint is not None:
-            checkpoint_state = cast(DbtCheckpointState, cur_checkpoint.state)
-            checkpoint_state.encoded_node_urns = list(
-                set(checkpoint_state.encoded_node_urns)
-            )
-            checkpoint_state.encoded_assertion_urns = list(
-                set(checkpoint_state.encoded_assertion_urns)
-            )
-
     def create_platform_mces(
         self,
         dbt_nodes: List[DBTNode],
@@ -2108,7 +2058,6 @@ class DBTSource(StatefulIngestionSourceBase):
         return JobId(f"{self.platform}_stateful_ingestion")
 
     def close(self):
-        self.remove_duplicate_urns_from_checkpoint_state()
         self.prepare_for_commit()
 
     @property
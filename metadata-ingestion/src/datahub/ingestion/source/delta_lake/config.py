@@ -2,17 +2,16 @@ import logging
 from typing import Optional
 
 import pydantic
-from cached_property import cached_property
 from pydantic import Field
 
 from datahub.configuration.common import AllowDenyPattern
-from datahub.configuration.source_common import (
-    ConfigModel,
-    EnvBasedSourceConfigBase,
-    PlatformSourceConfigBase,
-)
+from datahub.configuration.source_common import ConfigModel
 from datahub.ingestion.source.aws.aws_common import AwsSourceConfig
 from datahub.ingestion.source.aws.s3_util import is_s3_uri
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionConfigBase,
+    StatefulStaleMetadataRemovalConfig,
+)
 
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
@@ -33,7 +32,20 @@ class S3(ConfigModel):
     )
 
 
-class DeltaLakeSourceConfig(PlatformSourceConfigBase, EnvBasedSourceConfigBase):
+class DeltaLakeStatefulIngestionConfig(StatefulStaleMetadataRemovalConfig):
+    """
+    Specialization of StatefulStaleMetadataRemovalConfig to adding custom config.
+    This will be used to override the stateful_ingestion config param of StatefulIngestionConfigBase
+    in the DeltaLakeSourceConfig.
+    """
+
+    skip_unchanged_tables: bool = Field(
+        default=True,
+        description="Skip tables whose version is the same as in the last run. Operations are only emitted for versions newer than the last run's in any case. Set `ignore_old_state` to force a full run.",
+    )
+
+
+class DeltaLakeSourceConfig(StatefulIngestionConfigBase):
 
     base_path: str = Field(
         description="Path to table (s3 or local file system). If path is not a delta table path "
@@ -65,11 +77,24 @@ class DeltaLakeSourceConfig(PlatformSourceConfigBase, EnvBasedSourceConfigBase):
 
     s3: Optional[S3] = Field()
 
-    @cached_property
+    max_threads: int = Field(
+        default=1,
+        description="Number of threads used to list folders and to load delta tables concurrently. Tables are still ingested in the order they are found.",
+    )
+    max_folder_depth: Optional[int] = Field(
+        default=None,
+        description="How many levels of subfolders below the base path are searched for delta tables. Unlimited by default.",
+    )
+
+    stateful_ingestion: Optional[DeltaLakeStatefulIngestionConfig] = None
+
+    # These aren't cached on the instance, where they would end up in the serialized
+    # config, e.g. the one stored with stateful ingestion checkpoints.
+    @property
     def is_s3(self):
         return is_s3_uri(self.base_path or "")
 
-    @cached_property
+    @property
     def complete_path(self):
         complete_path = self.base_path
         if self.relative_path is not None:
@@ -79,6 +104,12 @@ class DeltaLakeSourceConfig(PlatformSourceConfigBase, EnvBasedSourceConfigBase):
 
         return complete_path
 
+    @pydantic.validator("max_folder_depth")
+    def max_folder_depth_not_negative(cls, v):
+        if v is not None and v < 0:
+            raise ValueError("max_folder_depth must not be negative")
+        return v
+
     @pydantic.validator("version_history_lookback")
     def negative_version_history_implies_no_limit(cls, v):
         if v and v < 0:
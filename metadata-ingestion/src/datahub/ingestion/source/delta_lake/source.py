@@ -1,8 +1,9 @@
+import concurrent.futures
 import logging
 import os
 import time
 from datetime import datetime
-from typing import Callable, Iterable, List
+from typing import Callable, Iterable, List, Optional, Tuple, Type, cast
 
 from deltalake import DeltaTable
 
@@ -20,6 +21,7 @@ from datahub.ingestion.api.decorators import (
     platform_name,
     support_status,
 )
+from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.aws.s3_boto_utils import get_s3_tags, list_folders_path
@@ -36,6 +38,10 @@ from datahub.ingestion.source.delta_lake.delta_lake_utils import (
 from datahub.ingestion.source.delta_lake.report import DeltaLakeSourceReport
 from datahub.ingestion.source.s3.data_lake_utils import ContainerWUCreator
 from datahub.ingestion.source.schema_inference.csv_tsv import tableschema_type_map
+from datahub.ingestion.source.state.delta_lake_state import DeltaLakeCheckpointState
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionSourceBase,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
@@ -50,8 +56,11 @@ from datahub.metadata.schema_classes import (
     OperationClass,
     OperationTypeClass,
     OtherSchemaClass,
+    StatusClass,
 )
 from datahub.telemetry import telemetry
+from datahub.utilities.ordered_thread_map import ordered_executor_map
+from datahub.utilities.perf_timer import PerfTimer
 
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
@@ -78,12 +87,18 @@ OPERATION_STATEMENT_TYPES = {
 @config_class(DeltaLakeSourceConfig)
 @support_status(SupportStatus.INCUBATING)
 @capability(SourceCapability.TAGS, "Can extract S3 object/bucket tags if enabled")
-class DeltaLakeSource(Source):
+@capability(
+    SourceCapability.DELETION_DETECTION,
+    "Enabled by default when stateful ingestion is turned on.",
+)
+class DeltaLakeSource(StatefulIngestionSourceBase):
     """
     This plugin extracts:
     - Column types and schema associated with each delta table
     - Custom properties: number_of_files, partition_columns, table_creation_time, location, version etc.
 
+    With stateful ingestion enabled, the version of every table is recorded. Tables whose version is the same as in the last run are skipped, only the history entries of newer versions are emitted as operations, and tables that are no longer found are soft-deleted.
+
     :::caution
 
     If you are ingesting datasets from AWS S3, we recommend running the ingestion on a server in the same region to avoid high egress costs.
@@ -98,7 +113,7 @@ class DeltaLakeSource(Source):
     container_WU_creator: ContainerWUCreator
 
     def __init__(self, config: DeltaLakeSourceConfig, ctx: PipelineContext):
-        super().__init__(ctx)
+        super().__init__(config, ctx)
         self.source_config = config
         self.report = DeltaLakeSourceReport()
         # self.profiling_times_taken = []
@@ -118,7 +133,9 @@ class DeltaLakeSource(Source):
         config = DeltaLakeSourceConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
-    def get_fields(self, delta_table: DeltaTable) -> List[SchemaField]:
+    def get_fields(
+        self, delta_table: DeltaTable, partition_columns: List[str]
+    ) -> List[SchemaField]:
 
         fields: List[SchemaField] = []
 
@@ -133,7 +150,7 @@ class DeltaLakeSource(Source):
                 nullable=raw_field.nullable,
                 description=str(raw_field.metadata),
                 isPartitioningKey=True
-                if raw_field.name in delta_table.metadata().partition_columns
+                if raw_field.name in partition_columns
                 else False,
             )
             fields.append(field)
@@ -142,11 +159,9 @@ class DeltaLakeSource(Source):
         return fields
 
     def _create_operation_aspect_wu(
-        self, delta_table: DeltaTable, dataset_urn: str
+        self, delta_table: DeltaTable, dataset_urn: str, limit: Optional[int]
     ) -> Iterable[MetadataWorkUnit]:
-        for hist in delta_table.history(
-            limit=self.source_config.version_history_lookback
-        ):
+        for hist in delta_table.history(limit=limit):
 
             # History schema picked up from https://docs.delta.io/latest/delta-utility.html#retrieve-delta-table-history
             reported_time: int = int(time.time() * 1000)
@@ -193,14 +208,43 @@ class DeltaLakeSource(Source):
             self.report.report_workunit(operational_wu)
             yield operational_wu
 
+    def _get_last_table_version(self, dataset_urn: str) -> Optional[int]:
+        last_checkpoint_state = self.get_last_default_checkpoint_state()
+        if last_checkpoint_state is None:
+            return None
+        return cast(DeltaLakeCheckpointState, last_checkpoint_state).get_table_version(
+            dataset_urn
+        )
+
+    def _add_table_version_to_checkpoint(self, dataset_urn: str, version: int) -> None:
+        cur_checkpoint_state = self.get_current_default_checkpoint_state()
+        if cur_checkpoint_state is None:
+            return
+        cast(DeltaLakeCheckpointState, cur_checkpoint_state).add_table_version(
+            dataset_urn, version
+        )
+
+    def _get_history_limit(
+        self, version: int, last_version: Optional[int]
+    ) -> Optional[int]:
+        """
+        The number of history entries to emit as operations. Each commit creates a new
+        version, so only the last `version - last_version` entries are new since the
+        last run. A lower version means the table was recreated, and is read in full.
+        """
+        lookback = self.source_config.version_history_lookback
+        if last_version is None or last_version > version:
+            return lookback
+        new_versions = version - last_version
+        return new_versions if lookback is None else min(lookback, new_versions)
+
     def ingest_table(
         self, delta_table: DeltaTable, path: str
     ) -> Iterable[MetadataWorkUnit]:
-        table_name = (
-            delta_table.metadata().name
-            if delta_table.metadata().name
-            else path.split("/")[-1]
-        )
+        # Both read the table's log, so they are only fetched once per table.
+        metadata = delta_table.metadata()
+        version: int = delta_table.version()
+        table_name = metadata.name if metadata.name else path.split("/")[-1]
         if not self.source_config.table_pattern.allowed(table_name):
             logger.debug(
                 f"Skipping table ({table_name}) present at location {path} as table pattern does not match"
@@ -222,32 +266,45 @@ class DeltaLakeSource(Source):
             self.source_config.platform_instance,
             self.source_config.env,
         )
+
+        last_version = self._get_last_table_version(dataset_urn)
+        if self.is_skipping_unchanged_entities() and last_version == version:
+            logger.debug(
+                f"Skipping table {table_name} as its version {version} is unchanged"
+            )
+            self._add_table_version_to_checkpoint(dataset_urn, version)
+            self.report.report_table_skipped_unchanged()
+            return
+
         dataset_snapshot = DatasetSnapshot(
             urn=dataset_urn,
             aspects=[],
         )
+        if self.is_stateful_ingestion_configured():
+            # Un-delete the table, in case it was soft-deleted as stale in a past run.
+            dataset_snapshot.aspects.append(StatusClass(removed=False))
 
         customProperties = {
             "number_of_files": str(get_file_count(delta_table)),
-            "partition_columns": str(delta_table.metadata().partition_columns),
-            "table_creation_time": str(delta_table.metadata().created_time),
-            "id": str(delta_table.metadata().id),
-            "version": str(delta_table.version()),
+            "partition_columns": str(metadata.partition_columns),
+            "table_creation_time": str(metadata.created_time),
+            "id": str(metadata.id),
+            "version": str(version),
             "location": self.source_config.complete_path,
         }
 
         dataset_properties = DatasetPropertiesClass(
-            description=delta_table.metadata().description,
+            description=metadata.description,
             name=table_name,
             customProperties=customProperties,
         )
         dataset_snapshot.aspects.append(dataset_properties)
 
-        fields = self.get_fields(delta_table)
+        fields = self.get_fields(delta_table, metadata.partition_columns)
         schema_metadata = SchemaMetadata(
             schemaName=table_name,
             platform=data_platform_urn,
-            version=delta_table.version(),
+            version=version,
             hash="",
             fields=fields,
             platformSchema=OtherSchemaClass(rawSchema=""),
@@ -276,7 +333,7 @@ class DeltaLakeSource(Source):
             if s3_tags is not None:
                 dataset_snapshot.aspects.append(s3_tags)
         mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
-        wu = MetadataWorkUnit(id=delta_table.metadata().id, mce=mce)
+        wu = MetadataWorkUnit(id=metadata.id, mce=mce)
         self.report.report_workunit(wu)
         yield wu
 
@@ -287,20 +344,75 @@ class DeltaLakeSource(Source):
             self.report.report_workunit(wu)
             yield wu
 
-        yield from self._create_operation_aspect_wu(delta_table, dataset_urn)
+        history_limit = self._get_history_limit(version, last_version)
+        if history_limit != 0:
+            yield from self._create_operation_aspect_wu(
+                delta_table, dataset_urn, history_limit
+            )
 
-    def process_folder(
-        self, path: str, get_folders: Callable[[str], Iterable[str]]
-    ) -> Iterable[MetadataWorkUnit]:
+        self._add_table_version_to_checkpoint(dataset_urn, version)
+
+    def _probe_folder(
+        self, path: str, depth: int, get_folders: Callable[[str], Iterable[str]]
+    ) -> Tuple[Optional[DeltaTable], List[str]]:
+        """
+        Loads the delta table at the path. If there is none, lists the subfolders to
+        search next, unless they are deeper than max_folder_depth.
+        """
         logger.debug(f"Processing folder: {path}")
-        delta_table = read_delta_table(path, self.source_config)
+        with PerfTimer() as timer:
+            delta_table = read_delta_table(path, self.source_config)
         if delta_table:
             logger.debug(f"Delta table found at: {path}")
-            for wu in self.ingest_table(delta_table, path):
-                yield wu
-        else:
-            for folder in get_folders(path):
-                yield from self.process_folder(path + "/" + folder, get_folders)
+            self.report.report_table_loaded(path, timer.elapsed_seconds())
+            return delta_table, []
+        max_folder_depth = self.source_config.max_folder_depth
+        if max_folder_depth is not None and depth >= max_folder_depth:
+            return None, []
+        return None, list(get_folders(path))
+
+    def _find_tables(
+        self,
+        executor: Optional[concurrent.futures.Executor],
+        paths: Iterable[str],
+        depth: int,
+        get_folders: Callable[[str], Iterable[str]],
+    ) -> Iterable[Tuple[str, DeltaTable]]:
+        # Sibling folders are probed ahead on the executor, and the tree is walked
+        # depth first on this thread, so tables are found in the sequential order.
+        for path, (delta_table, folders) in ordered_executor_map(
+            executor,
+            lambda path: (path, self._probe_folder(path, depth, get_folders)),
+            paths,
+            2 * self.source_config.max_threads,
+        ):
+            if delta_table:
+                yield path, delta_table
+            else:
+                yield from self._find_tables(
+                    executor,
+                    (path + "/" + folder for folder in folders),
+                    depth + 1,
+                    get_folders,
+                )
+
+    def process_folder(
+        self, path: str, get_folders: Callable[[str], Iterable[str]]
+    ) -> Iterable[MetadataWorkUnit]:
+        max_threads = self.source_config.max_threads
+        executor = (
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_threads)
+            if max_threads > 1
+            else None
+        )
+        try:
+            for table_path, delta_table in self._find_tables(
+                executor, [path], 0, get_folders
+            ):
+                yield from self.ingest_table(delta_table, table_path)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
     def s3_get_folders(self, path: str) -> Iterable[str]:
         if self.source_config.s3 is not None:
@@ -329,8 +441,31 @@ class DeltaLakeSource(Source):
         for wu in self.process_folder(self.source_config.complete_path, get_folders):
             yield wu
 
+        if self.is_stateful_ingestion_configured():
+            # Clean up stale entities.
+            yield from self.gen_removed_entity_workunits()
+
+    def get_platform_instance_id(self) -> str:
+        return self.source_config.platform_instance or self.source_config.platform
+
+    def get_default_ingestion_job_id(self) -> JobId:
+        """
+        Delta Lake ingestion job name.
+        """
+        return JobId(f"{self.source_config.platform}_stateful_ingestion")
+
+    def get_default_checkpoint_state_class(self) -> Type[DeltaLakeCheckpointState]:
+        return DeltaLakeCheckpointState
+
+    def is_skipping_unchanged_entities(self) -> bool:
+        return bool(
+            self.source_config.stateful_ingestion
+            and self.source_config.stateful_ingestion.skip_unchanged_tables
+        )
+
     def get_report(self) -> SourceReport:
         return self.report
 
     def close(self):
-        pass
+        self.update_default_job_run_summary()
+        self.prepare_for_commit()
@@ -1,12 +1,15 @@
+import concurrent.futures
 import datetime
+import itertools
 import json
 import logging
 import os.path
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from io import BufferedReader
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import ijson
 from pydantic import root_validator, validator
@@ -32,6 +35,11 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.schema_classes import UsageAggregationClass
+from datahub.utilities.json_files import (
+    CompressedFile,
+    get_uncompressed_size,
+    is_json_lines_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +57,20 @@ class FileSourceConfig(ConfigModel):
     )
     file_extension: str = Field(
         ".json",
-        description="When providing a folder to use to read files, set this field to control file extensions that you want the source to process. * is a special value that means process every file regardless of extension",
+        description="When providing a folder to use to read files, set this field to control file extensions that you want the source to process. * is a special value that means process every file regardless of extension. Files ending in .jsonl or .ndjson are read as JSON lines, and a .gz or .zst suffix is decompressed on the fly.",
     )
     read_mode: FileReadMode = FileReadMode.AUTO
     aspect: Optional[str] = Field(
         description="Set to an aspect to only read this aspect for ingestion."
     )
+    deserialize_workers: int = Field(
+        1,
+        description="Number of processes used to deserialize and validate the records read from the files. Records are still emitted in file order.",
+    )
+    deserialize_chunk_size: int = Field(
+        1000,
+        description="Number of records handed to a deserialization process at a time, when deserialize_workers is greater than 1.",
+    )
 
     _minsize_for_streaming_mode_in_bytes: int = (
         100 * 1000 * 1000  # Must be at least 100MB before we use streaming mode
@@ -105,12 +121,16 @@ class FileSourceReport(SourceReport):
     total_parse_time_in_seconds: float = 0
     total_count_time_in_seconds: float = 0
     total_deserialize_time_in_seconds: float = 0
+    total_deserialize_wait_time_in_seconds: float = 0
     aspect_counts: Dict[str, int] = field(default_factory=dict)
     entity_type_counts: Dict[str, int] = field(default_factory=dict)
 
     def add_deserialize_time(self, delta: datetime.timedelta) -> None:
         self.total_deserialize_time_in_seconds += round(delta.total_seconds(), 2)
 
+    def add_deserialize_wait_time(self, delta: datetime.timedelta) -> None:
+        self.total_deserialize_wait_time_in_seconds += round(delta.total_seconds(), 2)
+
     def add_parse_time(self, delta: datetime.timedelta) -> None:
         self.total_parse_time_in_seconds += round(delta.total_seconds(), 2)
 
@@ -163,6 +183,39 @@ class FileSourceReport(SourceReport):
             self.percentage_completion = f"{percentage_completion:.2f}%"
 
 
+_GenericFileItem = Union[
+    MetadataChangeEvent, MetadataChangeProposal, UsageAggregationClass
+]
+
+
+def _deserialize_obj(i: int, obj: Any) -> _GenericFileItem:
+    item: _GenericFileItem
+    if "proposedSnapshot" in obj:
+        item = MetadataChangeEvent.from_obj(obj)
+    elif "aspect" in obj:
+        item = MetadataChangeProposal.from_obj(obj)
+    else:
+        item = UsageAggregationClass.from_obj(obj)
+    if not item.validate():
+        raise ValueError(f"failed to parse: {obj} (index {i})")
+    return item
+
+
+def _deserialize_chunk(
+    chunk: List[Tuple[str, int, Any]]
+) -> Tuple[List[Tuple[str, int, Union[_GenericFileItem, str]]], float]:
+    # Runs in a worker process. Failures are returned as strings, so that a single bad
+    # record doesn't fail the whole chunk.
+    start_time = time.perf_counter()
+    results: List[Tuple[str, int, Union[_GenericFileItem, str]]] = []
+    for path, i, obj in chunk:
+        try:
+            results.append((path, i, _deserialize_obj(i, obj)))
+        except Exception as e:
+            results.append((path, i, str(e)))
+    return results, time.perf_counter() - start_time
+
+
 @platform_name("File")
 @config_class(FileSourceConfig)
 @support_status(SupportStatus.CERTIFIED)
@@ -175,7 +228,8 @@ class GenericFileSource(TestableSource):
         self.ctx = ctx
         self.config = config
         self.report = FileSourceReport()
-        self.fp: Optional[BufferedReader] = None
+        self.fp: Optional[CompressedFile] = None
+        self.executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
 
     @classmethod
     def create(cls, config_dict, ctx):
@@ -201,30 +255,29 @@ class GenericFileSource(TestableSource):
         raise Exception(f"Failed to process {self.config.path}")
 
     def get_workunits(self) -> Iterable[Union[MetadataWorkUnit, UsageStatsWorkUnit]]:
-        for f in self.get_filenames():
-            for i, obj in self.iterate_generic_file(f):
-                wu: Union[MetadataWorkUnit, UsageStatsWorkUnit]
-                if isinstance(obj, UsageAggregationClass):
-                    wu = UsageStatsWorkUnit(f"file://{f}:{i}", obj)
-                elif isinstance(obj, MetadataChangeProposal):
-                    self.report.entity_type_counts[obj.entityType] = (
-                        self.report.entity_type_counts.get(obj.entityType, 0) + 1
+        for f, i, obj in self._iterate_generic_files(self.get_filenames()):
+            wu: Union[MetadataWorkUnit, UsageStatsWorkUnit]
+            if isinstance(obj, UsageAggregationClass):
+                wu = UsageStatsWorkUnit(f"file://{f}:{i}", obj)
+            elif isinstance(obj, MetadataChangeProposal):
+                self.report.entity_type_counts[obj.entityType] = (
+                    self.report.entity_type_counts.get(obj.entityType, 0) + 1
+                )
+                if obj.aspectName is not None:
+                    cur_aspect_name = str(obj.aspectName)
+                    self.report.aspect_counts[cur_aspect_name] = (
+                        self.report.aspect_counts.get(cur_aspect_name, 0) + 1
                     )
-                    if obj.aspectName is not None:
-                        cur_aspect_name = str(obj.aspectName)
-                        self.report.aspect_counts[cur_aspect_name] = (
-                            self.report.aspect_counts.get(cur_aspect_name, 0) + 1
-                        )
-                        if (
-                            self.config.aspect is not None
-                            and cur_aspect_name != self.config.aspect
-                        ):
-                            continue
-                    wu = MetadataWorkUnit(f"file://{f}:{i}", mcp_raw=obj)
-                else:
-                    wu = MetadataWorkUnit(f"file://{f}:{i}", mce=obj)
-                self.report.report_workunit(wu)
-                yield wu
+                    if (
+                        self.config.aspect is not None
+                        and cur_aspect_name != self.config.aspect
+                    ):
+                        continue
+                wu = MetadataWorkUnit(f"file://{f}:{i}", mcp_raw=obj)
+            else:
+                wu = MetadataWorkUnit(f"file://{f}:{i}", mce=obj)
+            self.report.report_workunit(wu)
+            yield wu
 
     def get_report(self):
         return self.report
@@ -232,15 +285,54 @@ class GenericFileSource(TestableSource):
     def close(self):
         if self.fp:
             self.fp.close()
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
 
     def _iterate_file(self, path: str) -> Iterable[Tuple[int, Any]]:
         self.report.current_file_name = path
         self.report.current_file_size = os.path.getsize(path)
+        if is_json_lines_file(path):
+            logger.info(f"Reading file {path} as JSON lines")
+            yield from self._iterate_json_lines_file(path)
+        else:
+            yield from self._iterate_json_file(path)
+
+        self.report.files_completed.append(path)
+        self.report.num_files_completed += 1
+        self.report.total_bytes_read_completed_files += self.report.current_file_size
+        self.report.reset_current_file_stats()
+
+    def _iterate_json_lines_file(self, path: str) -> Iterable[Tuple[int, Any]]:
+        self.report.current_file_elements_read = 0
+        self.fp = CompressedFile(path, "rb")
+        with self.fp:
+            parse_start_time = datetime.datetime.now()
+            for i, line in enumerate(self.fp.stream):
+                if not line.strip():
+                    continue
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError as e:
+                    # Most likely the last line of a file that is still being written.
+                    self.report.report_failure(f"path-{i}", f"Invalid JSON line: {e}")
+                    continue
+                self.report.add_parse_time(datetime.datetime.now() - parse_start_time)
+                self.report.current_file_elements_read += 1
+                self.report.current_file_bytes_read = self.fp.raw_bytes_read
+                yield i, obj
+                parse_start_time = datetime.datetime.now()
+        self.fp = None
+
+    def _iterate_json_file(self, path: str) -> Iterable[Tuple[int, Any]]:
+        assert self.report.current_file_size is not None
+        self.report.current_file_elements_read = 0
         if self.config.read_mode == FileReadMode.AUTO:
+            # Memory use depends on the size of the decompressed JSON, not of the file.
+            min_size = self.config._minsize_for_streaming_mode_in_bytes
             file_read_mode = (
                 FileReadMode.BATCH
-                if self.report.current_file_size
-                < self.config._minsize_for_streaming_mode_in_bytes
+                if get_uncompressed_size(path, min_size) < min_size
                 else FileReadMode.STREAM
             )
             logger.info(f"Reading file {path} in {file_read_mode} mode")
@@ -248,9 +340,9 @@ class GenericFileSource(TestableSource):
             file_read_mode = self.config.read_mode
 
         if file_read_mode == FileReadMode.BATCH:
-            with open(path, "r") as f:
+            with CompressedFile(path, "rb") as f:
                 parse_start_time = datetime.datetime.now()
-                obj_list = json.load(f)
+                obj_list = json.load(f.stream)
                 parse_end_time = datetime.datetime.now()
                 self.report.add_parse_time(parse_end_time - parse_start_time)
             if not isinstance(obj_list, list):
@@ -258,37 +350,26 @@ class GenericFileSource(TestableSource):
             count_start_time = datetime.datetime.now()
             self.report.current_file_num_elements = len(obj_list)
             self.report.add_count_time(datetime.datetime.now() - count_start_time)
-            self.report.current_file_elements_read = 0
             for i, obj in enumerate(obj_list):
                 yield i, obj
                 self.report.current_file_elements_read += 1
         else:
-            self.fp = open(path, "rb")
-            count_start_time = datetime.datetime.now()
-            parse_stream = ijson.parse(self.fp, use_float=True)
-            total_elements = 0
-            for row in ijson.items(parse_stream, "item", use_float=True):
-                total_elements += 1
-            count_end_time = datetime.datetime.now()
-            self.report.add_count_time(count_end_time - count_start_time)
-            self.report.current_file_num_elements = total_elements
-            self.report.current_file_elements_read = 0
-            self.fp.seek(0)
-            parse_start_time = datetime.datetime.now()
-            parse_stream = ijson.parse(self.fp, use_float=True)
-            rows_yielded = 0
-            for row in ijson.items(parse_stream, "item", use_float=True):
-                parse_end_time = datetime.datetime.now()
-                self.report.add_parse_time(parse_end_time - parse_start_time)
-                rows_yielded += 1
-                self.report.current_file_elements_read += 1
-                yield rows_yielded, row
+            # Progress is estimated from the position in the file, which saves a
+            # separate pass over the whole file just to count its elements.
+            self.fp = CompressedFile(path, "rb")
+            with self.fp:
                 parse_start_time = datetime.datetime.now()
-
-        self.report.files_completed.append(path)
-        self.report.num_files_completed += 1
-        self.report.total_bytes_read_completed_files += self.report.current_file_size
-        self.report.reset_current_file_stats()
+                parse_stream = ijson.parse(self.fp.stream, use_float=True)
+                rows_yielded = 0
+                for row in ijson.items(parse_stream, "item", use_float=True):
+                    parse_end_time = datetime.datetime.now()
+                    self.report.add_parse_time(parse_end_time - parse_start_time)
+                    rows_yielded += 1
+                    self.report.current_file_elements_read += 1
+                    self.report.current_file_bytes_read = self.fp.raw_bytes_read
+                    yield rows_yielded, row
+                    parse_start_time = datetime.datetime.now()
+            self.fp = None
 
     def iterate_mce_file(self, path: str) -> Iterator[MetadataChangeEvent]:
         for i, obj in self._iterate_file(path):
@@ -298,32 +379,70 @@ class GenericFileSource(TestableSource):
     def iterate_generic_file(
         self,
         path: str,
-    ) -> Iterator[
-        Tuple[
-            int,
-            Union[MetadataChangeEvent, MetadataChangeProposal, UsageAggregationClass],
-        ]
-    ]:
-        for i, obj in self._iterate_file(path):
-            item: Union[
-                MetadataChangeEvent, MetadataChangeProposal, UsageAggregationClass
-            ]
+    ) -> Iterator[Tuple[int, _GenericFileItem]]:
+        for _, i, item in self._iterate_generic_files([path]):
+            yield i, item
+
+    def _iterate_generic_files(
+        self, paths: Iterable[str]
+    ) -> Iterator[Tuple[str, int, _GenericFileItem]]:
+        objs = ((path, i, obj) for path in paths for i, obj in self._iterate_file(path))
+        if self.config.deserialize_workers > 1:
+            yield from self._deserialize_in_parallel(objs)
+            return
+
+        for path, i, obj in objs:
             try:
                 deserialize_start_time = datetime.datetime.now()
-                if "proposedSnapshot" in obj:
-                    item = MetadataChangeEvent.from_obj(obj)
-                elif "aspect" in obj:
-                    item = MetadataChangeProposal.from_obj(obj)
-                else:
-                    item = UsageAggregationClass.from_obj(obj)
-                if not item.validate():
-                    raise ValueError(f"failed to parse: {obj} (index {i})")
+                item = _deserialize_obj(i, obj)
                 deserialize_duration = datetime.datetime.now() - deserialize_start_time
                 self.report.add_deserialize_time(deserialize_duration)
-                yield i, item
+                yield path, i, item
             except Exception as e:
                 self.report.report_failure(f"path-{i}", str(e))
 
+    def _deserialize_in_parallel(
+        self, objs: Iterator[Tuple[str, int, Any]]
+    ) -> Iterator[Tuple[str, int, _GenericFileItem]]:
+        """
+        Deserializes and validates chunks of records in a process pool, while this
+        process keeps reading the files. Results are yielded in the original order,
+        and the number of chunks in flight is bounded to keep memory usage flat.
+        """
+        if self.executor is None:
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.config.deserialize_workers
+            )
+        max_pending_chunks = 2 * self.config.deserialize_workers
+        pending: Deque[concurrent.futures.Future] = deque()
+
+        def _collect(
+            future: concurrent.futures.Future,
+        ) -> Iterator[Tuple[str, int, _GenericFileItem]]:
+            wait_start_time = datetime.datetime.now()
+            results, deserialize_seconds = future.result()
+            self.report.add_deserialize_wait_time(
+                datetime.datetime.now() - wait_start_time
+            )
+            self.report.add_deserialize_time(
+                datetime.timedelta(seconds=deserialize_seconds)
+            )
+            for path, i, item in results:
+                if isinstance(item, str):
+                    self.report.report_failure(f"path-{i}", item)
+                else:
+                    yield path, i, item
+
+        while True:
+            chunk = list(itertools.islice(objs, self.config.deserialize_chunk_size))
+            if not chunk:
+                break
+            pending.append(self.executor.submit(_deserialize_chunk, chunk))
+            if len(pending) >= max_pending_chunks:
+                yield from _collect(pending.popleft())
+        while pending:
+            yield from _collect(pending.popleft())
+
     @staticmethod
     def test_connection(config_dict: dict) -> TestConnectionReport:
         config = FileSourceConfig.parse_obj(config_dict)
@@ -1,7 +1,7 @@
 import json
 import logging
 import uuid
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, cast
 
 from iceberg.api import types as IcebergTypes
 from iceberg.api.table import Table
@@ -27,7 +27,8 @@ from datahub.ingestion.api.decorators import (
     platform_name,
     support_status,
 )
-from datahub.ingestion.api.source import Source, SourceReport
+from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
+from datahub.ingestion.api.source import SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor import schema_util
 from datahub.ingestion.source.iceberg.iceberg_common import (
@@ -35,6 +36,10 @@ from datahub.ingestion.source.iceberg.iceberg_common import (
     IcebergSourceReport,
 )
 from datahub.ingestion.source.iceberg.iceberg_profiler import IcebergProfiler
+from datahub.ingestion.source.state.iceberg_state import IcebergCheckpointState
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionSourceBase,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
@@ -49,6 +54,7 @@ from datahub.metadata.schema_classes import (
     OwnerClass,
     OwnershipClass,
     OwnershipTypeClass,
+    StatusClass,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -81,7 +87,11 @@ _all_atomic_types = {
     SourceCapability.OWNERSHIP,
     "Optionally enabled via configuration by specifying which Iceberg table property holds user or group ownership.",
 )
-class IcebergSource(Source):
+@capability(
+    SourceCapability.DELETION_DETECTION,
+    "Optionally enabled via `stateful_ingestion.remove_stale_metadata`",
+)
+class IcebergSource(StatefulIngestionSourceBase):
     """
     ## Integration Details
 
@@ -98,10 +108,13 @@ class IcebergSource(Source):
 
     The current implementation of the Iceberg source plugin will only discover tables stored in a local file system or in ADLS.  Support for S3 could
     be added fairly easily.
+
+    With stateful ingestion enabled, tables whose current snapshot is the one they were last profiled at are not profiled again. Tables
+    that are no longer found are soft-deleted if `stateful_ingestion.remove_stale_metadata` is also enabled.
     """
 
     def __init__(self, config: IcebergSourceConfig, ctx: PipelineContext) -> None:
-        super().__init__(ctx)
+        super().__init__(config, ctx)
         self.PLATFORM: str = "iceberg"
         self.report: IcebergSourceReport = IcebergSourceReport()
         self.config: IcebergSourceConfig = config
@@ -135,6 +148,10 @@ class IcebergSource(Source):
                     f"Exception while processing table {dataset_path}, skipping it.",
                 )
 
+        if self.is_stateful_ingestion_configured():
+            # Clean up stale entities.
+            yield from self.gen_removed_entity_workunits()
+
     def _create_iceberg_workunit(
         self, dataset_name: str, table: Table
     ) -> Iterable[MetadataWorkUnit]:
@@ -145,18 +162,23 @@ class IcebergSource(Source):
             self.config.platform_instance,
             self.config.env,
         )
+        # Added first, so that a table failing later on isn't removed as stale.
+        self._add_table_to_checkpoint(dataset_urn)
         dataset_snapshot = DatasetSnapshot(
             urn=dataset_urn,
             aspects=[],
         )
+        if self.is_stateful_ingestion_configured():
+            # Un-delete the table, in case it was soft-deleted as stale in a past run.
+            dataset_snapshot.aspects.append(StatusClass(removed=False))
 
         custom_properties: Dict = dict(table.properties())
         custom_properties["location"] = table.location()
+        snapshot_id: Optional[int] = None
         try:
             if isinstance(table, BaseTable) and table.current_snapshot():
-                custom_properties["snapshot-id"] = str(
-                    table.current_snapshot().snapshot_id
-                )
+                snapshot_id = table.current_snapshot().snapshot_id
+                custom_properties["snapshot-id"] = str(snapshot_id)
                 custom_properties[
                     "manifest-list"
                 ] = table.current_snapshot().manifest_location
@@ -187,8 +209,44 @@ class IcebergSource(Source):
             yield dpi_aspect
 
         if self.config.profiling.enabled:
-            profiler = IcebergProfiler(self.report, self.config.profiling)
-            yield from profiler.profile_table(dataset_name, dataset_urn, table)
+            if self._skip_unchanged_profile(dataset_urn, snapshot_id):
+                self.report.report_profile_skipped_unchanged(dataset_name)
+            else:
+                profiler = IcebergProfiler(self.report, self.config.profiling)
+                yield from profiler.profile_table(dataset_name, dataset_urn, table)
+            self._add_table_to_checkpoint(dataset_urn, snapshot_id)
+
+    def _get_current_checkpoint_state(self) -> Optional[IcebergCheckpointState]:
+        return cast(
+            Optional[IcebergCheckpointState],
+            self.get_current_default_checkpoint_state(),
+        )
+
+    def _add_table_to_checkpoint(
+        self, dataset_urn: str, profiled_snapshot_id: Optional[int] = None
+    ) -> None:
+        checkpoint_state = self._get_current_checkpoint_state()
+        if checkpoint_state is not None:
+            checkpoint_state.add_table(dataset_urn, profiled_snapshot_id)
+
+    def _skip_unchanged_profile(
+        self, dataset_urn: str, snapshot_id: Optional[int]
+    ) -> bool:
+        """
+        Tells if the table was last profiled at its current snapshot. As snapshots are
+        immutable, its profile would be the same.
+        """
+        if snapshot_id is None or not self.is_skipping_unchanged_entities():
+            return False
+        last_checkpoint_state = self.get_last_default_checkpoint_state()
+        if last_checkpoint_state is None:
+            return False
+        return (
+            cast(
+                IcebergCheckpointState, last_checkpoint_state
+            ).get_profiled_snapshot_id(dataset_urn)
+            == snapshot_id
+        )
 
     def _get_ownership_aspect(self, table: Table) -> Optional[OwnershipClass]:
         owners = []
@@ -295,11 +353,30 @@ class IcebergSource(Source):
             ],
         }
 
+    def get_platform_instance_id(self) -> str:
+        return self.config.platform_instance or self.PLATFORM
+
+    def get_default_ingestion_job_id(self) -> JobId:
+        """
+        Iceberg ingestion job name.
+        """
+        return JobId(f"{self.PLATFORM}_stateful_ingestion")
+
+    def get_default_checkpoint_state_class(self) -> Type[IcebergCheckpointState]:
+        return IcebergCheckpointState
+
+    def is_skipping_unchanged_entities(self) -> bool:
+        return bool(
+            self.config.stateful_ingestion
+            and self.config.stateful_ingestion.skip_unchanged_profiles
+        )
+
     def get_report(self) -> SourceReport:
         return self.report
 
     def close(self) -> None:
-        pass
+        self.update_default_job_run_summary()
+        self.prepare_for_commit()
 
 
 def _parse_datatype(type: IcebergTypes.Type, nullable: bool = False) -> Dict[str, Any]:
@@ -12,9 +12,12 @@ from datahub.configuration.common import (
     ConfigModel,
     ConfigurationError,
 )
-from datahub.configuration.source_common import DatasetSourceConfigBase
-from datahub.ingestion.api.source import SourceReport
 from datahub.ingestion.source.azure.azure_common import AdlsSourceConfig
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionConfigBase,
+    StatefulIngestionReport,
+    StatefulStaleMetadataRemovalConfig,
+)
 
 
 class IcebergProfilingConfig(ConfigModel):
@@ -34,6 +37,10 @@ class IcebergProfilingConfig(ConfigModel):
         default=True,
         description="Whether to profile for the max value of numeric columns.",
     )
+    max_workers: int = Field(
+        default=1,
+        description="Number of threads used to read the manifests of a table concurrently.",
+    )
     # Stats we cannot compute without looking at data
     # include_field_mean_value: bool = True
     # include_field_median_value: bool = True
@@ -44,7 +51,24 @@ class IcebergProfilingConfig(ConfigModel):
     # include_field_sample_values: bool = True
 
 
-class IcebergSourceConfig(DatasetSourceConfigBase):
+class IcebergStatefulIngestionConfig(StatefulStaleMetadataRemovalConfig):
+    """
+    Specialization of StatefulStaleMetadataRemovalConfig to adding custom config.
+    This will be used to override the stateful_ingestion config param of StatefulIngestionConfigBase
+    in the IcebergSourceConfig.
+    """
+
+    remove_stale_metadata: bool = Field(
+        default=False,
+        description="Soft-deletes the tables that were found in the last successful run but missing in the current run with stateful_ingestion enabled.",
+    )
+    skip_unchanged_profiles: bool = Field(
+        default=True,
+        description="Skip profiling tables whose current snapshot is the one they were last profiled at. Set `ignore_old_state` to force profiling, e.g. after changing the profiling config.",
+    )
+
+
+class IcebergSourceConfig(StatefulIngestionConfigBase):
     adls: Optional[AdlsSourceConfig] = Field(
         description="[Azure Data Lake Storage](https://docs.microsoft.com/en-us/azure/storage/blobs/data-lake-storage-introduction) to crawl for Iceberg tables.  This is one filesystem type supported by this source and **only one can be configured**.",
     )
@@ -67,6 +91,7 @@ class IcebergSourceConfig(DatasetSourceConfigBase):
         description="Iceberg table property to look for a `CorpGroup` owner.  Can only hold a single group value.  If property has no value, no owner information will be emitted.",
     )
     profiling: IcebergProfilingConfig = IcebergProfilingConfig()
+    stateful_ingestion: Optional[IcebergStatefulIngestionConfig] = None
 
     @root_validator()
     def _ensure_one_filesystem_is_configured(
@@ -157,9 +182,10 @@ class IcebergSourceConfig(DatasetSourceConfigBase):
 
 
 @dataclass
-class IcebergSourceReport(SourceReport):
+class IcebergSourceReport(StatefulIngestionReport):
     tables_scanned: int = 0
     entities_profiled: int = 0
+    profiles_skipped_unchanged: int = 0
     filtered: List[str] = field(default_factory=list)
 
     def report_table_scanned(self, name: str) -> None:
@@ -170,3 +196,6 @@ class IcebergSourceReport(SourceReport):
 
     def report_entity_profiled(self, name: str) -> None:
         self.entities_profiled += 1
+
+    def report_profile_skipped_unchanged(self, name: str) -> None:
+        self.profiles_skipped_unchanged += 1
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Iterable, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, cast
 
 from iceberg.api import types as IcebergTypes
 from iceberg.api.data_file import DataFile
@@ -25,6 +26,20 @@ from datahub.metadata.schema_classes import (
     DatasetFieldProfileClass,
     DatasetProfileClass,
 )
+from datahub.utilities.ordered_thread_map import ordered_thread_map
+
+
+@dataclass
+class _ColumnStats:
+    """Column statistics aggregated over a set of data files, in lists indexed by field ID."""
+
+    null_counts: List[int]
+    min_bounds: List[Any]
+    max_bounds: List[Any]
+
+    @classmethod
+    def create(cls, size: int) -> "_ColumnStats":
+        return cls([0] * size, [None] * size, [None] * size)
 
 
 class IcebergProfiler:
@@ -37,37 +52,77 @@ class IcebergProfiler:
         self.config: IcebergProfilingConfig = config
         self.platform: str = "iceberg"
 
+    @staticmethod
     def _aggregate_counts(
-        self,
-        aggregated_count: Dict[int, int],
-        manifest_counts: Dict[int, int],
-    ) -> Dict[int, int]:
-        return {
-            k: aggregated_count.get(k, 0) + manifest_counts.get(k, 0)
-            for k in set(aggregated_count) | set(manifest_counts)
-        }
+        aggregated_counts: List[int],
+        counts: Dict[int, int],
+    ) -> None:
+        for field_id, count in counts.items():  # type: int, int
+            # Counts of historical field IDs are not reported, see _aggregate_bounds.
+            if field_id < len(aggregated_counts):
+                aggregated_counts[field_id] += count
 
+    @staticmethod
     def _aggregate_bounds(
-        self,
-        schema: Schema,
+        numeric_types: List[Optional[Type]],
         aggregator: Callable,
-        aggregated_values: Dict[int, Any],
-        manifest_values: Dict[int, Any],
+        aggregated_values: List[Any],
+        values: Dict[int, Any],
     ) -> None:
-        for field_id, value_encoded in manifest_values.items():  # type: int, Any
-            field: NestedField = schema.find_field(field_id)
+        for field_id, value_encoded in values.items():  # type: int, Any
             # Bounds in manifests can reference historical field IDs that are not part of the current schema.
             # We simply not profile those since we only care about the current snapshot.
-            if field and IcebergProfiler._is_numeric_type(field.type):
-                value_decoded = Conversions.from_byte_buffer(field.type, value_encoded)
+            field_type = (
+                numeric_types[field_id] if field_id < len(numeric_types) else None
+            )
+            if field_type is not None:
+                value_decoded = Conversions.from_byte_buffer(field_type, value_encoded)
                 if value_decoded:
-                    agg_value = aggregated_values.get(field_id)
+                    agg_value = aggregated_values[field_id]
                     aggregated_values[field_id] = (
                         aggregator(agg_value, value_decoded)
                         if agg_value
                         else value_decoded
                     )
 
+    @staticmethod
+    def _merge_bounds(
+        aggregator: Callable,
+        aggregated_values: List[Any],
+        values: List[Any],
+    ) -> None:
+        for field_id, value in enumerate(values):
+            if value is not None:
+                agg_value = aggregated_values[field_id]
+                aggregated_values[field_id] = (
+                    aggregator(agg_value, value) if agg_value is not None else value
+                )
+
+    def _read_manifest(
+        self,
+        table: Table,
+        manifest: ManifestFile,
+        numeric_types: List[Optional[Type]],
+    ) -> _ColumnStats:
+        stats = _ColumnStats.create(len(numeric_types))
+        manifest_input_file = FileSystemInputFile.from_location(
+            manifest.manifest_path, table.ops.conf
+        )
+        manifest_reader = ManifestReader.read(manifest_input_file)
+        data_file: DataFile
+        for data_file in manifest_reader.iterator():
+            if self.config.include_field_null_count:
+                self._aggregate_counts(stats.null_counts, data_file.null_value_counts())
+            if self.config.include_field_min_value:
+                self._aggregate_bounds(
+                    numeric_types, min, stats.min_bounds, data_file.lower_bounds()
+                )
+            if self.config.include_field_max_value:
+                self._aggregate_bounds(
+                    numeric_types, max, stats.max_bounds, data_file.upper_bounds()
+                )
+        return stats
+
     def profile_table(
         self,
         dataset_name: str,
@@ -111,50 +166,38 @@ class IcebergProfiler:
         )
         dataset_profile.fieldProfiles = []
 
-        field_paths: Dict[int, str] = table.schema()._id_to_name
+        schema: Schema = table.schema()
+        field_paths: Dict[int, str] = schema._id_to_name
+        # The types of the numeric fields, looked up once rather than for every bound.
+        numeric_types: List[Optional[Type]] = [None] * (max(field_paths, default=0) + 1)
+        for field_id in field_paths:
+            schema_field: NestedField = schema.find_field(field_id)
+            if schema_field and IcebergProfiler._is_numeric_type(schema_field.type):
+                numeric_types[field_id] = schema_field.type
         current_snapshot: Snapshot = table.current_snapshot()
-        total_count: int = 0
-        null_counts: Dict[int, int] = {}
-        min_bounds: Dict[int, Any] = {}
-        max_bounds: Dict[int, Any] = {}
-        manifest: ManifestFile
+        stats = _ColumnStats.create(len(numeric_types))
         try:
-            for manifest in current_snapshot.manifests:
-                manifest_input_file = FileSystemInputFile.from_location(
-                    manifest.manifest_path, table.ops.conf
-                )
-                manifest_reader = ManifestReader.read(manifest_input_file)
-                data_file: DataFile
-                for data_file in manifest_reader.iterator():
-                    if self.config.include_field_null_count:
-                        null_counts = self._aggregate_counts(
-                            null_counts, data_file.null_value_counts()
-                        )
-                    if self.config.include_field_min_value:
-                        self._aggregate_bounds(
-                            table.schema(),
-                            min,
-                            min_bounds,
-                            data_file.lower_bounds(),
-                        )
-                    if self.config.include_field_max_value:
-                        self._aggregate_bounds(
-                            table.schema(),
-                            max,
-                            max_bounds,
-                            data_file.upper_bounds(),
-                        )
-                    total_count += data_file.record_count()
+            # Manifests are read concurrently, and their statistics merged as they come.
+            manifest_stats: _ColumnStats
+            for manifest_stats in ordered_thread_map(
+                lambda manifest: self._read_manifest(table, manifest, numeric_types),
+                current_snapshot.manifests,
+                self.config.max_workers,
+            ):
+                for field_id, null_count in enumerate(manifest_stats.null_counts):
+                    stats.null_counts[field_id] += null_count
+                self._merge_bounds(min, stats.min_bounds, manifest_stats.min_bounds)
+                self._merge_bounds(max, stats.max_bounds, manifest_stats.max_bounds)
         # TODO Work on error handling to provide better feedback.  Iceberg exceptions are weak...
         except FileSystemNotFound as e:
             raise Exception("Error loading table manifests") from e
         if row_count:
             # Iterating through fieldPaths introduces unwanted stats for list element fields...
             for field_id, field_path in field_paths.items():
-                field: NestedField = table.schema().find_field(field_id)
+                field: NestedField = schema.find_field(field_id)
                 column_profile = DatasetFieldProfileClass(fieldPath=field_path)
                 if self.config.include_field_null_count:
-                    column_profile.nullCount = cast(int, null_counts.get(field_id, 0))
+                    column_profile.nullCount = cast(int, stats.null_counts[field_id])
                     column_profile.nullProportion = float(
                         column_profile.nullCount / row_count
                     )
@@ -162,17 +205,17 @@ class IcebergProfiler:
                 if self.config.include_field_min_value:
                     column_profile.min = (
                         self._renderValue(
-                            dataset_name, field.type, min_bounds.get(field_id)
+                            dataset_name, field.type, stats.min_bounds[field_id]
                         )
-                        if field_id in min_bounds
+                        if stats.min_bounds[field_id] is not None
                         else None
                     )
                 if self.config.include_field_max_value:
                     column_profile.max = (
                         self._renderValue(
-                            dataset_name, field.type, max_bounds.get(field_id)
+                            dataset_name, field.type, stats.max_bounds[field_id]
                         )
-                        if field_id in max_bounds
+                        if stats.max_bounds[field_id] is not None
                         else None
                     )
                 dataset_profile.fieldProfiles.append(column_profile)
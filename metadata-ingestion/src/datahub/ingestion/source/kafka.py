@@ -90,7 +90,6 @@ class KafkaSourceConfig(StatefulIngestionConfigBase, DatasetSourceConfigBase):
 class KafkaSourceReport(StatefulIngestionReport):
     topics_scanned: int = 0
     filtered: List[str] = field(default_factory=list)
-    soft_deleted_stale_entities: List[str] = field(default_factory=list)
 
     def report_topic_scanned(self, topic: str) -> None:
         self.topics_scanned += 1
@@ -98,9 +97,6 @@ class KafkaSourceReport(StatefulIngestionReport):
     def report_dropped(self, topic: str) -> None:
         self.filtered.append(topic)
 
-    def report_stale_entity_soft_deleted(self, urn: str) -> None:
-        self.soft_deleted_stale_entities.append(urn)
-
 
 @platform_name("Kafka")
 @config_class(KafkaSourceConfig)
@@ -211,27 +207,13 @@ class KafkaSource(StatefulIngestionSourceBase):
         ):
             logger.debug("Checking for stale entity removal.")
 
-            def soft_delete_dataset(urn: str, type: str) -> Iterable[MetadataWorkUnit]:
-                logger.info(f"Soft-deleting stale entity of type {type} - {urn}.")
-                mcp = MetadataChangeProposalWrapper(
-                    entityType="dataset",
-                    entityUrn=urn,
-                    changeType=ChangeTypeClass.UPSERT,
-                    aspectName="status",
-                    aspect=Status(removed=True),
-                )
-                wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
-                self.report.report_workunit(wu)
-                self.report.report_stale_entity_soft_deleted(urn)
-                yield wu
-
             last_checkpoint_state = cast(KafkaCheckpointState, last_checkpoint.state)
             cur_checkpoint_state = cast(KafkaCheckpointState, cur_checkpoint.state)
 
-            for topic_urn in last_checkpoint_state.get_topic_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_dataset(topic_urn, "topic")
+            yield from self.gen_stale_entity_workunits(
+                "topic",
+                last_checkpoint_state.get_topic_urns_not_in(cur_checkpoint_state),
+            )
 
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
         topics = self.consumer.list_topics().topics
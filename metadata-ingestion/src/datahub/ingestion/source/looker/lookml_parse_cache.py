@@ -0,0 +1,170 @@
+import concurrent.futures
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+import lkml
+
+from datahub.ingestion.api.report import Report
+
+logger = logging.getLogger(__name__)
+
+# (modification time in ns, size, raw content, parsed content as json)
+_CacheEntry = Tuple[int, int, str, str]
+
+
+def _read_and_parse(path: str) -> Optional[Tuple[str, _CacheEntry]]:
+    """Reads and parses a LookML file in a worker process."""
+    try:
+        stat = os.stat(path)
+        with open(path, "r") as file:
+            raw_file_content = file.read()
+        parsed = lkml.load(raw_file_content)
+        return path, (
+            stat.st_mtime_ns,
+            stat.st_size,
+            raw_file_content,
+            json.dumps(parsed),
+        )
+    except Exception as e:
+        # The file gets parsed again when it is actually loaded, which reports the error.
+        logger.debug(f"Failed to parse {path} ahead of time: {e}")
+        return None
+
+
+@dataclass
+class LookMLParseCacheReport(Report):
+    hits: int = 0
+    misses: int = 0
+    # Files whose parse was read from the on-disk cache, during a load or a preload.
+    disk_hits: int = 0
+    files_parsed_in_parallel: int = 0
+
+
+class LookMLParseCache:
+    """
+    Parsed LookML files, keyed by their resolved path and validated against their
+    modification time and size.
+
+    Every file is read once and parsed once per run. When a path is given, entries are
+    also kept in a SQLite database so that files that haven't changed since a previous
+    run aren't parsed again. Parsed files are stored as JSON and decoded on every load,
+    so callers get their own copy to modify.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.report = LookMLParseCacheReport()
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            # The cache can always be rebuilt, so trade durability for cheap commits.
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS lookml_parse_cache (path TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+                "raw TEXT NOT NULL, parsed TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _resolve(path: str) -> str:
+        return str(pathlib.Path(path).resolve())
+
+    def _get(
+        self, path: str, stat: os.stat_result, count_hit: bool = True
+    ) -> Optional[_CacheEntry]:
+        # Entries read from disk are kept in memory, so later loads count as hits.
+        entry = self._entries.get(path)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            if count_hit:
+                self.report.hits += 1
+            return entry
+
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT mtime_ns, size, raw, parsed FROM lookml_parse_cache WHERE path = ?",
+                (path,),
+            ).fetchone()
+            if row is not None and (row[0], row[1]) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                entry = (row[0], row[1], row[2], row[3])
+                self._entries[path] = entry
+                self.report.disk_hits += 1
+                return entry
+        return None
+
+    def _put(self, path: str, entry: _CacheEntry, commit: bool = True) -> None:
+        self._entries[path] = entry
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO lookml_parse_cache (path, mtime_ns, size, raw, parsed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (path, *entry),
+            )
+            if commit:
+                self._db.commit()
+
+    def load(self, path: str) -> Tuple[str, dict]:
+        """Returns the raw content of the LookML file at path and its parsed form."""
+        path = self._resolve(path)
+        stat = os.stat(path)
+        entry = self._get(path, stat)
+        if entry is None:
+            self.report.misses += 1
+            with open(path, "r") as file:
+                raw_file_content = file.read()
+            logger.debug(f"Parsing LookML file {path}")
+            parsed = lkml.load(raw_file_content)
+            entry = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                raw_file_content,
+                json.dumps(parsed),
+            )
+            self._put(path, entry)
+        return entry[2], json.loads(entry[3])
+
+    def preload(self, paths: Iterable[str], max_workers: int) -> None:
+        """Parses the files that aren't cached yet across up to max_workers processes."""
+        to_parse = []
+        for path in paths:
+            path = self._resolve(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if self._get(path, stat, count_hit=False) is None:
+                to_parse.append(path)
+        if not to_parse:
+            return
+
+        logger.info(
+            f"Parsing {len(to_parse)} LookML files with {max_workers} processes"
+        )
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            for result in executor.map(
+                _read_and_parse,
+                to_parse,
+                chunksize=max(1, len(to_parse) // (4 * max_workers)),
+            ):
+                if result is not None:
+                    path, entry = result
+                    self._put(path, entry, commit=False)
+                    self.report.files_parsed_in_parallel += 1
+        if self._db is not None:
+            self._db.commit()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -3,7 +3,6 @@ import itertools
 import logging
 import pathlib
 import re
-import sys
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from dataclasses import replace
@@ -44,6 +43,10 @@ from datahub.ingestion.source.looker.looker_lib_wrapper import (
     LookerAPIConfig,
     TransportOptionsConfig,
 )
+from datahub.ingestion.source.looker.lookml_parse_cache import (
+    LookMLParseCache,
+    LookMLParseCacheReport,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.common import BrowsePaths, Status
 from datahub.metadata.com.linkedin.pegasus2avro.dataset import (
     DatasetLineageTypeClass,
@@ -59,11 +62,7 @@ from datahub.metadata.schema_classes import (
     SubTypesClass,
 )
 from datahub.utilities.sql_parser import SQLParser
-
-if sys.version_info >= (3, 7):
-    import lkml
-else:
-    raise ModuleNotFoundError("The lookml plugin requires Python 3.7 or newer.")
+from datahub.utilities.sql_parser_cache import SQLParseCacheReport, get_sql_parse_cache
 
 logger = logging.getLogger(__name__)
 
@@ -178,6 +177,14 @@ class LookMLSourceConfig(LookerCommonConfig):
         False,
         description="When enabled, only views that are reachable from explores defined in the model files are emitted",
     )
+    parse_workers: int = Field(
+        1,
+        description="Number of processes used to parse all the LookML files of the repo up front. With 1, files are parsed one at a time as they are included.",
+    )
+    parse_cache_path: Optional[str] = Field(
+        None,
+        description="Path of a SQLite file in which parsed LookML files are kept across runs. Files whose path, modification time and size haven't changed since a previous run are not parsed again.",
+    )
 
     @validator("platform_instance")
     def platform_instance_not_supported(cls, v: str) -> str:
@@ -235,6 +242,8 @@ class LookMLSourceReport(SourceReport):
     models_dropped: List[str] = dataclass_field(default_factory=list)
     views_discovered: int = 0
     views_dropped: List[str] = dataclass_field(default_factory=list)
+    sql_parse_cache: Optional[SQLParseCacheReport] = None
+    lookml_parse_cache: Optional[LookMLParseCacheReport] = None
 
     def report_models_scanned(self) -> None:
         self.models_discovered += 1
@@ -262,6 +271,7 @@ class LookerModel:
         base_folder: str,
         path: str,
         reporter: LookMLSourceReport,
+        parse_cache: LookMLParseCache,
     ) -> "LookerModel":
         logger.debug(f"Loading model from {path}")
         connection = looker_model_dict["connection"]
@@ -271,6 +281,7 @@ class LookerModel:
             base_folder,
             path,
             reporter,
+            parse_cache,
             seen_so_far=set(),
             traversal_path=pathlib.Path(path).stem,
         )
@@ -290,6 +301,7 @@ class LookerModel:
         base_folder: str,
         path: str,
         reporter: LookMLSourceReport,
+        parse_cache: LookMLParseCache,
         seen_so_far: Set[str],
         traversal_path: str = "",  # a cosmetic parameter to aid debugging
     ) -> List[str]:
@@ -351,22 +363,22 @@ class LookerModel:
                     f"Will be loading {included_file}, traversed here via {traversal_path}"
                 )
                 try:
-                    with open(included_file, "r") as file:
-                        parsed = lkml.load(file)
-                        seen_so_far.add(included_file)
-                        if "includes" in parsed:  # we have more includes to resolve!
-                            resolved.extend(
-                                LookerModel.resolve_includes(
-                                    parsed["includes"],
-                                    base_folder,
-                                    included_file,
-                                    reporter,
-                                    seen_so_far,
-                                    traversal_path=traversal_path
-                                    + "."
-                                    + pathlib.Path(included_file).stem,
-                                )
+                    _, parsed = parse_cache.load(included_file)
+                    seen_so_far.add(included_file)
+                    if "includes" in parsed:  # we have more includes to resolve!
+                        resolved.extend(
+                            LookerModel.resolve_includes(
+                                parsed["includes"],
+                                base_folder,
+                                included_file,
+                                reporter,
+                                parse_cache,
+                                seen_so_far,
+                                traversal_path=traversal_path
+                                + "."
+                                + pathlib.Path(included_file).stem,
                             )
+                        )
                 except Exception as e:
                     reporter.report_warning(
                         path, f"Failed to load {included_file} due to {e}"
@@ -395,6 +407,7 @@ class LookerViewFile:
         base_folder: str,
         raw_file_content: str,
         reporter: LookMLSourceReport,
+        parse_cache: LookMLParseCache,
     ) -> "LookerViewFile":
         logger.debug(f"Loading view file at {absolute_file_path}")
         includes = looker_view_file_dict.get("includes", [])
@@ -406,6 +419,7 @@ class LookerViewFile:
             base_folder,
             absolute_file_path,
             reporter,
+            parse_cache,
             seen_so_far=seen_so_far,
         )
         logger.debug(
@@ -435,10 +449,16 @@ class LookerViewFileLoader:
     This is to avoid reloading the same file off of disk many times during the recursive include resolution process
     """
 
-    def __init__(self, base_folder: str, reporter: LookMLSourceReport) -> None:
+    def __init__(
+        self,
+        base_folder: str,
+        reporter: LookMLSourceReport,
+        parse_cache: LookMLParseCache,
+    ) -> None:
         self.viewfile_cache: Dict[str, LookerViewFile] = {}
         self._base_folder = base_folder
         self.reporter = reporter
+        self.parse_cache = parse_cache
 
     def is_view_seen(self, path: str) -> bool:
         return path in self.viewfile_cache
@@ -459,25 +479,19 @@ class LookerViewFileLoader:
             return self.viewfile_cache[path]
 
         try:
-            with open(path, "r") as file:
-                raw_file_content = file.read()
-        except Exception as e:
-            self.reporter.report_failure(path, f"failed to load view file: {e}")
-            return None
-        try:
-            with open(path, "r") as file:
-                logger.debug(f"Loading viewfile {path}")
-                parsed = lkml.load(file)
-                looker_viewfile = LookerViewFile.from_looker_dict(
-                    absolute_file_path=path,
-                    looker_view_file_dict=parsed,
-                    base_folder=self._base_folder,
-                    raw_file_content=raw_file_content,
-                    reporter=reporter,
-                )
-                logger.debug(f"adding viewfile for path {path} to the cache")
-                self.viewfile_cache[path] = looker_viewfile
-                return looker_viewfile
+            logger.debug(f"Loading viewfile {path}")
+            raw_file_content, parsed = self.parse_cache.load(path)
+            looker_viewfile = LookerViewFile.from_looker_dict(
+                absolute_file_path=path,
+                looker_view_file_dict=parsed,
+                base_folder=self._base_folder,
+                raw_file_content=raw_file_content,
+                reporter=reporter,
+                parse_cache=self.parse_cache,
+            )
+            logger.debug(f"adding viewfile for path {path} to the cache")
+            self.viewfile_cache[path] = looker_viewfile
+            return looker_viewfile
         except Exception as e:
             self.reporter.report_failure(path, f"failed to load view file: {e}")
             return None
@@ -522,10 +536,9 @@ class LookerView:
     def _get_sql_info(cls, sql: str, sql_parser_path: str) -> SQLInfo:
         parser_cls = cls._import_sql_parser_cls(sql_parser_path)
 
-        parser_instance: SQLParser = parser_cls(sql)
-
-        sql_table_names: List[str] = parser_instance.get_tables()
-        column_names: List[str] = parser_instance.get_columns()
+        sql_table_names, column_names = get_sql_parse_cache().get_tables_and_columns(
+            parser_cls, sql
+        )
         logger.debug(f"Column names parsed = {column_names}")
         # Drop table names with # in them
         sql_table_names = [t for t in sql_table_names if "#" not in t]
@@ -819,6 +832,9 @@ class LookMLSource(Source):
         super().__init__(ctx)
         self.source_config = config
         self.reporter = LookMLSourceReport()
+        self.reporter.sql_parse_cache = get_sql_parse_cache().report
+        self.parse_cache = LookMLParseCache(self.source_config.parse_cache_path)
+        self.reporter.lookml_parse_cache = self.parse_cache.report
         if self.source_config.api:
             looker_api = LookerAPI(self.source_config.api)
             self.looker_client = looker_api.get_client()
@@ -830,12 +846,15 @@ class LookMLSource(Source):
                 )
 
     def _load_model(self, path: str) -> LookerModel:
-        with open(path, "r") as file:
-            logger.debug(f"Loading model from file {path}")
-            parsed = lkml.load(file)
-            looker_model = LookerModel.from_looker_dict(
-                parsed, str(self.source_config.base_folder), path, self.reporter
-            )
+        logger.debug(f"Loading model from file {path}")
+        _, parsed = self.parse_cache.load(path)
+        looker_model = LookerModel.from_looker_dict(
+            parsed,
+            str(self.source_config.base_folder),
+            path,
+            self.reporter,
+            self.parse_cache,
+        )
         return looker_model
 
     def _platform_names_have_2_parts(self, platform: str) -> bool:
@@ -1068,8 +1087,17 @@ class LookMLSource(Source):
 
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:  # noqa: C901
         viewfile_loader = LookerViewFileLoader(
-            str(self.source_config.base_folder), self.reporter
+            str(self.source_config.base_folder), self.reporter, self.parse_cache
         )
+        if self.source_config.parse_workers > 1:
+            self.parse_cache.preload(
+                (
+                    str(path)
+                    for path in self.source_config.base_folder.glob("**/*.lkml")
+                    if not path.name.endswith(".dashboard.lkml")
+                ),
+                self.source_config.parse_workers,
+            )
 
         # some views can be mentioned by multiple 'include' statements and can be included via different connections.
         # So this set is used to prevent creating duplicate events
@@ -1235,4 +1263,4 @@ class LookMLSource(Source):
         return self.reporter
 
     def close(self):
-        pass
+        self.parse_cache.close()
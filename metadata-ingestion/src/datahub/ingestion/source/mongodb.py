@@ -192,7 +192,7 @@ def construct_schema_pymongo(
         aggregations.append({"$limit": sample_size})
         documents = collection.aggregate(aggregations, allowDiskUse=True)
 
-    return construct_schema(list(documents), delimiter)
+    return construct_schema(documents, delimiter)
 
 
 @platform_name("MongoDB")
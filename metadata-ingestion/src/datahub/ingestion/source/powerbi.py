@@ -5,16 +5,20 @@
 #########################################################
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from enum import Enum
+from functools import lru_cache
 from time import sleep
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 from xmlrpc.client import Boolean
 
 import msal
 import pydantic
 import requests
+from requests.adapters import HTTPAdapter
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import ConfigurationError
@@ -50,10 +54,18 @@ from datahub.metadata.schema_classes import (
     StatusClass,
 )
 from datahub.utilities.dedup_list import deduplicate_list
+from datahub.utilities.ordered_thread_map import (
+    ordered_executor_map,
+    ordered_thread_map,
+)
+from datahub.utilities.perf_timer import PerfTimer
 
 # Logger instance
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class Constant:
     """
@@ -110,6 +122,11 @@ class PowerBiAPIConfig(EnvBasedSourceConfigBase):
     tenant_id: str = pydantic.Field(description="PowerBI tenant identifier")
     # PowerBi workspace identifier
     workspace_id: str = pydantic.Field(description="PowerBI workspace identifier")
+    # More PowerBi workspace identifiers
+    workspace_ids: List[str] = pydantic.Field(
+        default=[],
+        description="Identifiers of more PowerBI workspaces to ingest along with workspace_id",
+    )
     # Dataset type mapping
     dataset_type_mapping: Dict[str, str] = pydantic.Field(
         description="Mapping of PowerBI datasource type to DataHub supported data-sources. See Quickstart Recipe for mapping"
@@ -126,6 +143,20 @@ class PowerBiAPIConfig(EnvBasedSourceConfigBase):
     extract_ownership: bool = pydantic.Field(
         default=True, description="Whether ownership should be ingested"
     )
+    # Number of threads to query PowerBi with
+    max_threads: int = pydantic.Field(
+        default=1,
+        description="Number of workspaces to scan concurrently. The datasets, tiles and users of a workspace are fetched on as many threads.",
+    )
+
+    @pydantic.validator("max_threads")
+    def max_threads_positive(cls, v):
+        if v < 1:
+            raise ValueError("max_threads must be at least 1")
+        return v
+
+    def get_workspace_ids(self) -> List[str]:
+        return deduplicate_list([self.workspace_id, *self.workspace_ids])
 
 
 class PowerBiDashboardSourceConfig(PowerBiAPIConfig):
@@ -310,9 +341,29 @@ class PowerBiAPI:
         def __hash__(self):
             return hash(self.__members())
 
-    def __init__(self, config: PowerBiAPIConfig) -> None:
+    def __init__(
+        self,
+        config: PowerBiAPIConfig,
+        reporter: Optional["PowerBiDashboardSourceReport"] = None,
+    ) -> None:
         self.__config: PowerBiAPIConfig = config
         self.__access_token: str = ""
+        self.__reporter = reporter
+        self.__report_lock = threading.Lock()
+
+        # Requests share a session, so that connections to PowerBi are kept alive.
+        # Workspaces are scanned on max_threads threads, while their datasets, tiles
+        # and users are fetched on as many threads again.
+        self.__session = requests.Session()
+        self.__session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=max(2 * self.__config.max_threads, 10)),
+        )
+        self.__executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=self.__config.max_threads)
+            if self.__config.max_threads > 1
+            else None
+        )
 
         # Power-Bi Auth (Service Principal Auth)
         self.__msal_client = msal.ConfidentialClientApplication(
@@ -329,6 +380,39 @@ class PowerBiAPI:
     def __get_authority_url(self):
         return "{}{}".format(PowerBiAPI.AUTHORITY, self.__config.tenant_id)
 
+    def __request(
+        self, endpoint: str, method: str, url: str, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send the request on the shared session and report its latency for the endpoint
+        """
+        with PerfTimer() as timer:
+            response = self.__session.request(
+                method,
+                url,
+                headers={Constant.Authorization: self.get_access_token()},
+                **kwargs,
+            )
+
+        if self.__reporter is not None:
+            with self.__report_lock:
+                self.__reporter.report_http_request(endpoint, timer.elapsed_seconds())
+
+        return response
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterable[R]:
+        """
+        Apply fn to the items on the request threads and return the results in order
+        """
+        return ordered_executor_map(
+            self.__executor, fn, items, 2 * self.__config.max_threads
+        )
+
+    def close(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown()
+        self.__session.close()
+
     def __get_users(self, workspace_id: str, entity: str, id: str) -> List[User]:
         """
         Get user for the given PowerBi entity
@@ -349,10 +433,7 @@ class PowerBiAPI:
         )
         # Hit PowerBi
         LOGGER.info(f"Request to URL={user_list_endpoint}")
-        response = requests.get(
-            user_list_endpoint,
-            headers={Constant.Authorization: self.get_access_token()},
-        )
+        response = self.__request(Constant.ENTITY_USER_LIST, "GET", user_list_endpoint)
 
         # Check if we got response from PowerBi
         if response.status_code != 200:
@@ -382,9 +463,11 @@ class PowerBiAPI:
 
         return users
 
+    @lru_cache(maxsize=None)
     def __get_report(self, workspace_id: str, report_id: str) -> Any:
         """
-        Fetch the dataset from PowerBi for the given dataset identifier
+        Fetch the report from PowerBi for the given report identifier. As many tiles
+        can be created from the same report, the report is fetched only once.
         """
         if workspace_id is None or report_id is None:
             LOGGER.info("Input values are None")
@@ -401,10 +484,7 @@ class PowerBiAPI:
         )
         # Hit PowerBi
         LOGGER.info(f"Request to report URL={report_get_endpoint}")
-        response = requests.get(
-            report_get_endpoint,
-            headers={Constant.Authorization: self.get_access_token()},
-        )
+        response = self.__request(Constant.REPORT_GET, "GET", report_get_endpoint)
 
         # Check if we got response from PowerBi
         if response.status_code != 200:
@@ -474,9 +554,8 @@ class PowerBiAPI:
         )
         # Hit PowerBi
         LOGGER.info(f"Request to URL={dashboard_list_endpoint}")
-        response = requests.get(
-            dashboard_list_endpoint,
-            headers={Constant.Authorization: self.get_access_token()},
+        response = self.__request(
+            Constant.DASHBOARD_LIST, "GET", dashboard_list_endpoint
         )
 
         # Check if we got response from PowerBi
@@ -508,9 +587,11 @@ class PowerBiAPI:
 
         return dashboards
 
+    @lru_cache(maxsize=None)
     def get_dataset(self, workspace_id: str, dataset_id: str) -> Any:
         """
-        Fetch the dataset from PowerBi for the given dataset identifier
+        Fetch the dataset from PowerBi for the given dataset identifier. As the
+        dataset is also referenced by reports, it is fetched only once.
         """
         if workspace_id is None or dataset_id is None:
             LOGGER.info("Input values are None")
@@ -527,10 +608,7 @@ class PowerBiAPI:
         )
         # Hit PowerBi
         LOGGER.info(f"Request to dataset URL={dataset_get_endpoint}")
-        response = requests.get(
-            dataset_get_endpoint,
-            headers={Constant.Authorization: self.get_access_token()},
-        )
+        response = self.__request(Constant.DATASET_GET, "GET", dataset_get_endpoint)
 
         # Check if we got response from PowerBi
         if response.status_code != 200:
@@ -568,9 +646,8 @@ class PowerBiAPI:
         )
         # Hit PowerBi
         LOGGER.info(f"Request to datasource URL={datasource_get_endpoint}")
-        response = requests.get(
-            datasource_get_endpoint,
-            headers={Constant.Authorization: self.get_access_token()},
+        response = self.__request(
+            Constant.DATASOURCE_GET, "GET", datasource_get_endpoint
         )
 
         # Check if we got response from PowerBi
@@ -685,10 +762,7 @@ class PowerBiAPI:
         )
         # Hit PowerBi
         LOGGER.info("Request to URL={}".format(tile_list_endpoint))
-        response = requests.get(
-            tile_list_endpoint,
-            headers={Constant.Authorization: self.get_access_token()},
-        )
+        response = self.__request(Constant.TILE_LIST, "GET", tile_list_endpoint)
 
         # Check if we got response from PowerBi
         if response.status_code != 200:
@@ -729,7 +803,9 @@ class PowerBiAPI:
             """
             request_body = {"workspaces": [workspace_id]}
 
-            res = requests.post(
+            res = self.__request(
+                Constant.SCAN_CREATE,
+                "POST",
                 scan_create_endpoint,
                 data=request_body,
                 params={
@@ -739,7 +815,6 @@ class PowerBiAPI:
                     "getArtifactUsers": True,
                     "lineage": True,
                 },
-                headers={Constant.Authorization: self.get_access_token()},
             )
 
             if res.status_code not in (200, 202):
@@ -776,10 +851,7 @@ class PowerBiAPI:
             trail = 1
             while True:
                 LOGGER.info(f"Trial = {trail}")
-                res = requests.get(
-                    scan_get_endpoint,
-                    headers={Constant.Authorization: self.get_access_token()},
-                )
+                res = self.__request(Constant.SCAN_GET, "GET", scan_get_endpoint)
                 if res.status_code != 200:
                     message = f"API({scan_get_endpoint}) return error code {res.status_code} for scan id({scan_id})"
 
@@ -811,9 +883,8 @@ class PowerBiAPI:
             )
 
             LOGGER.info(f"Hitting URL={scan_result_get_endpoint}")
-            res = requests.get(
-                scan_result_get_endpoint,
-                headers={Constant.Authorization: self.get_access_token()},
+            res = self.__request(
+                Constant.SCAN_RESULT_GET, "GET", scan_result_get_endpoint
             )
             if res.status_code != 200:
                 message = f"API({scan_result_get_endpoint}) return error code {res.status_code} for scan id({scan_id})"
@@ -839,15 +910,20 @@ class PowerBiAPI:
                 LOGGER.info("Returning empty datasets")
                 return dataset_map
 
-            for dataset_dict in datasets:
+            def new_dataset(dataset_dict: dict) -> PowerBiAPI.Dataset:
                 dataset_instance: PowerBiAPI.Dataset = self.get_dataset(
                     workspace_id=scan_result["id"],
                     dataset_id=dataset_dict["id"],
                 )
-
-                dataset_map[dataset_instance.id] = dataset_instance
                 # set dataset's DataSource
                 dataset_instance.datasource = self.get_data_source(dataset_instance)
+                return dataset_instance
+
+            # The datasets and their data sources are fetched concurrently
+            for dataset_dict, dataset_instance in zip(
+                datasets, self.map(new_dataset, datasets)
+            ):
+                dataset_map[dataset_instance.id] = dataset_instance
                 # Set table only if the datasource is relational and dataset is not created from custom SQL i.e Value.NativeQuery(
                 # There are dataset which doesn't have DataSource
                 if (
@@ -878,8 +954,12 @@ class PowerBiAPI:
             return dataset_map
 
         def init_dashboard_tiles(workspace: PowerBiAPI.Workspace) -> None:
-            for dashboard in workspace.dashboards:
-                dashboard.tiles = self.get_tiles(workspace, dashboard=dashboard)
+            tiles = self.map(
+                lambda dashboard: self.get_tiles(workspace, dashboard=dashboard),
+                workspace.dashboards,
+            )
+            for dashboard, dashboard_tiles in zip(workspace.dashboards, tiles):
+                dashboard.tiles = dashboard_tiles
 
             return None
 
@@ -1187,7 +1267,7 @@ class Mapper:
 
         # Dashboard browsePaths
         browse_path = BrowsePathsClass(
-            paths=["/powerbi/{}".format(self.__config.workspace_id)]
+            paths=["/powerbi/{}".format(dashboard.workspace_id)]
         )
         browse_path_mcp = self.new_mcp(
             entity_type=Constant.DASHBOARD,
@@ -1328,6 +1408,30 @@ class PowerBiDashboardSourceReport(SourceReport):
     charts_scanned: int = 0
     filtered_dashboards: List[str] = dataclass_field(default_factory=list)
     filtered_charts: List[str] = dataclass_field(default_factory=list)
+    workspaces_scanned: int = 0
+    # Number, total and maximum latency of the requests to each PowerBi endpoint
+    http_requests: Dict[str, int] = dataclass_field(default_factory=dict)
+    http_request_seconds: Dict[str, float] = dataclass_field(default_factory=dict)
+    http_request_max_seconds: Dict[str, float] = dataclass_field(default_factory=dict)
+    http_requests_per_second: float = 0.0
+
+    def report_workspaces_scanned(self, count: int = 1) -> None:
+        self.workspaces_scanned += count
+
+    def report_http_request(self, endpoint: str, seconds: float) -> None:
+        self.http_requests[endpoint] = self.http_requests.get(endpoint, 0) + 1
+        self.http_request_seconds[endpoint] = (
+            self.http_request_seconds.get(endpoint, 0.0) + seconds
+        )
+        self.http_request_max_seconds[endpoint] = max(
+            self.http_request_max_seconds.get(endpoint, 0.0), seconds
+        )
+
+    def report_http_throughput(self, elapsed_seconds: float) -> None:
+        if elapsed_seconds > 0:
+            self.http_requests_per_second = (
+                sum(self.http_requests.values()) / elapsed_seconds
+            )
 
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
@@ -1364,8 +1468,8 @@ class PowerBiDashboardSource(Source):
         super().__init__(ctx)
         self.source_config = config
         self.reporter = PowerBiDashboardSourceReport()
-        self.auth_token = PowerBiAPI(self.source_config).get_access_token()
-        self.powerbi_client = PowerBiAPI(self.source_config)
+        self.powerbi_client = PowerBiAPI(self.source_config, self.reporter)
+        self.auth_token = self.powerbi_client.get_access_token()
         self.mapper = Mapper(config)
 
     @classmethod
@@ -1379,29 +1483,65 @@ class PowerBiDashboardSource(Source):
         """
         LOGGER.info("PowerBi plugin execution is started")
 
-        # Fetch PowerBi workspace for given workspace identifier
-        workspace = self.powerbi_client.get_workspace(self.source_config.workspace_id)
-
-        for dashboard in workspace.dashboards:
-
-            try:
-                # Fetch PowerBi users for dashboards
-                dashboard.users = self.powerbi_client.get_dashboard_users(dashboard)
-                # Increase dashboard and tiles count in report
-                self.reporter.report_dashboards_scanned()
-                self.reporter.report_charts_scanned(count=len(dashboard.tiles))
-            except Exception as e:
-                message = f"Error ({e}) occurred while loading dashboard {dashboard.displayName}(id={dashboard.id}) tiles."
-
-                LOGGER.exception(message, e)
-                self.reporter.report_warning(dashboard.id, message)
-            # Convert PowerBi Dashboard and child entities to Datahub work unit to ingest into Datahub
-            workunits = self.mapper.to_datahub_work_units(dashboard)
-            for workunit in workunits:
-                # Add workunit to report
-                self.reporter.report_workunit(workunit)
-                # Return workunit to Datahub Ingestion framework
-                yield workunit
+        with PerfTimer() as timer:
+            yield from self.__get_workspaces_workunits()
+        self.reporter.report_http_throughput(timer.elapsed_seconds())
+
+    def __scan_workspace(
+        self, workspace_id: str
+    ) -> Union[PowerBiAPI.Workspace, Exception]:
+        try:
+            return self.powerbi_client.get_workspace(workspace_id)
+        except Exception as e:
+            LOGGER.exception(f"Failed to scan workspace {workspace_id}")
+            return e
+
+    def __fetch_dashboard_users(
+        self, dashboard: PowerBiAPI.Dashboard
+    ) -> Optional[Exception]:
+        try:
+            # Fetch PowerBi users for dashboards
+            dashboard.users = self.powerbi_client.get_dashboard_users(dashboard)
+        except Exception as e:
+            LOGGER.exception(f"Failed to fetch users of dashboard {dashboard.id}")
+            return e
+        return None
+
+    def __get_workspaces_workunits(self) -> Iterable[MetadataWorkUnit]:
+        workspace_ids = self.source_config.get_workspace_ids()
+        # Scan jobs of the next workspaces are submitted and polled while the
+        # workunits of a workspace are generated
+        workspaces = ordered_thread_map(
+            self.__scan_workspace, workspace_ids, self.source_config.max_threads
+        )
+        for workspace_id, workspace in zip(workspace_ids, workspaces):
+            if isinstance(workspace, Exception):
+                message = f"Error ({workspace}) occurred while scanning workspace(id={workspace_id})."
+                self.reporter.report_failure(workspace_id, message)
+                continue
+
+            self.reporter.report_workspaces_scanned()
+            errors = self.powerbi_client.map(
+                self.__fetch_dashboard_users, workspace.dashboards
+            )
+            for dashboard, error in zip(workspace.dashboards, errors):
+                if error is None:
+                    # Increase dashboard and tiles count in report
+                    self.reporter.report_dashboards_scanned()
+                    self.reporter.report_charts_scanned(count=len(dashboard.tiles))
+                else:
+                    message = f"Error ({error}) occurred while loading dashboard {dashboard.displayName}(id={dashboard.id}) tiles."
+                    self.reporter.report_warning(dashboard.id, message)
+                # Convert PowerBi Dashboard and child entities to Datahub work unit to ingest into Datahub
+                workunits = self.mapper.to_datahub_work_units(dashboard)
+                for workunit in workunits:
+                    # Add workunit to report
+                    self.reporter.report_workunit(workunit)
+                    # Return workunit to Datahub Ingestion framework
+                    yield workunit
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        self.powerbi_client.close()
@@ -264,20 +264,6 @@ class PulsarSource(StatefulIngestionSourceBase):
 
         return cls(config, ctx)
 
-    def soft_delete_dataset(self, urn: str, type: str) -> Iterable[MetadataWorkUnit]:
-        logger.debug(f"Soft-deleting stale entity of type {type} - {urn}.")
-        mcp = MetadataChangeProposalWrapper(
-            entityType="dataset",
-            entityUrn=urn,
-            changeType=ChangeTypeClass.UPSERT,
-            aspectName="status",
-            aspect=StatusClass(removed=True),
-        )
-        wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
-        self.report.report_workunit(wu)
-        self.report.report_stale_entity_soft_deleted(urn)
-        yield wu
-
     def gen_removed_entity_workunits(self) -> Iterable[MetadataWorkUnit]:
         last_checkpoint = self.get_last_checkpoint(
             self.get_default_ingestion_job_id(), KafkaCheckpointState
@@ -298,10 +284,10 @@ class PulsarSource(StatefulIngestionSourceBase):
             last_checkpoint_state = cast(KafkaCheckpointState, last_checkpoint.state)
             cur_checkpoint_state = cast(KafkaCheckpointState, cur_checkpoint.state)
 
-            for topic_urn in last_checkpoint_state.get_topic_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from self.soft_delete_dataset(topic_urn, "topic")
+            yield from self.gen_stale_entity_workunits(
+                "topic",
+                last_checkpoint_state.get_topic_urns_not_in(cur_checkpoint_state),
+            )
 
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
         """
@@ -41,6 +41,7 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.sql_parser import SQLParser
+from datahub.utilities.sql_parser_cache import SQLParseCacheReport, get_sql_parse_cache
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -296,6 +297,7 @@ class RedashSourceReport(SourceReport):
     max_page_dashboards: Optional[int] = field(default=None)
     api_page_limit: Optional[float] = field(default=None)
     timing: Dict[str, int] = field(default_factory=dict)
+    sql_parse_cache: Optional[SQLParseCacheReport] = None
 
     def report_item_scanned(self) -> None:
         self.items_scanned += 1
@@ -352,6 +354,8 @@ class RedashSource(Source):
 
         self.parse_table_names_from_sql = self.config.parse_table_names_from_sql
         self.sql_parser_path = self.config.sql_parser
+        if self.parse_table_names_from_sql:
+            self.report.sql_parse_cache = get_sql_parse_cache().report
 
         logger.info(
             f"Running Redash ingestion with parse_table_names_from_sql={self.parse_table_names_from_sql}"
@@ -390,7 +394,7 @@ class RedashSource(Source):
     def _get_sql_table_names(cls, sql: str, sql_parser_path: str) -> List[str]:
         parser_cls = cls._import_sql_parser_cls(sql_parser_path)
 
-        sql_table_names: List[str] = parser_cls(sql).get_tables()
+        sql_table_names: List[str] = get_sql_parse_cache().get_tables(parser_cls, sql)
 
         # Remove quotes from table names
         sql_table_names = [t.replace('"', "") for t in sql_table_names]
@@ -0,0 +1,441 @@
+import collections
+import dataclasses
+import hashlib
+import math
+from typing import Any, Counter, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.profiling.common import (
+    Cardinality,
+    _convert_to_cardinality,
+)
+from datahub.ingestion.source.s3.profiling import (
+    MAX_HIST_BINS,
+    NUM_SAMPLE_ROWS,
+    QUANTILES,
+    DataLakeProfilerConfig,
+    null_str,
+)
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    HistogramClass,
+    QuantileClass,
+    ValueFrequencyClass,
+)
+from datahub.telemetry import stats, telemetry
+from datahub.utilities.heavy_hitters import SpaceSavingCounter
+
+# Distinct values of a column are counted exactly up to this many. Past that, their
+# number is estimated and only the most frequent ones are tracked.
+MAX_EXACT_DISTINCT_VALUES = 100_000
+TOP_VALUES_CAPACITY = 1_000
+DISTINCT_VALUES_SKETCH_SIZE = 16_384
+# quantiles are computed from a uniform sample of this many values of a column
+QUANTILE_SAMPLE_SIZE = 100_000
+BATCH_SIZE = 65_536
+
+_FEW_CARDINALITIES = [
+    Cardinality.ONE,
+    Cardinality.TWO,
+    Cardinality.VERY_FEW,
+    Cardinality.FEW,
+]
+
+
+def _stable_hash(value: Any) -> int:
+    # Unlike hash(), this is the same in every process and doesn't map -1 and -2 to
+    # the same value.
+    return int.from_bytes(
+        hashlib.blake2b(repr(value).encode(), digest_size=8).digest(), "little"
+    )
+
+
+class _DistinctValuesSketch:
+    """
+    Estimates the number of distinct values in a stream from the k smallest hashes
+    seen (the KMV estimator, Bar-Yossef et al., 2002).
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self._min_hashes = np.empty(0, dtype=np.uint64)
+
+    def add(self, values: Iterable[Any]) -> None:
+        hashes = np.fromiter((_stable_hash(value) for value in values), dtype=np.uint64)
+        self._min_hashes = np.unique(np.concatenate([self._min_hashes, hashes]))[
+            : self.k
+        ]
+
+    def estimate(self) -> int:
+        if len(self._min_hashes) < self.k:
+            return len(self._min_hashes)
+        return int((self.k - 1) / (float(self._min_hashes[-1]) / 2**64))
+
+
+class _UniformSample:
+    """A uniform sample of up to `size` values of a stream: the ones given the smallest random keys."""
+
+    def __init__(self, size: int, rng: np.random.Generator) -> None:
+        self.size = size
+        self._rng = rng
+        self._keys = np.empty(0)
+        self.values = np.empty(0)
+
+    def add(self, values: np.ndarray) -> None:
+        keys = np.concatenate([self._keys, self._rng.random(len(values))])
+        values = np.concatenate([self.values, values])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size)[: self.size]
+            keys, values = keys[keep], values[keep]
+        self._keys, self.values = keys, values
+
+
+@dataclasses.dataclass
+class _ArrowColumnSpec:
+    column: str
+    column_profile: DatasetFieldProfileClass
+    type_: pa.DataType
+
+    null_count: int = 0
+    # Exact counts of the values, until there are too many of them. Then the distinct
+    # values are estimated by the sketch and the most frequent ones are tracked instead.
+    value_counts: Optional[Counter[Any]] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    distinct_values: Optional[_DistinctValuesSketch] = None
+    top_values: Optional[SpaceSavingCounter] = None
+    # values of types such as lists and structs can't be counted
+    countable: bool = True
+
+    min: Any = None
+    max: Any = None
+    # numeric columns only
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    quantile_sample: Optional[_UniformSample] = None
+
+    def is_numeric(self) -> bool:
+        return (
+            pa.types.is_integer(self.type_)
+            or pa.types.is_floating(self.type_)
+            or pa.types.is_decimal(self.type_)
+        )
+
+    def is_temporal(self) -> bool:
+        return pa.types.is_date(self.type_) or pa.types.is_timestamp(self.type_)
+
+    def unique_count(self) -> Optional[int]:
+        if not self.countable:
+            return None
+        if self.value_counts is not None:
+            return len(self.value_counts)
+        assert self.distinct_values is not None
+        return self.distinct_values.estimate()
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Any, int]]:
+        if self.value_counts is not None:
+            return self.value_counts.most_common(n)
+        assert self.top_values is not None
+        return self.top_values.most_common(n)
+
+    def _count_values(self, values: pa.Array) -> None:
+        try:
+            counts = pc.value_counts(values)
+            counted = dict(
+                zip(
+                    counts.field("values").to_pylist(),
+                    counts.field("counts").to_pylist(),
+                )
+            )
+        except (pa.ArrowNotImplementedError, TypeError):
+            self.countable = False
+            return
+
+        if self.value_counts is not None:
+            self.value_counts.update(counted)
+            if len(self.value_counts) <= MAX_EXACT_DISTINCT_VALUES:
+                return
+            counted, self.value_counts = dict(self.value_counts), None
+            self.distinct_values = _DistinctValuesSketch(DISTINCT_VALUES_SKETCH_SIZE)
+            self.top_values = SpaceSavingCounter(TOP_VALUES_CAPACITY)
+
+        assert self.distinct_values is not None and self.top_values is not None
+        self.distinct_values.add(counted.keys())
+        for value, count in counted.items():
+            self.top_values.add(value, count)
+
+    def update(self, array: pa.Array) -> None:
+        self.null_count += array.null_count
+        values = array.filter(pc.is_valid(array))
+        if pa.types.is_floating(self.type_):
+            # NaNs count as nulls, like in the spark engine
+            not_nan = pc.invert(pc.is_nan(values))
+            self.null_count += len(values) - (pc.sum(not_nan).as_py() or 0)
+            values = values.filter(not_nan)
+        if len(values) == 0:
+            return
+
+        if self.countable:
+            self._count_values(values)
+
+        if self.is_numeric() or self.is_temporal():
+            min_max = pc.min_max(values)
+            batch_min, batch_max = min_max["min"].as_py(), min_max["max"].as_py()
+            self.min = batch_min if self.min is None else min(self.min, batch_min)
+            self.max = batch_max if self.max is None else max(self.max, batch_max)
+
+        if self.is_numeric():
+            # unsafe, since 64-bit integers beyond 2**53 can't be represented exactly
+            floats = pc.cast(values, pa.float64(), safe=False)
+            n = len(floats)
+            batch_mean = pc.mean(floats).as_py()
+            batch_m2 = pc.variance(floats, ddof=0).as_py() * n
+            # merge the batch into the running mean and sum of squared differences
+            total = self.count + n
+            delta = batch_mean - self.mean
+            self.mean += delta * n / total
+            self.m2 += batch_m2 + delta * delta * self.count * n / total
+            self.count = total
+            if self.quantile_sample is not None:
+                self.quantile_sample.add(floats.to_numpy(zero_copy_only=False))
+
+
+class _ArrowTableProfiler:
+    """
+    Profiles a table in-process with pyarrow, streaming over its record batches.
+
+    Computes the same metrics as the spark engine. Min, max, mean and standard
+    deviation are exact. Distinct counts are exact up to MAX_EXACT_DISTINCT_VALUES and
+    estimated past that, and quantiles are computed from a uniform sample of values.
+    """
+
+    dataset: ds.Dataset
+    column_specs: List[_ArrowColumnSpec]
+    row_count: int
+    rows_profiled: int
+    profiling_config: DataLakeProfilerConfig
+    file_path: str
+    columns_to_profile: List[str]
+    ignored_columns: List[str]
+    profile: DatasetProfileClass
+    report: DataLakeSourceReport
+
+    def __init__(
+        self,
+        dataset: ds.Dataset,
+        profiling_config: DataLakeProfilerConfig,
+        report: DataLakeSourceReport,
+        file_path: str,
+    ):
+        self.dataset = dataset
+        self.column_specs = []
+        self.row_count = dataset.count_rows()
+        self.rows_profiled = 0
+        self.profiling_config = profiling_config
+        self.file_path = file_path
+        self.columns_to_profile = []
+        self.ignored_columns = []
+        self.profile = DatasetProfileClass(timestampMillis=get_sys_time())
+        self.report = report
+        # fixed seed, so that samples don't change between runs over the same data
+        self._rng = np.random.default_rng(0)
+        self._row_sample = _UniformSample(NUM_SAMPLE_ROWS, self._rng)
+        self._sample_rows: Dict[int, Dict[str, Any]] = {}
+
+        self.profile.rowCount = self.row_count
+        self.profile.columnCount = len(dataset.schema.names)
+
+        if self.profiling_config.profile_table_level_only:
+            return
+
+        for column in dataset.schema.names:
+            if not self.profiling_config.allow_deny_patterns.allowed(column):
+                self.ignored_columns.append(column)
+                continue
+            self.columns_to_profile.append(column)
+
+        if self.profiling_config.max_number_of_fields_to_profile is not None:
+            if (
+                len(self.columns_to_profile)
+                > self.profiling_config.max_number_of_fields_to_profile
+            ):
+                columns_being_dropped = self.columns_to_profile[
+                    self.profiling_config.max_number_of_fields_to_profile :
+                ]
+                self.columns_to_profile = self.columns_to_profile[
+                    : self.profiling_config.max_number_of_fields_to_profile
+                ]
+
+                self.report.report_file_dropped(
+                    f"The max_number_of_fields_to_profile={self.profiling_config.max_number_of_fields_to_profile} reached. Profile of columns {self.file_path}({', '.join(sorted(columns_being_dropped))})"
+                )
+
+        for column in self.columns_to_profile:
+            column_spec = _ArrowColumnSpec(
+                column,
+                DatasetFieldProfileClass(fieldPath=column),
+                dataset.schema.field(column).type,
+            )
+            if column_spec.is_numeric() and (
+                self.profiling_config.include_field_median_value
+                or self.profiling_config.include_field_quantiles
+            ):
+                column_spec.quantile_sample = _UniformSample(
+                    QUANTILE_SAMPLE_SIZE, self._rng
+                )
+            self.column_specs.append(column_spec)
+
+    def _batches(self) -> Iterable[pa.RecordBatch]:
+        max_rows = self.profiling_config.max_rows_to_profile
+        rows = 0
+        for batch in self.dataset.to_batches(
+            columns=self.columns_to_profile, batch_size=BATCH_SIZE
+        ):
+            if max_rows is not None and rows + batch.num_rows >= max_rows:
+                yield batch.slice(0, max_rows - rows)
+                return
+            rows += batch.num_rows
+            yield batch
+
+    def _sample_batch_rows(self, batch: pa.RecordBatch) -> None:
+        offset = self.rows_profiled
+        self._row_sample.add(np.arange(offset, offset + batch.num_rows))
+        sampled = {int(position) for position in self._row_sample.values}
+        new_positions = sorted(position for position in sampled if position >= offset)
+        if new_positions:
+            rows = batch.take(
+                pa.array([position - offset for position in new_positions])
+            ).to_pylist()
+            self._sample_rows.update(zip(new_positions, rows))
+        self._sample_rows = {
+            position: row
+            for position, row in self._sample_rows.items()
+            if position in sampled
+        }
+
+    def scan(self) -> None:
+        """Streams over the table's record batches and updates the column metrics."""
+        if not self.column_specs:
+            return
+        for batch in self._batches():
+            for column_spec in self.column_specs:
+                column_spec.update(batch.column(column_spec.column))
+            if self.profiling_config.include_field_sample_values:
+                self._sample_batch_rows(batch)
+            self.rows_profiled += batch.num_rows
+
+    def extract_table_profiles(self) -> None:
+        telemetry.telemetry_instance.ping(
+            "profile_data_lake_table",
+            {"rows_profiled": stats.discretize(self.rows_profiled)},
+        )
+
+        self.profile.fieldProfiles = []
+        row_count = self.rows_profiled
+        for column_spec in self.column_specs:
+            column_profile = column_spec.column_profile
+
+            non_null_count = row_count - column_spec.null_count
+            if self.profiling_config.include_field_null_count:
+                column_profile.nullCount = column_spec.null_count
+                column_profile.nullProportion = (
+                    column_spec.null_count / row_count if row_count > 0 else 0
+                )
+
+            unique_count = column_spec.unique_count()
+            unique_proportion = None
+            if unique_count is not None:
+                # estimates can overshoot
+                unique_count = min(unique_count, non_null_count)
+                unique_proportion = (
+                    unique_count / non_null_count if non_null_count > 0 else 0
+                )
+                column_profile.uniqueCount = unique_count
+                column_profile.uniqueProportion = unique_proportion
+
+            if self.profiling_config.include_field_sample_values:
+                column_profile.sampleValues = sorted(
+                    str(row[column_spec.column]) for row in self._sample_rows.values()
+                )
+
+            cardinality = _convert_to_cardinality(unique_count, unique_proportion)
+            if column_spec.is_numeric():
+                if cardinality in _FEW_CARDINALITIES:
+                    self._extract_distinct_value_frequencies(column_spec)
+                elif cardinality in [Cardinality.MANY, Cardinality.VERY_MANY]:
+                    self._extract_numeric_stats(column_spec)
+                    self._extract_field_histogram(column_spec)
+            elif pa.types.is_string(column_spec.type_) or pa.types.is_large_string(
+                column_spec.type_
+            ):
+                if cardinality in _FEW_CARDINALITIES:
+                    self._extract_distinct_value_frequencies(column_spec)
+            elif column_spec.is_temporal():
+                self._extract_min_max(column_spec)
+                if cardinality in _FEW_CARDINALITIES:
+                    self._extract_distinct_value_frequencies(column_spec)
+
+            self.profile.fieldProfiles.append(column_profile)
+
+    def _extract_min_max(self, column_spec: _ArrowColumnSpec) -> None:
+        if self.profiling_config.include_field_min_value:
+            column_spec.column_profile.min = null_str(column_spec.min)
+        if self.profiling_config.include_field_max_value:
+            column_spec.column_profile.max = null_str(column_spec.max)
+
+    def _extract_numeric_stats(self, column_spec: _ArrowColumnSpec) -> None:
+        column_profile = column_spec.column_profile
+        self._extract_min_max(column_spec)
+        if column_spec.count == 0:
+            return
+
+        if self.profiling_config.include_field_mean_value:
+            column_profile.mean = str(column_spec.mean)
+        if self.profiling_config.include_field_stddev_value:
+            column_profile.stdev = str(math.sqrt(column_spec.m2 / column_spec.count))
+
+        sample = column_spec.quantile_sample
+        if sample is not None and len(sample.values) > 0:
+            if self.profiling_config.include_field_median_value:
+                column_profile.median = str(float(np.quantile(sample.values, 0.5)))
+            if self.profiling_config.include_field_quantiles:
+                column_profile.quantiles = [
+                    QuantileClass(
+                        quantile=str(quantile),
+                        value=str(float(np.quantile(sample.values, quantile))),
+                    )
+                    for quantile in QUANTILES
+                ]
+
+    def _extract_distinct_value_frequencies(
+        self, column_spec: _ArrowColumnSpec
+    ) -> None:
+        if self.profiling_config.include_field_distinct_value_frequencies:
+            # sort so output is deterministic
+            column_spec.column_profile.distinctValueFrequencies = sorted(
+                (
+                    ValueFrequencyClass(value=str(value), frequency=count)
+                    for value, count in column_spec.most_common()
+                ),
+                key=lambda x: x.value,
+            )
+
+    def _extract_field_histogram(self, column_spec: _ArrowColumnSpec) -> None:
+        # Like deequ's Histogram, the most frequent values and their counts.
+        if self.profiling_config.include_field_histogram:
+            most_common = sorted(
+                (str(value), count)
+                for value, count in column_spec.most_common(MAX_HIST_BINS)
+            )
+            column_spec.column_profile.histogram = HistogramClass(
+                [value for value, _ in most_common],
+                [float(count) for _, count in most_common],
+            )
@@ -5,21 +5,34 @@ import pydantic
 from pydantic.fields import Field
 
 from datahub.configuration.common import AllowDenyPattern
-from datahub.configuration.source_common import (
-    EnvBasedSourceConfigBase,
-    PlatformSourceConfigBase,
-)
 from datahub.ingestion.source.aws.aws_common import AwsSourceConfig
 from datahub.ingestion.source.aws.path_spec import PathSpec
 from datahub.ingestion.source.aws.s3_util import get_bucket_name
 from datahub.ingestion.source.s3.profiling import DataLakeProfilerConfig
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionConfigBase,
+    StatefulStaleMetadataRemovalConfig,
+)
 
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-class DataLakeSourceConfig(PlatformSourceConfigBase, EnvBasedSourceConfigBase):
+class DataLakeStatefulIngestionConfig(StatefulStaleMetadataRemovalConfig):
+    """
+    Specialization of basic StatefulIngestionConfig to adding custom config.
+    This will be used to override the stateful_ingestion config param of StatefulIngestionConfigBase
+    in the DataLakeSourceConfig.
+    """
+
+    skip_unchanged_tables: bool = Field(
+        default=True,
+        description="Skip schema inference, profiling and re-emission for tables whose files have the same latest modification time, count and total size as in the last run. Set `ignore_old_state` to force a full run, e.g. after changing how schemas are inferred.",
+    )
+
+
+class DataLakeSourceConfig(StatefulIngestionConfigBase):
     path_specs: Optional[List[PathSpec]] = Field(
         description="List of PathSpec. See below the details about PathSpec"
     )
@@ -61,7 +74,20 @@ class DataLakeSourceConfig(PlatformSourceConfigBase, EnvBasedSourceConfigBase):
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
+    )
+
+    max_bytes: Optional[int] = Field(
+        default=None,
+        description="Maximum number of bytes to read from a JSON file when inferring its schema, on top of `max_rows`.",
+    )
+
+    # Custom Stateful Ingestion settings
+    stateful_ingestion: Optional[DataLakeStatefulIngestionConfig] = None
+
+    max_threads: int = Field(
+        default=1,
+        description="Number of threads used to list templated folders and to infer the schemas of tables concurrently. Tables are still emitted in the order they are listed.",
     )
 
     @pydantic.root_validator(pre=False)
@@ -2,16 +2,26 @@ import dataclasses
 from dataclasses import field as dataclass_field
 from typing import List
 
-from datahub.ingestion.api.source import SourceReport
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionReport,
+)
 
 
 @dataclasses.dataclass
-class DataLakeSourceReport(SourceReport):
+class DataLakeSourceReport(StatefulIngestionReport):
     files_scanned = 0
     filtered: List[str] = dataclass_field(default_factory=list)
+    tables_skipped_unchanged: int = 0
+    tables_with_schema_changes: List[str] = dataclass_field(default_factory=list)
 
     def report_file_scanned(self) -> None:
         self.files_scanned += 1
 
     def report_file_dropped(self, file: str) -> None:
         self.filtered.append(file)
+
+    def report_table_skipped_unchanged(self) -> None:
+        self.tables_skipped_unchanged += 1
+
+    def report_table_schema_changed(self, table: str) -> None:
+        self.tables_with_schema_changes.append(table)
@@ -1,37 +1,29 @@
 import dataclasses
+import hashlib
 import logging
 import os
 import pathlib
 import re
+import threading
 from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple
-
-import pydeequ
-from pydeequ.analyzers import AnalyzerContext
-from pyspark.conf import SparkConf
-from pyspark.sql import SparkSession
-from pyspark.sql.dataframe import DataFrame
-from pyspark.sql.types import (
-    ArrayType,
-    BinaryType,
-    BooleanType,
-    ByteType,
-    DateType,
-    DecimalType,
-    DoubleType,
-    FloatType,
-    IntegerType,
-    LongType,
-    MapType,
-    NullType,
-    ShortType,
-    StringType,
-    StructField,
-    StructType,
-    TimestampType,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
 )
-from pyspark.sql.utils import AnalysisException
+
+import pyarrow
+import pyarrow.csv
+import pyarrow.dataset
+import pyarrow.fs
+import pyarrow.json
 from smart_open import open as smart_open
 
 import datahub.ingestion.source.s3.config
@@ -49,7 +41,8 @@ from datahub.ingestion.api.decorators import (
     platform_name,
     support_status,
 )
-from datahub.ingestion.api.source import Source, SourceReport
+from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
+from datahub.ingestion.api.source import SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.aws.s3_boto_utils import get_s3_tags, list_folders
 from datahub.ingestion.source.aws.s3_util import (
@@ -58,11 +51,19 @@ from datahub.ingestion.source.aws.s3_util import (
     get_key_prefix,
     strip_s3_prefix,
 )
+from datahub.ingestion.source.s3.arrow_profiling import _ArrowTableProfiler
 from datahub.ingestion.source.s3.config import DataLakeSourceConfig, PathSpec
 from datahub.ingestion.source.s3.data_lake_utils import ContainerWUCreator
-from datahub.ingestion.source.s3.profiling import _SingleTableProfiler
+from datahub.ingestion.source.s3.profiling import DataLakeProfilingEngine
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
+from datahub.ingestion.source.state.data_lake_state import (
+    DataLakeCheckpointState,
+    DataLakeTableState,
+)
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionSourceBase,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
@@ -72,6 +73,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     NullTypeClass,
     NumberTypeClass,
     RecordTypeClass,
+    SchemaField,
     SchemaFieldDataType,
     SchemaMetadata,
     StringTypeClass,
@@ -79,37 +81,23 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import (
 )
 from datahub.metadata.schema_classes import (
     ChangeTypeClass,
+    DatasetProfileClass,
     DatasetPropertiesClass,
     MapTypeClass,
     OtherSchemaClass,
+    StatusClass,
 )
 from datahub.telemetry import stats, telemetry
+from datahub.utilities.ordered_thread_map import ordered_thread_map
 from datahub.utilities.perf_timer import PerfTimer
 
+if TYPE_CHECKING:
+    from pyspark.sql.dataframe import DataFrame
+
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
 
-# for a list of all types, see https://spark.apache.org/docs/3.0.3/api/python/_modules/pyspark/sql/types.html
-_field_type_mapping = {
-    NullType: NullTypeClass,
-    StringType: StringTypeClass,
-    BinaryType: BytesTypeClass,
-    BooleanType: BooleanTypeClass,
-    DateType: DateTypeClass,
-    TimestampType: TimeTypeClass,
-    DecimalType: NumberTypeClass,
-    DoubleType: NumberTypeClass,
-    FloatType: NumberTypeClass,
-    ByteType: BytesTypeClass,
-    IntegerType: NumberTypeClass,
-    LongType: NumberTypeClass,
-    ShortType: NumberTypeClass,
-    ArrayType: NullTypeClass,
-    MapType: MapTypeClass,
-    StructField: RecordTypeClass,
-    StructType: RecordTypeClass,
-}
 SAMPLE_SIZE = 100
 PAGE_SIZE = 1000
 
@@ -120,9 +108,50 @@ def get_column_type(
     """
     Maps known Spark types to datahub types
     """
+    # pyspark is only installed for profiling with the spark engine
+    from pyspark.sql.types import (
+        ArrayType,
+        BinaryType,
+        BooleanType,
+        ByteType,
+        DateType,
+        DecimalType,
+        DoubleType,
+        FloatType,
+        IntegerType,
+        LongType,
+        MapType,
+        NullType,
+        ShortType,
+        StringType,
+        StructField,
+        StructType,
+        TimestampType,
+    )
+
+    # for a list of all types, see https://spark.apache.org/docs/3.0.3/api/python/_modules/pyspark/sql/types.html
+    field_type_mapping = {
+        NullType: NullTypeClass,
+        StringType: StringTypeClass,
+        BinaryType: BytesTypeClass,
+        BooleanType: BooleanTypeClass,
+        DateType: DateTypeClass,
+        TimestampType: TimeTypeClass,
+        DecimalType: NumberTypeClass,
+        DoubleType: NumberTypeClass,
+        FloatType: NumberTypeClass,
+        ByteType: BytesTypeClass,
+        IntegerType: NumberTypeClass,
+        LongType: NumberTypeClass,
+        ShortType: NumberTypeClass,
+        ArrayType: NullTypeClass,
+        MapType: MapTypeClass,
+        StructField: RecordTypeClass,
+        StructType: RecordTypeClass,
+    }
     TypeClass: Any = None
 
-    for field_type, type_class in _field_type_mapping.items():
+    for field_type, type_class in field_type_mapping.items():
         if isinstance(column_type, field_type):
             TypeClass = type_class
             break
@@ -188,7 +217,11 @@ class TableData:
 @support_status(SupportStatus.INCUBATING)
 @capability(SourceCapability.DATA_PROFILING, "Optionally enabled via configuration")
 @capability(SourceCapability.TAGS, "Can extract S3 object/bucket tags if enabled")
-class S3Source(Source):
+@capability(
+    SourceCapability.DELETION_DETECTION,
+    "Enabled by default when stateful ingestion is turned on.",
+)
+class S3Source(StatefulIngestionSourceBase):
     """
     This plugin extracts:
 
@@ -209,11 +242,13 @@ class S3Source(Source):
 
     Schemas for Parquet and Avro files are extracted as provided.
 
-    Schemas for schemaless formats (CSV, TSV, JSON) are inferred. For CSV and TSV files, we consider the first 100 rows by default, which can be controlled via the `max_rows` recipe parameter (see [below](#config-details))
-    JSON file schemas are inferred on the basis of the entire file (given the difficulty in extracting only the first few objects of the file), which may impact performance.
-    We are working on using iterator-based JSON parsers to avoid reading in the entire JSON object.
+    Schemas for schemaless formats (CSV, TSV, JSON) are inferred. For CSV, TSV and JSON files, we consider the first 100 rows (or objects) by default, which can be controlled via the `max_rows` recipe parameter (see [below](#config-details)). JSON files can hold a single object, an array of objects or one object per line.
+    JSON files are read incrementally, so only the objects used for inference are read in. The `max_bytes` recipe parameter additionally bounds how much of each JSON file is read.
 
-    Note that because the profiling is run with PySpark, we require Spark 3.0.3 with Hadoop 3.2 to be installed (see [compatibility](#compatibility) for more details). If profiling, make sure that permissions for **s3a://** access are set because Spark and Hadoop use the s3a:// protocol to interface with AWS (schema inference outside of profiling requires s3:// access).
+    With stateful ingestion enabled, tables whose files have the same latest modification time, count and total size as in the last run are skipped, and tables that are no longer found are soft-deleted.
+
+    Note that because the profiling is run with PySpark by default, we require Spark 3.0.3 with Hadoop 3.2 to be installed (see [compatibility](#compatibility) for more details). If profiling, make sure that permissions for **s3a://** access are set because Spark and Hadoop use the s3a:// protocol to interface with AWS (schema inference outside of profiling requires s3:// access).
+    Alternatively, setting `profiling.engine` to `arrow` profiles tables in-process with pyarrow, without Spark. Tables are streamed in batches, distinct counts past 100,000 values and quantiles are approximate, and `profiling.max_rows_to_profile` can limit how many rows are profiled. Avro files can't be profiled with this engine.
     Enabling profiling will slow down ingestion runs.
     """
 
@@ -223,10 +258,13 @@ class S3Source(Source):
     container_WU_creator: ContainerWUCreator
 
     def __init__(self, config: DataLakeSourceConfig, ctx: PipelineContext):
-        super().__init__(ctx)
+        super().__init__(config, ctx)
         self.source_config = config
         self.report = DataLakeSourceReport()
         self.profiling_times_taken = []
+        # boto3 resources aren't thread-safe, so each listing thread gets its own
+        self._thread_local = threading.local()
+        self._arrow_s3_filesystem: Optional[pyarrow.fs.S3FileSystem] = None
         config_report = {
             config_option: config.dict().get(config_option)
             for config_option in config_options_to_report
@@ -246,9 +284,13 @@ class S3Source(Source):
                     for config_flag in profiling_flags_to_report
                 },
             )
-            self.init_spark()
+            if config.profiling.engine == DataLakeProfilingEngine.SPARK:
+                self.init_spark()
 
     def init_spark(self):
+        import pydeequ
+        from pyspark.conf import SparkConf
+        from pyspark.sql import SparkSession
 
         conf = SparkConf()
 
@@ -322,7 +364,8 @@ class S3Source(Source):
 
         return cls(config, ctx)
 
-    def read_file_spark(self, file: str, ext: str) -> Optional[DataFrame]:
+    def read_file_spark(self, file: str, ext: str) -> Optional["DataFrame"]:
+        from pyspark.sql.utils import AnalysisException
 
         logger.debug(f"Opening file {file} for profiling in spark")
         file = file.replace("s3://", "s3a://")
@@ -373,6 +416,74 @@ class S3Source(Source):
         # see https://mungingdata.com/pyspark/avoid-dots-periods-column-names/
         return df.toDF(*(c.replace(".", "_") for c in df.columns))
 
+    def get_arrow_filesystem(self, is_s3: bool) -> pyarrow.fs.FileSystem:
+        if not is_s3:
+            return pyarrow.fs.LocalFileSystem()
+        if self._arrow_s3_filesystem is None:
+            if self.source_config.aws_config is None:
+                raise ValueError("AWS config is required for S3 file sources")
+            credentials = self.source_config.aws_config.get_credentials()
+            self._arrow_s3_filesystem = pyarrow.fs.S3FileSystem(
+                access_key=credentials.get("aws_access_key_id"),
+                secret_key=credentials.get("aws_secret_access_key"),
+                session_token=credentials.get("aws_session_token"),
+                region=self.source_config.aws_config.aws_region,
+                endpoint_override=self.source_config.aws_config.aws_endpoint_url,
+            )
+        return self._arrow_s3_filesystem
+
+    def read_file_arrow(
+        self, file: str, is_s3: bool, ext: str
+    ) -> Optional[pyarrow.dataset.Dataset]:
+
+        logger.debug(f"Opening file {file} for profiling with arrow")
+        filesystem = self.get_arrow_filesystem(is_s3)
+        path = strip_s3_prefix(file) if is_s3 else file
+
+        telemetry.telemetry_instance.ping("data_lake_file", {"extension": ext})
+
+        if ext.endswith(".parquet"):
+            file_format: pyarrow.dataset.FileFormat = (
+                pyarrow.dataset.ParquetFileFormat()
+            )
+        elif ext.endswith(".csv"):
+            file_format = pyarrow.dataset.CsvFileFormat()
+        elif ext.endswith(".tsv"):
+            file_format = pyarrow.dataset.CsvFileFormat(
+                parse_options=pyarrow.csv.ParseOptions(delimiter="\t")
+            )
+        elif ext.endswith(".json"):
+            # pyarrow can't scan JSON files lazily, so they are read in whole. Like the
+            # spark engine, this expects one object per line.
+            if filesystem.get_file_info(path).type == pyarrow.fs.FileType.Directory:
+                paths = [
+                    info.path
+                    for info in filesystem.get_file_info(
+                        pyarrow.fs.FileSelector(path, recursive=True)
+                    )
+                    if info.type == pyarrow.fs.FileType.File
+                ]
+            else:
+                paths = [path]
+            tables = []
+            for json_path in paths:
+                with filesystem.open_input_stream(json_path) as stream:
+                    tables.append(pyarrow.json.read_json(stream))
+            table = (
+                tables[0]
+                if len(tables) == 1
+                else pyarrow.concat_tables(tables, promote=True)
+            )
+            return pyarrow.dataset.dataset(table)
+        else:
+            self.report.report_warning(
+                file, f"file {file} has unsupported extension for the arrow engine"
+            )
+            return None
+        return pyarrow.dataset.dataset(
+            path, format=file_format, filesystem=filesystem, partitioning="hive"
+        )
+
     def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
         if table_data.is_s3:
             if self.source_config.aws_config is None:
@@ -411,7 +522,10 @@ class S3Source(Source):
                     max_rows=self.source_config.max_rows
                 ).infer_schema(file)
             elif extension == ".json":
-                fields = json.JsonInferrer().infer_schema(file)
+                fields = json.JsonInferrer(
+                    max_rows=self.source_config.max_rows,
+                    max_bytes=self.source_config.max_bytes,
+                ).infer_schema(file)
             elif extension == ".avro":
                 fields = avro.AvroInferrer().infer_schema(file)
             else:
@@ -434,6 +548,33 @@ class S3Source(Source):
     def get_table_profile(
         self, table_data: TableData, dataset_urn: str
     ) -> Iterable[MetadataWorkUnit]:
+        if self.source_config.profiling.engine == DataLakeProfilingEngine.ARROW:
+            profile = self.get_table_profile_arrow(table_data)
+        else:
+            profile = self.get_table_profile_spark(table_data)
+        if profile is None:
+            return
+
+        mcp = MetadataChangeProposalWrapper(
+            entityType="dataset",
+            entityUrn=dataset_urn,
+            changeType=ChangeTypeClass.UPSERT,
+            aspectName="datasetProfile",
+            aspect=profile,
+        )
+        wu = MetadataWorkUnit(
+            id=f"profile-{self.source_config.platform}-{table_data.table_path}", mcp=mcp
+        )
+        self.report.report_workunit(wu)
+        yield wu
+
+    def get_table_profile_spark(
+        self, table_data: TableData
+    ) -> Optional[DatasetProfileClass]:
+        from pydeequ.analyzers import AnalyzerContext
+
+        from datahub.ingestion.source.s3.spark_profiling import _SingleTableProfiler
+
         # read in the whole table with Spark for profiling
         table = None
         try:
@@ -454,7 +595,7 @@ class S3Source(Source):
                 table_data.display_name,
                 f"unable to read table {table_data.display_name} from file {table_data.full_path}",
             )
-            return
+            return None
 
         with PerfTimer() as timer:
             # init PySpark analysis object
@@ -499,43 +640,181 @@ class S3Source(Source):
 
             self.profiling_times_taken.append(time_taken)
 
-        mcp = MetadataChangeProposalWrapper(
-            entityType="dataset",
-            entityUrn=dataset_urn,
-            changeType=ChangeTypeClass.UPSERT,
-            aspectName="datasetProfile",
-            aspect=table_profiler.profile,
-        )
-        wu = MetadataWorkUnit(
-            id=f"profile-{self.source_config.platform}-{table_data.table_path}", mcp=mcp
-        )
-        self.report.report_workunit(wu)
-        yield wu
+        return table_profiler.profile
 
-    def ingest_table(
-        self, table_data: TableData, path_spec: PathSpec
-    ) -> Iterable[MetadataWorkUnit]:
+    def get_table_profile_arrow(
+        self, table_data: TableData
+    ) -> Optional[DatasetProfileClass]:
+        # the table is streamed in record batches, so it is never held in memory whole
+        dataset = None
+        try:
+            if table_data.partitions:
+                dataset = self.read_file_arrow(
+                    table_data.table_path,
+                    table_data.is_s3,
+                    os.path.splitext(table_data.full_path)[1],
+                )
+            else:
+                dataset = self.read_file_arrow(
+                    table_data.full_path,
+                    table_data.is_s3,
+                    os.path.splitext(table_data.full_path)[1],
+                )
+        except Exception as e:
+            logger.error(e)
 
-        logger.info(f"Extracting table schema from file: {table_data.full_path}")
+        # if table is not readable, skip
+        if dataset is None:
+            self.report.report_warning(
+                table_data.display_name,
+                f"unable to read table {table_data.display_name} from file {table_data.full_path}",
+            )
+            return None
+
+        with PerfTimer() as timer:
+            try:
+                table_profiler = _ArrowTableProfiler(
+                    dataset,
+                    self.source_config.profiling,
+                    self.report,
+                    table_data.full_path,
+                )
+                logger.debug(
+                    f"Profiling {table_data.full_path}: computing profiles {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
+                )
+                table_profiler.scan()
+                table_profiler.extract_table_profiles()
+            except Exception as e:
+                logger.exception(f"Failed to profile {table_data.full_path}")
+                self.report.report_warning(
+                    table_data.display_name,
+                    f"unable to profile table {table_data.display_name} from file {table_data.full_path}: {e}",
+                )
+                return None
+
+            time_taken = timer.elapsed_seconds()
+
+            logger.info(
+                f"Finished profiling {table_data.full_path}; took {time_taken:.3f} seconds"
+            )
+
+            self.profiling_times_taken.append(time_taken)
+
+        return table_profiler.profile
+
+    def get_dataset_urn(self, table_data: TableData) -> str:
         browse_path: str = (
             strip_s3_prefix(table_data.table_path)
             if table_data.is_s3
             else table_data.table_path.strip("/")
         )
-
-        data_platform_urn = make_data_platform_urn(self.source_config.platform)
         logger.info(f"Creating dataset urn with name: {browse_path}")
-        dataset_urn = make_dataset_urn_with_platform_instance(
+        return make_dataset_urn_with_platform_instance(
             self.source_config.platform,
             browse_path,
             self.source_config.platform_instance,
             self.source_config.env,
         )
 
+    @staticmethod
+    def _get_table_state(
+        table_data: TableData, schema_fingerprint: str = ""
+    ) -> DataLakeTableState:
+        return DataLakeTableState(
+            last_modified=int(table_data.timestamp.timestamp() * 1000),
+            number_of_files=table_data.number_of_files,
+            size_in_bytes=table_data.size_in_bytes,
+            schema_fingerprint=schema_fingerprint,
+        )
+
+    @staticmethod
+    def _get_schema_fingerprint(fields: List[SchemaField]) -> str:
+        schema = [
+            (
+                field.fieldPath,
+                field.nativeDataType,
+                type(field.type.type).__name__,
+                field.nullable,
+            )
+            for field in fields
+        ]
+        return hashlib.md5(repr(schema).encode("utf-8")).hexdigest()
+
+    def _get_last_table_state(self, dataset_urn: str) -> Optional[DataLakeTableState]:
+        last_checkpoint_state = self.get_last_default_checkpoint_state()
+        if last_checkpoint_state is None:
+            return None
+        return cast(DataLakeCheckpointState, last_checkpoint_state).get_table(
+            dataset_urn
+        )
+
+    def _get_current_checkpoint_state(self) -> Optional[DataLakeCheckpointState]:
+        return cast(
+            Optional[DataLakeCheckpointState],
+            self.get_current_default_checkpoint_state(),
+        )
+
+    def _add_table_to_checkpoint(
+        self, dataset_urn: str, table_data: TableData, fields: List[SchemaField]
+    ) -> None:
+        checkpoint_state = self._get_current_checkpoint_state()
+        if checkpoint_state is None:
+            return
+        # Without a fingerprint, the table is inferred again in the next run. That's
+        # the case when no fields were found, e.g. because the file couldn't be read.
+        table_state = self._get_table_state(
+            table_data, self._get_schema_fingerprint(fields) if fields else ""
+        )
+        last_table_state = self._get_last_table_state(dataset_urn)
+        if (
+            last_table_state is not None
+            and last_table_state.schema_fingerprint
+            and last_table_state.schema_fingerprint != table_state.schema_fingerprint
+        ):
+            self.report.report_table_schema_changed(table_data.table_path)
+        checkpoint_state.add_table(dataset_urn, table_state)
+
+    def _skip_unchanged_table(self, table_data: TableData) -> bool:
+        """
+        Tells if the files of the table look the same as in the last run, in which case
+        the table's state is carried over to the current checkpoint.
+        """
+        if not self.is_skipping_unchanged_entities():
+            return False
+        checkpoint_state = self._get_current_checkpoint_state()
+        if checkpoint_state is None:
+            return False
+        dataset_urn = self.get_dataset_urn(table_data)
+        last_table_state = self._get_last_table_state(dataset_urn)
+        if (
+            last_table_state is None
+            or not last_table_state.schema_fingerprint
+            or self._get_table_state(table_data, last_table_state.schema_fingerprint)
+            != last_table_state
+        ):
+            return False
+        checkpoint_state.add_table(dataset_urn, last_table_state)
+        self.report.report_table_skipped_unchanged()
+        return True
+
+    def ingest_table(
+        self,
+        table_data: TableData,
+        path_spec: PathSpec,
+        fields: Optional[List] = None,
+    ) -> Iterable[MetadataWorkUnit]:
+
+        logger.info(f"Extracting table schema from file: {table_data.full_path}")
+        data_platform_urn = make_data_platform_urn(self.source_config.platform)
+        dataset_urn = self.get_dataset_urn(table_data)
+
         dataset_snapshot = DatasetSnapshot(
             urn=dataset_urn,
             aspects=[],
         )
+        if self.is_stateful_ingestion_configured():
+            # undo the soft-delete of tables that are found again
+            dataset_snapshot.aspects.append(StatusClass(removed=False))
 
         customProperties: Optional[Dict[str, str]] = None
         if not path_spec.sample_files:
@@ -551,7 +830,9 @@ class S3Source(Source):
         )
         dataset_snapshot.aspects.append(dataset_properties)
 
-        fields = self.get_fields(table_data, path_spec)
+        if fields is None:
+            fields = self.get_fields(table_data, path_spec)
+        self._add_table_to_checkpoint(dataset_urn, table_data, fields)
         schema_metadata = SchemaMetadata(
             schemaName=table_data.display_name,
             platform=data_platform_urn,
@@ -644,6 +925,27 @@ class S3Source(Source):
                 bucket_name, f"{folder}{folder_split[1]}"
             )
 
+    def sample_folder(
+        self, bucket_name: str, folder: str
+    ) -> List[Tuple[str, datetime, int]]:
+        s3 = getattr(self._thread_local, "s3", None)
+        if s3 is None:
+            assert self.source_config.aws_config
+            s3 = self._thread_local.s3 = self.source_config.aws_config.get_s3_resource()
+        logger.info(f"Processing folder: {folder}")
+
+        samples = []
+        for obj in (
+            s3.Bucket(bucket_name)
+            .objects.filter(Prefix=f"{folder}")
+            .page_size(PAGE_SIZE)
+            .limit(SAMPLE_SIZE)
+        ):
+            s3_path = f"s3://{obj.bucket_name}/{obj.key}"
+            logger.debug(f"Samping file: {s3_path}")
+            samples.append((s3_path, obj.last_modified, obj.size))
+        return samples
+
     def s3_browser(self, path_spec: PathSpec) -> Iterable[Tuple[str, datetime, int]]:
         if self.source_config.aws_config is None:
             raise ValueError("aws_config not set. Cannot browse s3")
@@ -676,22 +978,29 @@ class S3Source(Source):
                     max_match = match.group()
 
             table_index = include.find(max_match)
-            for folder in self.resolve_templated_folders(
+            max_threads = self.source_config.max_threads
+            folders = self.resolve_templated_folders(
                 bucket_name, get_bucket_relative_path(include[:table_index])
+            )
+            table_folders = (
+                f
+                for subfolders in ordered_thread_map(
+                    lambda folder: list(
+                        list_folders(
+                            bucket_name, f"{folder}", self.source_config.aws_config
+                        )
+                    ),
+                    folders,
+                    max_threads,
+                )
+                for f in subfolders
+            )
+            for samples in ordered_thread_map(
+                lambda f: self.sample_folder(bucket_name, f),
+                table_folders,
+                max_threads,
             ):
-                for f in list_folders(
-                    bucket_name, f"{folder}", self.source_config.aws_config
-                ):
-                    logger.info(f"Processing folder: {f}")
-
-                    for obj in (
-                        bucket.objects.filter(Prefix=f"{f}")
-                        .page_size(PAGE_SIZE)
-                        .limit(SAMPLE_SIZE)
-                    ):
-                        s3_path = f"s3://{obj.bucket_name}/{obj.key}"
-                        logger.debug(f"Samping file: {s3_path}")
-                        yield s3_path, obj.last_modified, obj.size,
+                yield from samples
         else:
             logger.debug(
                 "No template in the pathspec can't do sampling, fallbacking to do full scan"
@@ -757,8 +1066,26 @@ class S3Source(Source):
                                 table_data.table_path
                             ].timestamp = table_data.timestamp
 
-                for guid, table_data in table_dict.items():
-                    yield from self.ingest_table(table_data, path_spec)
+                changed_tables = [
+                    table_data
+                    for table_data in table_dict.values()
+                    if not self._skip_unchanged_table(table_data)
+                ]
+                # Schemas are inferred ahead on a thread pool, while the tables are
+                # ingested in order on this thread.
+                for table_data, fields in ordered_thread_map(
+                    lambda table_data: (
+                        table_data,
+                        self.get_fields(table_data, path_spec),
+                    ),
+                    changed_tables,
+                    self.source_config.max_threads,
+                ):
+                    yield from self.ingest_table(table_data, path_spec, fields)
+
+            if self.is_stateful_ingestion_configured():
+                # Clean up stale entities.
+                yield from self.gen_removed_entity_workunits()
 
             if not self.source_config.profiling.enabled:
                 return
@@ -795,8 +1122,27 @@ class S3Source(Source):
                 },
             )
 
+    def get_platform_instance_id(self) -> str:
+        return self.source_config.platform_instance or self.source_config.platform
+
+    def get_default_ingestion_job_id(self) -> JobId:
+        """
+        Data lake ingestion job name.
+        """
+        return JobId(f"{self.source_config.platform}_stateful_ingestion")
+
+    def get_default_checkpoint_state_class(self) -> Type[DataLakeCheckpointState]:
+        return DataLakeCheckpointState
+
+    def is_skipping_unchanged_entities(self) -> bool:
+        return bool(
+            self.source_config.stateful_ingestion
+            and self.source_config.stateful_ingestion.skip_unchanged_tables
+        )
+
     def get_report(self):
         return self.report
 
     def close(self):
-        pass
+        self.update_default_job_run_summary()
+        self.prepare_for_commit()
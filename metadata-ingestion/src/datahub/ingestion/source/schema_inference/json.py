@@ -1,9 +1,10 @@
-from typing import IO, Dict, List, Type, Union
+import itertools
+from typing import IO, Any, Dict, Iterator, List, Optional, Type, Union
 
-import ujson
+import ijson
 
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
-from datahub.ingestion.source.schema_inference.object import construct_schema
+from datahub.ingestion.source.schema_inference.object import SchemaBuilder
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     ArrayTypeClass,
     BooleanTypeClass,
@@ -28,15 +29,72 @@ _field_type_mapping: Dict[Union[Type, str], Type] = {
 }
 
 
+class _PeekableReader:
+    """Wraps a binary file to look at its first non-whitespace byte and count the bytes read."""
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self._file = file
+        self._buffer = b""
+        self.bytes_read = 0
+
+    def peek_first_byte(self) -> bytes:
+        while not self._buffer.strip():
+            chunk = self._file.read(1024)
+            if not chunk:
+                return b""
+            self._buffer += chunk
+        return self._buffer.lstrip()[:1]
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson reads nothing first to check whether the file is binary
+        if size == 0:
+            return b""
+        if self._buffer:
+            data, self._buffer = self._buffer, b""
+        else:
+            data = self._file.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
 class JsonInferrer(SchemaInferenceBase):
-    def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
+    """
+    Infers the schema of a JSON file holding either a single object, an array of objects
+    or one object per line (JSON Lines).
 
-        datastore = ujson.load(file)
+    The file is read incrementally, and only up to max_rows objects or roughly max_bytes
+    bytes of it are looked at when those are given.
+    """
+
+    def __init__(
+        self, max_rows: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
+    def _read_records(self, file: IO[bytes]) -> Iterator[Any]:
+        reader = _PeekableReader(file)
+        if reader.peek_first_byte() == b"[":
+            records = ijson.items(reader, "item", use_float=True)
+        else:
+            records = ijson.items(reader, "", multiple_values=True, use_float=True)
+
+        for record in records:
+            yield record
+            # bytes are read in chunks, so this may go over the limit by one chunk
+            if self.max_bytes is not None and reader.bytes_read >= self.max_bytes:
+                return
+
+    def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
 
-        if not isinstance(datastore, list):
-            datastore = [datastore]
+        builder = SchemaBuilder(delimiter=".")
+        records = (
+            record for record in self._read_records(file) if isinstance(record, dict)
+        )
+        for record in itertools.islice(records, self.max_rows):
+            builder.add_document(record)
 
-        schema = construct_schema(datastore, delimiter=".")
+        schema = builder.get_schema()
         fields: List[SchemaField] = []
 
         for schema_field in sorted(schema.values(), key=lambda x: x["delimited_name"]):
@@ -1,7 +1,7 @@
 from collections import Counter
 from typing import Any
 from typing import Counter as CounterType
-from typing import Dict, Sequence, Tuple, Union
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
 
 from mypy_extensions import TypedDict
 
@@ -65,47 +65,52 @@ def is_field_nullable(doc: Dict[str, Any], field_path: Tuple) -> bool:
     return True
 
 
-def is_nullable_collection(
-    collection: Sequence[Dict[str, Any]], field_path: Tuple
-) -> bool:
+def _non_nullable_fields(doc: Dict[str, Any]) -> Set[Tuple[str, ...]]:
     """
-    Check if a nested field is nullable in a collection.
-
-    Parameters
-    ----------
-        collection:
-            collection to check nullability for
-        field_path:
-            path to nested field to check, ex. ('first_field', 'nested_child', '2nd_nested_child')
+    Returns the nested fields of a document that are not nullable in it, i.e. the ones
+    for which is_field_nullable(doc, field_path) is False.
     """
 
-    return any(is_field_nullable(doc, field_path) for doc in collection)
-
+    fields: Set[Tuple[str, ...]] = set()
+    for key, value in doc.items():
+        if value is None:
+            continue
+        fields.add((key,))
 
-def construct_schema(
-    collection: Sequence[Dict[str, Any]], delimiter: str
-) -> Dict[Tuple[str, ...], SchemaDescription]:
+        nested: Optional[Set[Tuple[str, ...]]] = None
+        if isinstance(value, dict):
+            nested = _non_nullable_fields(value)
+        elif isinstance(value, list):
+            # a nested field has to be in every member of the list
+            for item in value:
+                item_fields = (
+                    _non_nullable_fields(item) if isinstance(item, dict) else set()
+                )
+                nested = item_fields if nested is None else nested & item_fields
+                if not nested:
+                    break
+        if nested:
+            fields.update((key,) + field_path for field_path in nested)
+    return fields
+
+
+class SchemaBuilder:
     """
-    Construct (infer) a schema from a collection of documents.
+    Infers a schema from documents added one at a time, without holding on to them.
 
-    For each field (represented as a tuple to handle nested items), reports the following:
-        - `types`: Python types of field values
-        - `count`: Number of times the field was encountered
-        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
-        - `nullable`: if field is ever null/missing
-        - `delimited_name`: name of the field, joined by a given delimiter
-
-    Parameters
-    ----------
-        collection:
-            collection to construct schema over.
-        delimiter:
-            string to concatenate field names by
+    The result is the same as construct_schema over all the added documents.
     """
 
-    schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+    def __init__(self, delimiter: str) -> None:
+        self.delimiter = delimiter
+        self.num_documents = 0
+        self._schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+        # number of documents in which each field is not nullable
+        self._non_nullable_counts: CounterType[Tuple[str, ...]] = Counter()
 
-    def append_to_schema(doc: Dict[str, Any], parent_prefix: Tuple[str, ...]) -> None:
+    def _append_to_schema(
+        self, doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+    ) -> None:
         """
         Recursively update the schema with a document, which may/may not contain nested fields.
 
@@ -122,50 +127,81 @@ def construct_schema(
 
             # if nested value, look at the types within
             if isinstance(value, dict):
-                append_to_schema(value, new_parent_prefix)
+                self._append_to_schema(value, new_parent_prefix)
             # if array of values, check what types are within
             if isinstance(value, list):
                 for item in value:
                     # if dictionary, add it as a nested object
                     if isinstance(item, dict):
-                        append_to_schema(item, new_parent_prefix)
+                        self._append_to_schema(item, new_parent_prefix)
 
             # don't record None values (counted towards nullable)
             if value is not None:
-                if new_parent_prefix not in schema:
-                    schema[new_parent_prefix] = {
+                if new_parent_prefix not in self._schema:
+                    self._schema[new_parent_prefix] = {
                         "types": Counter([type(value)]),
                         "count": 1,
                     }
 
                 else:
                     # update the type count
-                    schema[new_parent_prefix]["types"].update({type(value): 1})
-                    schema[new_parent_prefix]["count"] += 1
+                    self._schema[new_parent_prefix]["types"].update({type(value): 1})
+                    self._schema[new_parent_prefix]["count"] += 1
+
+    def add_document(self, doc: Dict[str, Any]) -> None:
+        self._append_to_schema(doc, ())
+        self._non_nullable_counts.update(_non_nullable_fields(doc))
+        self.num_documents += 1
+
+    def get_schema(self) -> Dict[Tuple[str, ...], SchemaDescription]:
+        extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+
+        for field_path in self._schema.keys():
+            field_types = self._schema[field_path]["types"]
+            field_type: Union[str, type] = "mixed"
+
+            # if single type detected, mark that as the type to go with
+            if len(field_types.keys()) == 1:
+                field_type = next(iter(field_types))
+            elif set(field_types.keys()) == {int, float}:
+                # If there's only floats and ints, it's not really a mixed type.
+                field_type = float
+            field_extended: SchemaDescription = {
+                "types": self._schema[field_path]["types"],
+                "count": self._schema[field_path]["count"],
+                # nullable if it is missing or null in any document
+                "nullable": self._non_nullable_counts[field_path] < self.num_documents,
+                "delimited_name": self.delimiter.join(field_path),
+                "type": field_type,
+            }
+
+            extended_schema[field_path] = field_extended
+
+        return extended_schema
+
+
+def construct_schema(
+    collection: Iterable[Dict[str, Any]], delimiter: str
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Construct (infer) a schema from a collection of documents.
+
+    For each field (represented as a tuple to handle nested items), reports the following:
+        - `types`: Python types of field values
+        - `count`: Number of times the field was encountered
+        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
+        - `nullable`: if field is ever null/missing
+        - `delimited_name`: name of the field, joined by a given delimiter
+
+    Parameters
+    ----------
+        collection:
+            collection to construct schema over. It is only iterated once.
+        delimiter:
+            string to concatenate field names by
+    """
 
+    builder = SchemaBuilder(delimiter)
     for document in collection:
-        append_to_schema(document, ())
-
-    extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
-
-    for field_path in schema.keys():
-        field_types = schema[field_path]["types"]
-        field_type: Union[str, type] = "mixed"
-
-        # if single type detected, mark that as the type to go with
-        if len(field_types.keys()) == 1:
-            field_type = next(iter(field_types))
-        elif set(field_types.keys()) == {int, float}:
-            # If there's only floats and ints, it's not really a mixed type.
-            field_type = float
-        field_extended: SchemaDescription = {
-            "types": schema[field_path]["types"],
-            "count": schema[field_path]["count"],
-            "nullable": is_nullable_collection(collection, field_path),
-            "delimited_name": delimiter.join(field_path),
-            "type": field_type,
-        }
-
-        extended_schema[field_path] = field_extended
-
-    return extended_schema
+        builder.add_document(document)
+    return builder.get_schema()
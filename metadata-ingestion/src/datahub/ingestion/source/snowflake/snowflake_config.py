@@ -4,6 +4,7 @@ from typing import Dict, Optional, cast
 from pydantic import Field, SecretStr, root_validator
 
 from datahub.configuration.common import AllowDenyPattern
+from datahub.ingestion.source.usage.usage_common import UsageAggregationBackend
 from datahub.ingestion.source_config.sql.snowflake import (
     BaseSnowflakeConfig,
     SnowflakeConfig,
@@ -59,6 +60,18 @@ class SnowflakeV2Config(SnowflakeConfig, SnowflakeUsageConfig):
                 "include_read_operational_stats is not supported. Set `include_read_operational_stats` to False.",
             )
 
+        value = values.get("aggregation_backend")
+        if value is not None and value != UsageAggregationBackend.MEMORY:
+            raise ValueError(
+                "aggregation_backend is not supported. Remove `aggregation_backend` or set it to `memory`.",
+            )
+
+        value = values.get("query_sketch_size")
+        if value is not None and value != cls.__fields__["query_sketch_size"].default:
+            raise ValueError(
+                "query_sketch_size is not supported. Remove `query_sketch_size`.",
+            )
+
         # Always exclude reporting metadata for INFORMATION_SCHEMA schema
         schema_pattern = values.get("schema_pattern")
         if schema_pattern is not None and schema_pattern:
@@ -102,7 +102,6 @@ from datahub.metadata.schema_classes import (
     ChangeTypeClass,
     DataPlatformInstanceClass,
     JobStatusClass,
-    StatusClass,
     TimeWindowSizeClass,
 )
 from datahub.utilities.registries.domain_registry import DomainRegistry
@@ -1071,25 +1070,6 @@ class SnowflakeV2Source(
         ):
             logger.debug("Checking for stale entity removal.")
 
-            def soft_delete_item(urn: str, type: str) -> Iterable[MetadataWorkUnit]:
-                entity_type: str = "dataset"
-
-                if type == "container":
-                    entity_type = "container"
-
-                logger.info(f"Soft-deleting stale entity of type {type} - {urn}.")
-                mcp = MetadataChangeProposalWrapper(
-                    entityType=entity_type,
-                    entityUrn=urn,
-                    changeType=ChangeTypeClass.UPSERT,
-                    aspectName="status",
-                    aspect=StatusClass(removed=True),
-                )
-                wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
-                self.report.report_workunit(wu)
-                self.report.report_stale_entity_soft_deleted(urn)
-                yield wu
-
             last_checkpoint_state = cast(
                 BaseSQLAlchemyCheckpointState, last_checkpoint.state
             )
@@ -1097,20 +1077,18 @@ class SnowflakeV2Source(
                 BaseSQLAlchemyCheckpointState, cur_checkpoint.state
             )
 
-            for table_urn in last_checkpoint_state.get_table_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(table_urn, "table")
-
-            for view_urn in last_checkpoint_state.get_view_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(view_urn, "view")
-
-            for container_urn in last_checkpoint_state.get_container_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(container_urn, "container")
+            yield from self.gen_stale_entity_workunits(
+                "table",
+                last_checkpoint_state.get_table_urns_not_in(cur_checkpoint_state),
+            )
+            yield from self.gen_stale_entity_workunits(
+                "view", last_checkpoint_state.get_view_urns_not_in(cur_checkpoint_state)
+            )
+            yield from self.gen_stale_entity_workunits(
+                "container",
+                last_checkpoint_state.get_container_urns_not_in(cur_checkpoint_state),
+                entity_type="container",
+            )
 
     def _should_skip_usage_run(self) -> bool:
         # Check if forced rerun.
@@ -67,6 +67,7 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.utilities.bigquery_sql_parser import BigQuerySQLParser
 from datahub.utilities.mapping import Constants
+from datahub.utilities.sql_parser_cache import get_sql_parse_cache
 
 logger = logging.getLogger(__name__)
 
@@ -695,6 +696,7 @@ class BigQuerySource(SQLAlchemySource):
         self.report.num_skipped_lineage_entries_not_allowed = 0
         self.report.num_skipped_lineage_entries_other = 0
         self.report.num_skipped_lineage_entries_sql_parser_failure = 0
+        self.report.sql_parse_cache = get_sql_parse_cache().report
         for e in entries:
             self.report.num_total_lineage_entries += 1
             if e.destinationTable is None or not (
@@ -733,9 +735,13 @@ class BigQuerySource(SQLAlchemySource):
                 # in the references. There is no distinction between direct/base objects accessed. So doing sql parsing
                 # to ensure we only use direct objects accessed for lineage
                 try:
-                    parser = BigQuerySQLParser(e.query)
                     referenced_objs = set(
-                        map(lambda x: x.split(".")[-1], parser.get_tables())
+                        map(
+                            lambda x: x.split(".")[-1],
+                            get_sql_parse_cache().get_tables(
+                                BigQuerySQLParser, e.query
+                            ),
+                        )
                     )
                 except Exception as ex:
                     logger.warning(
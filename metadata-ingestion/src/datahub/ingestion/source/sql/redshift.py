@@ -15,7 +15,6 @@ from sqlalchemy import create_engine, inspect
 from sqlalchemy.engine import Connection, reflection
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy_redshift.dialect import RedshiftDialect, RelationKey
-from sqllineage.runner import LineageRunner
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration import ConfigModel
@@ -54,6 +53,7 @@ from datahub.metadata.schema_classes import (
     DatasetSnapshotClass,
     UpstreamClass,
 )
+from datahub.utilities.sql_parser import get_sql_lineage_parser_pool
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -673,15 +673,16 @@ class RedshiftSource(SQLAlchemySource):
 
         return all_tables_set
 
-    def _get_sources_from_query(self, db_name: str, query: str) -> List[LineageDataset]:
+    def _get_sources_from_tables(
+        self, db_name: str, tables: List[str]
+    ) -> List[LineageDataset]:
         sources = list()
 
-        parser = LineageRunner(query)
-
-        for table in parser.source_tables:
-            source_schema, source_table = str(table).split(".")
-            if source_schema == "<default>":
-                source_schema = str(self.config.default_schema)
+        for table in tables:
+            if "." in table:
+                source_schema, source_table = table.split(".")
+            else:
+                source_schema, source_table = str(self.config.default_schema), table
 
             source = LineageDataset(
                 platform=LineageDatasetPlatform.REDSHIFT,
@@ -732,13 +733,24 @@ class RedshiftSource(SQLAlchemySource):
         db_name = self.get_db_name()
 
         try:
-            for db_row in engine.execute(query):
-
-                if not self.config.schema_pattern.allowed(
-                    db_row["target_schema"]
-                ) or not self.config.table_pattern.allowed(db_row["target_table"]):
-                    continue
+            db_rows = [
+                db_row
+                for db_row in engine.execute(query)
+                if self.config.schema_pattern.allowed(db_row["target_schema"])
+                and self.config.table_pattern.allowed(db_row["target_table"])
+            ]
+            parse_results: List[Any] = [None] * len(db_rows)
+            if lineage_type in [
+                lineage_type.QUERY_SQL_PARSER,
+                lineage_type.NON_BINDING_VIEW,
+            ]:
+                # Parse all of the queries at once, so that they are spread across the
+                # parser worker processes.
+                parse_results = get_sql_lineage_parser_pool().parse_many(
+                    [db_row["ddl"] for db_row in db_rows], return_exceptions=True
+                )
 
+            for db_row, parse_result in zip(db_rows, parse_results):
                 # Target
                 target_path = (
                     f'{db_name}.{db_row["target_schema"]}.{db_row["target_table"]}'
@@ -759,8 +771,11 @@ class RedshiftSource(SQLAlchemySource):
                     lineage_type.NON_BINDING_VIEW,
                 ]:
                     try:
-                        sources = self._get_sources_from_query(
-                            db_name=db_name, query=db_row["ddl"]
+                        if isinstance(parse_result, BaseException):
+                            raise parse_result
+                        tables, _ = parse_result
+                        sources = self._get_sources_from_tables(
+                            db_name=db_name, tables=tables
                         )
                     except Exception as e:
                         target.query_parser_failed_sqls.append(db_row["ddl"])
@@ -0,0 +1,558 @@
+import logging
+from abc import ABCMeta, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sqlalchemy
+from sqlalchemy import sql
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.sql import sqltypes
+
+logger = logging.getLogger(__name__)
+
+# Catalog metadata of a whole schema, keyed by table (or view) name.
+_SchemaColumns = Dict[str, List[Dict[str, Any]]]
+_SchemaPKConstraints = Dict[str, Dict[str, Any]]
+_SchemaForeignKeys = Dict[str, List[Dict[str, Any]]]
+_SchemaComments = Dict[str, Optional[str]]
+
+
+class _BulkReflector(metaclass=ABCMeta):
+    """
+    Fetches the catalog metadata of a whole schema with a single query per kind.
+    The results mirror what the dialect's per-table Inspector methods return.
+    A reflector returns None for the kinds it can't load in bulk.
+    """
+
+    @abstractmethod
+    def get_columns(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaColumns]:
+        pass
+
+    @abstractmethod
+    def get_pk_constraints(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaPKConstraints]:
+        pass
+
+    @abstractmethod
+    def get_foreign_keys(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaForeignKeys]:
+        pass
+
+    @abstractmethod
+    def get_table_comments(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaComments]:
+        pass
+
+
+def _group_foreign_keys(rows: Any) -> _SchemaForeignKeys:
+    # Rows must be ordered by table, constraint name and column position.
+    foreign_keys: _SchemaForeignKeys = defaultdict(list)
+    for (
+        table_name,
+        constraint_name,
+        constrained_column,
+        referred_schema,
+        referred_table,
+        referred_column,
+    ) in rows:
+        table_fks = foreign_keys[table_name]
+        if not table_fks or table_fks[-1]["name"] != constraint_name:
+            table_fks.append(
+                {
+                    "name": constraint_name,
+                    "constrained_columns": [],
+                    "referred_schema": referred_schema,
+                    "referred_table": referred_table,
+                    "referred_columns": [],
+                    "options": {},
+                }
+            )
+        table_fks[-1]["constrained_columns"].append(constrained_column)
+        table_fks[-1]["referred_columns"].append(referred_column)
+    return dict(foreign_keys)
+
+
+def _group_pk_constraints(rows: Any) -> _SchemaPKConstraints:
+    # Rows must be ordered by table and column position.
+    pk_constraints: _SchemaPKConstraints = {}
+    for table_name, constraint_name, column_name in rows:
+        pk = pk_constraints.setdefault(
+            table_name, {"constrained_columns": [], "name": constraint_name}
+        )
+        pk["constrained_columns"].append(column_name)
+    return pk_constraints
+
+
+def _get_sqlalchemy_version() -> Tuple[int, ...]:
+    return tuple(int(part) for part in sqlalchemy.__version__.split(".")[:2])
+
+
+class _PostgresBulkReflector(_BulkReflector):
+    # We query pg_catalog rather than information_schema because the latter only
+    # shows constraints on tables that the current user owns or can modify.
+    _RELKINDS = "('r', 'p', 'v', 'm', 'f')"
+
+    # Column types are resolved with the private PGDialect helpers _load_domains,
+    # _load_enums and _get_column_info, as get_columns() does. Their signatures
+    # are those of SQLAlchemy 1.3 and 1.4, and 2.0 removed them, so columns are
+    # reflected per table on other versions.
+    _COLUMN_INFO_SQLALCHEMY_VERSIONS = ((1, 3), (1, 4))
+
+    def get_columns(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaColumns]:
+        if _get_sqlalchemy_version() not in self._COLUMN_INFO_SQLALCHEMY_VERSIONS:
+            return None
+
+        dialect: Any = inspector.dialect
+        generated = (
+            "a.attgenerated AS generated"
+            if dialect.server_version_info >= (12,)
+            else "NULL AS generated"
+        )
+        query = sql.text(
+            f"""
+            SELECT c.relname AS table_name,
+              a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              (SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_catalog.pg_attrdef d
+               WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+               AND a.atthasdef) AS default,
+              a.attnotnull,
+              pgd.description AS comment,
+              {generated}
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_catalog.pg_description pgd ON (
+                pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+            WHERE n.nspname = :schema
+            AND c.relkind IN {self._RELKINDS}
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY c.relname, a.attnum
+            """
+        ).columns(attname=sqltypes.Unicode, default=sqltypes.Unicode)
+        rows = inspector.bind.execute(query, schema=schema).fetchall()
+
+        # Type resolution is delegated to the dialect so that the columns are
+        # identical to the ones returned by Inspector.get_columns().
+        domains = dialect._load_domains(inspector.bind)
+        enums = dict(
+            ((rec["name"],), rec)
+            if rec["visible"]
+            else ((rec["schema"], rec["name"]), rec)
+            for rec in dialect._load_enums(inspector.bind, schema="*")
+        )
+
+        columns: _SchemaColumns = defaultdict(list)
+        for (
+            table_name,
+            name,
+            format_type,
+            default,
+            notnull,
+            comment,
+            generated,
+        ) in rows:
+            columns[table_name].append(
+                dialect._get_column_info(
+                    name,
+                    format_type,
+                    default,
+                    notnull,
+                    domains,
+                    enums,
+                    schema,
+                    comment,
+                    generated,
+                )
+            )
+        return dict(columns)
+
+    def get_pk_constraints(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaPKConstraints]:
+        query = sql.text(
+            """
+            SELECT c.relname AS table_name, r.conname, a.attname
+            FROM pg_catalog.pg_constraint r
+            JOIN pg_catalog.pg_class c ON c.oid = r.conrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            CROSS JOIN LATERAL unnest(r.conkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_catalog.pg_attribute a
+              ON a.attrelid = r.conrelid AND a.attnum = k.attnum
+            WHERE n.nspname = :schema AND r.contype = 'p'
+            ORDER BY c.relname, k.ord
+            """
+        )
+        return _group_pk_constraints(inspector.bind.execute(query, schema=schema))
+
+    def get_foreign_keys(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaForeignKeys]:
+        query = sql.text(
+            """
+            SELECT c.relname AS table_name,
+              r.conname,
+              a.attname AS constrained_column,
+              rn.nspname AS referred_schema,
+              rc.relname AS referred_table,
+              ra.attname AS referred_column
+            FROM pg_catalog.pg_constraint r
+            JOIN pg_catalog.pg_class c ON c.oid = r.conrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_catalog.pg_class rc ON rc.oid = r.confrelid
+            JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+            CROSS JOIN LATERAL unnest(r.conkey, r.confkey)
+              WITH ORDINALITY AS k(attnum, refattnum, ord)
+            JOIN pg_catalog.pg_attribute a
+              ON a.attrelid = r.conrelid AND a.attnum = k.attnum
+            JOIN pg_catalog.pg_attribute ra
+              ON ra.attrelid = r.confrelid AND ra.attnum = k.refattnum
+            WHERE n.nspname = :schema AND r.contype = 'f'
+            ORDER BY c.relname, r.conname, k.ord
+            """
+        )
+        return _group_foreign_keys(inspector.bind.execute(query, schema=schema))
+
+    def get_table_comments(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaComments]:
+        query = sql.text(
+            f"""
+            SELECT c.relname AS table_name, pgd.description AS table_comment
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_catalog.pg_description pgd
+              ON pgd.objoid = c.oid AND pgd.objsubid = 0
+              AND pgd.classoid = 'pg_catalog.pg_class'::regclass
+            WHERE n.nspname = :schema AND c.relkind IN {self._RELKINDS}
+            """
+        )
+        return {
+            table_name: comment
+            for table_name, comment in inspector.bind.execute(query, schema=schema)
+        }
+
+
+class _MSSQLBulkReflector(_BulkReflector):
+    def get_columns(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaColumns]:
+        from sqlalchemy.dialects.mssql.base import (
+            MSBinary,
+            MSChar,
+            MSNChar,
+            MSNText,
+            MSNVarchar,
+            MSString,
+            MSText,
+            MSVarBinary,
+        )
+
+        query = sql.text(
+            """
+            SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE,
+              CHARACTER_MAXIMUM_LENGTH, NUMERIC_PRECISION, NUMERIC_SCALE,
+              COLUMN_DEFAULT, COLLATION_NAME
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = :schema
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """
+        )
+        ischema_names: Dict[str, Any] = inspector.dialect.ischema_names  # type: ignore
+
+        # This follows the type resolution of the dialect's get_columns(). The
+        # identity and computed column details are not needed for ingestion.
+        columns: _SchemaColumns = defaultdict(list)
+        for (
+            table_name,
+            name,
+            type_,
+            is_nullable,
+            charlen,
+            numericprec,
+            numericscale,
+            default,
+            collation,
+        ) in inspector.bind.execute(query, schema=schema):
+            coltype = ischema_names.get(type_, None)
+            kwargs: Dict[str, Any] = {}
+            if coltype in (
+                MSString,
+                MSChar,
+                MSNVarchar,
+                MSNChar,
+                MSText,
+                MSNText,
+                MSBinary,
+                MSVarBinary,
+                sqltypes.LargeBinary,
+            ):
+                if charlen == -1:
+                    charlen = None
+                kwargs["length"] = charlen
+                if collation:
+                    kwargs["collation"] = collation
+
+            if coltype is None:
+                logger.debug(
+                    f"Did not recognize type '{type_}' of column '{table_name}.{name}'"
+                )
+                coltype = sqltypes.NULLTYPE
+            else:
+                if issubclass(coltype, sqltypes.Numeric):
+                    kwargs["precision"] = numericprec
+                    if not issubclass(coltype, sqltypes.Float):
+                        kwargs["scale"] = numericscale
+                coltype = coltype(**kwargs)
+
+            columns[table_name].append(
+                {
+                    "name": name,
+                    "type": coltype,
+                    "nullable": is_nullable == "YES",
+                    "default": default,
+                    "autoincrement": False,
+                }
+            )
+        return dict(columns)
+
+    def get_pk_constraints(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaPKConstraints]:
+        query = sql.text(
+            """
+            SELECT KCU.TABLE_NAME, KCU.CONSTRAINT_NAME, KCU.COLUMN_NAME
+            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS AS TC
+            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS KCU
+              ON KCU.CONSTRAINT_SCHEMA = TC.CONSTRAINT_SCHEMA
+              AND KCU.CONSTRAINT_NAME = TC.CONSTRAINT_NAME
+            WHERE TC.TABLE_SCHEMA = :schema
+              AND TC.CONSTRAINT_TYPE = 'PRIMARY KEY'
+            ORDER BY KCU.TABLE_NAME, KCU.ORDINAL_POSITION
+            """
+        )
+        return _group_pk_constraints(inspector.bind.execute(query, schema=schema))
+
+    def get_foreign_keys(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaForeignKeys]:
+        query = sql.text(
+            """
+            SELECT C.TABLE_NAME, RC.CONSTRAINT_NAME, C.COLUMN_NAME,
+              R.TABLE_SCHEMA, R.TABLE_NAME, R.COLUMN_NAME
+            FROM INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS AS RC
+            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS C
+              ON C.CONSTRAINT_SCHEMA = RC.CONSTRAINT_SCHEMA
+              AND C.CONSTRAINT_NAME = RC.CONSTRAINT_NAME
+            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE AS R
+              ON R.CONSTRAINT_SCHEMA = RC.UNIQUE_CONSTRAINT_SCHEMA
+              AND R.CONSTRAINT_NAME = RC.UNIQUE_CONSTRAINT_NAME
+              AND R.ORDINAL_POSITION = C.ORDINAL_POSITION
+            WHERE C.TABLE_SCHEMA = :schema
+            ORDER BY C.TABLE_NAME, RC.CONSTRAINT_NAME, C.ORDINAL_POSITION
+            """
+        )
+        return _group_foreign_keys(inspector.bind.execute(query, schema=schema))
+
+    def get_table_comments(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[_SchemaComments]:
+        # SQL Server has no table comments in SQLAlchemy; the mssql source reads the
+        # MS_Description extended properties of the whole database up front instead.
+        return None
+
+
+_BULK_REFLECTORS: Dict[str, _BulkReflector] = {
+    "postgresql": _PostgresBulkReflector(),
+    "mssql": _MSSQLBulkReflector(),
+}
+
+
+class _ReflectionError:
+    """An exception raised while prefetching, re-raised when the result is used."""
+
+    def __init__(self, exception: Exception) -> None:
+        self.exception = exception
+
+
+class SchemaReflectionCache:
+    """
+    Catalog metadata of a single schema.
+
+    With bulk reflection, each kind of metadata (columns, primary keys, foreign keys
+    and table comments) is loaded for the whole schema with one query the first time
+    a table asks for it. The whole schema can also be prefetched up front, which is
+    used to reflect several schemas concurrently, each on its own connection.
+
+    Lookups fall back to the per-table Inspector methods when the dialect has no bulk
+    implementation for a kind, when the bulk query fails, or when a table is missing
+    from the results (for example, because it was created in the meantime). Those
+    are counted as fallbacks, while lookups that a prefetched schema couldn't answer
+    are counted as prefetch misses.
+    """
+
+    _BULK_KINDS = ["columns", "pk_constraints", "foreign_keys", "table_comments"]
+
+    def __init__(
+        self, inspector: Inspector, schema: str, bulk_reflection: bool = True
+    ) -> None:
+        self.inspector = inspector
+        self.schema = schema
+        self._reflector = (
+            _BULK_REFLECTORS.get(inspector.dialect.name) if bulk_reflection else None
+        )
+        self._bulk: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._prefetched: Dict[Tuple[str, str], Any] = {}
+        self._is_prefetched = False
+        self.bulk_queries = 0
+        self.fallbacks = 0
+        self.prefetch_misses = 0
+
+    @staticmethod
+    def is_supported(inspector: Inspector) -> bool:
+        return inspector.dialect.name in _BULK_REFLECTORS
+
+    def _load(
+        self, kind: str, inspector: Optional[Inspector] = None
+    ) -> Optional[Dict[str, Any]]:
+        if kind not in self._bulk:
+            results: Optional[Dict[str, Any]] = None
+            if self._reflector is not None:
+                try:
+                    results = getattr(self._reflector, f"get_{kind}")(
+                        inspector or self.inspector, self.schema
+                    )
+                    if results is not None:
+                        self.bulk_queries += 1
+                except Exception as e:
+                    logger.warning(
+                        f"Bulk reflection of {kind} failed for schema {self.schema}, "
+                        f"falling back to per-table reflection: {e}"
+                    )
+            self._bulk[kind] = results
+        return self._bulk[kind]
+
+    def _reflect(
+        self,
+        method: str,
+        name: Optional[str],
+        inspector: Optional[Inspector] = None,
+    ) -> Any:
+        inspector = inspector or self.inspector
+        if name is None:
+            return getattr(inspector, method)(self.schema)
+        return getattr(inspector, method)(name, self.schema)
+
+    def _get(
+        self, method: str, name: Optional[str] = None, bulk_fallback: bool = False
+    ) -> Any:
+        if bulk_fallback and self._reflector is not None:
+            self.fallbacks += 1
+        key = (method, name or "")
+        if key in self._prefetched:
+            result = self._prefetched[key]
+            if isinstance(result, _ReflectionError):
+                raise result.exception
+            return result
+        if self._is_prefetched:
+            self.prefetch_misses += 1
+        return self._reflect(method, name)
+
+    def _prefetch(self, inspector: Inspector, method: str, name: Optional[str]) -> Any:
+        try:
+            result = self._reflect(method, name, inspector)
+        except Exception as e:
+            result = _ReflectionError(e)
+        self._prefetched[(method, name or "")] = result
+        return result
+
+    def prefetch(
+        self,
+        inspector: Inspector,
+        is_table_allowed: Optional[Callable[[str], bool]] = None,
+        is_view_allowed: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        """
+        Reflects everything that ingestion needs from the schema using the given
+        inspector. Tables are only reflected when is_table_allowed accepts their name,
+        and likewise for views, so that excluded objects are not read. Without a
+        filter, the kind of object isn't reflected at all. Lookups made afterwards
+        don't issue any catalog queries, unless a table is missing from the
+        prefetched results.
+        """
+        self._is_prefetched = True
+        for kind in self._BULK_KINDS:
+            self._load(kind, inspector)
+
+        if is_table_allowed is not None:
+            tables = self._prefetch(inspector, "get_table_names", None)
+            if not isinstance(tables, _ReflectionError):
+                for table in tables:
+                    if is_table_allowed(table):
+                        self._prefetch_table(inspector, table)
+
+        if is_view_allowed is not None:
+            views = self._prefetch(inspector, "get_view_names", None)
+            if not isinstance(views, _ReflectionError):
+                for view in views:
+                    if is_view_allowed(view):
+                        self._prefetch_table(inspector, view, is_view=True)
+                        self._prefetch(inspector, "get_view_definition", view)
+
+    def _prefetch_table(
+        self, inspector: Inspector, table: str, is_view: bool = False
+    ) -> None:
+        columns = self._bulk.get("columns")
+        if columns is None or table not in columns:
+            self._prefetch(inspector, "get_columns", table)
+        comments = self._bulk.get("table_comments")
+        if comments is None or table not in comments:
+            self._prefetch(inspector, "get_table_comment", table)
+        if not is_view:
+            if self._bulk.get("pk_constraints") is None:
+                self._prefetch(inspector, "get_pk_constraint", table)
+            if self._bulk.get("foreign_keys") is None:
+                self._prefetch(inspector, "get_foreign_keys", table)
+
+    def get_table_names(self) -> List[str]:
+        return self._get("get_table_names")
+
+    def get_view_names(self) -> List[str]:
+        return self._get("get_view_names")
+
+    def get_view_definition(self, view: str) -> Any:
+        return self._get("get_view_definition", view)
+
+    def get_columns(self, table: str) -> List[Dict[str, Any]]:
+        columns = self._load("columns")
+        if columns is None or table not in columns:
+            return self._get("get_columns", table, bulk_fallback=True)
+        return columns[table]
+
+    def get_pk_constraint(self, table: str) -> Dict[str, Any]:
+        # Tables without a primary key are absent from the bulk results, so we can't
+        # tell a new table apart from one without a key. Both have no known key.
+        pk_constraints = self._load("pk_constraints")
+        if pk_constraints is None:
+            return self._get("get_pk_constraint", table, bulk_fallback=True)
+        return pk_constraints.get(table, {"constrained_columns": [], "name": None})
+
+    def get_foreign_keys(self, table: str) -> List[Dict[str, Any]]:
+        foreign_keys = self._load("foreign_keys")
+        if foreign_keys is None:
+            return self._get("get_foreign_keys", table, bulk_fallback=True)
+        return foreign_keys.get(table, [])
+
+    def get_table_comment(self, table: str) -> Dict[str, Any]:
+        comments = self._load("table_comments")
+        if comments is None or table not in comments:
+            return self._get("get_table_comment", table, bulk_fallback=True)
+        return {"text": comments[table]}
@@ -1,14 +1,17 @@
+import concurrent.futures
 import datetime
+import functools
 import logging
 import traceback
 from abc import abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -29,6 +32,7 @@ from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.sql import sqltypes as types
 
 from datahub.configuration.common import AllowDenyPattern
+from datahub.configuration.pattern_matcher import PatternMatchStats
 from datahub.emitter.mce_builder import (
     make_data_platform_urn,
     make_dataplatform_instance_urn,
@@ -47,6 +51,7 @@ from datahub.emitter.mcp_builder import (
 )
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.source.sql.sql_bulk_reflection import SchemaReflectionCache
 from datahub.ingestion.source.state.checkpoint import Checkpoint
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
@@ -191,7 +196,10 @@ class SQLSourceReport(StatefulIngestionReport):
     views_scanned: int = 0
     entities_profiled: int = 0
     filtered: List[str] = field(default_factory=list)
-    soft_deleted_stale_entities: List[str] = field(default_factory=list)
+    bulk_reflection_queries: int = 0
+    bulk_reflection_fallbacks: int = 0
+    schema_prefetch_misses: int = 0
+    pattern_match_stats: Dict[str, PatternMatchStats] = field(default_factory=dict)
 
     query_combiner: Optional[SQLAlchemyQueryCombinerReport] = None
 
@@ -217,8 +225,10 @@ class SQLSourceReport(StatefulIngestionReport):
     ) -> None:
         self.query_combiner = query_combiner_report
 
-    def report_stale_entity_soft_deleted(self, urn: str) -> None:
-        self.soft_deleted_stale_entities.append(urn)
+    def report_schema_reflection(self, cache: SchemaReflectionCache) -> None:
+        self.bulk_reflection_queries += cache.bulk_queries
+        self.bulk_reflection_fallbacks += cache.fallbacks
+        self.schema_prefetch_misses += cache.prefetch_misses
 
 
 class SQLAlchemyStatefulIngestionConfig(StatefulIngestionConfig):
@@ -267,6 +277,14 @@ class SQLAlchemyConfig(StatefulIngestionConfigBase):
     include_tables: Optional[bool] = Field(
         default=True, description="Whether tables should be ingested."
     )
+    bulk_reflection: bool = Field(
+        default=False,
+        description="Fetch the columns, primary keys, foreign keys and comments of all tables in a schema with one catalog query per kind, instead of querying the catalog for every table. Supported for Postgres and SQL Server; other databases always use per-table reflection.",
+    )
+    reflection_max_workers: int = Field(
+        default=1,
+        description="Number of schemas whose catalog metadata is reflected concurrently, each on its own pooled connection. Workunits are still produced in schema order.",
+    )
 
     from datahub.ingestion.source.ge_data_profiler import GEProfilingConfig
 
@@ -483,6 +501,9 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         self.config = config
         self.platform = platform
         self.report: SQLSourceReport = SQLSourceReport()
+        self._schema_reflection_caches: Dict[
+            Tuple[str, str], SchemaReflectionCache
+        ] = {}
 
         config_report = {
             config_option: config.dict().get(config_option)
@@ -617,25 +638,6 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         ):
             logger.debug("Checking for stale entity removal.")
 
-            def soft_delete_item(urn: str, type: str) -> Iterable[MetadataWorkUnit]:
-                entity_type: str = "dataset"
-
-                if type == "container":
-                    entity_type = "container"
-
-                logger.info(f"Soft-deleting stale entity of type {type} - {urn}.")
-                mcp = MetadataChangeProposalWrapper(
-                    entityType=entity_type,
-                    entityUrn=urn,
-                    changeType=ChangeTypeClass.UPSERT,
-                    aspectName="status",
-                    aspect=StatusClass(removed=True),
-                )
-                wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
-                self.report.report_workunit(wu)
-                self.report.report_stale_entity_soft_deleted(urn)
-                yield wu
-
             last_checkpoint_state = cast(
                 BaseSQLAlchemyCheckpointState, last_checkpoint.state
             )
@@ -643,20 +645,18 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                 BaseSQLAlchemyCheckpointState, cur_checkpoint.state
             )
 
-            for table_urn in last_checkpoint_state.get_table_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(table_urn, "table")
-
-            for view_urn in last_checkpoint_state.get_view_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(view_urn, "view")
-
-            for container_urn in last_checkpoint_state.get_container_urns_not_in(
-                cur_checkpoint_state
-            ):
-                yield from soft_delete_item(container_urn, "container")
+            yield from self.gen_stale_entity_workunits(
+                "table",
+                last_checkpoint_state.get_table_urns_not_in(cur_checkpoint_state),
+            )
+            yield from self.gen_stale_entity_workunits(
+                "view", last_checkpoint_state.get_view_urns_not_in(cur_checkpoint_state)
+            )
+            yield from self.gen_stale_entity_workunits(
+                "container",
+                last_checkpoint_state.get_container_urns_not_in(cur_checkpoint_state),
+                entity_type="container",
+            )
 
     def gen_schema_key(self, db_name: str, schema: str) -> PlatformKey:
         return SchemaKey(
@@ -730,9 +730,15 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
 
         # Extra default SQLAlchemy option for better connection pooling and threading.
         # https://docs.sqlalchemy.org/en/14/core/pooling.html#sqlalchemy.pool.QueuePool.params.max_overflow
-        if sql_config.profiling.enabled:
+        if sql_config.profiling.enabled or sql_config.reflection_max_workers > 1:
             sql_config.options.setdefault(
-                "max_overflow", sql_config.profiling.max_workers
+                "max_overflow",
+                max(
+                    sql_config.profiling.max_workers
+                    if sql_config.profiling.enabled
+                    else 0,
+                    sql_config.reflection_max_workers,
+                ),
             )
 
         for inspector in self.get_inspectors():
@@ -744,7 +750,9 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             db_name = self.get_db_name(inspector)
             yield from self.gen_database_containers(db_name)
 
-            for schema in self.get_allowed_schemas(inspector, db_name):
+            for schema in self.prefetch_schemas(
+                inspector, db_name, self.get_allowed_schemas(inspector, db_name)
+            ):
                 self.add_information_for_schema(inspector, schema)
 
                 yield from self.gen_schema_containers(schema, db_name)
@@ -760,6 +768,10 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                         self.loop_profiler_requests(inspector, schema, sql_config)
                     )
 
+                self.release_schema_reflection_caches(db_name, schema)
+
+            self.release_schema_reflection_caches(db_name)
+
             if profiler and profile_requests:
                 yield from self.loop_profiler(
                     profile_requests, profiler, platform=self.platform
@@ -864,8 +876,13 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
         tables_seen: Set[str] = set()
+        schema_reflection = self.get_schema_reflection_cache(inspector, schema)
         try:
-            for table in inspector.get_table_names(schema):
+            for table in (
+                schema_reflection.get_table_names()
+                if schema_reflection
+                else inspector.get_table_names(schema)
+            ):
                 schema, table = self.standardize_schema_table_names(
                     schema=schema, entity=table
                 )
@@ -903,6 +920,96 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     def add_information_for_schema(self, inspector: Inspector, schema: str) -> None:
         pass
 
+    def get_schema_reflection_cache(
+        self, inspector: Inspector, schema: str
+    ) -> Optional[SchemaReflectionCache]:
+        """
+        Returns the prefetched or bulk-reflected catalog metadata of the schema, or
+        None if the schema should be reflected table by table.
+        """
+        key = (self.get_db_name(inspector), schema)
+        cache = self._schema_reflection_caches.get(key)
+        if (
+            cache is None
+            and self.config.bulk_reflection
+            and SchemaReflectionCache.is_supported(inspector)
+        ):
+            cache = SchemaReflectionCache(inspector, schema)
+            self._schema_reflection_caches[key] = cache
+        return cache
+
+    def release_schema_reflection_caches(
+        self, db_name: str, schema: Optional[str] = None
+    ) -> None:
+        for key in list(self._schema_reflection_caches):
+            if key[0] == db_name and (schema is None or key[1] == schema):
+                cache = self._schema_reflection_caches.pop(key)
+                self.report.report_schema_reflection(cache)
+
+    def prefetch_schemas(
+        self, inspector: Inspector, db_name: str, schemas: Iterable[str]
+    ) -> Iterable[str]:
+        """
+        Yields the schemas in order, each once its catalog metadata is available.
+
+        With reflection_max_workers > 1, upcoming schemas are reflected concurrently
+        by a pool of workers, each using its own connection from the engine's pool.
+        Workunits, report and checkpoint updates are still produced by the caller's
+        thread, so the output order doesn't depend on which schema finishes first.
+        """
+        max_workers = self.config.reflection_max_workers
+        if max_workers <= 1:
+            yield from schemas
+            return
+
+        def _is_allowed(pattern: AllowDenyPattern, schema: str, entity: str) -> bool:
+            # The same dataset names as in loop_tables() and loop_views().
+            schema, entity = self.standardize_schema_table_names(
+                schema=schema, entity=entity
+            )
+            dataset_name = self.get_identifier(
+                schema=schema, entity=entity, inspector=inspector
+            )
+            return pattern.allowed(self.normalise_dataset_name(dataset_name))
+
+        def _prefetch(cache: SchemaReflectionCache) -> None:
+            with inspector.engine.connect() as conn:
+                cache.prefetch(
+                    inspect(conn),
+                    is_table_allowed=functools.partial(
+                        _is_allowed, self.config.table_pattern, cache.schema
+                    )
+                    if self.config.include_tables
+                    else None,
+                    is_view_allowed=functools.partial(
+                        _is_allowed, self.config.view_pattern, cache.schema
+                    )
+                    if self.config.include_views
+                    else None,
+                )
+
+        def _wait(schema: str, future: "concurrent.futures.Future[None]") -> str:
+            try:
+                future.result()
+            except Exception as e:
+                # Reflect the schema table by table on the caller's connection instead.
+                self.release_schema_reflection_caches(db_name, schema)
+                self.warn(logger, schema, f"Unable to prefetch schema metadata: {e}")
+            return schema
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Deque[Tuple[str, "concurrent.futures.Future[None]"]] = deque()
+            for schema in schemas:
+                cache = SchemaReflectionCache(
+                    inspector, schema, bulk_reflection=self.config.bulk_reflection
+                )
+                self._schema_reflection_caches[(db_name, schema)] = cache
+                pending.append((schema, executor.submit(_prefetch, cache)))
+                if len(pending) >= max_workers:
+                    yield _wait(*pending.popleft())
+            while pending:
+                yield _wait(*pending.popleft())
+
     def get_extra_tags(
         self, inspector: Inspector, schema: str, table: str
     ) -> Optional[Dict[str, List[str]]]:
@@ -978,7 +1085,12 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             yield lineage_wu
 
         extra_tags = self.get_extra_tags(inspector, schema, table)
-        pk_constraints: dict = inspector.get_pk_constraint(table, schema)
+        schema_reflection = self.get_schema_reflection_cache(inspector, schema)
+        pk_constraints: dict = (
+            schema_reflection.get_pk_constraint(table)
+            if schema_reflection
+            else inspector.get_pk_constraint(table, schema)
+        )
         foreign_keys = self._get_foreign_keys(dataset_urn, inspector, schema, table)
         schema_fields = self.get_schema_fields(
             dataset_name, columns, pk_constraints, tags=extra_tags
@@ -1032,10 +1144,15 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         # this method and provide a location.
         location: Optional[str] = None
 
+        schema_reflection = self.get_schema_reflection_cache(inspector, schema)
         try:
             # SQLAlchemy stubs are incomplete and missing this method.
             # PR: https://github.com/dropbox/sqlalchemy-stubs/pull/223.
-            table_info: dict = inspector.get_table_comment(table, schema)  # type: ignore
+            table_info: dict = (
+                schema_reflection.get_table_comment(table)
+                if schema_reflection
+                else inspector.get_table_comment(table, schema)  # type: ignore
+            )
         except NotImplementedError:
             return description, properties, location
         except ProgrammingError as pe:
@@ -1081,9 +1198,14 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     def _get_columns(
         self, dataset_name: str, inspector: Inspector, schema: str, table: str
     ) -> List[dict]:
-        columns = []
+        columns: List[dict] = []
+        schema_reflection = self.get_schema_reflection_cache(inspector, schema)
         try:
-            columns = inspector.get_columns(table, schema)
+            columns = (
+                schema_reflection.get_columns(table)
+                if schema_reflection
+                else inspector.get_columns(table, schema)
+            )
             if len(columns) == 0:
                 self.report.report_warning(MISSING_COLUMN_INFO, dataset_name)
         except Exception as e:
@@ -1096,10 +1218,15 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     def _get_foreign_keys(
         self, dataset_urn: str, inspector: Inspector, schema: str, table: str
     ) -> List[ForeignKeyConstraint]:
+        schema_reflection = self.get_schema_reflection_cache(inspector, schema)
         try:
             foreign_keys = [
                 self.get_foreign_key_metadata(dataset_urn, schema, fk_rec, inspector)
-                for fk_rec in inspector.get_foreign_keys(table, schema)
+                for fk_rec in (
+                    schema_reflection.get_foreign_keys(table)
+                    if schema_reflection
+                    else inspector.get_foreign_keys(table, schema)
+                )
             ]
         except KeyError:
             # certain databases like MySQL cause issues due to lower-case/upper-case irregularities
@@ -1162,8 +1289,13 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         schema: str,
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
+        schema_reflection = self.get_schema_reflection_cache(inspector, schema)
         try:
-            for view in inspector.get_view_names(schema):
+            for view in (
+                schema_reflection.get_view_names()
+                if schema_reflection
+                else inspector.get_view_names(schema)
+            ):
                 schema, view = self.standardize_schema_table_names(
                     schema=schema, entity=view
                 )
@@ -1204,8 +1336,13 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         view: str,
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
+        schema_reflection = self.get_schema_reflection_cache(inspector, schema)
         try:
-            columns = inspector.get_columns(view, schema)
+            columns = (
+                schema_reflection.get_columns(view)
+                if schema_reflection
+                else inspector.get_columns(view, schema)
+            )
         except KeyError:
             # For certain types of views, we are unable to fetch the list of columns.
             self.report.report_warning(
@@ -1223,7 +1360,11 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             )
         description, properties, _ = self.get_table_properties(inspector, schema, view)
         try:
-            view_definition = inspector.get_view_definition(view, schema)
+            view_definition = (
+                schema_reflection.get_view_definition(view)
+                if schema_reflection
+                else inspector.get_view_definition(view, schema)
+            )
             if view_definition is None:
                 view_definition = ""
             else:
@@ -1513,6 +1654,15 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         )
 
     def get_report(self):
+        for pattern_name in [
+            "schema_pattern",
+            "table_pattern",
+            "view_pattern",
+            "profile_pattern",
+        ]:
+            self.report.pattern_match_stats[pattern_name] = getattr(
+                self.config, pattern_name
+            ).stats
         return self.report
 
     def close(self):
@@ -1,10 +1,23 @@
+import base64
 import bz2
-import functools
+import enum
 import json
 import logging
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, Type
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import pydantic
 
@@ -16,6 +29,104 @@ from datahub.metadata.schema_classes import (
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# The default serde, plain JSON.
+UTF8_SERDE = "utf-8"
+
+
+@enum.unique
+class CheckpointStateCompression(str, enum.Enum):
+    BZ2 = "bz2"
+    ZSTD = "zstd"
+
+
+def get_checkpoint_state_serde(compression: CheckpointStateCompression) -> str:
+    """
+    The serde of states stored as compressed JSON, base64 encoded to fit in the JSON
+    encoded checkpoint aspect.
+    """
+    return f"base64-{compression.value}-json"
+
+
+_COMPRESSION_BY_SERDE: Dict[str, CheckpointStateCompression] = {
+    get_checkpoint_state_serde(compression): compression
+    for compression in CheckpointStateCompression
+}
+
+_COMPRESSION_MAGIC_NUMBERS: Dict[CheckpointStateCompression, bytes] = {
+    CheckpointStateCompression.BZ2: b"BZh",
+    CheckpointStateCompression.ZSTD: b"\x28\xb5\x2f\xfd",
+}
+
+
+def detect_checkpoint_state_serde(data_bytes: bytes) -> str:
+    """Detects the serde of a serialized state from its first bytes."""
+    if data_bytes.lstrip()[:1] == b"{":
+        return UTF8_SERDE
+    # 8 base64 characters decode to the first 6 bytes of the compressed state
+    header = base64.b64decode(data_bytes[:8])
+    for compression, magic_number in _COMPRESSION_MAGIC_NUMBERS.items():
+        if header.startswith(magic_number):
+            return get_checkpoint_state_serde(compression)
+    raise ValueError("Unknown checkpoint state serde")
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compressed checkpoint states require the zstandard package: pip install zstandard"
+        ) from e
+    return zstandard
+
+
+def _compress(data: bytes, compression: CheckpointStateCompression) -> bytes:
+    if compression == CheckpointStateCompression.ZSTD:
+        return _import_zstandard().ZstdCompressor(level=9).compress(data)
+    return bz2.compress(data, compresslevel=9)
+
+
+def _decompress(data: bytes, compression: CheckpointStateCompression) -> bytes:
+    if compression == CheckpointStateCompression.ZSTD:
+        return _import_zstandard().ZstdDecompressor().decompress(data)
+    return bz2.decompress(data)
+
+
+def _shared_prefix_length(a: str, b: str) -> int:
+    # binary search, since comparing slices is much faster than comparing characters
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def front_code(values: Iterable[str]) -> List[Tuple[int, str]]:
+    """
+    Sorts and deduplicates the values, then stores each one as the length of the prefix
+    it shares with the previous one and the rest of it. Urns of the same platform and
+    database share long prefixes.
+    """
+    encoded: List[Tuple[int, str]] = []
+    previous = ""
+    for value in sorted(set(values)):
+        shared = _shared_prefix_length(previous, value)
+        encoded.append((shared, value[shared:]))
+        previous = value
+    return encoded
+
+
+def front_decode(encoded: Iterable[Tuple[int, str]]) -> List[str]:
+    values: List[str] = []
+    previous = ""
+    for shared, suffix in encoded:
+        previous = previous[:shared] + suffix
+        values.append(previous)
+    return values
+
 
 class CheckpointStateBase(ConfigModel):
     """
@@ -25,28 +136,45 @@ class CheckpointStateBase(ConfigModel):
     serialization along with potential validation for specific sources.
     """
 
+    # Fields holding lists that are sets in all but type, typically of encoded urns.
+    # They are sorted, deduplicated and front coded when the state is serialized.
+    sorted_set_fields: ClassVar[Tuple[str, ...]] = ()
+
     version: str = pydantic.Field(default="1.0")
-    serde: str = pydantic.Field(default="utf-8")
+    serde: str = pydantic.Field(default=UTF8_SERDE)
 
     def to_bytes(
         self,
-        compressor: Callable[[bytes], bytes] = functools.partial(
-            bz2.compress, compresslevel=9
-        ),
         # fmt: off
         # 4 MB
         max_allowed_state_size: int = 2**22,
         # fmt: on
     ) -> bytes:
         """
-        NOTE: Binary compression cannot be turned on yet as the current MCPs encode the GeneralizedAspect
-        payload using Json encoding which does not support bytes type data. For V1, we go with the utf-8 encoding.
-        This also means that double serialization also is not possible to encode version and serde separate from the
-        binary state payload. Binary content-type needs to be supported for encoding the GenericAspect to do this.
+        Serializes the state according to its serde. The checkpoint aspect is JSON
+        encoded, so compressed states are base64 encoded. The size limit applies to
+        the encoded state.
         """
 
-        json_str_self = self.json(exclude={"version", "serde"})
-        encoded_bytes = json_str_self.encode("utf-8")
+        if self.serde == UTF8_SERDE:
+            encoded_bytes = self.json(exclude={"version", "serde"}).encode("utf-8")
+        elif self.serde in _COMPRESSION_BY_SERDE:
+            state_dict = json.loads(self.json(exclude={"version", "serde"}))
+            for field in self.sorted_set_fields:
+                state_dict[field] = front_code(state_dict[field])
+            payload = {
+                "front_coded_fields": list(self.sorted_set_fields),
+                "state": state_dict,
+            }
+            encoded_bytes = base64.b64encode(
+                _compress(
+                    json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+                    _COMPRESSION_BY_SERDE[self.serde],
+                )
+            )
+        else:
+            raise ValueError(f"Unknown checkpoint state serde {self.serde}")
+
         if len(encoded_bytes) > max_allowed_state_size:
             raise ValueError(
                 f"The state size has exceeded the max_allowed_state_size of {max_allowed_state_size}"
@@ -56,13 +184,40 @@ class CheckpointStateBase(ConfigModel):
 
     @staticmethod
     def from_bytes_to_dict(
-        data_bytes: bytes, decompressor: Callable[[bytes], bytes] = bz2.decompress
+        data_bytes: bytes, serde: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Helper method for sub-classes to use."""
-        # uncompressed_data: bytes = decompressor(data_bytes)
-        # json_str = uncompressed_data.decode('utf-8')
-        json_str = data_bytes.decode("utf-8")
-        return json.loads(json_str)
+        """
+        Helper method for sub-classes to use. The serde is detected from the data if
+        it isn't given.
+        """
+        if serde is None:
+            serde = detect_checkpoint_state_serde(data_bytes)
+        if serde == UTF8_SERDE:
+            return json.loads(data_bytes.decode("utf-8"))
+        if serde not in _COMPRESSION_BY_SERDE:
+            raise ValueError(f"Unknown checkpoint state serde {serde}")
+
+        payload = json.loads(
+            _decompress(base64.b64decode(data_bytes), _COMPRESSION_BY_SERDE[serde])
+        )
+        state_dict = payload["state"]
+        for field in payload["front_coded_fields"]:
+            state_dict[field] = front_decode(state_dict[field])
+        return state_dict
+
+
+Derived = TypeVar("Derived", bound="StaleEntityCheckpointStateBase")
+
+
+class StaleEntityCheckpointStateBase(CheckpointStateBase, ABC, Generic[Derived]):
+    """
+    Base class for checkpoint states that keep the urns of the tables ingested in a
+    run, so that the ones that aren't found in the next run can be soft-deleted.
+    """
+
+    @abstractmethod
+    def get_table_urns_not_in(self, checkpoint: Derived) -> Iterable[str]:
+        """Returns the urns of the tables in this state but not in the given one."""
 
 
 @dataclass
@@ -104,7 +259,8 @@ class Checkpoint:
                 # Construct the state
                 state_as_dict = (
                     CheckpointStateBase.from_bytes_to_dict(
-                        checkpoint_aspect.state.payload
+                        checkpoint_aspect.state.payload,
+                        checkpoint_aspect.state.serde,
                     )
                     if checkpoint_aspect.state.payload is not None
                     else {}
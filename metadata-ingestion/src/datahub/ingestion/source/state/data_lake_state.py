@@ -0,0 +1,40 @@
+from typing import Dict, Iterable, Optional
+
+import pydantic
+
+from datahub.configuration.common import ConfigModel
+from datahub.ingestion.source.state.checkpoint import StaleEntityCheckpointStateBase
+
+
+class DataLakeTableState(ConfigModel):
+    """What the files of a data lake table looked like when it was last ingested."""
+
+    last_modified: int  # modification time of the newest file, in epoch millis
+    number_of_files: int
+    size_in_bytes: int
+    schema_fingerprint: str
+
+
+class DataLakeCheckpointState(
+    StaleEntityCheckpointStateBase["DataLakeCheckpointState"]
+):
+    """
+    This Class represents the checkpoint state for S3 and local data lake sources.
+    Stores the state of every table being ingested, keyed by dataset urn. It is used to
+    skip tables whose files didn't change and to remove any stale entities.
+    """
+
+    tables: Dict[str, DataLakeTableState] = pydantic.Field(default_factory=dict)
+
+    def add_table(self, dataset_urn: str, table_state: DataLakeTableState) -> None:
+        self.tables[dataset_urn] = table_state
+
+    def get_table(self, dataset_urn: str) -> Optional[DataLakeTableState]:
+        return self.tables.get(dataset_urn)
+
+    def get_table_urns_not_in(
+        self, checkpoint: "DataLakeCheckpointState"
+    ) -> Iterable[str]:
+        for dataset_urn in self.tables:
+            if dataset_urn not in checkpoint.tables:
+                yield dataset_urn
@@ -1,5 +1,6 @@
 import logging
-from typing import Callable, Dict, Iterable, List
+import sys
+from typing import Callable, ClassVar, Dict, Iterable, List, Tuple
 
 import pydantic
 
@@ -17,6 +18,11 @@ class DbtCheckpointState(CheckpointStateBase):
     Stores all nodes and assertions being ingested and is used to remove any stale entities.
     """
 
+    sorted_set_fields: ClassVar[Tuple[str, ...]] = (
+        "encoded_node_urns",
+        "encoded_assertion_urns",
+    )
+
     encoded_node_urns: List[str] = pydantic.Field(default_factory=list)
     encoded_assertion_urns: List[str] = pydantic.Field(default_factory=list)
 
@@ -26,7 +32,7 @@ class DbtCheckpointState(CheckpointStateBase):
         urn = Urn.create_from_string(assertion_urn)
         key = urn.get_entity_id_as_string()
         assert key is not None
-        return key
+        return sys.intern(key)
 
     def add_assertion_urn(self, assertion_urn: str) -> None:
         self.encoded_assertion_urns.append(
@@ -0,0 +1,32 @@
+from typing import Dict, Iterable, Optional
+
+import pydantic
+
+from datahub.ingestion.source.state.checkpoint import StaleEntityCheckpointStateBase
+from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
+
+
+class DeltaLakeCheckpointState(
+    StaleEntityCheckpointStateBase["DeltaLakeCheckpointState"]
+):
+    """
+    This Class represents the checkpoint state for Delta Lake sources.
+    Stores the version of every table when it was last ingested, keyed by dataset urn.
+    It is used to skip tables that didn't change, to only emit the operations of new
+    versions and to remove any stale entities.
+    """
+
+    table_versions: Dict[str, int] = pydantic.Field(default_factory=dict)
+
+    def add_table_version(self, dataset_urn: str, version: int) -> None:
+        self.table_versions[dataset_urn] = version
+
+    def get_table_version(self, dataset_urn: str) -> Optional[int]:
+        return self.table_versions.get(dataset_urn)
+
+    def get_table_urns_not_in(
+        self, checkpoint: "DeltaLakeCheckpointState"
+    ) -> Iterable[str]:
+        yield from CheckpointStateUtil.get_encoded_urns_not_in(
+            self.table_versions, checkpoint.table_versions
+        )
@@ -0,0 +1,34 @@
+from typing import Dict, Iterable, Optional
+
+import pydantic
+
+from datahub.ingestion.source.state.checkpoint import StaleEntityCheckpointStateBase
+from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
+
+
+class IcebergCheckpointState(StaleEntityCheckpointStateBase["IcebergCheckpointState"]):
+    """
+    This Class represents the checkpoint state for Iceberg sources.
+    Stores every ingested table, keyed by dataset urn, along with the ID of the snapshot
+    it was last profiled at, if any. It is used to skip profiling tables whose snapshot
+    didn't change and to remove any stale entities.
+    """
+
+    profiled_snapshot_ids: Dict[str, Optional[int]] = pydantic.Field(
+        default_factory=dict
+    )
+
+    def add_table(
+        self, dataset_urn: str, profiled_snapshot_id: Optional[int] = None
+    ) -> None:
+        self.profiled_snapshot_ids[dataset_urn] = profiled_snapshot_id
+
+    def get_profiled_snapshot_id(self, dataset_urn: str) -> Optional[int]:
+        return self.profiled_snapshot_ids.get(dataset_urn)
+
+    def get_table_urns_not_in(
+        self, checkpoint: "IcebergCheckpointState"
+    ) -> Iterable[str]:
+        yield from CheckpointStateUtil.get_encoded_urns_not_in(
+            self.profiled_snapshot_ids, checkpoint.profiled_snapshot_ids
+        )
@@ -1,9 +1,9 @@
-from typing import Iterable, List
+from typing import ClassVar, Iterable, List, Tuple
 
 import pydantic
 
-from datahub.emitter.mce_builder import dataset_urn_to_key, make_dataset_urn
 from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
+from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
 
 
 class KafkaCheckpointState(CheckpointStateBase):
@@ -12,6 +12,8 @@ class KafkaCheckpointState(CheckpointStateBase):
     Stores all the topics being ingested and it is used to remove any stale entities.
     """
 
+    sorted_set_fields: ClassVar[Tuple[str, ...]] = ("encoded_topic_urns",)
+
     encoded_topic_urns: List[str] = pydantic.Field(default_factory=list)
 
     @staticmethod
@@ -22,21 +24,15 @@ class KafkaCheckpointState(CheckpointStateBase):
     @staticmethod
     def _get_lightweight_repr(dataset_urn: str) -> str:
         """Reduces the amount of text in the URNs for smaller state footprint."""
-        SEP = KafkaCheckpointState._get_separator()
-        key = dataset_urn_to_key(dataset_urn)
-        assert key is not None
-        return f"{key.platform}{SEP}{key.name}{SEP}{key.origin}"
+        return CheckpointStateUtil.get_dataset_lightweight_repr(dataset_urn)
 
     @staticmethod
     def _get_urns_not_in(
         encoded_urns_1: List[str], encoded_urns_2: List[str]
     ) -> Iterable[str]:
-        difference = set(encoded_urns_1) - set(encoded_urns_2)
-        for encoded_urn in difference:
-            platform, name, env = encoded_urn.split(
-                KafkaCheckpointState._get_separator()
-            )
-            yield make_dataset_urn(platform, name, env)
+        yield from CheckpointStateUtil.get_dataset_urns_not_in(
+            encoded_urns_1, encoded_urns_2
+        )
 
     def get_topic_urns_not_in(
         self, checkpoint: "KafkaCheckpointState"
@@ -1,4 +1,5 @@
-from typing import Iterable, List
+import sys
+from typing import ClassVar, Iterable, List, Tuple
 
 import pydantic
 
@@ -14,6 +15,13 @@ class BaseSQLAlchemyCheckpointState(CheckpointStateBase):
     Subclasses can define additional state as appropriate.
     """
 
+    sorted_set_fields: ClassVar[Tuple[str, ...]] = (
+        "encoded_table_urns",
+        "encoded_view_urns",
+        "encoded_container_urns",
+        "encoded_assertion_urns",
+    )
+
     encoded_table_urns: List[str] = pydantic.Field(default_factory=list)
     encoded_view_urns: List[str] = pydantic.Field(default_factory=list)
     encoded_container_urns: List[str] = pydantic.Field(default_factory=list)
@@ -29,7 +37,7 @@ class BaseSQLAlchemyCheckpointState(CheckpointStateBase):
         """Reduces the amount of text in the URNs for smaller state footprint."""
         key = container_urn_to_key(container_urn)
         assert key is not None
-        return f"{key.guid}"
+        return sys.intern(f"{key.guid}")
 
     @staticmethod
     def _get_container_urns_not_in(
@@ -1,8 +1,8 @@
 import logging
 import platform
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional, Type, cast
+from typing import Any, Dict, Iterable, List, Optional, Type, cast
 
 import psutil
 import pydantic
@@ -14,6 +14,7 @@ from datahub.configuration.common import (
     DynamicTypedConfig,
 )
 from datahub.configuration.source_common import DatasetSourceConfigBase
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import (
     IngestionCheckpointingProviderBase,
@@ -23,15 +24,26 @@ from datahub.ingestion.api.ingestion_job_reporting_provider_base import (
     IngestionReportingProviderBase,
 )
 from datahub.ingestion.api.source import Source, SourceReport
-from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.source.state.checkpoint import (
+    UTF8_SERDE,
+    Checkpoint,
+    CheckpointStateBase,
+    CheckpointStateCompression,
+    StaleEntityCheckpointStateBase,
+    get_checkpoint_state_serde,
+)
 from datahub.ingestion.source.state_provider.state_provider_registry import (
     ingestion_checkpoint_provider_registry,
 )
 from datahub.metadata.schema_classes import (
+    ChangeTypeClass,
     DatahubIngestionCheckpointClass,
     DatahubIngestionRunSummaryClass,
     JobStatusClass,
+    StatusClass,
 )
+from datahub.utilities.perf_timer import PerfTimer
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -66,6 +78,10 @@ class StatefulIngestionConfig(ConfigModel):
     state_provider: Optional[DynamicTypedStateProviderConfig] = Field(
         default=None, description="The ingestion state provider configuration."
     )
+    state_compression: Optional[CheckpointStateCompression] = Field(
+        default=None,
+        description="How the checkpoint state is compressed, `bz2` or `zstd`. `zstd` is faster and requires the zstandard package. The state is stored as plain JSON by default. Older versions of datahub can't read compressed states, so upgrade every deployment that runs the pipeline before enabling this. The previous state is read whichever way it was stored.",
+    )
     ignore_old_state: bool = Field(
         default=False,
         description="If set to True, ignores the previous checkpoint state.",
@@ -85,6 +101,18 @@ class StatefulIngestionConfig(ConfigModel):
         return values
 
 
+class StatefulStaleMetadataRemovalConfig(StatefulIngestionConfig):
+    """
+    Stateful ingestion config of the sources that soft-delete the tables that were
+    ingested in the last run but are no longer found.
+    """
+
+    remove_stale_metadata: bool = Field(
+        default=True,
+        description="Soft-deletes the tables that were found in the last successful run but missing in the current run with stateful_ingestion enabled.",
+    )
+
+
 class StatefulIngestionConfigBase(DatasetSourceConfigBase):
     """
     Base configuration class for stateful ingestion for source configs to inherit from.
@@ -95,7 +123,19 @@ class StatefulIngestionConfigBase(DatasetSourceConfigBase):
 
 @dataclass
 class StatefulIngestionReport(SourceReport):
-    pass
+    soft_deleted_stale_entities: List[str] = field(default_factory=list)
+    # per type of stale entity, how many were found and the time spent finding them
+    stale_entity_counts: Dict[str, int] = field(default_factory=dict)
+    stale_entity_diff_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def report_stale_entity_soft_deleted(self, urn: str) -> None:
+        self.soft_deleted_stale_entities.append(urn)
+
+    def report_stale_entities(self, type: str, count: int, seconds: float) -> None:
+        self.stale_entity_counts[type] = self.stale_entity_counts.get(type, 0) + count
+        self.stale_entity_diff_seconds[type] = (
+            self.stale_entity_diff_seconds.get(type, 0.0) + seconds
+        )
 
 
 class StatefulIngestionSourceBase(Source):
@@ -108,6 +148,7 @@ class StatefulIngestionSourceBase(Source):
     ) -> None:
         super().__init__(ctx)
         self.stateful_ingestion_config = config.stateful_ingestion
+        self.stateful_source_config = config
         self.source_config_type = type(config)
         self.last_checkpoints: Dict[JobId, Optional[Checkpoint]] = {}
         self.cur_checkpoints: Dict[JobId, Optional[Checkpoint]] = {}
@@ -185,19 +226,66 @@ class StatefulIngestionSourceBase(Source):
         return False
 
     # Basic methods that sub-classes must implement
-    def create_checkpoint(self, job_id: JobId) -> Optional[Checkpoint]:
+    def get_platform_instance_id(self) -> str:
         raise NotImplementedError("Sub-classes must implement this method.")
 
-    def get_platform_instance_id(self) -> str:
+    def get_default_ingestion_job_id(self) -> JobId:
         raise NotImplementedError("Sub-classes must implement this method.")
 
+    # Methods that sub-classes keeping their state in the default job of a single
+    # checkpoint state class don't need to override, beyond the ones above.
+    def get_default_checkpoint_state_class(
+        self,
+    ) -> Type[StaleEntityCheckpointStateBase]:
+        raise NotImplementedError("Sub-classes must implement this method.")
+
+    def is_stale_metadata_removal_enabled(self) -> bool:
+        return (
+            isinstance(
+                self.stateful_ingestion_config, StatefulStaleMetadataRemovalConfig
+            )
+            and self.stateful_ingestion_config.remove_stale_metadata
+        )
+
+    def is_skipping_unchanged_entities(self) -> bool:
+        """
+        Sub-classes that skip the entities that didn't change since the last run, which
+        they tell from the last checkpoint, should override this method to tell if
+        they do so in this run.
+        """
+        return False
+
+    def create_checkpoint(self, job_id: JobId) -> Optional[Checkpoint]:
+        """
+        Create the custom checkpoint with empty state for the job.
+        """
+        assert self.ctx.pipeline_name is not None
+        if job_id == self.get_default_ingestion_job_id():
+            return Checkpoint(
+                job_name=job_id,
+                pipeline_name=self.ctx.pipeline_name,
+                platform_instance_id=self.get_platform_instance_id(),
+                run_id=self.ctx.run_id,
+                config=self.stateful_source_config,
+                state=self.get_default_checkpoint_state_class()(),
+            )
+        return None
+
     def is_checkpointing_enabled(self, job_id: JobId) -> bool:
         """
         Sub-classes should override this method to tell if checkpointing is enabled for this run.
         For instance, currently all of the SQL based sources use checkpointing for stale entity removal.
         They would turn it on only if remove_stale_metadata=True. Otherwise, the feature won't work correctly.
+        By default, only the default job is checkpointed, when either feature that needs it is on.
         """
-        raise NotImplementedError("Sub-classes must implement this method.")
+        return (
+            job_id == self.get_default_ingestion_job_id()
+            and self.is_stateful_ingestion_configured()
+            and (
+                self.is_stale_metadata_removal_enabled()
+                or self.is_skipping_unchanged_entities()
+            )
+        )
 
     def _get_last_checkpoint(
         self, job_id: JobId, checkpoint_state_class: Type[CheckpointStateBase]
@@ -250,6 +338,77 @@ class StatefulIngestionSourceBase(Source):
             )
         return self.cur_checkpoints[job_id]
 
+    def get_last_default_checkpoint_state(
+        self,
+    ) -> Optional[StaleEntityCheckpointStateBase]:
+        last_checkpoint = self.get_last_checkpoint(
+            self.get_default_ingestion_job_id(),
+            self.get_default_checkpoint_state_class(),
+        )
+        if last_checkpoint is None:
+            return None
+        return cast(StaleEntityCheckpointStateBase, last_checkpoint.state)
+
+    def get_current_default_checkpoint_state(
+        self,
+    ) -> Optional[StaleEntityCheckpointStateBase]:
+        cur_checkpoint = self.get_current_checkpoint(
+            self.get_default_ingestion_job_id()
+        )
+        if cur_checkpoint is None:
+            return None
+        return cast(StaleEntityCheckpointStateBase, cur_checkpoint.state)
+
+    def gen_removed_entity_workunits(self) -> Iterable[MetadataWorkUnit]:
+        """
+        Soft-deletes the tables in the last checkpoint of the default job that are
+        missing from the current one.
+        """
+        if not self.is_stale_metadata_removal_enabled():
+            return
+        last_checkpoint_state = self.get_last_default_checkpoint_state()
+        cur_checkpoint_state = self.get_current_default_checkpoint_state()
+        if last_checkpoint_state is None or cur_checkpoint_state is None:
+            return
+
+        logger.debug("Checking for stale entity removal.")
+        yield from self.gen_stale_entity_workunits(
+            "dataset", last_checkpoint_state.get_table_urns_not_in(cur_checkpoint_state)
+        )
+
+    def gen_stale_entity_workunits(
+        self, type: str, stale_urns: Iterable[str], entity_type: str = "dataset"
+    ) -> Iterable[MetadataWorkUnit]:
+        """
+        Soft-deletes stale entities of a type as the diff between checkpoint states
+        finds them. The number of stale entities and the time spent finding them are
+        reported per type, once the diff is exhausted.
+        """
+        stale_urn_iter = iter(stale_urns)
+        count = 0
+        seconds = 0.0
+        while True:
+            with PerfTimer() as timer:
+                urn = next(stale_urn_iter, None)
+            seconds += timer.elapsed_seconds()
+            if urn is None:
+                break
+            count += 1
+
+            logger.info(f"Soft-deleting stale entity of type {type} - {urn}.")
+            mcp = MetadataChangeProposalWrapper(
+                entityType=entity_type,
+                entityUrn=urn,
+                changeType=ChangeTypeClass.UPSERT,
+                aspectName="status",
+                aspect=StatusClass(removed=True),
+            )
+            wu = MetadataWorkUnit(id=f"soft-delete-{type}-{urn}", mcp=mcp)
+            self.report.report_workunit(wu)
+            self.report.report_stale_entity_soft_deleted(urn)
+            yield wu
+        self.report.report_stale_entities(type, count, seconds)
+
     def _prepare_checkpoint_states_for_commit(self) -> None:
         # Perform validations
         if not self.is_stateful_ingestion_configured():
@@ -275,6 +434,12 @@ class StatefulIngestionSourceBase(Source):
             if job_checkpoint is None:
                 continue
             try:
+                state_compression = self.stateful_ingestion_config.state_compression  # type: ignore
+                job_checkpoint.state.serde = (
+                    get_checkpoint_state_serde(state_compression)
+                    if state_compression is not None
+                    else UTF8_SERDE
+                )
                 checkpoint_aspect = job_checkpoint.to_checkpoint_aspect(
                     self.stateful_ingestion_config.max_checkpoint_state_size  # type: ignore
                 )
@@ -322,6 +487,18 @@ class StatefulIngestionSourceBase(Source):
         # and also populate other source specific metrics.
         return job_run_summary_default
 
+    def update_default_job_run_summary(self) -> None:
+        summary = self.get_job_run_summary(self.get_default_ingestion_job_id())
+        if summary is not None:
+            # For now just add the config and the report.
+            summary.config = self.stateful_source_config.json()
+            summary.custom_summary = self.report.as_string()
+            summary.runStatus = (
+                JobStatusClass.FAILED
+                if self.get_report().failures
+                else JobStatusClass.COMPLETED
+            )
+
     def get_job_run_summary(
         self, job_id: JobId
     ) -> Optional[DatahubIngestionRunSummaryClass]:
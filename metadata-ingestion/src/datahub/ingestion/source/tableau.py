@@ -1,5 +1,6 @@
 import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
@@ -13,6 +14,7 @@ from tableauserverclient import (
     ServerResponseError,
     TableauAuth,
 )
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import ConfigModel, ConfigurationError
@@ -36,6 +38,8 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.tableau_common import (
     FIELD_TYPE_MAPPING,
     MetadataQueryException,
+    MetadataQueryFetcher,
+    MetadataQueryThrottledException,
     clean_query,
     custom_sql_graphql_query,
     get_field_value_in_sheet,
@@ -45,6 +49,7 @@ from datahub.ingestion.source.tableau_common import (
     make_table_urn,
     published_datasource_graphql_query,
     query_metadata,
+    raise_for_throttled_response,
     workbook_graphql_query,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.common import (
@@ -142,6 +147,16 @@ class TableauConfig(ConfigModel):
         description="Number of metadata objects (e.g. CustomSQLTable, PublishedDatasource, etc) to query at a time using Tableau api.",
     )
 
+    max_concurrent_requests: int = Field(
+        default=1,
+        description="Maximum number of Tableau Metadata API requests in flight at once. Pages are still processed in order.",
+    )
+
+    max_retries: int = Field(
+        default=3,
+        description="Number of times a Tableau Metadata API request that is throttled (429) or fails with a server error (5xx) is retried, with exponential backoff.",
+    )
+
     env: str = Field(
         default=builder.DEFAULT_ENV,
         description="Environment to use in namespace when constructing URNs.",
@@ -151,6 +166,18 @@ class TableauConfig(ConfigModel):
     def remove_trailing_slash(cls, v):
         return config_clean.remove_trailing_slashes(v)
 
+    @validator("max_concurrent_requests")
+    def max_concurrent_requests_positive(cls, v):
+        if v < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        return v
+
+    @validator("max_retries")
+    def max_retries_not_negative(cls, v):
+        if v < 0:
+            raise ValueError("max_retries must not be negative")
+        return v
+
     @root_validator()
     def show_warning_for_deprecated_config_field(
         cls, values: Dict[str, Any]
@@ -167,6 +194,11 @@ class WorkbookKey(PlatformKey):
     workbook_id: str
 
 
+@dataclass
+class TableauSourceReport(SourceReport):
+    metadata_query_retries: int = 0
+
+
 @platform_name("Tableau")
 @config_class(TableauConfig)
 @support_status(SupportStatus.INCUBATING)
@@ -192,7 +224,7 @@ class WorkbookKey(PlatformKey):
 @capability(SourceCapability.LINEAGE_COARSE, "Enabled by default")
 class TableauSource(Source):
     config: TableauConfig
-    report: SourceReport
+    report: TableauSourceReport
     platform = "tableau"
     server: Optional[Server]
     upstream_tables: Dict[str, Tuple[Any, Optional[str], bool]] = {}
@@ -208,7 +240,7 @@ class TableauSource(Source):
         super().__init__(ctx)
 
         self.config = config
-        self.report = SourceReport()
+        self.report = TableauSourceReport()
         self.server = None
         # This list keeps track of datasource being actively used by workbooks so that we only retrieve those
         # when emitting published data sources.
@@ -216,10 +248,22 @@ class TableauSource(Source):
         # This list keeps track of datasource being actively used by workbooks so that we only retrieve those
         # when emitting custom SQL data sources.
         self.custom_sql_ids_being_used: List[str] = []
+        # Upstream tables are emitted after every page of workbooks, but only once each,
+        # unless a later workbook changes their columns or browse path.
+        self.emitted_upstream_tables: Dict[str, Tuple[Any, Optional[str], bool]] = {}
 
         self._authenticate()
+        self.fetcher = MetadataQueryFetcher(
+            self.get_connection_object,
+            max_concurrent_requests=self.config.max_concurrent_requests,
+            max_retries=self.config.max_retries,
+            # Throttled requests fail with 429, overloaded servers with 5xx. Other
+            # errors, like bad queries or expired credentials, aren't retried.
+            retry_on=(MetadataQueryThrottledException, InternalServerError),
+        )
 
     def close(self) -> None:
+        self.fetcher.close()
         if self.server is not None:
             self.server.auth.sign_out()
 
@@ -244,6 +288,7 @@ class TableauSource(Source):
         try:
             self.server = Server(self.config.connect_uri, use_server_version=True)
             self.server.auth.sign_in(authentication)
+            self.server.session.hooks["response"].append(raise_for_throttled_response)
         except ServerResponseError as e:
             logger.error(e)
             self.report.report_failure(
@@ -263,7 +308,7 @@ class TableauSource(Source):
         query_filter: str,
         count: int = 0,
         current_count: int = 0,
-    ) -> Tuple[dict, int, int]:
+    ) -> Tuple[dict, int, bool]:
         logger.debug(
             f"Query {connection_type} to get {count} objects with offset {current_count}"
         )
@@ -300,32 +345,10 @@ class TableauSource(Source):
             else ""
         )
 
-        workbook_connection, total_count, has_next_page = self.get_connection_object(
-            workbook_graphql_query, "workbooksConnection", projects
-        )
-
-        current_count = 0
-        while has_next_page:
-            count = (
-                count_on_query
-                if current_count + count_on_query < total_count
-                else total_count - current_count
-            )
-            (
-                workbook_connection,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object(
-                workbook_graphql_query,
-                "workbooksConnection",
-                projects,
-                count,
-                current_count,
-            )
-
-            current_count += count
-
-            for workbook in workbook_connection.get("nodes", []):
+        for workbooks in self.fetcher.fetch_pages(
+            workbook_graphql_query, "workbooksConnection", projects, count_on_query
+        ):
+            for workbook in workbooks:
                 yield from self.emit_workbook_as_container(workbook)
                 yield from self.emit_sheets_as_charts(workbook)
                 yield from self.emit_dashboards(workbook)
@@ -447,116 +470,92 @@ class TableauSource(Source):
         return upstream_tables
 
     def emit_custom_sql_datasources(self) -> Iterable[MetadataWorkUnit]:
-        count_on_query = len(self.custom_sql_ids_being_used)
-        custom_sql_filter = f"idWithin: {json.dumps(self.custom_sql_ids_being_used)}"
-        custom_sql_connection, total_count, has_next_page = self.get_connection_object(
-            custom_sql_graphql_query, "customSQLTablesConnection", custom_sql_filter
-        )
-
-        current_count = 0
-        while has_next_page:
-            count = (
-                count_on_query
-                if current_count + count_on_query < total_count
-                else total_count - current_count
-            )
-            (
-                custom_sql_connection,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object(
+        unique_custom_sql = get_unique_custom_sql(
+            self.fetcher.fetch_nodes_by_id(
                 custom_sql_graphql_query,
                 "customSQLTablesConnection",
-                custom_sql_filter,
-                count,
-                current_count,
+                self.custom_sql_ids_being_used,
+                self.config.page_size,
             )
-            current_count += count
-
-            unique_custom_sql = get_unique_custom_sql(
-                custom_sql_connection.get("nodes", [])
+        )
+        for csql in unique_custom_sql:
+            csql_id: str = csql["id"]
+            csql_urn = builder.make_dataset_urn(self.platform, csql_id, self.config.env)
+            dataset_snapshot = DatasetSnapshot(
+                urn=csql_urn,
+                aspects=[],
             )
-            for csql in unique_custom_sql:
-                csql_id: str = csql["id"]
-                csql_urn = builder.make_dataset_urn(
-                    self.platform, csql_id, self.config.env
+
+            datasource_name = None
+            project = None
+            if len(csql["datasources"]) > 0:
+                yield from self._create_lineage_from_csql_datasource(
+                    csql_urn, csql["datasources"]
                 )
-                dataset_snapshot = DatasetSnapshot(
-                    urn=csql_urn,
-                    aspects=[],
+
+                # CustomSQLTable id owned by exactly one tableau data source
+                logger.debug(
+                    f"Number of datasources referencing CustomSQLTable: {len(csql['datasources'])}"
                 )
 
-                datasource_name = None
-                project = None
-                if len(csql["datasources"]) > 0:
-                    yield from self._create_lineage_from_csql_datasource(
-                        csql_urn, csql["datasources"]
+                datasource = csql["datasources"][0]
+                datasource_name = datasource.get("name")
+                if datasource.get(
+                    "__typename"
+                ) == "EmbeddedDatasource" and datasource.get("workbook"):
+                    datasource_name = (
+                        f"{datasource.get('workbook').get('name')}/{datasource_name}"
+                        if datasource_name and datasource.get("workbook").get("name")
+                        else None
                     )
-
-                    # CustomSQLTable id owned by exactly one tableau data source
-                    logger.debug(
-                        f"Number of datasources referencing CustomSQLTable: {len(csql['datasources'])}"
+                    yield from add_entity_to_container(
+                        self.gen_workbook_key(datasource["workbook"]),
+                        "dataset",
+                        dataset_snapshot.urn,
                     )
+                project = self._get_project(datasource)
 
-                    datasource = csql["datasources"][0]
-                    datasource_name = datasource.get("name")
-                    if datasource.get(
-                        "__typename"
-                    ) == "EmbeddedDatasource" and datasource.get("workbook"):
-                        datasource_name = (
-                            f"{datasource.get('workbook').get('name')}/{datasource_name}"
-                            if datasource_name
-                            and datasource.get("workbook").get("name")
-                            else None
-                        )
-                        yield from add_entity_to_container(
-                            self.gen_workbook_key(datasource["workbook"]),
-                            "dataset",
-                            dataset_snapshot.urn,
-                        )
-                    project = self._get_project(datasource)
-
-                # lineage from custom sql -> datasets/tables #
-                columns = csql.get("columns", [])
-                yield from self._create_lineage_to_upstream_tables(csql_urn, columns)
+            # lineage from custom sql -> datasets/tables #
+            columns = csql.get("columns", [])
+            yield from self._create_lineage_to_upstream_tables(csql_urn, columns)
 
-                #  Schema Metadata
-                schema_metadata = self.get_schema_metadata_for_custom_sql(columns)
-                if schema_metadata is not None:
-                    dataset_snapshot.aspects.append(schema_metadata)
-
-                # Browse path
-                csql_name = csql.get("name") or csql_id
+            #  Schema Metadata
+            schema_metadata = self.get_schema_metadata_for_custom_sql(columns)
+            if schema_metadata is not None:
+                dataset_snapshot.aspects.append(schema_metadata)
 
-                if project and datasource_name:
-                    browse_paths = BrowsePathsClass(
-                        paths=[
-                            f"/{self.config.env.lower()}/{self.platform}/{project}/{datasource['name']}/{csql_name}"
-                        ]
-                    )
-                    dataset_snapshot.aspects.append(browse_paths)
-                else:
-                    logger.debug(f"Browse path not set for Custom SQL table {csql_id}")
+            # Browse path
+            csql_name = csql.get("name") or csql_id
 
-                dataset_properties = DatasetPropertiesClass(
-                    name=csql.get("name"), description=csql.get("description")
+            if project and datasource_name:
+                browse_paths = BrowsePathsClass(
+                    paths=[
+                        f"/{self.config.env.lower()}/{self.platform}/{project}/{datasource['name']}/{csql_name}"
+                    ]
                 )
+                dataset_snapshot.aspects.append(browse_paths)
+            else:
+                logger.debug(f"Browse path not set for Custom SQL table {csql_id}")
 
-                dataset_snapshot.aspects.append(dataset_properties)
+            dataset_properties = DatasetPropertiesClass(
+                name=csql.get("name"), description=csql.get("description")
+            )
 
-                view_properties = ViewPropertiesClass(
-                    materialized=False,
-                    viewLanguage="SQL",
-                    viewLogic=clean_query(csql.get("query", "")),
-                )
-                dataset_snapshot.aspects.append(view_properties)
+            dataset_snapshot.aspects.append(dataset_properties)
 
-                yield self.get_metadata_change_event(dataset_snapshot)
-                yield self.get_metadata_change_proposal(
-                    dataset_snapshot.urn,
-                    aspect_name="subTypes",
-                    aspect=SubTypesClass(typeNames=["View", "Custom SQL"]),
-                )
+            view_properties = ViewPropertiesClass(
+                materialized=False,
+                viewLanguage="SQL",
+                viewLogic=clean_query(csql.get("query", "")),
+            )
+            dataset_snapshot.aspects.append(view_properties)
+
+            yield self.get_metadata_change_event(dataset_snapshot)
+            yield self.get_metadata_change_proposal(
+                dataset_snapshot.urn,
+                aspect_name="subTypes",
+                aspect=SubTypesClass(typeNames=["View", "Custom SQL"]),
+            )
 
     def get_schema_metadata_for_custom_sql(
         self, columns: List[dict]
@@ -823,43 +822,19 @@ class TableauSource(Source):
             )
 
     def emit_published_datasources(self) -> Iterable[MetadataWorkUnit]:
-        count_on_query = len(self.datasource_ids_being_used)
-        datasource_filter = f"idWithin: {json.dumps(self.datasource_ids_being_used)}"
-        (
-            published_datasource_conn,
-            total_count,
-            has_next_page,
-        ) = self.get_connection_object(
+        for datasource in self.fetcher.fetch_nodes_by_id(
             published_datasource_graphql_query,
             "publishedDatasourcesConnection",
-            datasource_filter,
-        )
-
-        current_count = 0
-        while has_next_page:
-            count = (
-                count_on_query
-                if current_count + count_on_query < total_count
-                else total_count - current_count
-            )
-            (
-                published_datasource_conn,
-                total_count,
-                has_next_page,
-            ) = self.get_connection_object(
-                published_datasource_graphql_query,
-                "publishedDatasourcesConnection",
-                datasource_filter,
-                count,
-                current_count,
-            )
-
-            current_count += count
-            for datasource in published_datasource_conn.get("nodes", []):
-                yield from self.emit_datasource(datasource)
+            self.datasource_ids_being_used,
+            self.config.page_size,
+        ):
+            yield from self.emit_datasource(datasource)
 
     def emit_upstream_tables(self) -> Iterable[MetadataWorkUnit]:
-        for (table_urn, (columns, path, is_embedded)) in self.upstream_tables.items():
+        for table_urn, upstream_table in self.upstream_tables.items():
+            if self.emitted_upstream_tables.get(table_urn) == upstream_table:
+                continue
+            columns, path, is_embedded = upstream_table
             if not is_embedded and not self.config.ingest_tables_external:
                 logger.debug(
                     f"Skipping external table {table_urn} as ingest_tables_external is set to False"
@@ -910,6 +885,7 @@ class TableauSource(Source):
             if schema_metadata is not None:
                 dataset_snapshot.aspects.append(schema_metadata)
 
+            self.emitted_upstream_tables[table_urn] = upstream_table
             yield self.get_metadata_change_event(dataset_snapshot)
 
     def get_sheetwise_upstream_datasources(self, sheet: dict) -> set:
@@ -1203,6 +1179,8 @@ class TableauSource(Source):
                 key="tableau-metadata",
                 reason=f"Unable to retrieve metadata from tableau. Information: {str(md_exception)}",
             )
+        finally:
+            self.report.metadata_query_retries = self.fetcher.retries
 
-    def get_report(self) -> SourceReport:
+    def get_report(self) -> TableauSourceReport:
         return self.report
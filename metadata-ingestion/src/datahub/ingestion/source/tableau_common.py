@@ -1,6 +1,14 @@
+import concurrent.futures
 import html
+import json
+import logging
+import random
+import threading
+import time
 from functools import lru_cache
-from typing import List
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
+
+import requests
 
 import datahub.emitter.mce_builder as builder
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
@@ -17,12 +25,31 @@ from datahub.metadata.schema_classes import (
     GlobalTagsClass,
     TagAssociationClass,
 )
+from datahub.utilities.ordered_thread_map import ordered_executor_map
+
+logger = logging.getLogger(__name__)
 
 
 class MetadataQueryException(Exception):
     pass
 
 
+class MetadataQueryThrottledException(Exception):
+    """Raised for responses of the Tableau server with status 429 Too Many Requests."""
+
+
+def raise_for_throttled_response(
+    response: requests.Response, *args: Any, **kwargs: Any
+) -> None:
+    # A requests response hook. The Tableau server client raises the same
+    # NonXMLResponseError for every error response without an XML body, so throttled
+    # responses have to be told apart by their status code before they get to it.
+    if response.status_code == 429:
+        raise MetadataQueryThrottledException(
+            f"{response.status_code} {response.reason}: {response.text}"
+        )
+
+
 workbook_graphql_query = """
     {
       id
@@ -455,7 +482,7 @@ def get_field_value_in_sheet(field, field_name):
     return field.get(field_name, "")
 
 
-def get_unique_custom_sql(custom_sql_list: List[dict]) -> List[dict]:
+def get_unique_custom_sql(custom_sql_list: Iterable[dict]) -> List[dict]:
     unique_custom_sql = []
     for custom_sql in custom_sql_list:
         unique_csql = {
@@ -505,3 +532,123 @@ def query_metadata(server, main_query, connection_name, first, offset, qry_filte
         main_query=main_query,
     )
     return server.metadata.query(query)
+
+
+class MetadataQueryFetcher:
+    """
+    Pages through connections of the Tableau Metadata API with concurrent requests.
+
+    Pages are requested on a pool of max_concurrent_requests threads, shared by all the
+    connections being paged, and yielded in order. Requests failing with one of the
+    retry_on exceptions, as throttled ones do, are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        get_connection_object: Callable[
+            [str, str, str, int, int], Tuple[dict, int, bool]
+        ],
+        max_concurrent_requests: int = 1,
+        max_retries: int = 0,
+        retry_on: Tuple[Type[Exception], ...] = (),
+        retry_backoff_seconds: float = 1.0,
+    ) -> None:
+        self.get_connection_object = get_connection_object
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_retries = max_retries
+        self.retry_on = retry_on
+        self.retry_backoff_seconds = retry_backoff_seconds
+        # incremented by the threads of the pool
+        self.retries = 0
+        self._retries_lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = (
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_requests)
+            if max_concurrent_requests > 1
+            else None
+        )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _query(
+        self,
+        query: str,
+        connection_type: str,
+        query_filter: str,
+        count: int,
+        offset: int,
+    ) -> Tuple[dict, int, bool]:
+        attempt = 0
+        while True:
+            try:
+                return self.get_connection_object(
+                    query, connection_type, query_filter, count, offset
+                )
+            except self.retry_on as e:
+                if attempt >= self.max_retries:
+                    raise
+                # Jittered, so that throttled concurrent requests don't retry at once.
+                delay = self.retry_backoff_seconds * 2**attempt * random.uniform(1, 2)
+                logger.warning(
+                    f"Query {connection_type} with offset {offset} failed, retrying in {delay:.1f} seconds: {e}"
+                )
+                with self._retries_lock:
+                    self.retries += 1
+                attempt += 1
+                time.sleep(delay)
+
+    def _map_queries(
+        self,
+        query: str,
+        connection_type: str,
+        pages: Iterable[Tuple[str, int, int]],
+    ) -> Iterable[List[dict]]:
+        for connection_object, _, _ in ordered_executor_map(
+            self._executor,
+            lambda page: self._query(query, connection_type, *page),
+            pages,
+            2 * self.max_concurrent_requests,
+        ):
+            yield connection_object.get("nodes", [])
+
+    def fetch_pages(
+        self, query: str, connection_type: str, query_filter: str, page_size: int
+    ) -> Iterable[List[dict]]:
+        """Yields the nodes of every page of the connection, in order."""
+        _, total_count, has_next_page = self._query(
+            query, connection_type, query_filter, 0, 0
+        )
+        if not has_next_page:
+            return
+        # The total count is known upfront, so all the pages can be requested at once.
+        yield from self._map_queries(
+            query,
+            connection_type,
+            (
+                (query_filter, min(page_size, total_count - offset), offset)
+                for offset in range(0, total_count, page_size)
+            ),
+        )
+
+    def fetch_nodes_by_id(
+        self, query: str, connection_type: str, ids: List[str], page_size: int
+    ) -> Iterable[dict]:
+        """
+        Yields the nodes of the connection with the given IDs, requested in pages of up
+        to page_size IDs.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        for nodes in self._map_queries(
+            query,
+            connection_type,
+            (
+                (
+                    f"idWithin: {json.dumps(unique_ids[i : i + page_size])}",
+                    len(unique_ids[i : i + page_size]),
+                    0,
+                )
+                for i in range(0, len(unique_ids), page_size)
+            ),
+        ):
+            yield from nodes
@@ -1,4 +1,3 @@
-import collections
 import dataclasses
 import logging
 import time
@@ -28,8 +27,8 @@ from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.redshift import RedshiftConfig
 from datahub.ingestion.source.usage.usage_common import (
-    BaseUsageConfig,
-    GenericAggregatedDataset,
+    UsageAggregationConfig,
+    UsageAggregator,
 )
 from datahub.metadata.schema_classes import (
     ChangeTypeClass,
@@ -69,7 +68,7 @@ WHERE ss.starttime >= '{start_time}'
 AND ss.starttime < '{end_time}'
 AND sti.database = '{database}'
 AND sq.aborted = 0
-ORDER BY ss.endtime DESC;
+ORDER BY sq.starttime DESC;
 """.strip()
 
 REDSHIFT_OPERATION_ASPECT_QUERY_TEMPLATE: str = """
@@ -125,8 +124,6 @@ ORDER BY
 """.strip()
 
 RedshiftTableRef = str
-AggregatedDataset = GenericAggregatedDataset[RedshiftTableRef]
-AggregatedAccessEvents = Dict[datetime, Dict[RedshiftTableRef, AggregatedDataset]]
 
 
 class RedshiftAccessEvent(BaseModel):
@@ -143,7 +140,9 @@ class RedshiftAccessEvent(BaseModel):
     endtime: datetime
 
 
-class RedshiftUsageConfig(RedshiftConfig, BaseUsageConfig, EnvBasedSourceConfigBase):
+class RedshiftUsageConfig(
+    RedshiftConfig, UsageAggregationConfig, EnvBasedSourceConfigBase
+):
     email_domain: str = Field(
         description="Email domain of your organisation so users can be displayed on UI appropriately."
     )
@@ -162,6 +161,7 @@ class RedshiftUsageSourceReport(SourceReport):
     filtered: Set[str] = dataclasses.field(default_factory=set)
     num_usage_workunits_emitted: Optional[int] = None
     num_operational_stats_workunits_emitted: Optional[int] = None
+    num_late_usage_events_dropped: int = 0
 
     def report_dropped(self, key: str) -> None:
         self.filtered.add(key)
@@ -233,17 +233,12 @@ class RedshiftUsageSource(Source):
             RedshiftAccessEvent
         ] = self._gen_access_events_from_history_query(query, engine)
 
-        aggregated_events: AggregatedAccessEvents = self._aggregate_access_events(
-            access_events_iterable
-        )
         # Generate usage workunits from aggregated events.
         self.report.num_usage_workunits_emitted = 0
-        for time_bucket in aggregated_events.values():
-            for aggregate in time_bucket.values():
-                wu: MetadataWorkUnit = self._make_usage_stat(aggregate)
-                self.report.report_workunit(wu)
-                self.report.num_usage_workunits_emitted += 1
-                yield wu
+        for wu in self._aggregate_access_events(access_events_iterable):
+            self.report.report_workunit(wu)
+            self.report.num_usage_workunits_emitted += 1
+            yield wu
 
     def _gen_operation_aspect_workunits(
         self, engine: Engine
@@ -359,46 +354,42 @@ class RedshiftUsageSource(Source):
 
     def _aggregate_access_events(
         self, events_iterable: Iterable[RedshiftAccessEvent]
-    ) -> AggregatedAccessEvents:
-        datasets: AggregatedAccessEvents = collections.defaultdict(dict)
-        for event in events_iterable:
-            floored_ts: datetime = get_time_bucket(
-                event.starttime, self.config.bucket_duration
-            )
-            resource: str = f"{event.database}.{event.schema_}.{event.table}"
-            # Get a reference to the bucket value(or initialize not yet in dict) and update it.
-            agg_bucket: AggregatedDataset = datasets[floored_ts].setdefault(
-                resource,
-                AggregatedDataset(
-                    bucket_start_time=floored_ts,
-                    resource=resource,
-                    user_email_pattern=self.config.user_email_pattern,
-                ),
-            )
-            # current limitation in user stats UI, we need to provide email to show users
-            user_email: str = f"{event.username if event.username else 'unknown'}"
-            if "@" not in user_email:
-                user_email += f"@{self.config.email_domain}"
-            logger.info(f"user_email: {user_email}")
-            agg_bucket.add_read_entry(
-                user_email,
-                event.text,
-                [],  # TODO: not currently supported by redshift; find column level changes
-            )
-        return datasets
-
-    def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
-        return agg.make_usage_workunit(
-            self.config.bucket_duration,
-            lambda resource: builder.make_dataset_urn_with_platform_instance(
-                "redshift",
-                resource.lower(),
-                self.config.platform_instance,
-                self.config.env,
-            ),
-            self.config.top_n_queries,
-            self.config.format_sql_queries,
-            self.config.include_top_n_queries,
+    ) -> Iterable[MetadataWorkUnit]:
+        aggregator: UsageAggregator[RedshiftTableRef] = UsageAggregator(
+            self.config, self._make_dataset_urn
+        )
+        try:
+            for event in events_iterable:
+                floored_ts: datetime = get_time_bucket(
+                    event.starttime, self.config.bucket_duration
+                )
+                # Events are ordered by start time, so every other bucket is complete.
+                yield from aggregator.generate_closed_workunits(floored_ts)
+                resource: str = f"{event.database}.{event.schema_}.{event.table}"
+                # current limitation in user stats UI, we need to provide email to show users
+                user_email: str = f"{event.username if event.username else 'unknown'}"
+                if "@" not in user_email:
+                    user_email += f"@{self.config.email_domain}"
+                logger.info(f"user_email: {user_email}")
+                aggregator.add_read_entry(
+                    floored_ts,
+                    resource,
+                    user_email,
+                    event.text,
+                    [],  # TODO: not currently supported by redshift; find column level changes
+                )
+            yield from aggregator.generate_workunits()
+        finally:
+            self.report.num_late_usage_events_dropped = aggregator.num_late_events
+            aggregator.report_late_events(self.report)
+            aggregator.close()
+
+    def _make_dataset_urn(self, resource: RedshiftTableRef) -> str:
+        return builder.make_dataset_urn_with_platform_instance(
+            "redshift",
+            resource.lower(),
+            self.config.platform_instance,
+            self.config.env,
         )
 
     def get_report(self) -> RedshiftUsageSourceReport:
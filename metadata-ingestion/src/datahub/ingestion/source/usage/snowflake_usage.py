@@ -1,12 +1,10 @@
-import collections
 import json
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, cast
 
 import pydantic.dataclasses
-from more_itertools import partition
 from pydantic import BaseModel
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -28,7 +26,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionSourceBase,
 )
 from datahub.ingestion.source.state.usage_common_state import BaseUsageCheckpointState
-from datahub.ingestion.source.usage.usage_common import GenericAggregatedDataset
+from datahub.ingestion.source.usage.usage_common import UsageAggregator
 from datahub.ingestion.source_config.usage.snowflake_usage import SnowflakeUsageConfig
 from datahub.ingestion.source_report.usage.snowflake_usage import SnowflakeUsageReport
 from datahub.metadata.schema_classes import (
@@ -43,8 +41,6 @@ from datahub.utilities.perf_timer import PerfTimer
 logger = logging.getLogger(__name__)
 
 SnowflakeTableRef = str
-AggregatedDataset = GenericAggregatedDataset[SnowflakeTableRef]
-AggregatedAccessEvents = Dict[datetime, Dict[SnowflakeTableRef, AggregatedDataset]]
 
 SNOWFLAKE_USAGE_SQL_TEMPLATE = """
 SELECT
@@ -262,23 +258,9 @@ class SnowflakeUsageSource(StatefulIngestionSourceBase):
             self._init_checkpoints()
             # Generate the workunits.
             access_events = self._get_snowflake_history()
-            aggregated_info_items_raw, operation_aspect_work_units_raw = partition(
-                lambda x: isinstance(x, MetadataWorkUnit),
-                self._aggregate_access_events(access_events),
-            )
-            for wu in cast(Iterable[MetadataWorkUnit], operation_aspect_work_units_raw):
+            for wu in self._aggregate_access_events(access_events):
                 self.report.report_workunit(wu)
                 yield wu
-            aggregated_info_items = list(aggregated_info_items_raw)
-            assert len(aggregated_info_items) == 1
-
-            for time_bucket in cast(
-                AggregatedAccessEvents, aggregated_info_items[0]
-            ).values():
-                for aggregate in time_bucket.values():
-                    wu = self._make_usage_stat(aggregate)
-                    self.report.report_workunit(wu)
-                    yield wu
 
     def _make_usage_query(self) -> str:
         start_time = int(self.config.start_time.timestamp() * 1000)
@@ -493,56 +475,52 @@ class SnowflakeUsageSource(StatefulIngestionSourceBase):
 
     def _aggregate_access_events(
         self, events: Iterable[SnowflakeJoinedAccessEvent]
-    ) -> Iterable[Union[AggregatedAccessEvents, MetadataWorkUnit]]:
+    ) -> Iterable[MetadataWorkUnit]:
         """
-        Emits aggregated access events combined with operational workunits from the events.
+        Emits aggregated usage workunits, each time bucket as soon as its events are
+        over, combined with operational workunits from the events.
         """
-        datasets: AggregatedAccessEvents = collections.defaultdict(dict)
-
-        for event in events:
-            floored_ts = get_time_bucket(
-                event.query_start_time, self.config.bucket_duration
-            )
-
-            accessed_data = (
-                event.base_objects_accessed
-                if self.config.apply_view_usage_to_tables
-                else event.direct_objects_accessed
-            )
-            for object in accessed_data:
-                resource = object.objectName
-                agg_bucket = datasets[floored_ts].setdefault(
-                    resource,
-                    AggregatedDataset(
-                        bucket_start_time=floored_ts,
-                        resource=resource,
-                        user_email_pattern=self.config.user_email_pattern,
-                    ),
+        aggregator: UsageAggregator[SnowflakeTableRef] = UsageAggregator(
+            self.config, self._make_dataset_urn
+        )
+        try:
+            for event in events:
+                floored_ts = get_time_bucket(
+                    event.query_start_time, self.config.bucket_duration
                 )
-                agg_bucket.add_read_entry(
-                    event.email,
-                    event.query_text,
-                    [colRef.columnName.lower() for colRef in object.columns]
-                    if object.columns is not None
-                    else [],
+                # Events are ordered by start time, so every other bucket is complete.
+                yield from aggregator.generate_closed_workunits(floored_ts)
+
+                accessed_data = (
+                    event.base_objects_accessed
+                    if self.config.apply_view_usage_to_tables
+                    else event.direct_objects_accessed
                 )
-            if self.config.include_operational_stats:
-                yield from self._get_operation_aspect_work_unit(event)
-
-        yield datasets
-
-    def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
-        return agg.make_usage_workunit(
-            self.config.bucket_duration,
-            lambda resource: builder.make_dataset_urn_with_platform_instance(
-                "snowflake",
-                resource.lower(),
-                self.config.platform_instance,
-                self.config.env,
-            ),
-            self.config.top_n_queries,
-            self.config.format_sql_queries,
-            self.config.include_top_n_queries,
+                for object in accessed_data:
+                    aggregator.add_read_entry(
+                        floored_ts,
+                        object.objectName,
+                        event.email,
+                        event.query_text,
+                        [colRef.columnName.lower() for colRef in object.columns]
+                        if object.columns is not None
+                        else [],
+                    )
+                if self.config.include_operational_stats:
+                    yield from self._get_operation_aspect_work_unit(event)
+
+            yield from aggregator.generate_workunits()
+        finally:
+            self.report.num_late_usage_events_dropped = aggregator.num_late_events
+            aggregator.report_late_events(self.report)
+            aggregator.close()
+
+    def _make_dataset_urn(self, resource: SnowflakeTableRef) -> str:
+        return builder.make_dataset_urn_with_platform_instance(
+            "snowflake",
+            resource.lower(),
+            self.config.platform_instance,
+            self.config.env,
         )
 
     def get_report(self):
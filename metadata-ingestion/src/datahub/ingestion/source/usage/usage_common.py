@@ -1,8 +1,26 @@
 import collections
 import dataclasses
+import enum
+import hashlib
 import logging
+import os
+import sqlite3
+import tempfile
 from datetime import datetime
-from typing import Callable, Counter, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import pydantic
 from pydantic.fields import Field
@@ -14,6 +32,7 @@ from datahub.configuration.time_window_config import (
     BucketDuration,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.source import SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.metadata.schema_classes import (
     ChangeTypeClass,
@@ -22,12 +41,99 @@ from datahub.metadata.schema_classes import (
     DatasetUserUsageCountsClass,
     TimeWindowSizeClass,
 )
+from datahub.utilities.heavy_hitters import SpaceSavingCounter
 from datahub.utilities.sql_formatter import format_sql_query
 
 logger = logging.getLogger(__name__)
 
 ResourceType = TypeVar("ResourceType")
 
+# How many counter updates the sqlite aggregation backend buffers before writing them out.
+_SQLITE_WRITE_BUFFER_SIZE = 10_000
+
+
+@enum.unique
+class UsageAggregationBackend(str, enum.Enum):
+    # Exact counts of every distinct query, user and column, kept in memory.
+    MEMORY = "memory"
+    # Exact counts of users and columns, but only the most frequent queries are tracked.
+    SKETCH = "sketch"
+    # Exact counts of everything, kept in a temporary SQLite database.
+    SQLITE = "sqlite"
+
+
+def _query_digest(query: str) -> int:
+    # Signed, so that it fits in an sqlite integer.
+    return int.from_bytes(
+        hashlib.blake2b(query.encode("utf-8"), digest_size=8).digest(),
+        "big",
+        signed=True,
+    )
+
+
+class QueryTextStore:
+    """
+    Keeps a single copy of each query text referenced by query sketches, keyed by its
+    digest, and drops it once no sketch references it anymore.
+    """
+
+    def __init__(self) -> None:
+        self._texts: Dict[int, str] = {}
+        self._refs: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def acquire(self, digest: int, query: str) -> None:
+        refs = self._refs.get(digest, 0)
+        if refs == 0:
+            self._texts[digest] = query
+        self._refs[digest] = refs + 1
+
+    def release(self, digest: int) -> None:
+        refs = self._refs[digest] - 1
+        if refs == 0:
+            del self._refs[digest]
+            del self._texts[digest]
+        else:
+            self._refs[digest] = refs
+
+    def get(self, digest: int) -> str:
+        return self._texts[digest]
+
+
+class QueryFrequencySketch:
+    """
+    Tracks the most frequent queries of a dataset in bounded memory. Queries are counted
+    by digest and their text lives in a QueryTextStore shared with other sketches.
+    """
+
+    def __init__(self, capacity: int, texts: QueryTextStore) -> None:
+        self.texts = texts
+        self.counter: SpaceSavingCounter[int] = SpaceSavingCounter(capacity)
+
+    def add(self, query: str) -> None:
+        digest = _query_digest(query)
+        if digest in self.counter:
+            self.counter.add(digest)
+            return
+        self.texts.acquire(digest, query)
+        evicted = self.counter.add(digest)
+        if evicted is not None:
+            self.texts.release(evicted)
+
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        return [
+            (self.texts.get(digest), count)
+            for digest, count in self.counter.most_common(n)
+        ]
+
+    def release(self) -> None:
+        """Gives up the sketch's references to query texts. The sketch can't be used afterwards."""
+        for digest, _ in self.counter.most_common():
+            self.texts.release(digest)
+        self.counter = SpaceSavingCounter(self.counter.capacity)
+
 
 @dataclasses.dataclass
 class GenericAggregatedDataset(Generic[ResourceType]):
@@ -41,6 +147,8 @@ class GenericAggregatedDataset(Generic[ResourceType]):
     queryFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
     userFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
     columnFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    # When set, queries are counted in this sketch instead of queryFreq.
+    query_sketch: Optional[QueryFrequencySketch] = None
 
     total_budget_for_query_list: int = 24000
     query_trimmer_string_space: int = 10
@@ -61,7 +169,10 @@ class GenericAggregatedDataset(Generic[ResourceType]):
 
         if query:
             self.queryCount += 1
-            self.queryFreq[query] += 1
+            if self.query_sketch is not None:
+                self.query_sketch.add(query)
+            else:
+                self.queryFreq[query] += 1
         for column in fields:
             self.columnFreq[column] += 1
 
@@ -77,6 +188,11 @@ class GenericAggregatedDataset(Generic[ResourceType]):
                 )
         return trimmed_query
 
+    def most_common_queries(self, n: int) -> List[Tuple[str, int]]:
+        if self.query_sketch is not None:
+            return self.query_sketch.most_common(n)
+        return self.queryFreq.most_common(n)
+
     def make_usage_workunit(
         self,
         bucket_duration: BucketDuration,
@@ -98,7 +214,7 @@ class GenericAggregatedDataset(Generic[ResourceType]):
                     else query,
                     budget_per_query,
                 )
-                for query, _ in self.queryFreq.most_common(top_n_queries)
+                for query, _ in self.most_common_queries(top_n_queries)
             ]
 
         usageStats = DatasetUsageStatisticsClass(
@@ -176,3 +292,330 @@ class BaseUsageConfig(BaseTimeWindowConfig):
                 f"top_n_queries is set to {v} but it can be maximum {max_queries}"
             )
         return v
+
+
+class UsageAggregationConfig(BaseUsageConfig):
+    """Usage config of the sources that aggregate their usage with UsageAggregator."""
+
+    aggregation_backend: UsageAggregationBackend = Field(
+        default=UsageAggregationBackend.MEMORY,
+        description="Where usage is aggregated before being emitted. `memory` keeps exact counts of every distinct query in memory. "
+        "`sketch` only keeps the `query_sketch_size` most frequent queries of each table, which bounds memory use at the cost of approximate query ranks. "
+        "`sqlite` keeps exact counts in a temporary SQLite database, for long time windows that don't fit in memory.",
+    )
+    query_sketch_size: pydantic.PositiveInt = Field(
+        default=1000,
+        description="Number of distinct queries tracked per table and time bucket when `aggregation_backend` is `sketch`.",
+    )
+
+
+class _InMemoryUsageStore(Generic[ResourceType]):
+    def __init__(self, config: UsageAggregationConfig, use_sketch: bool) -> None:
+        self.config = config
+        self.query_texts: Optional[QueryTextStore] = (
+            QueryTextStore() if use_sketch else None
+        )
+        self._buckets: Dict[
+            datetime, Dict[ResourceType, GenericAggregatedDataset[ResourceType]]
+        ] = {}
+
+    def add_read_entry(
+        self,
+        bucket_start_time: datetime,
+        resource: ResourceType,
+        user_email: str,
+        query: Optional[str],
+        fields: List[str],
+    ) -> None:
+        datasets = self._buckets.setdefault(bucket_start_time, {})
+        dataset = datasets.get(resource)
+        if dataset is None:
+            dataset = GenericAggregatedDataset(
+                bucket_start_time=bucket_start_time,
+                resource=resource,
+                user_email_pattern=self.config.user_email_pattern,
+                query_sketch=QueryFrequencySketch(
+                    self.config.query_sketch_size, self.query_texts
+                )
+                if self.query_texts is not None
+                else None,
+            )
+            datasets[resource] = dataset
+        dataset.add_read_entry(user_email, query, fields)
+
+    def bucket_start_times(self) -> List[datetime]:
+        return list(self._buckets)
+
+    def pop_bucket(
+        self, bucket_start_time: datetime
+    ) -> Iterable[GenericAggregatedDataset[ResourceType]]:
+        for dataset in self._buckets.pop(bucket_start_time).values():
+            yield dataset
+            if dataset.query_sketch is not None:
+                dataset.query_sketch.release()
+
+    def close(self) -> None:
+        self._buckets = {}
+
+
+class _SqliteUsageStore(Generic[ResourceType]):
+    def __init__(self, config: UsageAggregationConfig) -> None:
+        self.config = config
+        self._bucket_start_times: Dict[str, datetime] = {}
+        self._resources: Dict[str, ResourceType] = {}
+
+        # Counter updates are buffered and written out in batches.
+        self._dataset_counts: Dict[Tuple[str, str], List[int]] = {}
+        self._query_counts: Counter[Tuple[str, str, int]] = collections.Counter()
+        self._query_texts: Dict[int, str] = {}
+        self._user_counts: Counter[Tuple[str, str, str]] = collections.Counter()
+        self._column_counts: Counter[Tuple[str, str, str]] = collections.Counter()
+
+        fd, self._db_path = tempfile.mkstemp(prefix="datahub-usage-", suffix=".db")
+        os.close(fd)
+        logger.info(f"Aggregating usage in {self._db_path}")
+        self._db = sqlite3.connect(self._db_path)
+        # The database only lives for the duration of the run, so durability is not needed.
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE datasets (bucket TEXT NOT NULL, resource TEXT NOT NULL, "
+            "read_count INTEGER NOT NULL, query_count INTEGER NOT NULL, "
+            "PRIMARY KEY (bucket, resource))"
+        )
+        self._db.execute(
+            "CREATE TABLE query_texts (digest INTEGER PRIMARY KEY, text TEXT NOT NULL)"
+        )
+        for table, key in [
+            ("query_counts", "digest INTEGER"),
+            ("user_counts", "user TEXT"),
+            ("column_counts", "field TEXT"),
+        ]:
+            self._db.execute(
+                f"CREATE TABLE {table} (bucket TEXT NOT NULL, resource TEXT NOT NULL, "
+                f"{key} NOT NULL, count INTEGER NOT NULL, "
+                f"PRIMARY KEY (bucket, resource, {key.split()[0]}))"
+            )
+
+    def _num_buffered(self) -> int:
+        return (
+            len(self._dataset_counts)
+            + len(self._query_counts)
+            + len(self._user_counts)
+            + len(self._column_counts)
+        )
+
+    def add_read_entry(
+        self,
+        bucket_start_time: datetime,
+        resource: ResourceType,
+        user_email: str,
+        query: Optional[str],
+        fields: List[str],
+    ) -> None:
+        if not self.config.user_email_pattern.allowed(user_email):
+            return
+
+        bucket = bucket_start_time.isoformat()
+        self._bucket_start_times.setdefault(bucket, bucket_start_time)
+        resource_key = str(resource)
+        self._resources.setdefault(resource_key, resource)
+
+        counts = self._dataset_counts.setdefault((bucket, resource_key), [0, 0])
+        counts[0] += 1
+        self._user_counts[(bucket, resource_key, user_email)] += 1
+        if query:
+            counts[1] += 1
+            digest = _query_digest(query)
+            self._query_texts[digest] = query
+            self._query_counts[(bucket, resource_key, digest)] += 1
+        for field in fields:
+            self._column_counts[(bucket, resource_key, field)] += 1
+
+        if self._num_buffered() >= _SQLITE_WRITE_BUFFER_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._db.executemany(
+            "INSERT INTO datasets (bucket, resource, read_count, query_count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (bucket, resource) DO UPDATE SET "
+            "read_count = read_count + excluded.read_count, "
+            "query_count = query_count + excluded.query_count",
+            (
+                (bucket, resource, counts[0], counts[1])
+                for (bucket, resource), counts in self._dataset_counts.items()
+            ),
+        )
+        self._db.executemany(
+            "INSERT OR IGNORE INTO query_texts (digest, text) VALUES (?, ?)",
+            self._query_texts.items(),
+        )
+        counters: List[Tuple[str, str, Counter[Tuple[str, str, Any]]]] = [
+            ("query_counts", "digest", self._query_counts),
+            ("user_counts", "user", self._user_counts),
+            ("column_counts", "field", self._column_counts),
+        ]
+        for table, key, counter in counters:
+            self._db.executemany(
+                f"INSERT INTO {table} (bucket, resource, {key}, count) VALUES (?, ?, ?, ?) "
+                f"ON CONFLICT (bucket, resource, {key}) DO UPDATE SET count = count + excluded.count",
+                (
+                    (bucket, resource, value, count)
+                    for (bucket, resource, value), count in counter.items()
+                ),
+            )
+        self._db.commit()
+        self._dataset_counts = {}
+        self._query_counts = collections.Counter()
+        self._query_texts = {}
+        self._user_counts = collections.Counter()
+        self._column_counts = collections.Counter()
+
+    def bucket_start_times(self) -> List[datetime]:
+        return list(self._bucket_start_times.values())
+
+    def pop_bucket(
+        self, bucket_start_time: datetime
+    ) -> Iterable[GenericAggregatedDataset[ResourceType]]:
+        self._flush()
+        bucket = bucket_start_time.isoformat()
+        num_queries = (
+            self.config.top_n_queries if self.config.include_top_n_queries else 0
+        )
+        rows: List[Tuple[str, int, int]] = self._db.execute(
+            "SELECT resource, read_count, query_count FROM datasets "
+            "WHERE bucket = ? ORDER BY rowid",
+            (bucket,),
+        ).fetchall()
+        for resource, read_count, query_count in rows:
+            dataset: GenericAggregatedDataset[ResourceType] = GenericAggregatedDataset(
+                bucket_start_time=bucket_start_time,
+                resource=self._resources[resource],
+                user_email_pattern=self.config.user_email_pattern,
+                readCount=read_count,
+                queryCount=query_count,
+            )
+            # Counts are read in insertion order, so that ties are ranked the same
+            # way as in memory.
+            for user, count in self._db.execute(
+                "SELECT user, count FROM user_counts "
+                "WHERE bucket = ? AND resource = ? ORDER BY rowid",
+                (bucket, resource),
+            ):
+                dataset.userFreq[user] = count
+            for field, count in self._db.execute(
+                "SELECT field, count FROM column_counts "
+                "WHERE bucket = ? AND resource = ? ORDER BY rowid",
+                (bucket, resource),
+            ):
+                dataset.columnFreq[field] = count
+            for text, count in self._db.execute(
+                "SELECT t.text, c.count FROM query_counts c "
+                "JOIN query_texts t ON t.digest = c.digest "
+                "WHERE c.bucket = ? AND c.resource = ? "
+                "ORDER BY c.count DESC, c.rowid LIMIT ?",
+                (bucket, resource, num_queries),
+            ):
+                dataset.queryFreq[text] = count
+            yield dataset
+
+        for table in ["datasets", "query_counts", "user_counts", "column_counts"]:
+            self._db.execute(f"DELETE FROM {table} WHERE bucket = ?", (bucket,))
+        self._db.commit()
+        del self._bucket_start_times[bucket]
+
+    def close(self) -> None:
+        self._db.close()
+        try:
+            os.remove(self._db_path)
+        except OSError:
+            pass
+
+
+class UsageAggregator(Generic[ResourceType]):
+    """
+    Aggregates read events into usage statistics per time bucket and resource, using
+    the backend picked by the config's aggregation_backend, and turns them into work
+    units.
+
+    Sources that read their events in time order, ascending or descending, can call
+    generate_closed_workunits as they go so that each bucket is emitted, and its state
+    dropped, as soon as the events have moved on to another bucket.
+    """
+
+    def __init__(
+        self,
+        config: UsageAggregationConfig,
+        urn_builder: Callable[[ResourceType], str],
+    ) -> None:
+        self.config = config
+        self.urn_builder = urn_builder
+        self._store: Union[
+            _InMemoryUsageStore[ResourceType], _SqliteUsageStore[ResourceType]
+        ]
+        if config.aggregation_backend == UsageAggregationBackend.SQLITE:
+            self._store = _SqliteUsageStore(config)
+        else:
+            self._store = _InMemoryUsageStore(
+                config,
+                use_sketch=config.aggregation_backend == UsageAggregationBackend.SKETCH,
+            )
+        self._emitted_buckets: Set[datetime] = set()
+        self.num_late_events = 0
+
+    def add_read_entry(
+        self,
+        bucket_start_time: datetime,
+        resource: ResourceType,
+        user_email: str,
+        query: Optional[str],
+        fields: List[str],
+    ) -> None:
+        if bucket_start_time in self._emitted_buckets:
+            # Emitting the bucket again would overwrite its statistics with partial ones.
+            if self.num_late_events == 0:
+                logger.warning(
+                    f"Dropping usage events for bucket {bucket_start_time.isoformat()}, which was already emitted. "
+                    "Events were expected to arrive in time order."
+                )
+            self.num_late_events += 1
+            return
+        self._store.add_read_entry(
+            bucket_start_time, resource, user_email, query, fields
+        )
+
+    def _generate_bucket_workunits(
+        self, bucket_start_time: datetime
+    ) -> Iterable[MetadataWorkUnit]:
+        self._emitted_buckets.add(bucket_start_time)
+        for dataset in self._store.pop_bucket(bucket_start_time):
+            yield dataset.make_usage_workunit(
+                self.config.bucket_duration,
+                self.urn_builder,
+                self.config.top_n_queries,
+                self.config.format_sql_queries,
+                self.config.include_top_n_queries,
+            )
+
+    def generate_closed_workunits(
+        self, current_bucket_start_time: datetime
+    ) -> Iterable[MetadataWorkUnit]:
+        """Emits every bucket other than the current one. Events must arrive in time order."""
+        for bucket_start_time in self._store.bucket_start_times():
+            if bucket_start_time != current_bucket_start_time:
+                yield from self._generate_bucket_workunits(bucket_start_time)
+
+    def generate_workunits(self) -> Iterable[MetadataWorkUnit]:
+        """Emits every bucket that has not been emitted yet."""
+        for bucket_start_time in self._store.bucket_start_times():
+            yield from self._generate_bucket_workunits(bucket_start_time)
+
+    def report_late_events(self, report: SourceReport) -> None:
+        """Adds a warning about the dropped late events, if any, to the source report."""
+        if self.num_late_events:
+            message = f"Dropped {self.num_late_events} usage events whose time bucket had already been emitted"
+            logger.warning(message)
+            report.report_warning("usage-late-events", message)
+
+    def close(self) -> None:
+        self._store.close()
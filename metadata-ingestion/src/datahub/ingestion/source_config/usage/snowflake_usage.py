@@ -8,7 +8,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfig,
     StatefulIngestionConfigBase,
 )
-from datahub.ingestion.source.usage.usage_common import BaseUsageConfig
+from datahub.ingestion.source.usage.usage_common import UsageAggregationConfig
 from datahub.ingestion.source_config.sql.snowflake import BaseSnowflakeConfig
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class SnowflakeStatefulIngestionConfig(StatefulIngestionConfig):
 
 
 class SnowflakeUsageConfig(
-    BaseSnowflakeConfig, BaseUsageConfig, StatefulIngestionConfigBase
+    BaseSnowflakeConfig, UsageAggregationConfig, StatefulIngestionConfigBase
 ):
     options: dict = pydantic.Field(
         default_factory=dict,
@@ -15,7 +15,6 @@ class PulsarSourceReport(StatefulIngestionReport):
     tenants_filtered: List[str] = field(default_factory=list)
     namespaces_filtered: List[str] = field(default_factory=list)
     topics_filtered: List[str] = field(default_factory=list)
-    soft_deleted_stale_entities: List[str] = field(default_factory=list)
 
     def report_pulsar_version(self, version: str) -> None:
         self.pulsar_version = version
@@ -28,6 +27,3 @@ class PulsarSourceReport(StatefulIngestionReport):
 
     def report_topics_dropped(self, topic: str) -> None:
         self.topics_filtered.append(topic)
-
-    def report_stale_entity_soft_deleted(self, urn: str) -> None:
-        self.soft_deleted_stale_entities.append(urn)
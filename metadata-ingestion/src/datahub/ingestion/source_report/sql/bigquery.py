@@ -5,6 +5,7 @@ from typing import Dict, List, Optional
 import pydantic
 
 from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+from datahub.utilities.sql_parser_cache import SQLParseCacheReport
 
 
 @dataclass
@@ -13,6 +14,7 @@ class BigQueryReport(SQLSourceReport):
     num_skipped_lineage_entries_missing_data: Optional[int] = None
     num_skipped_lineage_entries_not_allowed: Optional[int] = None
     num_skipped_lineage_entries_sql_parser_failure: Optional[int] = None
+    sql_parse_cache: Optional[SQLParseCacheReport] = None
     num_skipped_lineage_entries_other: Optional[int] = None
     num_total_log_entries: Optional[int] = None
     num_parsed_log_entires: Optional[int] = None
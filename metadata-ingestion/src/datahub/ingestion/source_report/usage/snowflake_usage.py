@@ -21,3 +21,4 @@ class SnowflakeUsageReport(BaseSnowflakeReport, StatefulIngestionReport):
     rows_zero_direct_objects_accessed: int = 0
     rows_missing_email: int = 0
     rows_parsing_error: int = 0
+    num_late_usage_events_dropped: int = 0
@@ -78,7 +78,7 @@ class AddDatasetOwnership(DatasetOwnershipTransformer):
             # nothing to add, no need to consult server
             return None
         assert mce_ownership
-        server_ownership = graph.get_ownership(entity_urn=urn)
+        server_ownership = graph.get_ownership(entity_urn=urn, use_prefetched=True)
         if server_ownership:
             # compute patch
             # we only include owners who are not present in the server ownership
@@ -107,6 +107,11 @@ class AddDatasetOwnership(DatasetOwnershipTransformer):
         else:
             return mce_ownership
 
+    def prefetch(self, entity_urns: List[str]) -> None:
+        if self.config.semantics == Semantics.PATCH:
+            assert self.ctx.graph
+            self._prefetch_server_aspects(self.ctx.graph, entity_urns, OwnershipClass)
+
     def transform_one(self, mce: MetadataChangeEventClass) -> MetadataChangeEventClass:
         assert isinstance(mce.proposedSnapshot, DatasetSnapshotClass)
         owners_to_add = self.config.get_owners_to_add(mce.proposedSnapshot)
@@ -1,12 +1,17 @@
 import logging
+import os
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Type, Union, cast
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union, cast
 
 import datahub.emitter.mce_builder
 from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import ControlRecord, EndOfStream, RecordEnvelope
+from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.transformer.entity_tracker import EntityTracker
 from datahub.metadata.schema_classes import (
     BrowsePathsClass,
     ChangeTypeClass,
@@ -28,6 +33,7 @@ from datahub.metadata.schema_classes import (
     OwnershipClass,
     SchemaMetadataClass,
     StatusClass,
+    SystemMetadataClass,
     UpstreamLineageClass,
     ViewPropertiesClass,
     _Aspect,
@@ -37,6 +43,23 @@ from datahub.utilities.urns.urn import Urn
 log = logging.getLogger(__name__)
 
 
+_END_OF_STREAM_PREFETCH_BATCH_SIZE = 1000
+
+
+def _get_spill_threshold() -> Optional[int]:
+    threshold = os.getenv("DATAHUB_TRANSFORMER_SPILL_THRESHOLD")
+    return int(threshold) if threshold else None
+
+
+@dataclass
+class TransformerReport(Report):
+    entities_processed: int = 0
+    entities_pending: int = 0
+    entities_spilled_to_disk: int = 0
+    state_memory_bytes_estimate: int = 0
+    end_of_stream_aspects_emitted: int = 0
+
+
 class SnapshotAspectRegistry:
     """A registry of aspect name to aspect type mappings, only for snapshot classes. Do not add non-snapshot aspect classes here."""
 
@@ -98,7 +121,10 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
         return ["*"]
 
     def __init__(self):
-        self.entity_map: Dict[str, Dict[str, Any]] = {}
+        # The pipeline overrides the spill threshold with the transformer's spill_threshold
+        # option. The environment variable is only a fallback.
+        self.entity_tracker = EntityTracker(spill_threshold=_get_spill_threshold())
+        self.report = TransformerReport()
         self.entity_type_mappings: Dict[str, Type] = {
             "dataset": DatasetSnapshotClass,
             "dataFlow": DataFlowSnapshotClass,
@@ -143,23 +169,56 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
         # default to process everything that is not caught by above checks
         return True
 
+    def get_report(self) -> TransformerReport:
+        self.report.entities_processed = self.entity_tracker.num_processed()
+        self.report.entities_pending = self.entity_tracker.num_pending()
+        self.report.entities_spilled_to_disk = self.entity_tracker.num_spilled
+        self.report.state_memory_bytes_estimate = (
+            self.entity_tracker.approx_memory_bytes()
+        )
+        return self.report
+
+    def _prefetch_server_aspects(
+        self, graph: DataHubGraph, entity_urns: List[str], aspect_type: Type[Aspect]
+    ) -> None:
+        entity_types = self.entity_types()
+        graph.prefetch_aspects(
+            [
+                urn
+                for urn in entity_urns
+                if "*" in entity_types or urn.split(":")[2] in entity_types
+            ],
+            [aspect_type],
+        )
+
+    def _pending_with_prefetch(
+        self,
+    ) -> Iterable[Tuple[str, Optional[SystemMetadataClass]]]:
+        # give the transformer a chance to look up server state in bulk before the
+        # end-of-stream aspects are generated
+        batch: List[Tuple[str, Optional[SystemMetadataClass]]] = []
+        for entry in self.entity_tracker.pending():
+            batch.append(entry)
+            if len(batch) >= _END_OF_STREAM_PREFETCH_BATCH_SIZE:
+                self.prefetch([urn for urn, _ in batch])
+                yield from batch
+                batch = []
+        if batch:
+            self.prefetch([urn for urn, _ in batch])
+            yield from batch
+
     def _record_mce(self, mce: MetadataChangeEventClass) -> None:
-        record_entry = self.entity_map.get(mce.proposedSnapshot.urn, {"seen": {}})
-        if "seen" in record_entry:
-            # we just record the system metadata field from the mce, since we might need it later
-            record_entry["seen"]["mce"] = mce.systemMetadata
-            self.entity_map[mce.proposedSnapshot.urn] = record_entry
+        # we just record the system metadata field from the mce, since we might need it later
+        self.entity_tracker.record_mce(mce.proposedSnapshot.urn, mce.systemMetadata)
 
     def _record_mcp(self, mcp: MetadataChangeProposalWrapper) -> None:
         assert mcp.entityUrn
-        record_entry = self.entity_map.get(mcp.entityUrn, {"seen": {}})
-        if "seen" in record_entry and "mcp" not in record_entry["seen"]:
-            # only record the first mcp seen
-            record_entry["seen"]["mcp"] = mcp
-        self.entity_map[mcp.entityUrn] = record_entry
+        # only mcps for other aspects are recorded, so all we need from them is the
+        # system metadata of the first one seen
+        self.entity_tracker.record_mcp(mcp.entityUrn, mcp.systemMetadata)
 
     def _mark_processed(self, entity_urn: str) -> None:
-        self.entity_map[entity_urn] = {"processed": True}
+        self.entity_tracker.mark_processed(entity_urn)
 
     def _transform_or_record_mce(
         self,
@@ -252,42 +311,36 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 self, SingleAspectTransformer
             ):
                 # walk through state and call transform for any unprocessed entities
-                for urn, state in self.entity_map.items():
-                    if "seen" in state:
-                        # call transform on this entity_urn
-                        last_seen_mcp = state["seen"].get("mcp")
-                        last_seen_mce_system_metadata = state["seen"].get("mce")
-
-                        transformed_aspect = self.transform_aspect(
-                            entity_urn=urn,
-                            aspect_name=self.aspect_name(),
-                            aspect=last_seen_mcp.aspect
-                            if last_seen_mcp
-                            and last_seen_mcp.aspectName == self.aspect_name()
-                            else None,
+                for urn, system_metadata in self._pending_with_prefetch():
+                    # call transform on this entity_urn
+                    transformed_aspect = self.transform_aspect(
+                        entity_urn=urn,
+                        aspect_name=self.aspect_name(),
+                        aspect=None,
+                    )
+                    if transformed_aspect:
+                        # for end of stream records, we modify the workunit-id
+                        structured_urn = Urn.create_from_string(urn)
+                        simple_name = "-".join(structured_urn.get_entity_id())
+                        record_metadata = envelope.metadata.copy()
+                        record_metadata.update(
+                            {
+                                "workunit_id": f"txform-{simple_name}-{self.aspect_name()}"
+                            }
+                        )
+                        yield RecordEnvelope(
+                            record=MetadataChangeProposalWrapper(
+                                entityUrn=urn,
+                                entityType=structured_urn.get_type(),
+                                changeType=ChangeTypeClass.UPSERT,
+                                systemMetadata=system_metadata,
+                                aspectName=self.aspect_name(),
+                                aspect=transformed_aspect,
+                            ),
+                            metadata=record_metadata,
                         )
-                        if transformed_aspect:
-                            # for end of stream records, we modify the workunit-id
-                            structured_urn = Urn.create_from_string(urn)
-                            simple_name = "-".join(structured_urn.get_entity_id())
-                            record_metadata = envelope.metadata.copy()
-                            record_metadata.update(
-                                {
-                                    "workunit_id": f"txform-{simple_name}-{self.aspect_name()}"
-                                }
-                            )
-                            yield RecordEnvelope(
-                                record=MetadataChangeProposalWrapper(
-                                    entityUrn=urn,
-                                    entityType=structured_urn.get_type(),
-                                    changeType=ChangeTypeClass.UPSERT,
-                                    systemMetadata=last_seen_mcp.systemMetadata
-                                    if last_seen_mcp
-                                    else last_seen_mce_system_metadata,
-                                    aspectName=self.aspect_name(),
-                                    aspect=transformed_aspect,
-                                ),
-                                metadata=record_metadata,
-                            )
+                        self.report.end_of_stream_aspects_emitted += 1
                     self._mark_processed(urn)
+                # nothing is pending anymore, so any spilled state can be dropped
+                self.entity_tracker.close()
             yield envelope
@@ -68,7 +68,7 @@ class AddDatasetDomain(DatasetDomainTransformer):
             # nothing to add, no need to consult server
             return None
 
-        server_domain = graph.get_domain(entity_urn=urn)
+        server_domain = graph.get_domain(entity_urn=urn, use_prefetched=True)
         if server_domain:
             # compute patch
             # we only include domain who are not present in the server domain list
@@ -82,6 +82,11 @@ class AddDatasetDomain(DatasetDomainTransformer):
 
         return mce_domain
 
+    def prefetch(self, entity_urns: List[str]) -> None:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            assert self.ctx.graph
+            self._prefetch_server_aspects(self.ctx.graph, entity_urns, DomainsClass)
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[Aspect]
     ) -> Optional[Aspect]:
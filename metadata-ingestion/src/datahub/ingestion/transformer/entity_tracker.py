@@ -0,0 +1,240 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from datahub.metadata.schema_classes import SystemMetadataClass
+
+logger = logging.getLogger(__name__)
+
+# System metadata is usually identical across the records of a run, so we keep a single
+# copy of each distinct serialized value. The number of copies is capped in case it isn't.
+_MAX_INTERNED_SYSTEM_METADATA = 10_000
+
+# How many writes to batch into a single transaction once pending entities are spilled.
+_SPILL_COMMIT_INTERVAL = 10_000
+
+# (serialized system metadata from the last MCE, whether an MCP was seen, serialized
+# system metadata from the first MCP)
+_PendingEntry = Tuple[Optional[str], bool, Optional[str]]
+
+
+def _urn_digest(urn: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(urn.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class EntityTracker:
+    """
+    Tracks the entities a transformer has seen so that it can emit aspects for the ones
+    it has not transformed yet when the stream ends.
+
+    Processed entities are only remembered as 64-bit digests of their urns. Pending
+    entities keep their urn and the serialized system metadata needed for emission, and
+    nothing else. Once more than spill_threshold entities are pending, they are moved to
+    a temporary SQLite database.
+    """
+
+    def __init__(self, spill_threshold: Optional[int] = None) -> None:
+        self.spill_threshold = spill_threshold
+        self._processed: Set[int] = set()
+        self._pending: Dict[str, _PendingEntry] = {}
+        self._interned: Dict[str, str] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_path: Optional[str] = None
+        self._writes_since_commit = 0
+        self.num_spilled = 0
+
+    @property
+    def is_spilled(self) -> bool:
+        return self._db is not None
+
+    def _serialize(
+        self, system_metadata: Optional[SystemMetadataClass]
+    ) -> Optional[str]:
+        if system_metadata is None:
+            return None
+        # Serializing also takes a snapshot, since the record's system metadata
+        # can be modified after it has gone past the transformer.
+        serialized = json.dumps(system_metadata.to_obj(), sort_keys=True)
+        interned = self._interned.get(serialized)
+        if interned is not None:
+            return interned
+        if len(self._interned) < _MAX_INTERNED_SYSTEM_METADATA:
+            self._interned[serialized] = serialized
+        return serialized
+
+    @staticmethod
+    def _deserialize(serialized: Optional[str]) -> Optional[SystemMetadataClass]:
+        if serialized is None:
+            return None
+        return SystemMetadataClass.from_obj(json.loads(serialized))
+
+    def is_processed(self, urn: str) -> bool:
+        return _urn_digest(urn) in self._processed
+
+    def record_mce(
+        self, urn: str, system_metadata: Optional[SystemMetadataClass]
+    ) -> None:
+        """Records an MCE for the entity, keeping the system metadata of the latest one."""
+        if self.is_processed(urn):
+            return
+        serialized = self._serialize(system_metadata)
+        entry = self._get(urn)
+        if entry is None:
+            self._put(urn, (serialized, False, None), new=True)
+        else:
+            self._put(urn, (serialized, entry[1], entry[2]), new=False)
+
+    def record_mcp(
+        self, urn: str, system_metadata: Optional[SystemMetadataClass]
+    ) -> None:
+        """Records an MCP for the entity, keeping the system metadata of the first one."""
+        if self.is_processed(urn):
+            return
+        entry = self._get(urn)
+        if entry is None:
+            self._put(urn, (None, True, self._serialize(system_metadata)), new=True)
+        elif not entry[1]:
+            self._put(
+                urn, (entry[0], True, self._serialize(system_metadata)), new=False
+            )
+
+    def mark_processed(self, urn: str) -> None:
+        self._processed.add(_urn_digest(urn))
+        self._delete(urn)
+
+    def pending(self) -> Iterable[Tuple[str, Optional[SystemMetadataClass]]]:
+        """
+        Yields the entities that have been seen but not processed, in the order they
+        were first seen, along with the system metadata to emit their aspect with.
+        System metadata from an MCP takes precedence over the one from an MCE.
+        """
+        if self._db is not None:
+            self._commit()
+            # Iterate over a snapshot, since callers mark entities processed as they go.
+            rows: Iterable[
+                Tuple[str, Optional[str], int, Optional[str]]
+            ] = self._db.execute(
+                "SELECT urn, mce, mcp_seen, mcp FROM pending ORDER BY seq"
+            ).fetchall()
+            for urn, mce, mcp_seen, mcp in rows:
+                yield urn, self._deserialize(mcp if mcp_seen else mce)
+        else:
+            for urn, (mce, mcp_seen, mcp) in list(self._pending.items()):
+                yield urn, self._deserialize(mcp if mcp_seen else mce)
+
+    def num_pending(self) -> int:
+        if self._db is not None:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM pending").fetchone()
+            return count
+        return len(self._pending)
+
+    def num_processed(self) -> int:
+        return len(self._processed)
+
+    def approx_memory_bytes(self) -> int:
+        """A rough estimate of the memory held by the tracked state, excluding spilled entries."""
+        size = sys.getsizeof(self._processed) + sum(
+            sys.getsizeof(digest) for digest in self._processed
+        )
+        size += sys.getsizeof(self._pending) + sum(
+            sys.getsizeof(urn) + sys.getsizeof(entry)
+            for urn, entry in self._pending.items()
+        )
+        size += sys.getsizeof(self._interned) + sum(
+            sys.getsizeof(serialized) for serialized in self._interned
+        )
+        return size
+
+    def _get(self, urn: str) -> Optional[_PendingEntry]:
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT mce, mcp_seen, mcp FROM pending WHERE urn = ?", (urn,)
+            ).fetchone()
+            return (row[0], bool(row[1]), row[2]) if row is not None else None
+        return self._pending.get(urn)
+
+    def _put(self, urn: str, entry: _PendingEntry, new: bool) -> None:
+        if self._db is not None:
+            if new:
+                self._db.execute(
+                    "INSERT INTO pending (urn, mce, mcp_seen, mcp) VALUES (?, ?, ?, ?)",
+                    (urn, entry[0], entry[1], entry[2]),
+                )
+                self.num_spilled += 1
+            else:
+                self._db.execute(
+                    "UPDATE pending SET mce = ?, mcp_seen = ?, mcp = ? WHERE urn = ?",
+                    (entry[0], entry[1], entry[2], urn),
+                )
+            self._wrote()
+            return
+
+        self._pending[urn] = entry
+        if (
+            new
+            and self.spill_threshold is not None
+            and len(self._pending) > self.spill_threshold
+        ):
+            self._spill()
+
+    def _delete(self, urn: str) -> None:
+        if self._db is not None:
+            self._db.execute("DELETE FROM pending WHERE urn = ?", (urn,))
+            self._wrote()
+        else:
+            self._pending.pop(urn, None)
+
+    def _spill(self) -> None:
+        fd, self._db_path = tempfile.mkstemp(
+            prefix="datahub-transformer-", suffix=".db"
+        )
+        os.close(fd)
+        logger.info(
+            f"More than {self.spill_threshold} entities pending in transformer, spilling them to {self._db_path}"
+        )
+        self._db = sqlite3.connect(self._db_path)
+        # The database only lives for the duration of the run, so durability is not needed.
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE pending (seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "urn TEXT NOT NULL UNIQUE, mce TEXT, mcp_seen INTEGER NOT NULL, mcp TEXT)"
+        )
+        self._db.executemany(
+            "INSERT INTO pending (urn, mce, mcp_seen, mcp) VALUES (?, ?, ?, ?)",
+            (
+                (urn, mce, mcp_seen, mcp)
+                for urn, (mce, mcp_seen, mcp) in self._pending.items()
+            ),
+        )
+        self._db.commit()
+        self.num_spilled += len(self._pending)
+        self._pending = {}
+
+    def _wrote(self) -> None:
+        self._writes_since_commit += 1
+        if self._writes_since_commit >= _SPILL_COMMIT_INTERVAL:
+            self._commit()
+
+    def _commit(self) -> None:
+        assert self._db is not None
+        self._db.commit()
+        self._writes_since_commit = 0
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        if self._db_path is not None:
+            try:
+                os.remove(self._db_path)
+            except OSError:
+                pass
+            self._db_path = None
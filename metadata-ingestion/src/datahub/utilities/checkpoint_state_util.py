@@ -1,4 +1,5 @@
-from typing import Iterable, List, Set
+import sys
+from typing import Iterable, Iterator, Optional
 
 from datahub.emitter.mce_builder import dataset_urn_to_key, make_dataset_urn
 
@@ -15,20 +16,39 @@ class CheckpointStateUtil:
 
     @staticmethod
     def get_encoded_urns_not_in(
-        encoded_urns_1: List[str], encoded_urns_2: List[str]
-    ) -> Set[str]:
-        return set(encoded_urns_1) - set(encoded_urns_2)
+        encoded_urns_1: Iterable[str], encoded_urns_2: Iterable[str]
+    ) -> Iterator[str]:
+        """
+        Lazily yields the distinct encoded urns of the first collection that aren't in
+        the second one, in sorted order.
+
+        Both are sorted and then walked in a single merge pass, which takes a list of
+        references per collection rather than two hash sets. States read from a
+        checkpoint are already sorted, which sorting detects in linear time.
+        """
+        others = iter(sorted(encoded_urns_2))
+        other: Optional[str] = next(others, None)
+        previous: Optional[str] = None
+        for encoded_urn in sorted(encoded_urns_1):
+            if encoded_urn == previous:
+                continue
+            previous = encoded_urn
+            while other is not None and other < encoded_urn:
+                other = next(others, None)
+            if other != encoded_urn:
+                yield encoded_urn
 
     @staticmethod
     def get_dataset_lightweight_repr(dataset_urn: str) -> str:
         SEP = CheckpointStateUtil.get_separator()
         key = dataset_urn_to_key(dataset_urn)
         assert key is not None
-        return f"{key.platform}{SEP}{key.name}{SEP}{key.origin}"
+        # Interned, as sources can add the same dataset to their state repeatedly.
+        return sys.intern(f"{key.platform}{SEP}{key.name}{SEP}{key.origin}")
 
     @staticmethod
     def get_dataset_urns_not_in(
-        encoded_urns_1: List[str], encoded_urns_2: List[str]
+        encoded_urns_1: Iterable[str], encoded_urns_2: Iterable[str]
     ) -> Iterable[str]:
         difference = CheckpointStateUtil.get_encoded_urns_not_in(
             encoded_urns_1, encoded_urns_2
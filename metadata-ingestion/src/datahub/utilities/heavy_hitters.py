@@ -0,0 +1,67 @@
+import heapq
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+_Item = TypeVar("_Item", bound=Hashable)
+
+
+class SpaceSavingCounter(Generic[_Item]):
+    """
+    Approximately counts the most frequent items of a stream while tracking at most
+    `capacity` distinct items, using the Space-Saving algorithm (Metwally et al., 2005).
+
+    When a new item arrives and the counter is full, the least counted item is evicted
+    and the new one takes over its count. Counts are therefore overestimates, by at most
+    the count of the evicted item, but any item seen more than 1/capacity of the time is
+    guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._counts: Dict[_Item, int] = {}
+        # One (count, insertion order, item) entry per tracked item. Entries are not
+        # updated when an item is counted again, so their count can be lower than the
+        # actual one. Such stale entries are refreshed when they reach the top.
+        self._heap: List[Tuple[int, int, _Item]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, item: _Item) -> bool:
+        return item in self._counts
+
+    def __getitem__(self, item: _Item) -> int:
+        return self._counts.get(item, 0)
+
+    def _push(self, count: int, item: _Item) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (count, self._seq, item))
+
+    def add(self, item: _Item, count: int = 1) -> Optional[_Item]:
+        """Counts occurrences of the item. Returns the item evicted to make room for it, if any."""
+        current_count = self._counts.get(item)
+        if current_count is not None:
+            self._counts[item] = current_count + count
+            return None
+        if len(self._counts) < self.capacity:
+            self._counts[item] = count
+            self._push(count, item)
+            return None
+
+        while True:
+            min_count, _, evicted = heapq.heappop(self._heap)
+            actual_count = self._counts[evicted]
+            if actual_count == min_count:
+                break
+            self._push(actual_count, evicted)
+        del self._counts[evicted]
+        self._counts[item] = min_count + count
+        self._push(min_count + count, item)
+        return evicted
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[_Item, int]]:
+        """The n most counted items with their counts, like Counter.most_common."""
+        ranked = sorted(self._counts.items(), key=lambda entry: entry[1], reverse=True)
+        return ranked if n is None else ranked[:n]
@@ -0,0 +1,96 @@
+import gzip
+import io
+import os
+from typing import IO, Any, BinaryIO, Optional
+
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".zst": "zstd"}
+
+
+def get_compression(path: str) -> Optional[str]:
+    for extension, compression in COMPRESSION_EXTENSIONS.items():
+        if path.endswith(extension):
+            return compression
+    return None
+
+
+def is_json_lines_file(path: str) -> bool:
+    """
+    Files named *.jsonl or *.ndjson, optionally followed by a compression extension,
+    contain one JSON record per line rather than a single JSON array.
+    """
+    compression = get_compression(path)
+    if compression is not None:
+        path = path[: path.rindex(".")]
+    return path.endswith(JSON_LINES_EXTENSIONS)
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Reading or writing zstd compressed files requires the zstandard package: pip install zstandard"
+        ) from e
+    return zstandard
+
+
+class CompressedFile:
+    """
+    Opens a file for reading or writing in binary mode, transparently (de)compressing
+    it based on its extension. When reading, raw_bytes_read tracks the position in
+    the file on disk, which can be compared to its size to estimate progress.
+    """
+
+    def __init__(self, path: str, mode: str) -> None:
+        assert mode in {"rb", "wb"}
+        self.compression = get_compression(path)
+        self._raw: BinaryIO = open(path, mode)  # type: ignore
+        self.stream: IO[bytes]
+        if self.compression == "gzip":
+            self.stream = gzip.GzipFile(fileobj=self._raw, mode=mode)  # type: ignore
+        elif self.compression == "zstd":
+            zstandard = _import_zstandard()
+            if mode == "rb":
+                self.stream = io.BufferedReader(
+                    zstandard.ZstdDecompressor().stream_reader(self._raw)
+                )
+            else:
+                self.stream = zstandard.ZstdCompressor().stream_writer(self._raw)
+        else:
+            self.stream = self._raw
+
+    @property
+    def raw_bytes_read(self) -> int:
+        return self._raw.tell()
+
+    def close(self) -> None:
+        if self.stream is not self._raw:
+            self.stream.close()
+        if not self._raw.closed:
+            self._raw.close()
+
+    def __enter__(self) -> "CompressedFile":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def get_uncompressed_size(path: str, limit: int) -> int:
+    """
+    Returns the size of the file's contents once decompressed, or limit if they are
+    at least that large. Compressed files are decompressed up to limit to find out,
+    since their headers don't reliably record the size of their contents.
+    """
+    if get_compression(path) is None:
+        return os.path.getsize(path)
+
+    size = 0
+    with CompressedFile(path, "rb") as f:
+        while size < limit:
+            chunk = f.stream.read(min(limit - size, 1024 * 1024))
+            if not chunk:
+                break
+            size += len(chunk)
+    return size
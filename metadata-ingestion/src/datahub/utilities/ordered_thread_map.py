@@ -0,0 +1,62 @@
+import collections
+import concurrent.futures
+from typing import Callable, Deque, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_executor_map(
+    executor: Optional[concurrent.futures.Executor],
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+) -> Iterable[R]:
+    """
+    Applies fn to the items on the executor and yields the results in the order of
+    the items, pulling at most max_in_flight items ahead of the consumed results.
+
+    As fn runs on the executor while the results are consumed on the calling thread,
+    the results of one call can be mapped again on the same executor. This is how a
+    tree is walked in order with a single bounded pool. Without an executor, fn is
+    called lazily on the calling thread.
+    """
+
+    if executor is None:
+        for item in items:
+            yield fn(item)
+        return
+
+    pending: Deque["concurrent.futures.Future[R]"] = collections.deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Don't leave work queued on a shared executor when the consumer stops early.
+        for future in pending:
+            future.cancel()
+
+
+def ordered_thread_map(
+    fn: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Iterable[R]:
+    """
+    Applies fn to the items on up to max_workers threads and yields the results in
+    the order of the items.
+
+    Unlike ThreadPoolExecutor.map, items are only pulled from the iterable as results
+    are consumed, so at most 2 * max_workers of them are in flight at once. With
+    max_workers <= 1, fn is called lazily on the calling thread. An exception raised
+    by fn is re-raised when its result would have been yielded.
+    """
+
+    if max_workers <= 1:
+        yield from ordered_executor_map(None, fn, items, 1)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from ordered_executor_map(executor, fn, items, 2 * max_workers)
@@ -1,12 +1,20 @@
+import atexit
+import collections
 import contextlib
 import logging
 import multiprocessing
+import multiprocessing.connection
+import os
 import re
 import sys
+import threading
+import time
 import traceback
 from abc import ABCMeta, abstractmethod
-from multiprocessing import Process, Queue
-from typing import List, Optional, Tuple, Type
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterable, List, NoReturn, Optional, Tuple, Type
+
+import psutil
 
 from datahub.utilities.sql_lineage_parser_impl import SqlLineageSQLParserImpl
 
@@ -80,19 +88,9 @@ class MetadataSQLSQLParser(SQLParser):
         return ["date" if c == self._DATE_SWAP_TOKEN else c for c in filtered_cols]
 
 
-def sql_lineage_parser_impl_func_wrapper(
-    queue: multiprocessing.Queue,
+def _parse_sql_lineage(
     sql_query: str,
-) -> None:
-    """
-    The wrapper function that computes the tables and columns using the SqlLineageSQLParserImpl
-    and puts the results on the shared IPC queue. This is used to isolate SqlLineageSQLParserImpl
-    functionality in a separate process, and hence protect our sources from memory leaks originating in
-    the sqllineage module.
-    :param queue: The shared IPC queue on to which the results will be put.
-    :param sql_query: The SQL query to extract the tables & columns from.
-    :return: None.
-    """
+) -> Tuple[List[str], List[str], Optional[Tuple[Optional[Type[BaseException]], str]]]:
     exception_details: Optional[Tuple[Optional[Type[BaseException]], str]] = None
     tables: List[str] = []
     columns: List[str] = []
@@ -105,8 +103,232 @@ def sql_lineage_parser_impl_func_wrapper(
         exc_msg: str = str(exc_info[1]) + "".join(traceback.format_tb(exc_info[2]))
         exception_details = (exc_info[0], exc_msg)
         logger.error(exc_msg)
-    finally:
-        queue.put((tables, columns, exception_details))
+    return tables, columns, exception_details
+
+
+def sql_lineage_parser_worker_loop(conn: Connection) -> None:
+    """
+    The main loop of a long-lived SqlLineageParserPool worker process. It receives SQL queries
+    over the pipe until it gets None, and sends back the tables, columns, exception details and
+    the current RSS of the worker so that the pool can recycle workers that have leaked too much.
+    :param conn: The worker end of the pipe shared with the pool.
+    :return: None.
+    """
+    process = psutil.Process()
+    while True:
+        try:
+            sql_query = conn.recv()
+        except EOFError:
+            break
+        if sql_query is None:
+            break
+        tables, columns, exception_details = _parse_sql_lineage(sql_query)
+        conn.send((tables, columns, exception_details, process.memory_info().rss))
+    conn.close()
+
+
+def _raise_sub_process_exception(
+    exception_details: Tuple[Optional[Type[BaseException]], str]
+) -> NoReturn:
+    exception_type = exception_details[0] or Exception
+    raise exception_type(f"Sub-process exception: {exception_details[1]}")
+
+
+class _SqlLineageParserWorker:
+    def __init__(self) -> None:
+        self.conn, worker_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=sql_lineage_parser_worker_loop, args=(worker_conn,), daemon=True
+        )
+        self.process.start()
+        worker_conn.close()
+        self.num_parsed = 0
+
+    def stop(self, kill: bool = False) -> None:
+        if not kill:
+            with contextlib.suppress(Exception):
+                self.conn.send(None)
+                self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class SqlLineageParserPool:
+    """
+    A pool of long-lived worker processes that run SqlLineageSQLParserImpl.
+
+    Parsing happens in separate processes to protect the ingestion process from the memory
+    leaks of the sqllineage module. Instead of paying for a new process per query, workers
+    are reused and recycled once they have parsed max_parses_per_worker queries or their RSS
+    exceeds max_worker_rss_bytes. A worker that takes longer than query_timeout_sec on a
+    single query is killed, and the query fails with a TimeoutError.
+
+    The pool is safe to share between threads. Each worker serves one caller at a time, and
+    at most max_workers of them are alive across all callers.
+    """
+
+    DEFAULT_MAX_PARSES_PER_WORKER = 1000
+    DEFAULT_MAX_WORKER_RSS_BYTES = 512 * 1024 * 1024
+    DEFAULT_QUERY_TIMEOUT_SEC = 60.0
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_parses_per_worker: int = DEFAULT_MAX_PARSES_PER_WORKER,
+        max_worker_rss_bytes: int = DEFAULT_MAX_WORKER_RSS_BYTES,
+        query_timeout_sec: Optional[float] = DEFAULT_QUERY_TIMEOUT_SEC,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_parses_per_worker = max_parses_per_worker
+        self.max_worker_rss_bytes = max_worker_rss_bytes
+        self.query_timeout_sec = query_timeout_sec
+        self._idle_workers: List[_SqlLineageParserWorker] = []
+        # Guards _idle_workers only, so that concurrent callers parse in parallel.
+        self._lock = threading.Lock()
+        self._worker_slots = threading.BoundedSemaphore(self.max_workers)
+
+    def parse(self, sql_query: str) -> Tuple[List[str], List[str]]:
+        return self.parse_many([sql_query])[0]
+
+    def parse_many(
+        self, sql_queries: Iterable[str], return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Parses the queries concurrently across up to max_workers processes.
+        :param sql_queries: The SQL queries to extract the tables & columns from.
+        :param return_exceptions: If True, a failed query's exception is returned in place of its
+        result. Otherwise, the exception of the first failed query is raised.
+        :return: A (tables, columns) tuple per query, in the same order as sql_queries.
+        """
+        results = self._parse_many(list(sql_queries))
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+
+    def _parse_many(self, sql_queries: List[str]) -> List[Any]:
+        results: List[Any] = [None] * len(sql_queries)
+        pending = collections.deque(enumerate(sql_queries))
+        # worker connection -> (worker, query index, deadline)
+        in_flight: Dict[Any, Tuple[_SqlLineageParserWorker, int, Optional[float]]] = {}
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.max_workers:
+                    # Only wait for a worker when there are no results of ours to collect.
+                    worker = self._acquire_worker(blocking=not in_flight)
+                    if worker is None:
+                        break
+                    index, sql_query = pending.popleft()
+                    try:
+                        worker.conn.send(sql_query)
+                    except (OSError, ValueError) as e:
+                        self._discard_worker(worker)
+                        results[index] = e
+                        continue
+                    deadline = (
+                        time.monotonic() + self.query_timeout_sec
+                        if self.query_timeout_sec is not None
+                        else None
+                    )
+                    in_flight[worker.conn] = (worker, index, deadline)
+                if not in_flight:
+                    continue
+
+                deadlines = [d for (_, _, d) in in_flight.values() if d is not None]
+                wait_timeout = (
+                    max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                )
+                for conn in multiprocessing.connection.wait(
+                    list(in_flight), timeout=wait_timeout
+                ):
+                    worker, index, _ = in_flight.pop(conn)
+                    try:
+                        tables, columns, exception_details, rss = worker.conn.recv()
+                    except EOFError:
+                        self._discard_worker(worker)
+                        results[index] = RuntimeError(
+                            "SQL parser worker process exited unexpectedly"
+                        )
+                        continue
+                    if exception_details is not None:
+                        try:
+                            _raise_sub_process_exception(exception_details)
+                        except BaseException as e:
+                            results[index] = e
+                    else:
+                        results[index] = (tables, columns)
+                    self._release_worker(worker, rss)
+
+                now = time.monotonic()
+                for conn, (worker, index, deadline) in list(in_flight.items()):
+                    if deadline is not None and deadline <= now:
+                        del in_flight[conn]
+                        self._discard_worker(worker)
+                        results[index] = TimeoutError(
+                            f"SQL parsing took longer than {self.query_timeout_sec} seconds"
+                        )
+        finally:
+            # Workers we gave up on, e.g. on KeyboardInterrupt, may still be parsing.
+            for worker, _, _ in in_flight.values():
+                self._discard_worker(worker)
+        return results
+
+    def _acquire_worker(self, blocking: bool) -> Optional[_SqlLineageParserWorker]:
+        if not self._worker_slots.acquire(blocking=blocking):
+            return None
+        with self._lock:
+            while self._idle_workers:
+                worker = self._idle_workers.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.stop(kill=True)
+        try:
+            return _SqlLineageParserWorker()
+        except BaseException:
+            self._worker_slots.release()
+            raise
+
+    def _discard_worker(self, worker: _SqlLineageParserWorker) -> None:
+        worker.stop(kill=True)
+        self._worker_slots.release()
+
+    def _release_worker(self, worker: _SqlLineageParserWorker, rss: int) -> None:
+        worker.num_parsed += 1
+        if (
+            worker.num_parsed >= self.max_parses_per_worker
+            or rss >= self.max_worker_rss_bytes
+        ):
+            logger.debug(
+                f"Recycling SQL parser worker after {worker.num_parsed} queries with RSS {rss}"
+            )
+            worker.stop()
+        else:
+            with self._lock:
+                self._idle_workers.append(worker)
+        self._worker_slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            for worker in self._idle_workers:
+                worker.stop()
+            self._idle_workers = []
+
+
+_sql_lineage_parser_pool: Optional[SqlLineageParserPool] = None
+_sql_lineage_parser_pool_lock = threading.Lock()
+
+
+def get_sql_lineage_parser_pool() -> SqlLineageParserPool:
+    """Returns the SqlLineageParserPool shared by every SqlLineageSQLParser in this process."""
+    global _sql_lineage_parser_pool
+    with _sql_lineage_parser_pool_lock:
+        if _sql_lineage_parser_pool is None:
+            _sql_lineage_parser_pool = SqlLineageParserPool()
+            atexit.register(_sql_lineage_parser_pool.close)
+        return _sql_lineage_parser_pool
 
 
 class SqlLineageSQLParser(SQLParser):
@@ -118,23 +340,11 @@ class SqlLineageSQLParser(SQLParser):
     def _get_tables_columns_process_wrapped(
         sql_query: str,
     ) -> Tuple[List[str], List[str]]:
-        # Invoke sql_lineage_parser_impl_func_wrapper in a separate process to avoid
-        # memory leaks from sqllineage module used by SqlLineageSQLParserImpl. This will help
-        # shield our sources like lookml & redash, that need to parse a large number of SQL statements,
-        # from causing significant memory leaks in the datahub cli during ingestion.
-        queue: multiprocessing.Queue = Queue()
-        process: multiprocessing.Process = Process(
-            target=sql_lineage_parser_impl_func_wrapper,
-            args=(
-                queue,
-                sql_query,
-            ),
-        )
-        process.start()
-        tables, columns, exception_details = queue.get(block=True)
-        if exception_details is not None:
-            raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
-        return tables, columns
+        # Run SqlLineageSQLParserImpl in a pooled worker process to avoid memory leaks from
+        # the sqllineage module. This will help shield our sources like lookml & redash, that
+        # need to parse a large number of SQL statements, from causing significant memory leaks
+        # in the datahub cli during ingestion.
+        return get_sql_lineage_parser_pool().parse(sql_query)
 
     def get_tables(self) -> List[str]:
         return self.tables
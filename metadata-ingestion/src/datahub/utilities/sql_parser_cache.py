@@ -0,0 +1,263 @@
+import collections
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple, Type
+
+import datahub
+from datahub.ingestion.api.report import Report
+from datahub.utilities.sql_parser import SQLParser
+
+logger = logging.getLogger(__name__)
+
+# Quoted literals and identifiers, which are kept verbatim, line comments, whose line
+# break is kept, and other whitespace.
+_SQL_WHITESPACE_RE = re.compile(
+    r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*"|`[^`]*`)|(--[^\n]*)\s*|\s+"""
+)
+
+# Distributions whose version changes what the parsers return.
+_PARSER_DISTRIBUTIONS = ["sqllineage", "sql-metadata", "sqlparse"]
+
+
+def _normalize_whitespace(match: "re.Match[str]") -> str:
+    literal, comment = match.groups()
+    if literal is not None:
+        return literal
+    if comment is not None:
+        return f"{comment}\n"
+    return " "
+
+
+def _normalize_sql_query(sql_query: str) -> str:
+    # Templated queries mostly differ in indentation and line breaks, so collapsing
+    # whitespace lets them share an entry without changing what the parsers see.
+    return _SQL_WHITESPACE_RE.sub(_normalize_whitespace, sql_query).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parsers_version() -> str:
+    versions = [f"acryl-datahub=={datahub.__version__}"]
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        # Python 3.7 lacks importlib.metadata. The datahub version pins the parsers.
+        return versions[0]
+
+    for distribution in _PARSER_DISTRIBUTIONS:
+        try:
+            versions.append(f"{distribution}=={version(distribution)}")
+        except PackageNotFoundError:
+            pass
+    return ",".join(versions)
+
+
+@dataclass
+class SQLParseCacheReport(Report):
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+
+
+class SQLParseCache:
+    """
+    A content-addressed cache of SQLParser results.
+
+    Entries are keyed by the parser class and version, the kind of result (tables or columns)
+    and a hash of the query, with whitespace outside of quoted literals normalized. The version
+    covers datahub and the parsing libraries, so that a parser upgrade invalidates the entries. They are held in an in-memory LRU and, when a path is
+    given, in a SQLite database so that they survive across sources and ingestion runs. Failed
+    parses are not cached.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10_000
+    DEFAULT_MAX_DISK_ENTRIES = 1_000_000
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: Optional[str] = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.report = SQLParseCacheReport()
+        self._entries: "collections.OrderedDict[str, List[str]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_inserts_since_eviction = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            # The cache can always be rebuilt, so trade durability for cheap commits.
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sql_parse_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS sql_parse_cache_last_used "
+                "ON sql_parse_cache (last_used)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _make_key(parser_cls: Type[SQLParser], kind: str, sql_query: str) -> str:
+        query_hash = hashlib.sha256(
+            _normalize_sql_query(sql_query).encode("utf-8")
+        ).hexdigest()
+        return f"{parser_cls.__module__}.{parser_cls.__qualname__}@{_get_parsers_version()}:{kind}:{query_hash}"
+
+    def get_tables(self, parser_cls: Type[SQLParser], sql_query: str) -> List[str]:
+        return self._get_or_parse(
+            parser_cls, "tables", sql_query, lambda parser: parser.get_tables()
+        )
+
+    def get_columns(self, parser_cls: Type[SQLParser], sql_query: str) -> List[str]:
+        return self._get_or_parse(
+            parser_cls, "columns", sql_query, lambda parser: parser.get_columns()
+        )
+
+    def get_tables_and_columns(
+        self, parser_cls: Type[SQLParser], sql_query: str
+    ) -> Tuple[List[str], List[str]]:
+        tables_key = self._make_key(parser_cls, "tables", sql_query)
+        columns_key = self._make_key(parser_cls, "columns", sql_query)
+        tables = self._get(tables_key)
+        columns = self._get(columns_key)
+        if tables is None or columns is None:
+            # Parse once for both kinds of results.
+            parser = parser_cls(sql_query)
+            if tables is None:
+                tables = parser.get_tables()
+                self._put(tables_key, tables)
+            if columns is None:
+                columns = parser.get_columns()
+                self._put(columns_key, columns)
+        return list(tables), list(columns)
+
+    def _get_or_parse(
+        self,
+        parser_cls: Type[SQLParser],
+        kind: str,
+        sql_query: str,
+        extract: Callable[[SQLParser], List[str]],
+    ) -> List[str]:
+        key = self._make_key(parser_cls, kind, sql_query)
+        value = self._get(key)
+        if value is None:
+            value = extract(parser_cls(sql_query))
+            self._put(key, value)
+        # Callers are free to mutate the returned list.
+        return list(value)
+
+    def _get(self, key: str) -> Optional[List[str]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.report.hits += 1
+                return value
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM sql_parse_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE sql_parse_cache SET last_used = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                    self._db.commit()
+                    value = json.loads(row[0])
+                    self._put_in_memory(key, value)
+                    self.report.disk_hits += 1
+                    return value
+
+            self.report.misses += 1
+            return None
+
+    def _put(self, key: str, value: List[str]) -> None:
+        with self._lock:
+            self._put_in_memory(key, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sql_parse_cache (key, value, last_used) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+                self._db.commit()
+                self._disk_inserts_since_eviction += 1
+                # Counting rows is not free, so only check the size bound periodically.
+                if self._disk_inserts_since_eviction >= max(
+                    1, self.max_disk_entries // 100
+                ):
+                    self._evict_from_disk()
+
+    def _put_in_memory(self, key: str, value: List[str]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.report.evictions += 1
+
+    def _evict_from_disk(self) -> None:
+        assert self._db is not None
+        self._disk_inserts_since_eviction = 0
+        (count,) = self._db.execute("SELECT COUNT(*) FROM sql_parse_cache").fetchone()
+        excess = count - self.max_disk_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM sql_parse_cache WHERE key IN "
+                "(SELECT key FROM sql_parse_cache ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self._db.commit()
+            self.report.disk_evictions += excess
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_sql_parse_cache: Optional[SQLParseCache] = None
+_sql_parse_cache_lock = threading.Lock()
+
+
+def get_sql_parse_cache() -> SQLParseCache:
+    """
+    Returns the SQLParseCache shared by all sources in this process. Setting the
+    DATAHUB_SQL_PARSE_CACHE_PATH environment variable enables the on-disk tier, which lets
+    parse results be reused across ingestion runs.
+    """
+    global _sql_parse_cache
+    with _sql_parse_cache_lock:
+        if _sql_parse_cache is None:
+            _sql_parse_cache = SQLParseCache(
+                max_entries=int(
+                    os.getenv(
+                        "DATAHUB_SQL_PARSE_CACHE_MAX_ENTRIES",
+                        str(SQLParseCache.DEFAULT_MAX_ENTRIES),
+                    )
+                ),
+                path=os.getenv("DATAHUB_SQL_PARSE_CACHE_PATH"),
+                max_disk_entries=int(
+                    os.getenv(
+                        "DATAHUB_SQL_PARSE_CACHE_MAX_DISK_ENTRIES",
+                        str(SQLParseCache.DEFAULT_MAX_DISK_ENTRIES),
+                    )
+                ),
+            )
+        return _sql_parse_cache
@@ -1,11 +1,21 @@
 import json
 import logging
 import os
+from typing import Any, Dict, List, cast
+from unittest.mock import patch
 
+import pyarrow as pa
 import pytest
+from deltalake.writer import write_deltalake
 
+from datahub.emitter.mce_builder import make_dataset_urn
 from datahub.ingestion.run.pipeline import Pipeline
+from datahub.ingestion.source.delta_lake.source import DeltaLakeSource
 from tests.test_helpers import mce_helpers
+from tests.test_helpers.state_helpers import (
+    run_and_get_pipeline,
+    validate_all_providers_have_committed_successfully,
+)
 
 FROZEN_TIME = "2020-04-14 07:00:00"
 
@@ -48,6 +58,34 @@ def test_delta_lake(pytestconfig, source_file, tmp_path, mock_time):
     )
 
 
+def test_delta_lake_max_threads(pytestconfig, tmp_path, mock_time):
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/delta_lake"
+
+    with open(os.path.join(SOURCE_FILES_PATH, "inner_table.json")) as f:
+        source = json.load(f)
+    source["config"]["max_threads"] = 4
+
+    pipeline = Pipeline.create(
+        {
+            "run_id": "inner_table.json",
+            "source": source,
+            "sink": {
+                "type": "file",
+                "config": {"filename": f"{tmp_path}/inner_table.json"},
+            },
+        }
+    )
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    # Tables are loaded concurrently, but emitted in the same order.
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=f"{tmp_path}/inner_table.json",
+        golden_path=f"{test_resources_dir}/golden_files/local/golden_mces_inner_table.json",
+    )
+
+
 def test_data_lake_incorrect_config_raises_error(tmp_path, mock_time):
     config_dict = {}
     config_dict["sink"] = {
@@ -71,3 +109,80 @@ def test_data_lake_incorrect_config_raises_error(tmp_path, mock_time):
         pipeline.raise_from_status()
 
     logging.debug(e_info)
+
+
+def _get_emitted_aspects(output_path: str) -> Dict[str, List[Any]]:
+    """Returns the urns of the ingested datasets and the operations emitted."""
+    with open(output_path) as f:
+        records = json.load(f)
+    return {
+        "datasets": [
+            record["proposedSnapshot"][
+                "com.linkedin.pegasus2avro.metadata.snapshot.DatasetSnapshot"
+            ]["urn"]
+            for record in records
+            if "proposedSnapshot" in record
+        ],
+        "operations": [
+            (record["entityUrn"], json.loads(record["aspect"]["value"]))
+            for record in records
+            if record.get("aspectName") == "operation"
+        ],
+    }
+
+
+def test_delta_lake_stateful(tmp_path, mock_datahub_graph):
+    base_path = f"{tmp_path}/tables"
+    output_path = f"{tmp_path}/mces.json"
+    pipeline_config_dict: Dict[str, Any] = {
+        "source": {
+            "type": "delta-lake",
+            "config": {
+                "base_path": base_path,
+                "version_history_lookback": -1,
+                "stateful_ingestion": {
+                    "enabled": True,
+                    "state_provider": {
+                        "type": "datahub",
+                        "config": {"datahub_api": {"server": "http://localhost:8080"}},
+                    },
+                },
+            },
+        },
+        "sink": {"type": "file", "config": {"filename": output_path}},
+        "pipeline_name": "statefulpipeline",
+    }
+    table_a = make_dataset_urn("delta-lake", f"{base_path}/table_a".strip("/"))
+    table_b = make_dataset_urn("delta-lake", f"{base_path}/table_b".strip("/"))
+
+    with patch(
+        "datahub.ingestion.source.state_provider.datahub_ingestion_checkpointing_provider.DataHubGraph",
+        mock_datahub_graph,
+    ) as mock_checkpoint:
+        mock_checkpoint.return_value = mock_datahub_graph
+
+        write_deltalake(f"{base_path}/table_a", pa.table({"id": [1]}))
+        write_deltalake(f"{base_path}/table_b", pa.table({"id": [1]}))
+        run_and_get_pipeline(pipeline_config_dict)
+        emitted = _get_emitted_aspects(output_path)
+        assert sorted(emitted["datasets"]) == [table_a, table_b]
+        assert sorted(urn for urn, _ in emitted["operations"]) == [table_a, table_b]
+
+        # table_a is left at version 0, table_b is overwritten to version 1
+        write_deltalake(f"{base_path}/table_b", pa.table({"id": [2]}), mode="overwrite")
+        pipeline_run2 = run_and_get_pipeline(pipeline_config_dict)
+        emitted = _get_emitted_aspects(output_path)
+        assert emitted["datasets"] == [table_b]
+        assert (
+            cast(DeltaLakeSource, pipeline_run2.source).report.tables_skipped_unchanged
+            == 1
+        )
+        # only the history entry of the new version is emitted
+        assert [
+            (urn, operation["customProperties"]["operationParameters_mode"])
+            for urn, operation in emitted["operations"]
+        ] == [(table_b, "Overwrite")]
+
+        validate_all_providers_have_committed_successfully(
+            pipeline=pipeline_run2, expected_providers=1
+        )
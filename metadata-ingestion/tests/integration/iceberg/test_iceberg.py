@@ -1,5 +1,6 @@
+import json
 from pathlib import PosixPath
-from typing import Union
+from typing import Any, Dict, List, Union, cast
 from unittest.mock import patch
 
 import pytest
@@ -7,11 +8,72 @@ from freezegun import freeze_time
 from iceberg.core.filesystem.file_status import FileStatus
 from iceberg.core.filesystem.local_filesystem import LocalFileSystem
 
+from datahub.emitter.mce_builder import make_dataset_urn
 from datahub.ingestion.run.pipeline import Pipeline
+from datahub.ingestion.source.iceberg.iceberg import IcebergSource
 from tests.test_helpers import mce_helpers
+from tests.test_helpers.state_helpers import (
+    run_and_get_pipeline,
+    validate_all_providers_have_committed_successfully,
+)
 
 FROZEN_TIME = "2020-04-14 07:00:00"
 
+PROFILING_TABLE_METADATA_FILE = (
+    "00002-cc241948-4c12-46d0-9a75-ce3578ec03d4.metadata.json"
+)
+
+
+class LocalFileSystemWrapper(LocalFileSystem):
+    # This class acts as a wrapper on LocalFileSystem to intercept calls using a path location.
+    # The wrapper will normalize those paths to be usable by the test.
+    fs: LocalFileSystem
+
+    def __init__(
+        self,
+        fs: LocalFileSystem,
+        test_resources_dir: PosixPath,
+        metadata_file: str = PROFILING_TABLE_METADATA_FILE,
+    ) -> None:
+        self.fs = fs
+        self.test_resources_dir = test_resources_dir
+        self.metadata_file = metadata_file
+
+    def _replace_path(self, path: Union[str, PosixPath]) -> str:
+        # When the Iceberg table was created, its warehouse folder was '/home/iceberg/warehouse'.  Iceberg tables
+        # are not portable, so we need to replace the warehouse folder by the test location at runtime.
+        normalized_path: str = str(path).replace(
+            "/home/iceberg/warehouse", str(self.test_resources_dir)
+        )
+
+        # When the Iceberg table was created, a postgres catalog was used instead of a HadoopCatalog.  The HadoopCatalog
+        # expects a file named 'v{}.metadata.json' where {} is the version number from 'version-hint.text'.  Since
+        # 'v2.metadata.json' does not exist, we will redirect the call to the metadata file of the table version under test.
+        if normalized_path.endswith("v2.metadata.json"):
+            return normalized_path.replace("v2.metadata.json", self.metadata_file)
+        return normalized_path
+
+    def open(self, path: str, mode: str = "rb") -> object:
+        return self.fs.open(self._replace_path(path), mode)
+
+    def delete(self, path: str) -> None:
+        self.fs.delete(self._replace_path(path))
+
+    def stat(self, path: str) -> FileStatus:
+        return self.fs.stat(self._replace_path(path))
+
+    def fix_path(self, path: str) -> str:
+        return self.fs.fix_path(self._replace_path(path))
+
+    def create(self, path: str, overwrite: bool = False) -> object:
+        return self.fs.create(self._replace_path(path), overwrite)
+
+    def rename(self, src: str, dest: str) -> bool:
+        return self.fs.rename(self._replace_path(src), self._replace_path(dest))
+
+    def exists(self, path: str) -> bool:
+        return self.fs.exists(self._replace_path(path))
+
 
 @freeze_time(FROZEN_TIME)
 @pytest.mark.integration
@@ -67,7 +129,7 @@ def test_iceberg_profiling(pytestconfig, tmp_path, mock_time):
     ```
 
     When importing the metadata files into this test, we need to create a `version-hint.text` with a value that
-    reflects the version of the table, and then change the code in `TestLocalFileSystem._replace_path()` accordingly.
+    reflects the version of the table, and then change the code in `LocalFileSystemWrapper._replace_path()` accordingly.
     """
     test_resources_dir = pytestconfig.rootpath / "tests/integration/iceberg/test_data"
 
@@ -97,61 +159,8 @@ def test_iceberg_profiling(pytestconfig, tmp_path, mock_time):
         }
     )
 
-    class TestLocalFileSystem(LocalFileSystem):
-        # This class acts as a wrapper on LocalFileSystem to intercept calls using a path location.
-        # The wrapper will normalize those paths to be usable by the test.
-        fs: LocalFileSystem
-
-        @staticmethod
-        def _replace_path(path: Union[str, PosixPath]) -> str:
-            # When the Iceberg table was created, its warehouse folder was '/home/iceberg/warehouse'.  Iceberg tables
-            # are not portable, so we need to replace the warehouse folder by the test location at runtime.
-            normalized_path: str = str(path).replace(
-                "/home/iceberg/warehouse", str(test_resources_dir)
-            )
-
-            # When the Iceberg table was created, a postgres catalog was used instead of a HadoopCatalog.  The HadoopCatalog
-            # expects a file named 'v{}.metadata.json' where {} is the version number from 'version-hint.text'.  Since
-            # 'v2.metadata.json' does not exist, we will redirect the call to '00002-02782173-8364-4caf-a3c4-9567c1d6608f.metadata.json'.
-            if normalized_path.endswith("v2.metadata.json"):
-                return normalized_path.replace(
-                    "v2.metadata.json",
-                    "00002-cc241948-4c12-46d0-9a75-ce3578ec03d4.metadata.json",
-                )
-            return normalized_path
-
-        def __init__(self, fs: LocalFileSystem) -> None:
-            self.fs = fs
-
-        def open(self, path: str, mode: str = "rb") -> object:
-            return self.fs.open(TestLocalFileSystem._replace_path(path), mode)
-
-        def delete(self, path: str) -> None:
-            self.fs.delete(TestLocalFileSystem._replace_path(path))
-
-        def stat(self, path: str) -> FileStatus:
-            return self.fs.stat(TestLocalFileSystem._replace_path(path))
-
-        @staticmethod
-        def fix_path(path: str) -> str:
-            return TestLocalFileSystem.fs.fix_path(
-                TestLocalFileSystem._replace_path(path)
-            )
-
-        def create(self, path: str, overwrite: bool = False) -> object:
-            return self.fs.create(TestLocalFileSystem._replace_path(path), overwrite)
-
-        def rename(self, src: str, dest: str) -> bool:
-            return self.fs.rename(
-                TestLocalFileSystem._replace_path(src),
-                TestLocalFileSystem._replace_path(dest),
-            )
-
-        def exists(self, path: str) -> bool:
-            return self.fs.exists(TestLocalFileSystem._replace_path(path))
-
-    local_fs_wrapper: TestLocalFileSystem = TestLocalFileSystem(
-        LocalFileSystem.get_instance()
+    local_fs_wrapper = LocalFileSystemWrapper(
+        LocalFileSystem.get_instance(), test_resources_dir
     )
     with patch.object(LocalFileSystem, "get_instance", return_value=local_fs_wrapper):
         pipeline.run()
@@ -164,3 +173,75 @@ def test_iceberg_profiling(pytestconfig, tmp_path, mock_time):
         golden_path=test_resources_dir
         / "datahub/integration/profiling/iceberg_mces_golden.json",
     )
+
+
+def _get_profiled_urns(output_path: PosixPath) -> List[str]:
+    with open(output_path) as f:
+        return [
+            record["entityUrn"]
+            for record in json.load(f)
+            if record.get("aspectName") == "datasetProfile"
+        ]
+
+
+@pytest.mark.integration
+def test_iceberg_stateful_profiling(pytestconfig, tmp_path, mock_datahub_graph):
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/iceberg/test_data"
+    output_path = tmp_path / "iceberg_mces.json"
+    pipeline_config_dict: Dict[str, Any] = {
+        "source": {
+            "type": "iceberg",
+            "config": {
+                "localfs": str(test_resources_dir),
+                "max_path_depth": 3,
+                "profiling": {"enabled": True},
+                "table_pattern": {"allow": ["datahub.integration.profiling"]},
+                "stateful_ingestion": {
+                    "enabled": True,
+                    "state_provider": {
+                        "type": "datahub",
+                        "config": {"datahub_api": {"server": "http://localhost:8080"}},
+                    },
+                },
+            },
+        },
+        "sink": {"type": "file", "config": {"filename": str(output_path)}},
+        "pipeline_name": "statefulpipeline",
+    }
+    table_urn = make_dataset_urn("iceberg", "datahub.integration.profiling")
+
+    def run_at_version(metadata_file: str) -> IcebergSource:
+        local_fs_wrapper = LocalFileSystemWrapper(
+            LocalFileSystem.get_instance(), test_resources_dir, metadata_file
+        )
+        with patch.object(
+            LocalFileSystem, "get_instance", return_value=local_fs_wrapper
+        ):
+            pipeline = run_and_get_pipeline(pipeline_config_dict)
+        validate_all_providers_have_committed_successfully(
+            pipeline=pipeline, expected_providers=1
+        )
+        return cast(IcebergSource, pipeline.source)
+
+    with patch(
+        "datahub.ingestion.source.state_provider.datahub_ingestion_checkpointing_provider.DataHubGraph",
+        mock_datahub_graph,
+    ) as mock_checkpoint:
+        mock_checkpoint.return_value = mock_datahub_graph
+
+        # the table after its first insert
+        first_snapshot_metadata_file = (
+            "00001-fb50681e-5f25-4180-99e2-065ef0b9791b.metadata.json"
+        )
+        source = run_at_version(first_snapshot_metadata_file)
+        assert _get_profiled_urns(output_path) == [table_urn]
+
+        # the snapshot is the same, so the profile would be too
+        source = run_at_version(first_snapshot_metadata_file)
+        assert _get_profiled_urns(output_path) == []
+        assert source.report.profiles_skipped_unchanged == 1
+
+        # the table after its second insert
+        source = run_at_version(PROFILING_TABLE_METADATA_FILE)
+        assert _get_profiled_urns(output_path) == [table_urn]
+        assert source.report.profiles_skipped_unchanged == 0
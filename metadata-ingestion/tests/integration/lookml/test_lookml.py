@@ -101,6 +101,59 @@ def test_lookml_ingest_offline(pytestconfig, tmp_path, mock_time):
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_lookml_ingest_offline_with_parse_cache(pytestconfig, tmp_path, mock_time):
+    """Parsing in parallel and reusing parsed files from a previous run gives the same output"""
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/lookml"
+    mce_out = "lookml_mces_offline.json"
+    for run in range(2):
+        pipeline = Pipeline.create(
+            {
+                "run_id": "lookml-test",
+                "source": {
+                    "type": "lookml",
+                    "config": {
+                        "base_folder": str(test_resources_dir / "lkml_samples"),
+                        "connection_to_platform_map": {
+                            "my_connection": {
+                                "platform": "snowflake",
+                                "default_db": "default_db",
+                                "default_schema": "default_schema",
+                            }
+                        },
+                        "parse_table_names_from_sql": True,
+                        "project_name": "lkml_samples",
+                        "model_pattern": {"deny": ["data2"]},
+                        "parse_workers": 2,
+                        "parse_cache_path": str(tmp_path / "lookml_parse_cache.db"),
+                    },
+                },
+                "sink": {
+                    "type": "file",
+                    "config": {
+                        "filename": f"{tmp_path}/{mce_out}",
+                    },
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.pretty_print_summary()
+        pipeline.raise_from_status(raise_warnings=True)
+
+        mce_helpers.check_golden_file(
+            pytestconfig,
+            output_path=tmp_path / mce_out,
+            golden_path=test_resources_dir / mce_out,
+        )
+        parse_cache_report = pipeline.source.get_report().lookml_parse_cache
+        assert parse_cache_report.misses == 0
+        if run == 0:
+            assert parse_cache_report.files_parsed_in_parallel > 0
+        else:
+            assert parse_cache_report.files_parsed_in_parallel == 0
+            assert parse_cache_report.disk_hits > 0
+
+
 @freeze_time(FROZEN_TIME)
 def test_lookml_ingest_offline_with_model_deny(pytestconfig, tmp_path, mock_time):
     """New form of config with offline specification of connection defaults"""
@@ -1,8 +1,13 @@
+import json
 from unittest import mock
+from urllib.parse import parse_qs
 
+import pydantic
+import pytest
 from freezegun import freeze_time
 
 from datahub.ingestion.run.pipeline import Pipeline
+from datahub.ingestion.source.powerbi import PowerBiDashboardSourceConfig
 from tests.test_helpers import mce_helpers
 
 FROZEN_TIME = "2022-02-03 07:00:00"
@@ -238,3 +243,128 @@ def test_override_ownership(
         output_path=tmp_path / "powerbi_mces_disabled_ownership.json",
         golden_path=f"{test_resources_dir}/{mce_out_file}",
     )
+
+
+def register_mock_workspace_api(request_mock):
+    """Register a second workspace, whose tiles are created from the same report."""
+    workspace_url = (
+        "https://api.powerbi.com/v1.0/myorg/groups/A8D655A6-F521-477E-8C22-255018583BF4"
+    )
+    api_vs_response = {
+        f"{workspace_url}/dashboards": {
+            "value": [
+                {
+                    "id": "8AB4C8F4-5C34-4BB1-9A27-6B6F1D5A3E42",
+                    "isReadOnly": True,
+                    "displayName": "sales_dashboard",
+                    "embedUrl": "https://localhost/dashboards/embed/2",
+                    "webUrl": "https://localhost/dashboards/web/2",
+                }
+            ]
+        },
+        "https://api.powerbi.com/v1.0/myorg/admin/dashboards/8AB4C8F4-5C34-4BB1-9A27-6B6F1D5A3E42/users": {
+            "value": []
+        },
+        f"{workspace_url}/dashboards/8AB4C8F4-5C34-4BB1-9A27-6B6F1D5A3E42/tiles": {
+            "value": [
+                {
+                    "id": f"2D9C4A1E-7B3F-4C8E-9A5D-1F6E8B7C3A2{i}",
+                    "title": f"sales_tile_{i}",
+                    "embedUrl": f"https://localhost/tiles/embed/2{i}",
+                    "reportId": "5B218778-E7A5-4D73-8187-F10824047715",
+                }
+                for i in range(3)
+            ]
+        },
+        f"{workspace_url}/reports/5B218778-E7A5-4D73-8187-F10824047715": {
+            "id": "5B218778-E7A5-4D73-8187-F10824047715",
+            "name": "sales_report",
+            "webUrl": "https://localhost/reports/web/1",
+            "embedUrl": "https://localhost/reports/embed/1",
+        },
+        "https://api.powerbi.com/v1.0/myorg/admin/workspaces/scanStatus/9b3a6f4c-2d8e-4e1a-b5c7-0f9d8e7a6b5c": {
+            "status": "SUCCEEDED",
+        },
+        "https://api.powerbi.com/v1.0/myorg/admin/workspaces/scanResult/9b3a6f4c-2d8e-4e1a-b5c7-0f9d8e7a6b5c": {
+            "workspaces": [
+                {
+                    "id": "A8D655A6-F521-477E-8C22-255018583BF4",
+                    "name": "sales-workspace",
+                    "state": "Active",
+                    "datasets": [],
+                },
+            ]
+        },
+    }
+    for url, response in api_vs_response.items():
+        request_mock.register_uri("GET", url, json=response)
+
+    scan_ids = {
+        "64ED5CAD-7C10-4684-8180-826122881108": "4674efd1-603c-4129-8d82-03cf2be05aff",
+        "A8D655A6-F521-477E-8C22-255018583BF4": "9b3a6f4c-2d8e-4e1a-b5c7-0f9d8e7a6b5c",
+    }
+    request_mock.register_uri(
+        "POST",
+        "https://api.powerbi.com/v1.0/myorg/admin/workspaces/getInfo",
+        json=lambda request, context: {
+            "id": scan_ids[parse_qs(request.text)["workspaces"][0]]
+        },
+    )
+
+
+@freeze_time(FROZEN_TIME)
+@mock.patch("msal.ConfidentialClientApplication", side_effect=mock_msal_cca)
+def test_powerbi_ingest_workspaces_concurrently(
+    mock_msal, pytestconfig, tmp_path, mock_time, requests_mock
+):
+    register_mock_api(request_mock=requests_mock)
+    register_mock_workspace_api(request_mock=requests_mock)
+
+    pipeline = Pipeline.create(
+        {
+            "run_id": "powerbi-test",
+            "source": {
+                "type": "powerbi",
+                "config": {
+                    **default_source_config(),
+                    "workspace_ids": ["A8D655A6-F521-477E-8C22-255018583BF4"],
+                    "max_threads": 2,
+                },
+            },
+            "sink": {
+                "type": "file",
+                "config": {
+                    "filename": f"{tmp_path}/powerbi_mces_workspaces.json",
+                },
+            },
+        }
+    )
+
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    # the source authenticates with the client it queries with
+    assert mock_msal.call_count == 1
+    report = pipeline.source.get_report()
+    assert report.workspaces_scanned == 2
+    assert report.dashboards_scanned == 2
+    assert report.charts_scanned == 4
+    # The report of the tiles is fetched once
+    assert report.http_requests["REPORT_GET"] == 1
+    assert report.http_requests["SCAN_CREATE"] == 2
+
+    with open(tmp_path / "powerbi_mces_workspaces.json") as f:
+        dashboard_urns = {
+            mcp["entityUrn"] for mcp in json.load(f) if mcp["entityType"] == "dashboard"
+        }
+    assert dashboard_urns == {
+        "urn:li:dashboard:(powerbi,dashboards.7D668CAD-7FFC-4505-9215-655BCA5BEBAE)",
+        "urn:li:dashboard:(powerbi,dashboards.8AB4C8F4-5C34-4BB1-9A27-6B6F1D5A3E42)",
+    }
+
+
+def test_powerbi_config_rejects_no_threads():
+    with pytest.raises(pydantic.ValidationError, match="max_threads"):
+        PowerBiDashboardSourceConfig.parse_obj(
+            {**default_source_config(), "max_threads": 0}
+        )
@@ -30,13 +30,15 @@ def side_effect_query_metadata(query):
     if "publishedDatasourcesConnection (first:0" in query:
         return _read_response("publishedDatasourcesConnection_0.json")
 
-    if "publishedDatasourcesConnection (first:2" in query:
+    # Nodes looked up by ID are requested in pages of up to page_size IDs.
+    if "publishedDatasourcesConnection (first:" in query:
         return _read_response("publishedDatasourcesConnection_all.json")
 
     if "customSQLTablesConnection (first:0" in query:
         return _read_response("customSQLTablesConnection_0.json")
 
-    if "customSQLTablesConnection (first:2" in query:
+    # Nodes looked up by ID are requested in pages of up to page_size IDs.
+    if "customSQLTablesConnection (first:" in query:
         return _read_response("customSQLTablesConnection_all.json")
 
 
@@ -49,7 +51,7 @@ def test_tableau_ingest(pytestconfig, tmp_path):
         pytestconfig.rootpath / "tests/integration/tableau"
     )
 
-    with mock.patch("tableauserverclient.Server") as mock_sdk:
+    with mock.patch("datahub.ingestion.source.tableau.Server") as mock_sdk:
         mock_client = mock.Mock()
         mocked_metadata = mock.Mock()
         mocked_metadata.query.side_effect = side_effect_query_metadata
@@ -57,6 +59,7 @@ def test_tableau_ingest(pytestconfig, tmp_path):
         mock_client.auth = mock.Mock()
         mock_client.auth.sign_in.return_value = None
         mock_client.auth.sign_out.return_value = None
+        mock_client.session.hooks = {"response": []}
         mock_sdk.return_value = mock_client
         mock_sdk._auth_token = "ABC"
 
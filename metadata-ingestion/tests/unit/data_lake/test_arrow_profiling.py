@@ -0,0 +1,105 @@
+import datetime
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+
+from datahub.ingestion.source.s3 import arrow_profiling
+from datahub.ingestion.source.s3.arrow_profiling import _ArrowTableProfiler
+from datahub.ingestion.source.s3.profiling import DataLakeProfilerConfig
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+
+
+def _profile(table: pa.Table, **config):
+    profiler = _ArrowTableProfiler(
+        ds.dataset(table),
+        DataLakeProfilerConfig(enabled=True, engine="arrow", **config),
+        DataLakeSourceReport(),
+        "test.parquet",
+    )
+    profiler.scan()
+    profiler.extract_table_profiles()
+    return profiler.profile
+
+
+def test_arrow_profiler():
+    n = 1000
+    table = pa.table(
+        {
+            "number": pa.array([float(i % 500) if i % 10 else None for i in range(n)]),
+            "category": pa.array([f"c{i % 3}" for i in range(n)]),
+            "day": pa.array([datetime.date(2022, 1, 1 + i % 2) for i in range(n)]),
+        }
+    )
+
+    profile = _profile(table)
+    assert profile.rowCount == n
+    assert profile.columnCount == 3
+    assert profile.fieldProfiles is not None
+    number, category, day = profile.fieldProfiles
+
+    assert number.nullCount == 100
+    assert number.uniqueCount == 450
+    assert number.min == "1.0"
+    assert number.max == "499.0"
+    assert float(number.mean) == pytest.approx(250.0)
+    assert number.quantiles is not None
+    assert len(number.sampleValues) == arrow_profiling.NUM_SAMPLE_ROWS
+
+    assert category.nullCount == 0
+    assert category.uniqueCount == 3
+    assert [(f.value, f.frequency) for f in category.distinctValueFrequencies] == [
+        ("c0", 334),
+        ("c1", 333),
+        ("c2", 333),
+    ]
+
+    assert day.min == "2022-01-01"
+    assert day.max == "2022-01-02"
+
+
+def test_arrow_profiler_max_rows_to_profile():
+    table = pa.table({"number": pa.array([i % 80 for i in range(1000)])})
+
+    profile = _profile(table, max_rows_to_profile=200)
+    # the row count is of the whole table, other metrics of the profiled rows only
+    assert profile.rowCount == 1000
+    assert profile.fieldProfiles is not None
+    assert profile.fieldProfiles[0].uniqueCount == 80
+    assert profile.fieldProfiles[0].max == "79"
+
+
+@pytest.mark.parametrize(
+    "type_,offset", [(pa.int64(), -(2**60)), (pa.uint64(), 2**63)]
+)
+def test_arrow_profiler_large_integers(type_, offset):
+    # beyond 2**53, so not every value has an exact float64 representation; every
+    # value appears twice, so the column isn't unique and gets numeric stats
+    table = pa.table({"id": pa.array([offset + i // 2 for i in range(2000)], type_)})
+
+    profile = _profile(table)
+    assert profile.fieldProfiles is not None
+    [id_profile] = profile.fieldProfiles
+    assert id_profile.uniqueCount == 1000
+    assert id_profile.min == str(offset)
+    assert id_profile.max == str(offset + 999)
+    assert float(id_profile.mean) == pytest.approx(offset + 499.5)
+
+
+def test_arrow_profiler_estimates_many_distinct_values(monkeypatch):
+    monkeypatch.setattr(arrow_profiling, "MAX_EXACT_DISTINCT_VALUES", 1000)
+    table = pa.table({"number": pa.array([i % 25000 for i in range(50000)])})
+
+    profile = _profile(table)
+    assert profile.fieldProfiles is not None
+    assert profile.fieldProfiles[0].uniqueCount == pytest.approx(25000, rel=0.05)
+    assert profile.fieldProfiles[0].mean == "12499.5"
+
+
+def test_distinct_values_sketch():
+    sketch = arrow_profiling._DistinctValuesSketch(1024)
+    sketch.add([-1, -2, "a", "a"])
+    assert sketch.estimate() == 3
+
+    sketch.add(range(100000))
+    assert sketch.estimate() == pytest.approx(100003, rel=0.1)
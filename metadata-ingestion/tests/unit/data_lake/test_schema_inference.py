@@ -88,6 +88,67 @@ def test_infer_schema_json():
         assert_field_types_match(fields, expected_field_types)
 
 
+def test_infer_schema_json_lines():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(
+            bytes(test_table.to_json(orient="records", lines=True), encoding="utf-8")
+        )
+        file.seek(0)
+
+        fields = json.JsonInferrer().infer_schema(file)
+        fields.sort(key=lambda x: x.fieldPath)
+
+        assert_field_paths_match(fields, expected_field_paths)
+        assert_field_types_match(fields, expected_field_types)
+
+
+def test_infer_schema_json_sampling():
+    records = [
+        {"id": 1, "nested": {"a": "x", "b": 1.5}},
+        {"id": 2, "nested": {"a": "y"}},
+        {"id": 3, "extra": True},
+    ]
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(bytes(ujson.dumps(records), encoding="utf-8"))
+
+        file.seek(0)
+        fields = json.JsonInferrer(max_rows=1).infer_schema(file)
+        assert [(field.fieldPath, field.nullable) for field in fields] == [
+            ("id", False),
+            ("nested", False),
+            ("nested.a", False),
+            ("nested.b", False),
+        ]
+
+        file.seek(0)
+        fields = json.JsonInferrer(max_rows=2).infer_schema(file)
+        assert [(field.fieldPath, field.nullable) for field in fields] == [
+            ("id", False),
+            ("nested", False),
+            ("nested.a", False),
+            ("nested.b", True),
+        ]
+
+        file.seek(0)
+        fields = json.JsonInferrer(max_bytes=1).infer_schema(file)
+        assert [field.fieldPath for field in fields] == [
+            "id",
+            "nested",
+            "nested.a",
+            "nested.b",
+        ]
+
+        file.seek(0)
+        fields = json.JsonInferrer().infer_schema(file)
+        assert [(field.fieldPath, field.nullable) for field in fields] == [
+            ("extra", True),
+            ("id", False),
+            ("nested", True),
+            ("nested.a", True),
+            ("nested.b", True),
+        ]
+
+
 def test_infer_schema_parquet():
     with tempfile.TemporaryFile(mode="w+b") as file:
         test_table.to_parquet(file)
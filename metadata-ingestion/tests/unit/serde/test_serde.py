@@ -1,6 +1,9 @@
+import gzip
 import io
 import json
 import pathlib
+import shutil
+from typing import Any, List, Tuple
 from unittest.mock import patch
 
 import fastavro
@@ -11,14 +14,22 @@ from freezegun import freeze_time
 import datahub.metadata.schema_classes as models
 from datahub.cli.json_file import check_mce_file
 from datahub.emitter import mce_builder
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
+from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.run.pipeline import Pipeline
-from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
+from datahub.ingestion.source.file import (
+    FileSourceConfig,
+    FileSourceReport,
+    GenericFileSource,
+)
 from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     OwnershipClass,
     _Aspect,
 )
 from datahub.metadata.schemas import getMetadataChangeEventSchema
+from datahub.utilities.json_files import get_uncompressed_size
 from tests.test_helpers import mce_helpers
 from tests.test_helpers.click_helpers import run_datahub_cmd
 from tests.test_helpers.type_helpers import PytestConfig
@@ -76,6 +87,83 @@ def test_serde_to_json(
     )
 
 
+@freeze_time(FROZEN_TIME)
+@pytest.mark.parametrize(
+    "intermediate_filename",
+    ["intermediate.json.gz", "intermediate.jsonl", "intermediate.jsonl.gz"],
+)
+def test_serde_through_intermediate_file(
+    pytestconfig: PytestConfig, tmp_path: pathlib.Path, intermediate_filename: str
+) -> None:
+    golden_file = pytestconfig.rootpath / "tests/unit/serde/test_serde_large.json"
+    intermediate_file = tmp_path / intermediate_filename
+    output_file = tmp_path / "output.json"
+
+    for source_file, sink_file, read_mode in [
+        (golden_file, intermediate_file, "AUTO"),
+        (intermediate_file, output_file, "STREAM"),
+    ]:
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "file",
+                    "config": {"path": str(source_file), "read_mode": read_mode},
+                },
+                "sink": {"type": "file", "config": {"filename": str(sink_file)}},
+                "run_id": "serde_test",
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+    if intermediate_filename.endswith(".jsonl"):
+        with open(intermediate_file) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == len(mce_helpers.load_json_file(golden_file))  # type: ignore
+        assert all(json.loads(line) for line in lines)
+
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=output_file,
+        golden_path=golden_file,
+    )
+
+
+def test_file_source_parallel_deserialization(
+    pytestconfig: PytestConfig, tmp_path: pathlib.Path
+) -> None:
+    for json_filename in [
+        "test_serde_large.json",
+        "test_serde_chart_snapshot.json",
+        "test_serde_profile.json",
+    ]:
+        shutil.copy(
+            pytestconfig.rootpath / "tests/unit/serde" / json_filename, tmp_path
+        )
+    with open(tmp_path / "test_serde_invalid.json", "w") as f:
+        json.dump([{"proposedSnapshot": {"not": "valid"}}], f)
+
+    def read_workunits(**config: Any) -> Tuple[List[Any], FileSourceReport]:
+        source = GenericFileSource.create(
+            {"path": str(tmp_path), **config}, PipelineContext(run_id="serde_test")
+        )
+        try:
+            return [
+                (wu.id, wu.metadata.to_obj()) for wu in source.get_workunits()
+            ], source.get_report()
+        finally:
+            source.close()
+
+    sequential_workunits, sequential_report = read_workunits()
+    parallel_workunits, parallel_report = read_workunits(
+        deserialize_workers=2, deserialize_chunk_size=2
+    )
+    assert len(sequential_workunits) == 9
+    assert parallel_workunits == sequential_workunits
+    assert len(parallel_report.failures) == len(sequential_report.failures) == 1
+    assert parallel_report.num_files_completed == 4
+
+
 @pytest.mark.parametrize(
     "json_filename",
     [
@@ -218,3 +306,51 @@ def test_null_hiding() -> None:
         "recursive": False,
         "type": {"type": {"com.linkedin.pegasus2avro.schema.StringType": {}}},
     }
+
+
+def test_pre_json_transform_roundtrip() -> None:
+    schemaField = models.SchemaFieldClass(
+        fieldPath="foo",
+        type=models.SchemaFieldDataTypeClass(type=models.StringTypeClass()),
+        nativeDataType="VARCHAR(50)",
+        description=None,
+    )
+
+    transformed = pre_json_transform(schemaField.to_obj())
+    assert transformed["type"] == {"type": {"com.linkedin.schema.StringType": {}}}
+    assert "description" not in transformed
+
+    assert post_json_transform(transformed)["type"] == schemaField.to_obj()["type"]
+
+
+def test_mcpw_serialization_is_memoized() -> None:
+    mcpw = MetadataChangeProposalWrapper(
+        entityType="dataset",
+        changeType=models.ChangeTypeClass.UPSERT,
+        entityUrn=mce_builder.make_dataset_urn("hive", "foo"),
+        aspect=models.StatusClass(removed=False),
+    )
+    assert mcpw.validate()
+
+    with patch("datahub.emitter.mcp._make_generic_aspect") as make_generic_aspect:
+        mcpw.to_obj()
+        make_generic_aspect.assert_not_called()
+
+    # Reassigning the aspect must invalidate the memoized serialization.
+    mcpw.aspect = models.StatusClass(removed=True)
+    assert json.loads(mcpw.make_mcp().aspect.value) == {"removed": True}
+
+
+def test_get_uncompressed_size(tmp_path: pathlib.Path) -> None:
+    contents = b"[" + b", ".join(b"{}" for _ in range(1000)) + b"]"
+    plain_file = tmp_path / "records.json"
+    plain_file.write_bytes(contents)
+    compressed_file = tmp_path / "records.json.gz"
+    with gzip.open(compressed_file, "wb") as f:
+        f.write(contents)
+    assert compressed_file.stat().st_size < len(contents)
+
+    # The decision to stream a file is based on the size of its JSON contents.
+    assert get_uncompressed_size(str(plain_file), 10**6) == len(contents)
+    assert get_uncompressed_size(str(compressed_file), 10**6) == len(contents)
+    assert get_uncompressed_size(str(compressed_file), 100) == 100
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from typing import Dict
 
@@ -6,7 +7,15 @@ import pytest
 from datahub.emitter.mce_builder import make_dataset_urn
 from datahub.ingestion.source.sql.mysql import MySQLConfig
 from datahub.ingestion.source.sql.sql_common import BasicSQLAlchemyConfig
-from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.checkpoint import (
+    UTF8_SERDE,
+    Checkpoint,
+    CheckpointStateBase,
+    CheckpointStateCompression,
+    front_code,
+    front_decode,
+    get_checkpoint_state_serde,
+)
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
@@ -128,3 +137,64 @@ def test_serde_idempotence(state_obj):
         config_class=MySQLConfig,
     )
     assert orig_checkpoint_obj == serde_checkpoint_obj
+
+
+def test_front_coding():
+    values = ["db1.t2", "db1.t1", "db2.t1", "db1.t1", ""]
+    encoded = front_code(values)
+    assert encoded == [(0, ""), (0, "db1.t1"), (5, "2"), (2, "2.t1")]
+    assert front_decode(encoded) == ["", "db1.t1", "db1.t2", "db2.t1"]
+
+
+@pytest.mark.parametrize("compression", list(CheckpointStateCompression))
+def test_compressed_state_serde(compression):
+    if compression == CheckpointStateCompression.ZSTD:
+        pytest.importorskip("zstandard")
+
+    state = BaseSQLAlchemyCheckpointState(serde=get_checkpoint_state_serde(compression))
+    for i in range(1000):
+        state.add_table_urn(make_dataset_urn("mysql", f"db1.t{i}", "prod"))
+    # Duplicates are dropped when the state is serialized.
+    state.add_table_urn(make_dataset_urn("mysql", "db1.t0", "prod"))
+
+    payload = state.to_bytes()
+    # The payload must fit in the JSON encoded checkpoint aspect.
+    payload.decode("ascii")
+    assert len(payload) < len(
+        BaseSQLAlchemyCheckpointState.parse_obj(
+            {**state.dict(), "serde": UTF8_SERDE}
+        ).to_bytes()
+    )
+
+    state_dict = CheckpointStateBase.from_bytes_to_dict(payload, state.serde)
+    assert state_dict["encoded_table_urns"] == sorted(set(state.encoded_table_urns))
+    assert state_dict["encoded_view_urns"] == []
+    # The serde is detected from the payload if it isn't given.
+    assert CheckpointStateBase.from_bytes_to_dict(payload) == state_dict
+
+
+def test_utf8_state_serde():
+    state = BaseSQLAlchemyCheckpointState()
+    assert state.serde == UTF8_SERDE
+    state.add_table_urn(make_dataset_urn("mysql", "db1.t1", "prod"))
+    payload = state.to_bytes()
+    assert payload == state.json(exclude={"version", "serde"}).encode("utf-8")
+    assert CheckpointStateBase.from_bytes_to_dict(payload) == json.loads(payload)
+
+    checkpoint = Checkpoint.create_from_checkpoint_aspect(
+        job_name=test_job_name,
+        checkpoint_aspect=DatahubIngestionCheckpointClass(
+            timestampMillis=0,
+            pipelineName=test_pipeline_name,
+            platformInstanceId=test_platform_instance_id,
+            config=test_source_config.json(),
+            state=IngestionCheckpointStateClass(
+                formatVersion=state.version, serde=UTF8_SERDE, payload=payload
+            ),
+            runId=test_run_id,
+        ),
+        state_class=BaseSQLAlchemyCheckpointState,
+        config_class=MySQLConfig,
+    )
+    assert checkpoint is not None
+    assert checkpoint.state == state
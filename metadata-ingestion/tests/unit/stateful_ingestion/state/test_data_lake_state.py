@@ -0,0 +1,30 @@
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.ingestion.source.state.data_lake_state import (
+    DataLakeCheckpointState,
+    DataLakeTableState,
+)
+
+
+def test_data_lake_state() -> None:
+    state1 = DataLakeCheckpointState()
+    test_table_urn = make_dataset_urn("s3", "bucket/folder/table1", "test")
+    table_state = DataLakeTableState(
+        last_modified=1586847600000,
+        number_of_files=3,
+        size_in_bytes=1024,
+        schema_fingerprint="abc",
+    )
+    state1.add_table(test_table_urn, table_state)
+
+    state2 = DataLakeCheckpointState()
+
+    table_urns_diff = list(state1.get_table_urns_not_in(state2))
+    assert len(table_urns_diff) == 1 and table_urns_diff[0] == test_table_urn
+    assert not list(state2.get_table_urns_not_in(state1))
+
+    # the state survives a round trip through its serialized form
+    restored = DataLakeCheckpointState.parse_obj(
+        DataLakeCheckpointState.from_bytes_to_dict(state1.to_bytes())
+    )
+    assert restored.get_table(test_table_urn) == table_state
+    assert restored.get_table("urn:li:dataset:(urn:li:dataPlatform:s3,x,TEST)") is None
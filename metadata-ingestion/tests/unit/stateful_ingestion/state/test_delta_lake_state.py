@@ -0,0 +1,14 @@
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.ingestion.source.state.delta_lake_state import DeltaLakeCheckpointState
+
+
+def test_delta_lake_state() -> None:
+    state1 = DeltaLakeCheckpointState()
+    test_table_urn = make_dataset_urn("delta-lake", "tests/my_table", "test")
+    state1.add_table_version(test_table_urn, 4)
+
+    state2 = DeltaLakeCheckpointState()
+
+    table_urns_diff = list(state1.get_table_urns_not_in(state2))
+    assert len(table_urns_diff) == 1 and table_urns_diff[0] == test_table_urn
+    assert not list(state2.get_table_urns_not_in(state1))
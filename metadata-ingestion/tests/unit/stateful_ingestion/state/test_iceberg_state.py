@@ -0,0 +1,16 @@
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.ingestion.source.state.iceberg_state import IcebergCheckpointState
+
+
+def test_iceberg_state() -> None:
+    state1 = IcebergCheckpointState()
+    test_table_urn = make_dataset_urn("iceberg", "db.my_table", "test")
+    state1.add_table(test_table_urn, 4)
+    unprofiled_table_urn = make_dataset_urn("iceberg", "db.other_table", "test")
+    state1.add_table(unprofiled_table_urn)
+
+    state2 = IcebergCheckpointState()
+
+    table_urns_diff = list(state1.get_table_urns_not_in(state2))
+    assert table_urns_diff == [test_table_urn, unprofiled_table_urn]
+    assert not list(state2.get_table_urns_not_in(state1))
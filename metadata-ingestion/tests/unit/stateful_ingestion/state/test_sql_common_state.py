@@ -2,6 +2,7 @@ from datahub.emitter.mce_builder import make_container_urn, make_dataset_urn
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
+from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
 
 
 def test_sql_common_state() -> None:
@@ -26,3 +27,14 @@ def test_sql_common_state() -> None:
     assert (
         len(container_urns_diff) == 1 and container_urns_diff[0] == test_container_urn
     )
+
+
+def test_encoded_urns_not_in() -> None:
+    difference = CheckpointStateUtil.get_encoded_urns_not_in(
+        ["c", "a", "d", "b", "a", "e"], ["e", "b", "x", "b"]
+    )
+    # lazily yields the distinct differences, in sorted order
+    assert not isinstance(difference, (list, set))
+    assert list(difference) == ["a", "c", "d"]
+    assert list(CheckpointStateUtil.get_encoded_urns_not_in([], ["a"])) == []
+    assert list(CheckpointStateUtil.get_encoded_urns_not_in(["a"], [])) == ["a"]
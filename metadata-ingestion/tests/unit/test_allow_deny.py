@@ -43,3 +43,37 @@ def test_case_sensitivity():
     pattern = AllowDenyPattern(allow=["Foo.myTable"], ignoreCase=False)
     assert not pattern.allowed("foo.mytable")
     assert pattern.allowed("Foo.myTable")
+
+
+def test_literal_and_regex_patterns():
+    pattern = AllowDenyPattern(
+        allow=[r"^db\.schema\.orders$", "db.events", "(a)\\1.*"],
+        deny=["db.events_tmp", r".*_bak$"],
+    )
+    assert pattern.allowed("DB.SCHEMA.ORDERS")
+    assert pattern.allowed("db.schema.orders\n")
+    assert not pattern.allowed("db.schema.orders_2")
+    assert pattern.allowed("db.events_2022")
+    assert not pattern.allowed("db.events_tmp_2022")
+    assert not pattern.allowed("db.events_bak")
+    assert pattern.allowed("aa_table")
+    assert not pattern.allowed("ab_table")
+    # IGNORECASE matches the Kelvin sign against k
+    assert AllowDenyPattern(allow=["kelvin"]).allowed("\u212aelvin")
+
+
+def test_pattern_changes_are_picked_up():
+    pattern = AllowDenyPattern(allow=["foo.*"])
+    assert pattern.allowed("foo.mytable")
+    pattern.deny.append("foo.mytable")
+    assert not pattern.allowed("foo.mytable")
+
+
+def test_match_stats():
+    pattern = AllowDenyPattern(allow=["foo.*"])
+    for _ in range(3):
+        pattern.allowed("foo.mytable")
+    pattern.allowed("bar.mytable")
+    assert pattern.stats.calls == 4
+    assert pattern.stats.cache_misses == 2
+    assert pattern.stats.matched == 3
@@ -1,4 +1,6 @@
+import json
 import os
+from typing import Any, Dict, List, Sequence, Tuple
 from unittest import mock
 
 from datahub.cli import cli_utils
@@ -59,3 +61,86 @@ def test_correct_url_when_gms_host_port_url_protocol_set():
 )
 def test_correct_url_when_url_set():
     assert cli_utils.get_details_from_env() == ("https://example.com", None)
+
+
+def _mock_search_session(
+    urns: List[str], stale_urns: Sequence[str] = ()
+) -> Tuple[mock.MagicMock, List[Dict[str, Any]]]:
+    """
+    Serves urn-sorted search pages the way GMS does: hits for stale_urns, which are still
+    in the index but no longer exist, are dropped from a page but counted in numEntities.
+    """
+    session = mock.MagicMock()
+    search_bodies: List[Dict[str, Any]] = []
+
+    def post(url, payload):
+        search_body = json.loads(payload)
+        search_bodies.append(search_body)
+        cursor = next(
+            (
+                criterion["value"]
+                for criterion in search_body["filter"]["or"][0]["and"]
+                if criterion["field"] == "urn"
+            ),
+            None,
+        )
+        remaining = sorted(
+            urn for urn in [*urns, *stale_urns] if cursor is None or urn > cursor
+        )
+        page = [
+            urn for urn in remaining[: search_body["count"]] if urn not in stale_urns
+        ]
+        response = mock.MagicMock(status_code=200)
+        response._content = json.dumps(
+            {
+                "value": {
+                    "numEntities": len(remaining),
+                    "entities": [{"entity": urn} for urn in page],
+                }
+            }
+        )
+        return response
+
+    session.post.side_effect = post
+    return session, search_bodies
+
+
+def test_get_urns_by_filter_pages_with_urn_cursor():
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,table{i},PROD)" for i in range(5)
+    ]
+    session, search_bodies = _mock_search_session(urns)
+    with mock.patch(
+        "datahub.cli.cli_utils.get_session_and_host",
+        return_value=(session, "http://localhost:8080"),
+    ):
+        assert list(cli_utils.get_urns_by_filter(platform="hive", batch_size=2)) == urns
+        assert len(search_bodies) == 3
+        assert all(
+            body["sort"] == {"field": "urn", "order": "ASCENDING"}
+            for body in search_bodies
+        )
+
+        assert (
+            list(
+                cli_utils.get_urns_by_filter(
+                    platform="hive", batch_size=2, start_after_urn=urns[2]
+                )
+            )
+            == urns[3:]
+        )
+
+
+def test_get_urns_by_filter_continues_after_short_page():
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,table{i},PROD)" for i in range(5)
+    ]
+    stale_urns = ["urn:li:dataset:(urn:li:dataPlatform:hive,table0_stale,PROD)"]
+    session, search_bodies = _mock_search_session(urns, stale_urns)
+    with mock.patch(
+        "datahub.cli.cli_utils.get_session_and_host",
+        return_value=(session, "http://localhost:8080"),
+    ):
+        # the stale hit leaves the first two pages with one urn each
+        assert list(cli_utils.get_urns_by_filter(platform="hive", batch_size=2)) == urns
+        assert len(search_bodies) == 4
@@ -0,0 +1,133 @@
+import collections
+import threading
+from typing import Dict, List, Set
+from unittest import mock
+
+import click
+import pytest
+
+from datahub.cli import delete_cli
+from datahub.cli.delete_cli import DeletionResult
+
+
+def _deleted(urn: str, **kwargs: object) -> DeletionResult:
+    return DeletionResult(num_entities=1, num_records=1)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_delete_urns_concurrently(workers):
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,table{i},PROD)" for i in range(10)
+    ]
+    result = DeletionResult()
+    sessions_by_thread: Dict[int, Set[int]] = collections.defaultdict(set)
+
+    def delete_one_urn(urn: str, cached_session_host, **kwargs) -> DeletionResult:
+        sessions_by_thread[threading.get_ident()].add(id(cached_session_host[0]))
+        return _deleted(urn)
+
+    with mock.patch.object(
+        delete_cli.cli_utils,
+        "get_session_and_host",
+        side_effect=lambda: (mock.MagicMock(), "http://localhost:8080"),
+    ), mock.patch.object(delete_cli.cli_utils, "get_token"), mock.patch.object(
+        delete_cli, "_delete_one_urn", side_effect=delete_one_urn
+    ) as mock_delete:
+        delete_cli._delete_urns_concurrently(
+            iter(urns), len(urns), result, workers, delete_cli.ACTIVE_PASS, soft=False
+        )
+    assert sorted(call.args[0] for call in mock_delete.call_args_list) == urns
+    # every worker thread reuses a session of its own
+    assert all(len(sessions) == 1 for sessions in sessions_by_thread.values())
+    assert len(set().union(*sessions_by_thread.values())) == len(sessions_by_thread)
+    assert result.num_entities == 10
+    assert result.num_records == 10
+
+
+def test_delete_urns_concurrently_prints_resume_point_on_failure():
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,table{i},PROD)" for i in range(5)
+    ]
+
+    def delete_one_urn(urn: str, **kwargs: object) -> DeletionResult:
+        if urn == urns[3]:
+            raise ConnectionError("GMS went away")
+        return _deleted(urn)
+
+    # progressbar wraps stdout globally, which doesn't mix well with capsys
+    with mock.patch.object(
+        delete_cli, "_delete_one_urn", side_effect=delete_one_urn
+    ), mock.patch.object(delete_cli.click, "echo") as mock_echo, pytest.raises(
+        ConnectionError
+    ):
+        delete_cli._delete_urns_concurrently(
+            iter(urns),
+            len(urns),
+            DeletionResult(),
+            1,
+            delete_cli.SOFT_DELETED_PASS,
+            soft=False,
+        )
+    assert f"--resume-from 'soft-deleted:{urns[2]}'" in mock_echo.call_args.args[0]
+
+
+def test_delete_with_filters_resumes_the_interrupted_pass():
+    active_urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,a{i},PROD)" for i in range(4)
+    ]
+    soft_deleted_urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,s{i},PROD)" for i in range(3)
+    ]
+
+    def list_urns(only_soft_deleted=None, start_after_urn=None, **kwargs) -> List[str]:
+        urns = soft_deleted_urns if only_soft_deleted else active_urns
+        return [urn for urn in urns if start_after_urn is None or urn > start_after_urn]
+
+    with mock.patch.object(
+        delete_cli.cli_utils,
+        "get_session_and_host",
+        return_value=(mock.MagicMock(), "http://localhost:8080"),
+    ), mock.patch.object(delete_cli.cli_utils, "get_token"), mock.patch.object(
+        delete_cli.cli_utils,
+        "get_num_urns_by_filter",
+        side_effect=lambda **kwargs: len(list_urns(**kwargs)),
+    ) as mock_count, mock.patch.object(
+        delete_cli.cli_utils, "get_urns_by_filter", side_effect=list_urns
+    ), mock.patch.object(
+        delete_cli, "_delete_one_urn", side_effect=_deleted
+    ) as mock_delete, mock.patch.object(
+        delete_cli,
+        "_delete_urns_concurrently",
+        wraps=delete_cli._delete_urns_concurrently,
+    ) as mock_delete_urns:
+        result = delete_cli.delete_with_filters(
+            dry_run=False,
+            soft=False,
+            force=True,
+            include_removed=True,
+            platform="hive",
+            resume_from=f"active:{active_urns[1]}",
+        )
+
+    # the interrupted pass continues after the resume point, the next one starts over
+    deleted = [call.args[0] for call in mock_delete.call_args_list]
+    assert deleted == active_urns[2:] + soft_deleted_urns
+    assert result.num_entities == 5
+    # and the progress totals only count what is left to delete
+    assert [call.kwargs["start_after_urn"] for call in mock_count.call_args_list] == [
+        active_urns[1],
+        None,
+    ]
+    assert [call.args[1] for call in mock_delete_urns.call_args_list] == [2, 3]
+
+
+def test_delete_with_filters_rejects_resume_point_without_pass():
+    with pytest.raises(click.BadParameter):
+        delete_cli.delete_with_filters(
+            dry_run=False,
+            soft=False,
+            force=True,
+            include_removed=False,
+            platform="hive",
+            resume_from="urn:li:dataset:(urn:li:dataPlatform:hive,a0,PROD)",
+        )
@@ -8,6 +8,7 @@ from datahub.configuration.common import ConfigurationError
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.azure.azure_common import AdlsSourceConfig
 from datahub.ingestion.source.iceberg.iceberg import IcebergSource, IcebergSourceConfig
+from datahub.ingestion.source.iceberg.iceberg_profiler import IcebergProfiler
 from datahub.metadata.com.linkedin.pegasus2avro.schema import ArrayType, SchemaField
 from datahub.metadata.schema_classes import (
     ArrayTypeClass,
@@ -403,3 +404,16 @@ def test_avro_decimal_bytes_nullable():
     print(
         f"After avro parsing, _nullable attribute is preserved:  {boolean_avro_schema}"
     )
+
+
+def test_profiler_aggregates_stats_by_field_id():
+    null_counts = [0, 0, 0]
+    IcebergProfiler._aggregate_counts(null_counts, {1: 2, 2: 1})
+    # Counts of historical field IDs, beyond the current schema, are ignored.
+    IcebergProfiler._aggregate_counts(null_counts, {1: 3, 7: 4})
+    assert null_counts == [0, 5, 1]
+
+    min_bounds = [None, 5, None]
+    IcebergProfiler._merge_bounds(min, min_bounds, [None, 3, 8])
+    IcebergProfiler._merge_bounds(min, min_bounds, [None, 4, None])
+    assert min_bounds == [None, 3, 8]
@@ -0,0 +1,47 @@
+import os
+
+from datahub.ingestion.source.looker.lookml_parse_cache import LookMLParseCache
+
+
+def test_lookml_parse_cache_invalidation(tmp_path):
+    view_file = tmp_path / "foo.view.lkml"
+    view_file.write_text("view: foo { sql_table_name: foo ;; }")
+    cache_path = str(tmp_path / "cache.db")
+
+    cache = LookMLParseCache(cache_path)
+    raw, parsed = cache.load(str(view_file))
+    assert raw == "view: foo { sql_table_name: foo ;; }"
+    assert parsed["views"][0]["sql_table_name"] == "foo"
+    # Callers get their own copy of the parsed file.
+    parsed["views"].clear()
+    assert cache.load(str(view_file))[1]["views"]
+    assert (cache.report.misses, cache.report.hits) == (1, 1)
+    cache.close()
+
+    cache = LookMLParseCache(cache_path)
+    cache.load(str(view_file))
+    assert (cache.report.misses, cache.report.disk_hits) == (0, 1)
+
+    view_file.write_text("view: foo { sql_table_name: bar ;; }")
+    stat = view_file.stat()
+    os.utime(view_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    _, parsed = cache.load(str(view_file))
+    assert parsed["views"][0]["sql_table_name"] == "bar"
+    assert cache.report.misses == 1
+    cache.close()
+
+
+def test_lookml_parse_cache_preload(tmp_path):
+    paths = []
+    for i in range(4):
+        view_file = tmp_path / f"view_{i}.view.lkml"
+        view_file.write_text(f"view: view_{i} {{ sql_table_name: table_{i} ;; }}")
+        paths.append(str(view_file))
+    (tmp_path / "broken.view.lkml").write_text("view: {")
+
+    cache = LookMLParseCache()
+    cache.preload(paths + [str(tmp_path / "broken.view.lkml")], max_workers=2)
+    assert cache.report.files_parsed_in_parallel == 4
+    for i, path in enumerate(paths):
+        assert cache.load(path)[1]["views"][0]["name"] == f"view_{i}"
+    assert (cache.report.misses, cache.report.hits) == (0, 4)
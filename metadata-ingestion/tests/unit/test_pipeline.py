@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
+from pydantic import ValidationError
 
 from datahub.configuration.common import DynamicTypedConfig
 from datahub.ingestion.api.committable import CommitPolicy, Committable
@@ -11,6 +12,7 @@ from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
+from datahub.ingestion.transformer.base_transformer import BaseTransformer
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import SystemMetadata
 from datahub.metadata.schema_classes import (
     DatasetPropertiesClass,
@@ -175,6 +177,45 @@ class TestPipeline(object):
         )
         assert pipeline
 
+    def test_configure_transformer_spill_threshold(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+                "transformers": [
+                    {
+                        "type": "simple_add_dataset_tags",
+                        "spill_threshold": 100,
+                        "config": {"tag_urns": ["urn:li:tag:Test"]},
+                    },
+                    {
+                        "type": "simple_add_dataset_ownership",
+                        "config": {"owner_urns": ["urn:li:corpuser:foo"]},
+                    },
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+            }
+        )
+        thresholds = [
+            cast(BaseTransformer, transformer).entity_tracker.spill_threshold
+            for transformer in pipeline.transformers
+        ]
+        assert thresholds == [100, None]
+
+        with pytest.raises(ValidationError):
+            Pipeline.create(
+                {
+                    "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+                    "transformers": [
+                        {
+                            "type": "simple_add_dataset_tags",
+                            "spill_threshold": 0,
+                            "config": {"tag_urns": ["urn:li:tag:Test"]},
+                        }
+                    ],
+                    "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                }
+            )
+
     @pytest.mark.parametrize(
         "commit_policy,source,should_commit",
         [
@@ -1,11 +1,19 @@
+import datetime
 import json
+import time
+from typing import Any, List
+from unittest import mock
 
 import pytest
 import requests
 
 import datahub.metadata.schema_classes as models
+from datahub.configuration.common import OperationalError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import WriteCallback
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink, DatahubRestSinkConfig
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -298,3 +306,163 @@ def test_datahub_rest_emitter(requests_mock, record, path, snapshot):
 
     emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
     emitter.emit(record)
+
+
+def test_datahub_rest_emitter_batch(requests_mock):
+    mcps = [
+        MetadataChangeProposalWrapper(
+            entityType="dataset",
+            changeType=models.ChangeTypeClass.UPSERT,
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:bigquery,table{i},PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        for i in range(3)
+    ]
+    usage = models.UsageAggregationClass(
+        bucket=1623826800000,
+        duration="DAY",
+        resource="urn:li:dataset:(urn:li:dataPlatform:bigquery,table0,PROD)",
+        metrics=models.UsageAggregationMetricsClass(uniqueUserCount=1),
+    )
+
+    def match_proposals(request: requests.Request) -> bool:
+        proposals = request.json()["proposals"]
+        assert [proposal["entityUrn"] for proposal in proposals] == [
+            mcp.entityUrn for mcp in mcps
+        ]
+        assert proposals[0]["aspect"] == {
+            "value": '{"removed": false}',
+            "contentType": "application/json",
+        }
+        return True
+
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        additional_matcher=match_proposals,
+    )
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/usageStats?action=batchIngest",
+        additional_matcher=lambda request: len(request.json()["buckets"]) == 1,
+    )
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    emitter.emit_batch([*mcps, usage])
+
+    assert requests_mock.call_count == 2
+
+
+class RecordingCallback(WriteCallback):
+    def __init__(self) -> None:
+        self.succeeded: List[Any] = []
+        self.failed: List[Any] = []
+
+    def on_success(self, record_envelope, success_metadata):
+        self.succeeded.append(record_envelope.record)
+
+    def on_failure(self, record_envelope, failure_exception, failure_metadata):
+        self.failed.append(record_envelope.record)
+
+
+def make_status_mcps(count: int) -> List[MetadataChangeProposalWrapper]:
+    return [
+        MetadataChangeProposalWrapper(
+            entityType="dataset",
+            changeType=models.ChangeTypeClass.UPSERT,
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:bigquery,table{i},PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def mock_emitter():
+    emitter = mock.MagicMock()
+    emitter.test_connection.return_value = {}
+    emitter.make_batch_entry.side_effect = DatahubRestEmitter(
+        MOCK_GMS_ENDPOINT
+    ).make_batch_entry
+    now = datetime.datetime.now()
+    emitter.emit_batch_entries.return_value = (now, now)
+    emitter.emit.return_value = (now, now)
+    with mock.patch(
+        "datahub.ingestion.sink.datahub_rest.DatahubRestEmitter",
+        return_value=emitter,
+    ):
+        yield emitter
+
+
+def make_batch_sink(**config: Any) -> DatahubRestSink:
+    return DatahubRestSink(
+        PipelineContext(run_id="test-rest-sink"),
+        DatahubRestSinkConfig(server=MOCK_GMS_ENDPOINT, mode="ASYNC_BATCH", **config),
+    )
+
+
+def test_datahub_rest_sink_batches_records(mock_emitter):
+    sink = make_batch_sink(max_batch_records=2, max_batch_linger_sec=60)
+    callback = RecordingCallback()
+    mcps = make_status_mcps(5)
+    usage = models.UsageAggregationClass(
+        bucket=1623826800000,
+        duration="DAY",
+        resource="urn:li:dataset:(urn:li:dataPlatform:bigquery,table0,PROD)",
+        metrics=models.UsageAggregationMetricsClass(uniqueUserCount=1),
+    )
+    for record in [*mcps, usage]:
+        sink.write_record_async(RecordEnvelope(record, metadata={}), callback)
+    sink.close()
+
+    # Full batches are sent as they fill up, partial ones per endpoint on close.
+    batches = [call.args[0] for call in mock_emitter.emit_batch_entries.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [1, 1, 2, 2]
+    assert all(len({entry.endpoint for entry in batch}) == 1 for batch in batches)
+    mock_emitter.emit.assert_not_called()
+    assert sorted(record.entityUrn for record in callback.succeeded[:5]) == [
+        mcp.entityUrn for mcp in mcps
+    ]
+    assert usage in callback.succeeded and not callback.failed
+    assert sink.get_report().batches_written == 4
+    assert sink.get_report().total_records_written == 6
+
+
+def test_datahub_rest_sink_flushes_lingering_batches(mock_emitter):
+    sink = make_batch_sink(max_batch_linger_sec=0.1)
+    callback = RecordingCallback()
+    (mcp,) = make_status_mcps(1)
+    sink.write_record_async(RecordEnvelope(mcp, metadata={}), callback)
+
+    deadline = time.monotonic() + 5
+    while not callback.succeeded and time.monotonic() < deadline:
+        time.sleep(0.05)
+    # The partially filled batch is sent before the sink is closed.
+    assert callback.succeeded == [mcp]
+    sink.close()
+    assert mock_emitter.emit_batch_entries.call_count == 1
+
+
+def test_datahub_rest_sink_falls_back_to_single_records(mock_emitter):
+    mcps = make_status_mcps(3)
+    now = datetime.datetime.now()
+    mock_emitter.emit_batch_entries.side_effect = OperationalError(
+        "Unable to emit metadata to DataHub GMS", {"status": 404}
+    )
+    mock_emitter.emit.side_effect = [
+        (now, now),
+        OperationalError("Unable to emit metadata to DataHub GMS", {}),
+        (now, now),
+    ]
+    sink = make_batch_sink(max_batch_linger_sec=60)
+    callback = RecordingCallback()
+    for mcp in mcps:
+        sink.write_record_async(RecordEnvelope(mcp, metadata={}), callback)
+    sink.close()
+
+    # Failures are attributed to the records that failed when sent one by one.
+    assert mock_emitter.emit.call_count == 3
+    assert callback.succeeded == [mcps[0], mcps[2]]
+    assert callback.failed == [mcps[1]]
+    report = sink.get_report()
+    assert report.batch_fallbacks == 1
+    assert report.batches_written == 1
+    assert len(report.failures) == 1
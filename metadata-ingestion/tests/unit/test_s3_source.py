@@ -0,0 +1,154 @@
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, cast
+from unittest.mock import patch
+
+from datahub.ingestion.run.pipeline import Pipeline
+from datahub.ingestion.source.s3.source import S3Source
+from datahub.ingestion.source.state.data_lake_state import DataLakeCheckpointState
+from tests.test_helpers.state_helpers import (
+    run_and_get_pipeline,
+    validate_all_providers_have_committed_successfully,
+)
+
+GMS_SERVER = "http://localhost:8080"
+
+
+def _write_table(data_dir: Path, table: str, rows: List[str]) -> None:
+    table_dir = data_dir / table
+    table_dir.mkdir(parents=True, exist_ok=True)
+    (table_dir / "part-0.csv").write_text("\n".join(["id,name", *rows]) + "\n")
+
+
+def _get_table_urn(data_dir: Path, table: str) -> str:
+    return f"urn:li:dataset:(urn:li:dataPlatform:file,{str(data_dir / table).strip('/')},PROD)"
+
+
+def _get_checkpoint_state(pipeline: Pipeline) -> DataLakeCheckpointState:
+    s3_source = cast(S3Source, pipeline.source)
+    checkpoint = s3_source.get_current_checkpoint(
+        s3_source.get_default_ingestion_job_id()
+    )
+    assert checkpoint
+    return cast(DataLakeCheckpointState, checkpoint.state)
+
+
+def _get_emitted_urns(output_path: Path) -> Dict[str, Set[str]]:
+    """Returns the urns of the ingested and of the soft-deleted datasets."""
+    ingested: Set[str] = set()
+    removed: Set[str] = set()
+    for record in json.loads(output_path.read_text()):
+        snapshot: Optional[Dict[str, Any]] = next(
+            iter(record.get("proposedSnapshot", {}).values()), None
+        )
+        if snapshot is not None and "DatasetSnapshot" in next(
+            iter(record["proposedSnapshot"])
+        ):
+            ingested.add(snapshot["urn"])
+        elif record.get("aspectName") == "status" and json.loads(
+            record["aspect"]["value"]
+        ) == {"removed": True}:
+            removed.add(record["entityUrn"])
+    return {"ingested": ingested, "removed": removed}
+
+
+def test_s3_stateful(tmp_path, mock_datahub_graph):
+    data_dir = tmp_path / "data"
+    output_path = tmp_path / "mces.json"
+    pipeline_config_dict: Dict[str, Any] = {
+        "source": {
+            "type": "s3",
+            "config": {
+                "path_specs": [{"include": f"{data_dir}/{{table}}/*.csv"}],
+                "stateful_ingestion": {
+                    "enabled": True,
+                    "state_provider": {
+                        "type": "datahub",
+                        "config": {"datahub_api": {"server": GMS_SERVER}},
+                    },
+                },
+            },
+        },
+        "sink": {"type": "file", "config": {"filename": str(output_path)}},
+        "pipeline_name": "statefulpipeline",
+    }
+    table_a = _get_table_urn(data_dir, "table_a")
+    table_b = _get_table_urn(data_dir, "table_b")
+    table_c = _get_table_urn(data_dir, "table_c")
+
+    with patch(
+        "datahub.ingestion.source.state_provider.datahub_ingestion_checkpointing_provider.DataHubGraph",
+        mock_datahub_graph,
+    ) as mock_checkpoint:
+        mock_checkpoint.return_value = mock_datahub_graph
+
+        _write_table(data_dir, "table_a", ["1,a"])
+        _write_table(data_dir, "table_b", ["1,b"])
+        pipeline_run1 = run_and_get_pipeline(pipeline_config_dict)
+        state1 = _get_checkpoint_state(pipeline_run1)
+        assert _get_emitted_urns(output_path) == {
+            "ingested": {table_a, table_b},
+            "removed": set(),
+        }
+        assert set(state1.tables) == {table_a, table_b}
+
+        # table_a doesn't change, table_b is removed and table_c is added
+        shutil.rmtree(data_dir / "table_b")
+        _write_table(data_dir, "table_c", ["1,c"])
+        pipeline_run2 = run_and_get_pipeline(pipeline_config_dict)
+        state2 = _get_checkpoint_state(pipeline_run2)
+        assert _get_emitted_urns(output_path) == {
+            "ingested": {table_c},
+            "removed": {table_b},
+        }
+        assert cast(S3Source, pipeline_run2.source).report.tables_skipped_unchanged == 1
+        # the unchanged table is carried over to the new checkpoint as it was
+        assert set(state2.tables) == {table_a, table_c}
+        assert state2.get_table(table_a) == state1.get_table(table_a)
+
+        # table_a gets a new row, so it is ingested again
+        _write_table(data_dir, "table_a", ["1,a", "2,a"])
+        pipeline_run3 = run_and_get_pipeline(pipeline_config_dict)
+        state3 = _get_checkpoint_state(pipeline_run3)
+        assert _get_emitted_urns(output_path) == {
+            "ingested": {table_a},
+            "removed": set(),
+        }
+        assert cast(S3Source, pipeline_run3.source).report.tables_skipped_unchanged == 1
+        assert set(state3.tables) == {table_a, table_c}
+        assert state3.get_table(table_a) != state1.get_table(table_a)
+
+        validate_all_providers_have_committed_successfully(
+            pipeline=pipeline_run3, expected_providers=1
+        )
+
+
+def test_s3_arrow_profiling_failure_is_reported(tmp_path):
+    data_dir = tmp_path / "data"
+    output_path = tmp_path / "mces.json"
+    _write_table(data_dir, "table_a", ["1,a"])
+    pipeline_config_dict: Dict[str, Any] = {
+        "source": {
+            "type": "s3",
+            "config": {
+                "path_specs": [{"include": f"{data_dir}/{{table}}/*.csv"}],
+                "profiling": {"enabled": True, "engine": "arrow"},
+            },
+        },
+        "sink": {"type": "file", "config": {"filename": str(output_path)}},
+    }
+
+    with patch(
+        "datahub.ingestion.source.s3.source._ArrowTableProfiler.scan",
+        side_effect=ValueError("bad batch"),
+    ):
+        pipeline = Pipeline.create(pipeline_config_dict)
+        pipeline.run()
+
+    # the table is still ingested, only without a profile
+    assert _get_emitted_urns(output_path)["ingested"] == {
+        _get_table_urn(data_dir, "table_a")
+    }
+    report = cast(S3Source, pipeline.source).report
+    assert any("bad batch" in str(warning) for warning in report.warnings.values())
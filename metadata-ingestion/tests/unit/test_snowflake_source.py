@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from datahub.configuration.common import ConfigurationError, OauthConfiguration
 from datahub.ingestion.api.source import SourceCapability
@@ -408,3 +409,12 @@ def test_test_connection_capability_all_success(mock_connect):
     assert report.capability_report[SourceCapability.DATA_PROFILING].capable
     assert report.capability_report[SourceCapability.DESCRIPTIONS].capable
     assert report.capability_report[SourceCapability.LINEAGE_COARSE].capable
+
+
+def test_snowflake_v2_config_rejects_usage_aggregation_backend():
+    from datahub.ingestion.source.snowflake.snowflake_config import SnowflakeV2Config
+
+    with pytest.raises(ValidationError, match="aggregation_backend is not supported"):
+        SnowflakeV2Config.parse_obj(
+            {"account_id": "test", "aggregation_backend": "sketch"}
+        )
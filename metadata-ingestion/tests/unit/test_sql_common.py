@@ -1,14 +1,19 @@
-from typing import Dict
+from typing import Dict, List, Tuple
+from unittest import mock
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.pool import QueuePool
 
 from datahub.ingestion.api.source import Source
+from datahub.ingestion.source.sql.sql_bulk_reflection import SchemaReflectionCache
 from datahub.ingestion.source.sql.sql_common import (
     PipelineContext,
     SQLAlchemyConfig,
     SQLAlchemySource,
+    SQLSourceReport,
     get_platform_from_sqlalchemy_uri,
 )
 
@@ -106,3 +111,156 @@ PLATFORM_FROM_SQLALCHEMY_URI_TEST_CASES: Dict[str, str] = {
 def test_get_platform_from_sqlalchemy_uri(uri: str, expected_platform: str) -> None:
     platform: str = get_platform_from_sqlalchemy_uri(uri)
     assert platform == expected_platform
+
+
+def test_bulk_reflection_with_per_table_fallback():
+    config: SQLAlchemyConfig = _TestSQLAlchemyConfig(bulk_reflection=True)
+    ctx: PipelineContext = PipelineContext(run_id="test_ctx")
+    source = _TestSQLAlchemySource(config=config, ctx=ctx, platform="postgres")
+
+    inspector = Mock()
+    inspector.dialect.name = "postgresql"
+    inspector.dialect.server_version_info = (14, 5)
+    inspector.engine.url.database = "test_db"
+    inspector.get_columns.return_value = [{"name": "id"}]
+
+    def execute(query, schema):
+        assert schema == "public"
+        if "contype = 'p'" in str(query):
+            return [
+                ("table_a", "table_a_pkey", "id"),
+                ("table_a", "table_a_pkey", "version"),
+            ]
+        elif "contype = 'f'" in str(query):
+            return [
+                ("table_b", "fk_b_a", "a_id", "public", "table_a", "id"),
+                ("table_b", "fk_b_a", "a_version", "public", "table_a", "version"),
+            ]
+        raise Exception("catalog query failed")
+
+    inspector.bind.execute.side_effect = execute
+
+    schema_reflection = source.get_schema_reflection_cache(inspector, "public")
+    assert schema_reflection is not None
+    assert source.get_schema_reflection_cache(inspector, "public") is schema_reflection
+
+    assert schema_reflection.get_pk_constraint("table_a") == {
+        "constrained_columns": ["id", "version"],
+        "name": "table_a_pkey",
+    }
+    assert schema_reflection.get_pk_constraint("table_b") == {
+        "constrained_columns": [],
+        "name": None,
+    }
+    assert [fk["name"] for fk in schema_reflection.get_foreign_keys("table_b")] == [
+        "fk_b_a"
+    ]
+    assert schema_reflection.get_foreign_keys("table_b")[0]["referred_columns"] == [
+        "id",
+        "version",
+    ]
+    assert schema_reflection.get_foreign_keys("table_a") == []
+    inspector.get_pk_constraint.assert_not_called()
+    inspector.get_foreign_keys.assert_not_called()
+
+    # The bulk column query fails, so columns are reflected table by table.
+    assert schema_reflection.get_columns("table_a") == [{"name": "id"}]
+    assert schema_reflection.get_columns("table_b") == [{"name": "id"}]
+    assert inspector.get_columns.call_count == 2
+    assert inspector.bind.execute.call_count == 3
+
+    source.release_schema_reflection_caches("test_db")
+    assert source.get_schema_reflection_cache(inspector, "public") is not (
+        schema_reflection
+    )
+    assert source.report.bulk_reflection_queries == 2
+    assert source.report.bulk_reflection_fallbacks == 2
+
+
+def test_bulk_reflection_of_unsupported_kinds(monkeypatch):
+    inspector = Mock()
+    inspector.dialect.name = "mssql"
+    inspector.get_table_comment.return_value = {"text": "a table"}
+    schema_reflection = SchemaReflectionCache(inspector, "dbo")
+
+    # SQL Server table comments aren't loaded in bulk.
+    assert schema_reflection.get_table_comment("table_a") == {"text": "a table"}
+    inspector.bind.execute.assert_not_called()
+    assert schema_reflection.bulk_queries == 0
+
+    # Columns are only resolved in bulk with known versions of the private
+    # PostgreSQL dialect helpers.
+    monkeypatch.setattr(
+        "datahub.ingestion.source.sql.sql_bulk_reflection.sqlalchemy.__version__",
+        "2.0.0",
+    )
+    inspector.dialect.name = "postgresql"
+    inspector.get_columns.return_value = [{"name": "id"}]
+    schema_reflection = SchemaReflectionCache(inspector, "public")
+    assert schema_reflection.get_columns("table_a") == [{"name": "id"}]
+    inspector.bind.execute.assert_not_called()
+    assert schema_reflection.bulk_queries == 0
+
+
+def test_bulk_reflection_is_not_used_for_unsupported_dialects():
+    config: SQLAlchemyConfig = _TestSQLAlchemyConfig(bulk_reflection=True)
+    ctx: PipelineContext = PipelineContext(run_id="test_ctx")
+    source = _TestSQLAlchemySource(config=config, ctx=ctx, platform="TEST")
+    inspector = Mock()
+    inspector.dialect.name = "sqlite"
+    assert source.get_schema_reflection_cache(inspector, "main") is None
+
+
+def test_parallel_schema_reflection(tmp_path):
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        for i in range(5):
+            conn.execute(f"CREATE TABLE table_{i} (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("CREATE VIEW view_0 AS SELECT name FROM table_0")
+
+    class _SQLiteConfig(SQLAlchemyConfig):
+        def get_sql_alchemy_url(self):
+            return f"sqlite:///{db_path}"
+
+    def get_workunit_ids(**config) -> Tuple[List[str], SQLSourceReport]:
+        source = _TestSQLAlchemySource(
+            config=_SQLiteConfig(**config),
+            ctx=PipelineContext(run_id="test_ctx"),
+            platform="sqlite",
+        )
+        return [wu.id for wu in source.get_workunits()], source.report
+
+    sequential_ids, _ = get_workunit_ids()
+    parallel_ids, report = get_workunit_ids(
+        reflection_max_workers=2, options={"poolclass": QueuePool}
+    )
+    assert "main.table_4" in sequential_ids
+    assert "main.view_0" in sequential_ids
+    assert parallel_ids == sequential_ids
+    # Everything was reflected by the workers.
+    assert report.schema_prefetch_misses == 0
+    assert report.bulk_reflection_fallbacks == 0
+
+    # Excluded tables and views are not reflected.
+    reflected: List[str] = []
+    reflect = SchemaReflectionCache._reflect
+
+    def _reflect(self, method, name, inspector=None):
+        reflected.append(f"{method}:{name}")
+        return reflect(self, method, name, inspector)
+
+    with mock.patch.object(SchemaReflectionCache, "_reflect", _reflect):
+        filtered_ids, report = get_workunit_ids(
+            reflection_max_workers=2,
+            options={"poolclass": QueuePool},
+            table_pattern={"deny": ["main.table_[1-4]"]},
+            view_pattern={"deny": [".*"]},
+        )
+    assert "main.table_0" in filtered_ids
+    assert not any("table_1" in id or "view_0" in id for id in filtered_ids)
+    assert "get_columns:table_0" in reflected
+    assert not any(
+        name.endswith(":table_1") or name.endswith(":view_0") for name in reflected
+    )
+    assert report.schema_prefetch_misses == 0
@@ -0,0 +1,264 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Iterator, List, Tuple
+from unittest import mock
+
+import pydantic
+import pytest
+import requests
+from tableauserverclient.server.endpoint.exceptions import (
+    InternalServerError,
+    NonXMLResponseError,
+)
+
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.tableau import TableauConfig, TableauSource
+from datahub.ingestion.source.tableau_common import (
+    MetadataQueryFetcher,
+    MetadataQueryThrottledException,
+    query_metadata,
+    raise_for_throttled_response,
+)
+from datahub.metadata.schema_classes import SchemaMetadataClass
+
+
+class MetadataApiStub(BaseHTTPRequestHandler):
+    """Serves a connection of numbered nodes, like the Tableau Metadata API does."""
+
+    total_count = 25
+    # the statuses of the error responses to send before succeeding again
+    error_statuses: List[int] = []
+    queries: List[str] = []
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))[
+            "query"
+        ]
+        stub = type(self)
+        with stub.lock:
+            stub.queries.append(query)
+            error_status = stub.error_statuses.pop(0) if stub.error_statuses else None
+            stub.in_flight += 1
+            stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+        time.sleep(0.05)
+        with stub.lock:
+            stub.in_flight -= 1
+        if error_status is not None:
+            self.send_response(error_status)
+            self.end_headers()
+            return
+
+        first = int(re.search(r"first:(\d+)", query).group(1))  # type: ignore
+        offset = int(re.search(r"offset:(\d+)", query).group(1))  # type: ignore
+        ids = re.search(r"idWithin: (\[.*?\])", query)
+        if ids:
+            nodes = [{"id": node_id} for node_id in json.loads(ids.group(1))]
+        else:
+            nodes = [
+                {"id": str(i)}
+                for i in range(offset, min(offset + first, stub.total_count))
+            ]
+        body = json.dumps(
+            {
+                "data": {
+                    "nodesConnection": {
+                        "nodes": nodes,
+                        "pageInfo": {"hasNextPage": True},
+                        "totalCount": stub.total_count,
+                    }
+                }
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def metadata_api() -> Iterator[str]:
+    MetadataApiStub.error_statuses = []
+    MetadataApiStub.queries = []
+    MetadataApiStub.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MetadataApiStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_fetcher(url: str, **kwargs) -> MetadataQueryFetcher:
+    session = requests.Session()
+    session.hooks["response"].append(raise_for_throttled_response)
+
+    def query(graphql_query: str) -> dict:
+        response = session.post(url, json={"query": graphql_query})
+        # the status checks of the Tableau server client
+        if response.status_code >= 500:
+            raise InternalServerError(response)
+        if not response.ok:
+            raise NonXMLResponseError(response.content)
+        return response.json()
+
+    server = SimpleNamespace(metadata=SimpleNamespace(query=query))
+
+    def get_connection_object(
+        main_query: str,
+        connection_type: str,
+        query_filter: str,
+        count: int,
+        offset: int,
+    ) -> Tuple[dict, int, bool]:
+        connection_object = query_metadata(
+            server, main_query, connection_type, count, offset, query_filter
+        )["data"][connection_type]
+        return (
+            connection_object,
+            connection_object["totalCount"],
+            connection_object["pageInfo"]["hasNextPage"],
+        )
+
+    return MetadataQueryFetcher(get_connection_object, **kwargs)
+
+
+def test_fetch_pages_concurrently_in_order(metadata_api):
+    fetcher = make_fetcher(metadata_api, max_concurrent_requests=4)
+    pages = list(fetcher.fetch_pages("{ id }", "nodesConnection", "", 3))
+    fetcher.close()
+
+    assert [node["id"] for page in pages for node in page] == [
+        str(i) for i in range(25)
+    ]
+    assert len(pages) == 9 and len(pages[-1]) == 1
+    # the total count is queried first, then the pages within the request budget
+    assert "first:0, offset:0" in MetadataApiStub.queries[0]
+    assert 1 < MetadataApiStub.max_in_flight <= 4
+
+
+def test_fetch_retries_throttled_requests(metadata_api):
+    MetadataApiStub.error_statuses = [429, 503]
+    fetcher = make_fetcher(
+        metadata_api,
+        max_retries=2,
+        retry_on=(MetadataQueryThrottledException, InternalServerError),
+        retry_backoff_seconds=0.01,
+    )
+    pages = list(fetcher.fetch_pages("{ id }", "nodesConnection", "", 10))
+    assert sum(len(page) for page in pages) == 25
+    assert fetcher.retries == 2
+
+    MetadataApiStub.error_statuses = [429, 429, 429]
+    with pytest.raises(MetadataQueryThrottledException):
+        list(fetcher.fetch_pages("{ id }", "nodesConnection", "", 10))
+
+
+def test_fetch_does_not_retry_client_errors(metadata_api):
+    MetadataApiStub.error_statuses = [400]
+    fetcher = make_fetcher(
+        metadata_api,
+        max_retries=2,
+        retry_on=(MetadataQueryThrottledException, InternalServerError),
+        retry_backoff_seconds=0.01,
+    )
+    with pytest.raises(NonXMLResponseError):
+        list(fetcher.fetch_pages("{ id }", "nodesConnection", "", 10))
+    assert fetcher.retries == 0
+    assert len(MetadataApiStub.queries) == 1
+
+
+def test_fetch_nodes_by_id_in_pages(metadata_api):
+    fetcher = make_fetcher(metadata_api, max_concurrent_requests=2)
+    nodes = list(
+        fetcher.fetch_nodes_by_id("{ id }", "nodesConnection", ["a", "b", "a", "c"], 2)
+    )
+    fetcher.close()
+    assert [node["id"] for node in nodes] == ["a", "b", "c"]
+    # duplicate IDs are only requested once
+    assert sorted(
+        re.search(r"idWithin: (\[.*?\])", query).group(1)  # type: ignore
+        for query in MetadataApiStub.queries
+    ) == ['["a", "b"]', '["c"]']
+
+
+@pytest.mark.parametrize(
+    "config",
+    [{"max_concurrent_requests": 0}, {"max_retries": -1}],
+)
+def test_tableau_config_rejects_invalid_request_limits(config):
+    with pytest.raises(pydantic.ValidationError):
+        TableauConfig.parse_obj({"connect_uri": "https://tableau", **config})
+
+
+@pytest.fixture
+def tableau_source() -> Iterator[TableauSource]:
+    with mock.patch("datahub.ingestion.source.tableau.Server") as mock_sdk:
+        mock_sdk.return_value.session.hooks = {"response": []}
+        source = TableauSource(
+            TableauConfig.parse_obj(
+                {
+                    "connect_uri": "https://tableau",
+                    "username": "username",
+                    "password": "password",
+                    "ingest_tables_external": True,
+                }
+            ),
+            PipelineContext(run_id="tableau-test"),
+        )
+        source.upstream_tables = {}
+        yield source
+        source.close()
+
+
+def test_upstream_tables_emitted_again_when_changed(tableau_source):
+    table_urn = "urn:li:dataset:(urn:li:dataPlatform:postgres,db.public.t,PROD)"
+
+    def emitted_fields() -> List[List[str]]:
+        return [
+            [field.fieldPath for field in aspect.fields]
+            for workunit in tableau_source.emit_upstream_tables()
+            for aspect in workunit.metadata.proposedSnapshot.aspects
+            if isinstance(aspect, SchemaMetadataClass)
+        ]
+
+    tableau_source.upstream_tables[table_urn] = ([{"name": "a"}], "p/ds/t", False)
+    assert emitted_fields() == [["a"]]
+    assert emitted_fields() == []
+
+    # a later workbook uses more columns of the table
+    tableau_source.upstream_tables[table_urn] = (
+        [{"name": "a"}, {"name": "b"}],
+        "p/ds/t",
+        False,
+    )
+    assert emitted_fields() == [["a", "b"]]
+    assert emitted_fields() == []
+
+
+def test_tableau_source_reports_metadata_query_retries(tableau_source):
+    tableau_source.fetcher.retry_backoff_seconds = 0
+    tableau_source.server.metadata.query.side_effect = [
+        InternalServerError(SimpleNamespace(status_code=503, content=b"")),
+        {
+            "data": {
+                "workbooksConnection": {
+                    "nodes": [],
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "totalCount": 0,
+                }
+            }
+        },
+    ]
+
+    assert list(tableau_source.get_workunits()) == []
+    assert tableau_source.get_report().metadata_query_retries == 1
@@ -11,6 +11,7 @@ import tests.test_helpers.mce_helpers
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api import workunit
 from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
 from datahub.ingestion.run.pipeline import Pipeline
 from datahub.ingestion.transformer.add_dataset_browse_path import (
     AddDatasetBrowsePathTransformer,
@@ -861,6 +862,78 @@ def test_ownership_patching_with_nones(mock_time):
     assert not test_ownership
 
 
+def test_ownership_patching_prefetches_server_ownership(mock_time):
+    mock_graph = mock.MagicMock()
+    pipeline_context = PipelineContext(run_id="test_ownership_prefetch")
+    pipeline_context.graph = mock_graph
+    transformer = SimpleAddDatasetOwnership.create(
+        {"owner_urns": [builder.make_user_urn("person1")], "semantics": "PATCH"},
+        pipeline_context,
+    )
+    dataset_urn = builder.make_dataset_urn("bigquery", "example1", "PROD")
+
+    transformer.prefetch([dataset_urn, builder.make_chart_urn("looker", "chart1")])
+    mock_graph.prefetch_aspects.assert_called_once_with(
+        [dataset_urn], [models.OwnershipClass]
+    )
+
+
+@mock.patch(
+    "datahub.emitter.rest_emitter.DatahubRestEmitter.test_connection",
+    return_value={"noCode": True},
+)
+def test_graph_prefetch_aspects_serves_cached_ownership(mock_test_connection):
+    graph = DataHubGraph(DatahubClientConfig(server="http://localhost:8080"))
+    owned_urn = builder.make_dataset_urn("bigquery", "example1", "PROD")
+    unowned_urn = builder.make_dataset_urn("bigquery", "example2", "PROD")
+    ownership = gen_owners(["foo"])
+    batch_response = {
+        "results": {
+            owned_urn: {
+                "aspects": {
+                    "ownership": {"name": "ownership", "value": ownership.to_obj()}
+                }
+            },
+            unowned_urn: {"aspects": {}},
+        },
+        "errors": {},
+    }
+    with mock.patch.object(
+        graph, "_get_generic", return_value=batch_response
+    ) as mock_get_generic, mock.patch.object(graph, "_session") as mock_session:
+        graph.prefetch_aspects([owned_urn, unowned_urn], [models.OwnershipClass])
+        assert mock_get_generic.call_count == 1
+
+        assert graph.get_ownership(owned_urn, use_prefetched=True) == ownership
+        assert graph.get_ownership(unowned_urn, use_prefetched=True) is None
+        mock_session.get.assert_not_called()
+
+        # already cached, so there is nothing left to fetch
+        graph.prefetch_aspects([owned_urn], [models.OwnershipClass])
+        assert mock_get_generic.call_count == 1
+
+        # other callers always ask the server
+        mock_session.get.return_value.status_code = 404
+        assert graph.get_ownership(owned_urn) is None
+        assert mock_session.get.call_count == 1
+
+        # emitting an aspect through the graph drops it from the cache
+        with mock.patch.object(graph, "_emit_generic"):
+            graph.emit_mcp(
+                MetadataChangeProposalWrapper(
+                    entityType="dataset",
+                    changeType=models.ChangeTypeClass.UPSERT,
+                    entityUrn=owned_urn,
+                    aspectName="ownership",
+                    aspect=gen_owners(["bar"]),
+                )
+            )
+        assert graph.get_ownership(owned_urn, use_prefetched=True) is None
+        assert mock_session.get.call_count == 2
+        assert graph.get_ownership(unowned_urn, use_prefetched=True) is None
+        assert mock_session.get.call_count == 2
+
+
 def test_ownership_patching_with_empty_mce_none_server(mock_time):
     mock_graph = mock.MagicMock()
     mce_ownership = gen_owners([])
@@ -1113,6 +1186,57 @@ def test_mcp_add_tags_existing(mock_time):
     assert isinstance(outputs[-1].record, EndOfStream)
 
 
+def test_mcp_add_tags_missing_with_spilled_state(mock_time, monkeypatch):
+    monkeypatch.setenv("DATAHUB_TRANSFORMER_SPILL_THRESHOLD", "2")
+    transformer = SimpleAddDatasetTags.create(
+        {"tag_urns": [builder.make_tag_urn("NeedsDocumentation")]},
+        PipelineContext(run_id="test-tags"),
+    )
+    urns = [
+        builder.make_dataset_urn("bigquery", f"example{i}", "PROD") for i in range(5)
+    ]
+    inputs: List[Any] = [make_generic_dataset_mcp(entity_urn=urn) for urn in urns] + [
+        # Entities that already have the aspect don't need end-of-stream processing.
+        make_generic_dataset_mcp(
+            entity_urn=urns[1],
+            aspect_name="globalTags",
+            aspect=GlobalTagsClass(tags=[]),
+        ),
+        make_generic_dataset_mcp(entity_urn=urns[1]),
+    ]
+    for i, mcp in enumerate(inputs):
+        mcp.systemMetadata = models.SystemMetadataClass(runId=f"run-{i}")
+    outputs = list(
+        transformer.transform(
+            [RecordEnvelope(input, metadata={}) for input in inputs]
+            + [RecordEnvelope(record=EndOfStream(), metadata={})]
+        )
+    )
+    assert transformer.entity_tracker.num_spilled == 5
+
+    end_of_stream_outputs = outputs[len(inputs) : -1]
+    assert [output.record.entityUrn for output in end_of_stream_outputs] == [
+        urns[0],
+        *urns[2:],
+    ]
+    assert [output.record.systemMetadata.runId for output in end_of_stream_outputs] == [
+        "run-0",
+        "run-2",
+        "run-3",
+        "run-4",
+    ]
+    assert all(
+        output.record.aspect.tags[0].tag == builder.make_tag_urn("NeedsDocumentation")
+        for output in end_of_stream_outputs
+    )
+    assert isinstance(outputs[-1].record, EndOfStream)
+
+    report = transformer.get_report()
+    assert report.entities_processed == 5
+    assert report.entities_pending == 0
+    assert report.end_of_stream_aspects_emitted == 4
+
+
 def test_mcp_multiple_transformers(mock_time, tmp_path):
 
     events_file = f"{tmp_path}/multi_transformer_test.json"
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Optional, Tuple
 
 import pytest
 from pydantic import ValidationError
@@ -6,12 +7,17 @@ from pydantic import ValidationError
 from datahub.configuration.common import AllowDenyPattern
 from datahub.configuration.time_window_config import BucketDuration, get_time_bucket
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.source import SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
     GenericAggregatedDataset,
+    UsageAggregationBackend,
+    UsageAggregationConfig,
+    UsageAggregator,
 )
 from datahub.metadata.schema_classes import DatasetUsageStatisticsClass
+from datahub.utilities.heavy_hitters import SpaceSavingCounter
 
 _TestTableRef = str
 
@@ -226,6 +232,112 @@ def test_query_trimming():
     assert du.topSqlQueries.pop() == "select * f ..."
 
 
+def test_space_saving_counter():
+    counter: SpaceSavingCounter[str] = SpaceSavingCounter(capacity=2)
+    for _ in range(3):
+        assert counter.add("a") is None
+    assert counter.add("b") is None
+    assert counter.add("c") == "b"
+    assert counter.add("d") == "c"
+    assert len(counter) == 2
+    assert counter.most_common() == [("a", 3), ("d", 3)]
+
+
+# (day, resource, user, query, fields)
+_TestEvent = Tuple[int, str, str, Optional[str], List[str]]
+
+
+def _aggregate_usage(
+    events: List[_TestEvent], **config: object
+) -> List[DatasetUsageStatisticsClass]:
+    aggregator: UsageAggregator[_TestTableRef] = UsageAggregator(
+        UsageAggregationConfig.parse_obj(config), lambda resource: resource
+    )
+    try:
+        for day, resource, user, query, fields in events:
+            aggregator.add_read_entry(
+                datetime(2020, 1, day), resource, user, query, fields
+            )
+        return [
+            wu.get_metadata()["metadata"].aspect
+            for wu in aggregator.generate_workunits()
+        ]
+    finally:
+        aggregator.close()
+
+
+def test_usage_aggregation_backends_agree():
+    events: List[_TestEvent] = [
+        (1, "db.a", "u1@test.com", "select 1", ["x"]),
+        (1, "db.b", "u2@test.com", "select 2", ["x", "y"]),
+        (1, "db.a", "u2@test.com", "select 3", ["y"]),
+        (1, "db.a", "u1@test.com", "select 3", []),
+        (2, "db.a", "u3@test.com", None, ["z"]),
+        (1, "db.b", "u2@test.com", "select 2", ["y"]),
+        (2, "db.b", "u1@test.com", "select 1", []),
+    ]
+
+    expected = _aggregate_usage(events, top_n_queries=2)
+    assert [usage.timestampMillis for usage in expected] == [
+        1577836800000,
+        1577836800000,
+        1577923200000,
+        1577923200000,
+    ]
+    assert expected[0].topSqlQueries == ["select 3", "select 1"]
+
+    for backend in [UsageAggregationBackend.SKETCH, UsageAggregationBackend.SQLITE]:
+        assert (
+            _aggregate_usage(events, top_n_queries=2, aggregation_backend=backend)
+            == expected
+        )
+
+
+def test_usage_aggregation_sketch_keeps_frequent_queries():
+    events: List[_TestEvent] = []
+    for i in range(200):
+        events.append((1, "db.a", "u1@test.com", f"select {i}", []))
+        if i % 4 == 0:
+            events.append((1, "db.a", "u1@test.com", "select frequent", []))
+
+    [usage] = _aggregate_usage(
+        events,
+        top_n_queries=1,
+        aggregation_backend=UsageAggregationBackend.SKETCH,
+        query_sketch_size=5,
+    )
+    assert usage.totalSqlQueries == 250
+    assert usage.topSqlQueries == ["select frequent"]
+
+
+def test_usage_aggregation_emits_closed_buckets():
+    aggregator: UsageAggregator[_TestTableRef] = UsageAggregator(
+        UsageAggregationConfig(), lambda resource: resource
+    )
+    day1 = datetime(2020, 1, 1)
+    day2 = datetime(2020, 1, 2)
+    aggregator.add_read_entry(day1, "db.a", "u1@test.com", "select 1", [])
+    assert list(aggregator.generate_closed_workunits(day1)) == []
+
+    [wu] = aggregator.generate_closed_workunits(day2)
+    assert wu.id == "2020-01-01T00:00:00-db.a"
+
+    aggregator.add_read_entry(day2, "db.a", "u1@test.com", "select 1", [])
+    aggregator.add_read_entry(day1, "db.a", "u1@test.com", "select 1", [])
+    assert aggregator.num_late_events == 1
+    assert [wu.id for wu in aggregator.generate_workunits()] == [
+        "2020-01-02T00:00:00-db.a"
+    ]
+
+    report = SourceReport()
+    aggregator.report_late_events(report)
+    assert report.warnings == {
+        "usage-late-events": [
+            "Dropped 1 usage events whose time bucket had already been emitted"
+        ]
+    }
+
+
 def test_top_n_queries_validator_fails():
     with pytest.raises(ValidationError) as excinfo:
         GenericAggregatedDataset.total_budget_for_query_list = 20
@@ -259,3 +371,8 @@ def test_make_usage_workunit_include_top_n_queries():
     du: DatasetUsageStatisticsClass = wu.get_metadata()["metadata"].aspect
     assert du.totalSqlQueries == 1
     assert du.topSqlQueries is None
+
+
+def test_usage_aggregation_backend_is_not_a_base_usage_option():
+    with pytest.raises(ValidationError):
+        BaseUsageConfig.parse_obj({"aggregation_backend": "sketch"})
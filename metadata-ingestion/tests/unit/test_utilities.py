@@ -1,5 +1,22 @@
+import concurrent.futures
+import random
+import time
+from unittest import mock
+
+import pytest
+
 from datahub.utilities.delayed_iter import delayed_iter
-from datahub.utilities.sql_parser import MetadataSQLSQLParser, SqlLineageSQLParser
+from datahub.utilities.ordered_thread_map import (
+    ordered_executor_map,
+    ordered_thread_map,
+)
+from datahub.utilities.sql_parser import (
+    MetadataSQLSQLParser,
+    SqlLineageParserPool,
+    SqlLineageSQLParser,
+    SQLParser,
+)
+from datahub.utilities.sql_parser_cache import SQLParseCache
 
 
 def test_delayed_iter():
@@ -36,6 +53,57 @@ def test_delayed_iter():
     ]
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_ordered_thread_map(max_workers):
+    pulled = []
+
+    def items(n):
+        for i in range(n):
+            pulled.append(i)
+            yield i
+
+    def square(i):
+        time.sleep(random.random() / 100)
+        return i * i
+
+    results = []
+    for result in ordered_thread_map(square, items(20), max_workers):
+        # items are only pulled a bounded number of steps ahead of the results
+        assert len(pulled) <= len(results) + max(1, 2 * max_workers)
+        results.append(result)
+    assert results == [i * i for i in range(20)]
+
+    def fail(i):
+        if i == 3:
+            raise ValueError(i)
+        return i
+
+    results = []
+    with pytest.raises(ValueError):
+        for result in ordered_thread_map(fail, range(10), max_workers):
+            results.append(result)
+    assert results == [0, 1, 2]
+
+
+def test_ordered_executor_map_nested():
+    tree = {"": ["a", "b"], "a": ["a1", "a2"], "b": ["b1"], "a1": ["a11"]}
+
+    def children(node):
+        time.sleep(random.random() / 100)
+        return node, tree.get(node, [])
+
+    def walk(executor, nodes):
+        # the nested maps share a single pool, and the walk is still depth first
+        for node, child_nodes in ordered_executor_map(executor, children, nodes, 4):
+            yield node
+            yield from walk(executor, child_nodes)
+
+    expected = ["", "a", "a1", "a11", "a2", "b", "b1"]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(walk(executor, [""])) == expected
+    assert list(walk(None, [""])) == expected
+
+
 def test_metadatasql_sql_parser_get_tables_from_simple_query():
     sql_query = "SELECT foo.a, foo.b, bar.c FROM foo JOIN bar ON (foo.a == bar.b);"
 
@@ -349,3 +417,124 @@ JOIN `admin-table` a on d.`column-date` = a.`column-admin`
     ]
     assert sorted(SqlLineageSQLParser(sql_query).get_tables()) == expected_tables
     assert sorted(SqlLineageSQLParser(sql_query).get_columns()) == expected_columns
+
+
+def test_sqllineage_parser_pool_parse_many():
+    pool = SqlLineageParserPool(max_workers=2, max_parses_per_worker=2)
+    try:
+        results = pool.parse_many(
+            [f"SELECT col_{i} FROM table_{i}" for i in range(5)]
+            # Not a string, so the parser fails inside the worker.
+            + [42],  # type: ignore
+            return_exceptions=True,
+        )
+        assert [sorted(tables) for tables, _ in results[:5]] == [
+            [f"table_{i}"] for i in range(5)
+        ]
+        assert isinstance(results[5], BaseException)
+
+        with pytest.raises(TypeError):
+            pool.parse_many([42])  # type: ignore
+
+        assert pool.parse("SELECT a FROM foo")[0] == ["foo"]
+    finally:
+        pool.close()
+
+
+def test_sqllineage_parser_pool_concurrent_callers():
+    pool = SqlLineageParserPool(max_workers=2)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda i: pool.parse_many(
+                        [f"SELECT a FROM table_{i}_{j}" for j in range(3)]
+                    ),
+                    range(4),
+                )
+            )
+        assert [[tables for tables, _ in result] for result in results] == [
+            [[f"table_{i}_{j}"] for j in range(3)] for i in range(4)
+        ]
+        # Every worker was handed back, and no more than max_workers were started.
+        assert len(pool._idle_workers) <= 2
+        for _ in range(2):
+            assert pool._worker_slots.acquire(blocking=False)
+    finally:
+        pool.close()
+
+
+def test_sqllineage_parser_pool_timeout():
+    pool = SqlLineageParserPool(max_workers=1, query_timeout_sec=0)
+    try:
+        with pytest.raises(TimeoutError):
+            pool.parse("SELECT a FROM foo")
+    finally:
+        pool.close()
+
+
+class _CountingSQLParser(SQLParser):
+    parse_count = 0
+
+    def __init__(self, sql_query: str) -> None:
+        super().__init__(sql_query)
+        _CountingSQLParser.parse_count += 1
+
+    def get_tables(self):
+        return ["table"]
+
+    def get_columns(self):
+        return ["column"]
+
+
+def test_sql_parse_cache(tmp_path):
+    _CountingSQLParser.parse_count = 0
+    path = str(tmp_path / "sql_parse_cache.db")
+
+    cache = SQLParseCache(max_entries=1, path=path)
+    assert cache.get_tables_and_columns(_CountingSQLParser, "SELECT a FROM b") == (
+        ["table"],
+        ["column"],
+    )
+    # Whitespace differences map to the same entry.
+    assert cache.get_tables(_CountingSQLParser, "SELECT a\n  FROM b") == ["table"]
+    assert _CountingSQLParser.parse_count == 1
+
+    cache.get_tables(_CountingSQLParser, "SELECT c FROM d")
+    assert _CountingSQLParser.parse_count == 2
+    assert cache.report.evictions == 3
+    cache.close()
+
+    # A new cache instance reuses the results persisted by the previous one.
+    cache = SQLParseCache(max_entries=1, path=path)
+    assert cache.get_tables(_CountingSQLParser, "SELECT a FROM b") == ["table"]
+    assert _CountingSQLParser.parse_count == 2
+    assert cache.report.disk_hits == 1
+    cache.close()
+
+
+def test_sql_parse_cache_key():
+    def key(sql_query: str) -> str:
+        return SQLParseCache._make_key(_CountingSQLParser, "tables", sql_query)
+
+    assert key("SELECT a\n  FROM b  WHERE c = 'x'") == key(
+        "SELECT a FROM b WHERE c = 'x'"
+    )
+    # Whitespace within literals and the end of a line comment are significant.
+    assert key("SELECT a FROM b WHERE c = 'x  y'") != key(
+        "SELECT a FROM b WHERE c = 'x y'"
+    )
+    assert key('SELECT "a  b" FROM c') != key('SELECT "a b" FROM c')
+    assert key("SELECT a FROM b WHERE c = 'it''s  x'") != key(
+        "SELECT a FROM b WHERE c = 'it''s x'"
+    )
+    assert key("SELECT a -- b\nFROM c") != key("SELECT a -- b FROM c")
+    assert key("SELECT a -- b\n  FROM c") == key("SELECT a -- b\nFROM c")
+
+    # The key changes with the parsers' version.
+    current_key = key("SELECT a FROM b")
+    with mock.patch(
+        "datahub.utilities.sql_parser_cache._get_parsers_version",
+        return_value="sqllineage==0.0.1",
+    ):
+        assert key("SELECT a FROM b") != current_key
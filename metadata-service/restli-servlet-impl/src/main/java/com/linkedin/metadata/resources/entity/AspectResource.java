@@ -29,6 +29,7 @@ import com.linkedin.restli.server.resources.CollectionResourceTaskTemplate;
 import io.opentelemetry.extension.annotations.WithSpan;
 import java.net.URISyntaxException;
 import java.time.Clock;
+import java.util.Arrays;
 import java.util.List;
 import javax.annotation.Nonnull;
 import javax.annotation.Nullable;
@@ -49,10 +50,12 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
 
   private static final String ACTION_GET_TIMESERIES_ASPECT = "getTimeseriesAspectValues";
   private static final String ACTION_INGEST_PROPOSAL = "ingestProposal";
+  private static final String ACTION_INGEST_PROPOSAL_BATCH = "ingestProposalBatch";
 
   private static final String PARAM_ENTITY = "entity";
   private static final String PARAM_ASPECT = "aspect";
   private static final String PARAM_PROPOSAL = "proposal";
+  private static final String PARAM_PROPOSALS = "proposals";
   private static final String PARAM_START_TIME_MILLIS = "startTimeMillis";
   private static final String PARAM_END_TIME_MILLIS = "endTimeMillis";
   private static final String PARAM_LATEST_VALUE = "latestValue";
@@ -150,4 +153,36 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
       }
     }, MetricRegistry.name(this.getClass(), "ingestProposal"));
   }
+
+  /**
+   * Ingests the proposals one after the other. This is not atomic: when a proposal fails, the ones before it
+   * have already been ingested, and the ones after it are not.
+   */
+  @Action(name = ACTION_INGEST_PROPOSAL_BATCH)
+  @Nonnull
+  @WithSpan
+  public Task<Void> ingestProposalBatch(
+      @ActionParam(PARAM_PROPOSALS) @Nonnull MetadataChangeProposal[] metadataChangeProposals) throws URISyntaxException {
+    log.info("INGEST PROPOSAL BATCH proposals: {}", metadataChangeProposals.length);
+
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    return RestliUtil.toTask(() -> {
+      for (MetadataChangeProposal metadataChangeProposal : Arrays.asList(metadataChangeProposals)) {
+        log.debug("Proposal: {}", metadataChangeProposal);
+        try {
+          final List<MetadataChangeProposal> additionalChanges =
+              AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService);
+          Urn urn = _entityService.ingestProposal(metadataChangeProposal, auditStamp).getUrn();
+          additionalChanges.forEach(proposal -> _entityService.ingestProposal(proposal, auditStamp));
+          tryIndexRunId(urn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
+        } catch (ValidationException e) {
+          throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
+        }
+      }
+      return null;
+    }, MetricRegistry.name(this.getClass(), "ingestProposalBatch"));
+  }
 }